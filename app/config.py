@@ -26,6 +26,41 @@ CONTENT_TYPES = ["notes", "til", "bookmarks", "how_to", "pages"]
 CACHE_TTL = 300  # 5 minutes
 CACHE_MAX_SIZE = 128
 
+# Content change detection: 'polling', 'inotify', 'auto' or 'off' (TTL expiry only)
+CONTENT_WATCH_BACKEND = os.getenv("CONTENT_WATCH_BACKEND", "polling")
+CONTENT_WATCH_INTERVAL = float(os.getenv("CONTENT_WATCH_INTERVAL", "2.0"))
+
+# Serve the previous content snapshot while a background worker rebuilds it
+CONTENT_STALE_WHILE_REVALIDATE = (
+    os.getenv("CONTENT_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+)
+
+# Number of rendered document bodies kept in memory (listings hold metadata only)
+CONTENT_BODY_CACHE_SIZE = int(os.getenv("CONTENT_BODY_CACHE_SIZE", "128"))
+# Estimated bytes the content cache may hold; bodies are evicted before metadata
+CONTENT_CACHE_MAX_BYTES = int(os.getenv("CONTENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Processes rendering content files on full rebuilds (0 = one per CPU, 1 = serial)
+CONTENT_INGEST_WORKERS = int(os.getenv("CONTENT_INGEST_WORKERS", "0"))
+# Files that must need rendering before a rebuild starts the process pool
+CONTENT_INGEST_PARALLEL_THRESHOLD = int(os.getenv("CONTENT_INGEST_PARALLEL_THRESHOLD", "64"))
+
+# Threads running blocking content reads and renders for async route handlers
+CONTENT_IO_THREADS = int(os.getenv("CONTENT_IO_THREADS", "8"))
+
+# Persistent parsed-content index (prebuilt into the image, see scripts/build_content_index.py)
+CONTENT_INDEX_PATH = os.getenv(
+    "CONTENT_INDEX_PATH", str(BASE_DIR / ".cache" / "content_index.sqlite3")
+)
+
+# Persistent rendered-HTML cache keyed by source and renderer config hashes
+RENDER_CACHE_PATH = os.getenv(
+    "RENDER_CACHE_PATH", str(BASE_DIR / ".cache" / "render_cache.sqlite3")
+)
+
+# Optional file persisting highlighted code blocks across restarts (memory only if unset)
+HIGHLIGHT_CACHE_PATH = os.getenv("HIGHLIGHT_CACHE_PATH") or None
+
 # Feed settings
 SITE_URL = "https://joshuaoliph.com"
 SITE_TITLE = "Joshua Oliphant's Digital Garden"
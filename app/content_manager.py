@@ -3,26 +3,250 @@ ContentManager class for handling content operations in the digital garden.
 Extracted from main.py for better code organization.
 """
 
+import heapq
 import os
 import re
 import random
 import yaml
+import bleach
+import html
 import markdown
+import threading
 import httpx
+import xml.etree.ElementTree as etree
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Any, Union
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from collections import defaultdict
 from pathlib import Path
 
 from markdown.extensions.fenced_code import FencedCodeExtension
 from markdown.extensions.codehilite import CodeHiliteExtension
+from markdown.extensions.toc import TocExtension
+from markdown.treeprocessors import Treeprocessor
+from markdown.util import HTML_PLACEHOLDER_RE
+from bleach import html5lib_shim
 from bs4 import BeautifulSoup
 from pydantic import ValidationError
 import logging
 
+from app.config import RENDER_CACHE_PATH
+from app.core.constants import ALLOWED_ATTRIBUTES, ALLOWED_TAGS, CONTENT_DIR
 from app.models import BaseContent, Bookmark, TIL, Note
+from app.services.highlight_cache import install_highlight_cache
+from app.services.render_cache import RenderCache, hash_config
 from app.utils.cache import timed_lru_cache
+from app.utils.frontmatter import load_yaml, read_frontmatter
+from app.utils.markdown_pool import MarkdownPool
+
+
+class InlineCodePattern(markdown.inlinepatterns.Pattern):
+    """Render inline code as ``<span class="inline-code"><code>``."""
+
+    def handleMatch(self, m):
+        el = etree.Element("span")
+        el.set("class", "inline-code")
+        code = etree.SubElement(el, "code")
+        code.text = markdown.util.AtomicString(m.group(2))
+        return el
+
+
+class InlineCodeExtension(markdown.Extension):
+    """Wrap inline code in spans."""
+
+    def extendMarkdown(self, md):
+        # Override the inline code pattern
+        md.inlinePatterns.register(
+            InlineCodePattern(r"(?<!\\)(`+)(.+?)(?<!`)\1(?!`)", md),
+            "backtick",
+            175,
+        )
+
+
+class CustomFencedCodeExtension(FencedCodeExtension):
+    """FencedCode extension that preserves link styling."""
+
+    def extendMarkdown(self, md):
+        """Add FencedBlockPreprocessor to the Markdown instance."""
+        md.registerExtension(self)
+        config = self.getConfigs()
+        processor = markdown.extensions.fenced_code.FencedBlockPreprocessor(
+            md, config
+        )
+        processor.run = lambda lines: self.custom_run(
+            processor, lines
+        )  # Override the run method
+        md.preprocessors.register(processor, "fenced_code_block", 25)
+
+    def custom_run(self, processor, lines):
+        """Custom run method to preserve link styling within code blocks"""
+        new_lines = []
+        for line in lines:
+            if line.strip().startswith("```"):
+                new_lines.append(line)
+            else:
+                # Replace markdown links with HTML links that have our styling
+                line = re.sub(
+                    r"\[(.*?)\]\((.*?)\)",
+                    r'<a href="\2" class="text-emerald-600 hover:text-emerald-500 hover:underline">\1</a>',
+                    line,
+                )
+                new_lines.append(line)
+        return processor.__class__.run(processor, new_lines)
+
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+
+class ContentTreeprocessor(Treeprocessor):
+    """Capture the excerpt and headings while the document tree is built.
+
+    Runs after ``toc`` has assigned heading ids, so the rendered HTML never
+    has to be parsed again to find them. Results are left on the Markdown
+    instance as ``excerpt`` (text of the first paragraph) and ``headings``.
+    """
+
+    def run(self, root):
+        excerpt = None
+        headings = []
+        for el in root.iter():
+            if el.tag == "p" and excerpt is None:
+                text = self._text(el)
+                # A paragraph holding only a raw HTML block is unwrapped later
+                if text is not None:
+                    excerpt = text
+            elif el.tag in HEADING_TAGS:
+                headings.append(
+                    {"level": int(el.tag[1]), "id": el.get("id", ""), "text": self._text(el) or ""}
+                )
+        self.md.excerpt = excerpt or ""
+        self.md.headings = headings
+
+    def _text(self, el) -> Optional[str]:
+        """Return the text of ``el`` as it reads once the HTML is rendered."""
+        raw = "".join(el.itertext())
+        if HTML_PLACEHOLDER_RE.fullmatch(raw.strip()):
+            return None
+        unescape = self.md.treeprocessors["unescape"].unescape
+        return HTML_PLACEHOLDER_RE.sub(self._stashed_text, unescape(raw))
+
+    def _stashed_text(self, match) -> str:
+        # Inline tags are stashed one by one, so only entities carry text
+        stashed = self.md.htmlStash.rawHtmlBlocks[int(match.group(1))]
+        return "" if stashed.lstrip().startswith("<") else html.unescape(stashed)
+
+
+class ContentExtension(markdown.Extension):
+    """Register ContentTreeprocessor and clear its results on reset."""
+
+    def extendMarkdown(self, md):
+        md.registerExtension(self)
+        self.md = md
+        self.reset()
+        # After toc (5) so ids exist, before unescape (0)
+        md.treeprocessors.register(ContentTreeprocessor(md), "content", 4)
+
+    def reset(self):
+        self.md.excerpt = ""
+        self.md.headings = []
+
+
+# Code blocks are highlighted through the cache shared with ContentService
+install_highlight_cache()
+
+
+def _build_markdown() -> markdown.Markdown:
+    return markdown.Markdown(
+        extensions=[
+            "extra",
+            "admonition",
+            TocExtension(baselevel=1),
+            CodeHiliteExtension(),
+            CustomFencedCodeExtension(),
+            InlineCodeExtension(),
+            ContentExtension(),
+        ]
+    )
+
+
+# Pre-built converters, reset and reused for every document
+_markdown_pool = MarkdownPool(_build_markdown)
+
+# Classes added to every rendered link
+LINK_CLASSES = ["text-emerald-600", "hover:text-emerald-500", "hover:underline"]
+
+# ALLOWED_ATTRIBUTES, extended so link classes and embeds survive sanitization
+SANITIZE_ATTRIBUTES = {
+    **ALLOWED_ATTRIBUTES,
+    "a": ["href", "title", "rel", "class", "target"],
+    "iframe": [
+        "src",
+        "width",
+        "height",
+        "frameborder",
+        "allow",
+        "allowfullscreen",
+        "title",
+        "referrerpolicy",
+    ],
+}
+
+
+
+class LinkClassFilter(html5lib_shim.Filter):
+    """Add LINK_CLASSES to every link during the sanitizer's own pass."""
+
+    def __iter__(self):
+        for token in super().__iter__():
+            if token["type"] in ("StartTag", "EmptyTag") and token["name"] == "a":
+                attrs = token["data"]
+                classes = (attrs.get((None, "class")) or "").split()
+                classes += [cls for cls in LINK_CLASSES if cls not in classes]
+                attrs[(None, "class")] = " ".join(classes)
+            yield token
+
+
+# bleach Cleaners hold parser state, so each thread gets its own
+_cleaners = threading.local()
+
+
+def _get_cleaner() -> bleach.sanitizer.Cleaner:
+    cleaner = getattr(_cleaners, "cleaner", None)
+    if cleaner is None:
+        cleaner = bleach.sanitizer.Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=SANITIZE_ATTRIBUTES,
+            strip=True,
+            filters=[LinkClassFilter],
+        )
+        _cleaners.cleaner = cleaner
+    return cleaner
+
+
+# Bump when _render_body changes in a way the config hash cannot see
+RENDER_PIPELINE_VERSION = 3
+
+RENDER_CONFIG_HASH = hash_config(
+    RENDER_PIPELINE_VERSION,
+    markdown.__version__,
+    bleach.__version__,
+    [type(ext).__name__ for ext in _build_markdown().registeredExtensions],
+    LINK_CLASSES,
+    ALLOWED_TAGS,
+    SANITIZE_ATTRIBUTES,
+)
+
+
+@lru_cache()
+def get_render_cache() -> RenderCache:
+    """Return the process-wide render cache, pruning entries of deleted files."""
+    cache = RenderCache(RENDER_CACHE_PATH, RENDER_CONFIG_HASH)
+    removed = cache.prune(os.path.exists)
+    if removed:
+        logging.getLogger(__name__).info(f"Render cache: pruned {removed} deleted sources")
+    return cache
 
 
 class ContentManager:
@@ -48,9 +272,34 @@ class ContentManager:
             content, file_path
         )
 
-        # Convert and sanitize markdown
-        html_content = ContentManager._convert_markdown(md_content)
-        return {"html": html_content, "metadata": metadata, "errors": errors}
+        # Convert and sanitize markdown, reusing the output for unchanged sources
+        rendered = get_render_cache().render(
+            md_content, ContentManager._render_body, path=file_path
+        )
+        return {**rendered, "metadata": metadata, "errors": errors}
+
+    @staticmethod
+    def read_metadata(file_path: str) -> dict:
+        """Read and validate a file's front matter without rendering its body.
+
+        For callers that only need metadata (tag counts, sitemaps); the file
+        is read up to the closing ``---`` and nothing is converted to HTML.
+        """
+        if not os.path.exists(file_path):
+            return {"metadata": {}, "errors": ["File not found"]}
+
+        try:
+            raw_metadata = read_frontmatter(file_path)
+            if raw_metadata is None:
+                return {"metadata": {}, "errors": ["No front matter found"]}
+            metadata, errors = ContentManager._validate_front_matter(
+                raw_metadata, file_path
+            )
+        except ValueError:
+            return {"metadata": {}, "errors": ["Invalid front matter format"]}
+        except yaml.YAMLError as e:
+            return {"metadata": {}, "errors": [f"YAML parsing error: {str(e)}"]}
+        return {"metadata": metadata, "errors": errors}
 
     @staticmethod
     def _parse_front_matter(content: str, file_path: str) -> tuple:
@@ -58,35 +307,11 @@ class ContentManager:
         if content.startswith("---"):
             try:
                 _, fm, md_content = content.split("---", 2)
-                raw_metadata = yaml.safe_load(fm)
-
-                # Determine content type from file path
-                path_parts = file_path.split(os.sep)
-                content_type = path_parts[-2] if len(path_parts) > 1 else "notes"
-
-                # Get the appropriate model
-                model_class = ContentManager.CONTENT_TYPE_MAP.get(
-                    content_type, BaseContent
+                raw_metadata = load_yaml(fm)
+                metadata, errors = ContentManager._validate_front_matter(
+                    raw_metadata, file_path
                 )
-
-                try:
-                    # Convert string dates to datetime objects
-                    if isinstance(raw_metadata.get("created"), str):
-                        raw_metadata["created"] = datetime.strptime(
-                            raw_metadata["created"], "%Y-%m-%d"
-                        )
-                    if isinstance(raw_metadata.get("updated"), str):
-                        raw_metadata["updated"] = datetime.strptime(
-                            raw_metadata["updated"], "%Y-%m-%d"
-                        )
-
-                    # Validate with Pydantic model
-                    validated_metadata = model_class(**raw_metadata)
-                    return validated_metadata.model_dump(), md_content, errors
-                except ValidationError as e:
-                    errors.extend([f"{err['loc']}: {err['msg']}" for err in e.errors()])
-                    return raw_metadata, md_content, errors
-
+                return metadata, md_content, errors
             except ValueError:
                 errors.append("Invalid front matter format")
                 return {}, content, errors
@@ -98,101 +323,55 @@ class ContentManager:
         return {}, content, errors
 
     @staticmethod
-    def _convert_markdown(content: str) -> str:
-        # Create a custom extension to wrap inline code in spans
-        class InlineCodeExtension(markdown.Extension):
-            def extendMarkdown(self, md):
-                # Override the inline code pattern
-                md.inlinePatterns.register(
-                    InlineCodePattern(r"(?<!\\)(`+)(.+?)(?<!`)\1(?!`)", md),
-                    "backtick",
-                    175,
-                )
+    def _validate_front_matter(raw_metadata: dict, file_path: str) -> tuple:
+        """Validate parsed front matter against the model for its content type."""
+        # Determine content type from file path
+        path_parts = file_path.split(os.sep)
+        content_type = path_parts[-2] if len(path_parts) > 1 else "notes"
+
+        # Get the appropriate model
+        model_class = ContentManager.CONTENT_TYPE_MAP.get(
+            content_type, BaseContent
+        )
 
-        class InlineCodePattern(markdown.inlinepatterns.Pattern):
-            def handleMatch(self, m):
-                el = markdown.util.etree.Element("span")
-                el.set("class", "inline-code")
-                code = markdown.util.etree.SubElement(el, "code")
-                code.text = markdown.util.AtomicString(m.group(2))
-                return el
-
-        # Custom FencedCode extension to preserve link styling
-        class CustomFencedCodeExtension(FencedCodeExtension):
-            def extendMarkdown(self, md):
-                """Add FencedBlockPreprocessor to the Markdown instance."""
-                md.registerExtension(self)
-                config = self.getConfigs()
-                processor = markdown.extensions.fenced_code.FencedBlockPreprocessor(
-                    md, config
+        try:
+            # Convert string dates to datetime objects
+            if isinstance(raw_metadata.get("created"), str):
+                raw_metadata["created"] = datetime.strptime(
+                    raw_metadata["created"], "%Y-%m-%d"
+                )
+            if isinstance(raw_metadata.get("updated"), str):
+                raw_metadata["updated"] = datetime.strptime(
+                    raw_metadata["updated"], "%Y-%m-%d"
                 )
-                processor.run = lambda lines: self.custom_run(
-                    processor, lines
-                )  # Override the run method
-                md.preprocessors.register(processor, "fenced_code_block", 25)
-
-            def custom_run(self, processor, lines):
-                """Custom run method to preserve link styling within code blocks"""
-                new_lines = []
-                for line in lines:
-                    if line.strip().startswith("```"):
-                        new_lines.append(line)
-                    else:
-                        # Replace markdown links with HTML links that have our styling
-                        line = re.sub(
-                            r"\[(.*?)\]\((.*?)\)",
-                            r'<a href="\2" class="text-emerald-600 hover:text-emerald-500 hover:underline">\1</a>',
-                            line,
-                        )
-                        new_lines.append(line)
-                return processor.__class__.run(processor, new_lines)
-
-        md = markdown.Markdown(
-            extensions=[
-                "extra",
-                "admonition",
-                TocExtension(baselevel=1),
-                CustomFencedCodeExtension(),
-                InlineCodeExtension(),
-            ]
-        )
 
-        html_content = md.convert(content)
-
-        # Use BeautifulSoup to modify link styles
-        soup = BeautifulSoup(html_content, "html.parser")
-        for link in soup.find_all("a"):
-            existing_classes = link.get("class", [])
-            if isinstance(existing_classes, str):
-                existing_classes = existing_classes.split()
-            new_classes = existing_classes + [
-                "text-emerald-600",
-                "hover:text-emerald-500",
-                "hover:underline",
-            ]
-            link["class"] = " ".join(new_classes)
-
-        # Update ALLOWED_ATTRIBUTES to ensure classes survive sanitization
-        allowed_attrs = {
-            **ALLOWED_ATTRIBUTES,
-            "a": ["href", "title", "rel", "class", "target"],
-            "iframe": [
-                "src",
-                "width",
-                "height",
-                "frameborder",
-                "allow",
-                "allowfullscreen",
-                "title",
-                "referrerpolicy",
-            ],
-        }
+            # Validate with Pydantic model
+            validated_metadata = model_class(**raw_metadata)
+            return validated_metadata.model_dump(), []
+        except ValidationError as e:
+            return raw_metadata, [f"{err['loc']}: {err['msg']}" for err in e.errors()]
 
-        clean_html = bleach.clean(
-            str(soup), tags=ALLOWED_TAGS, attributes=allowed_attrs, strip=True
-        )
+    @staticmethod
+    def _render_body(content: str) -> dict:
+        """Render markdown to sanitized HTML, with its excerpt and headings.
+
+        The excerpt and headings are captured from the markdown tree, and
+        links are decorated inside the sanitizer's pass, so the HTML is only
+        parsed once after conversion.
+        """
+        with _markdown_pool.checkout() as md:
+            html_content = md.convert(content)
+            excerpt, headings = md.excerpt, md.headings
+
+        return {
+            "html": _get_cleaner().clean(html_content),
+            "excerpt": excerpt,
+            "headings": headings,
+        }
 
-        return clean_html
+    @staticmethod
+    def _convert_markdown(content: str) -> str:
+        return ContentManager._render_body(content)["html"]
 
     @staticmethod
     def get_content(content_type: str, limit=None):
@@ -204,10 +383,7 @@ class ContentManager:
         validation_errors = {}
 
         for file in files:
-            name = file.stem
-            file_content = ContentManager.render_markdown(str(file))
-            metadata = file_content["metadata"]
-            errors = file_content.get("errors", [])
+            content_item, errors = ContentManager._content_item(file, content_type)
 
             if errors:
                 validation_errors[str(file)] = errors
@@ -215,47 +391,6 @@ class ContentManager:
                 if os.getenv("ENVIRONMENT") == "production":
                     continue
 
-            # Get excerpt
-            soup = BeautifulSoup(file_content["html"], "html.parser")
-            first_p = soup.find("p")
-            excerpt = first_p.get_text() if first_p else ""
-
-            # Create consistent content item structure
-            # Convert datetime objects in metadata to strings
-            def convert_dates_in_dict(obj):
-                if isinstance(obj, dict):
-                    return {k: convert_dates_in_dict(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_dates_in_dict(item) for item in obj]
-                elif isinstance(obj, datetime):
-                    return obj.strftime("%Y-%m-%d")
-                else:
-                    return obj
-            
-            # Clean metadata of datetime objects
-            clean_metadata = convert_dates_in_dict(metadata)
-            
-            content_item = {
-                "name": name,
-                "title": clean_metadata.get("title", name.replace("-", " ").title()),
-                "created": clean_metadata.get("created", ""),
-                "updated": clean_metadata.get("updated", ""),
-                "metadata": clean_metadata,
-                "excerpt": excerpt,
-                "url": f"/{content_type}/{name}",
-                "content_type": content_type,
-                "type_indicator": {
-                    "notes": "Note",
-                    "how_to": "How To",
-                    "bookmarks": "Bookmark",
-                    "til": "TIL",
-                }.get(content_type, ""),
-                "html": file_content["html"],
-            }
-
-            if errors and os.getenv("ENVIRONMENT") != "production":
-                content_item["validation_errors"] = errors
-
             content.append(content_item)
 
         # Log validation errors
@@ -272,6 +407,140 @@ class ContentManager:
             "type": content_type,
         }
 
+    @staticmethod
+    def _content_item(file: Path, content_type: str) -> tuple:
+        """Render one file into a listing item; returns (item, validation errors)."""
+        name = file.stem
+        file_content = ContentManager.render_markdown(str(file))
+        metadata = file_content["metadata"]
+        errors = file_content.get("errors", [])
+
+        excerpt = file_content["excerpt"]
+
+        # Create consistent content item structure
+        # Convert datetime objects in metadata to strings
+        def convert_dates_in_dict(obj):
+            if isinstance(obj, dict):
+                return {k: convert_dates_in_dict(v) for k, v in obj.items()}
+            elif isinstance(obj, list):
+                return [convert_dates_in_dict(item) for item in obj]
+            elif isinstance(obj, datetime):
+                return obj.strftime("%Y-%m-%d")
+            else:
+                return obj
+
+        # Clean metadata of datetime objects
+        clean_metadata = convert_dates_in_dict(metadata)
+
+        content_item = {
+            "name": name,
+            "title": clean_metadata.get("title", name.replace("-", " ").title()),
+            "created": clean_metadata.get("created", ""),
+            "updated": clean_metadata.get("updated", ""),
+            "metadata": clean_metadata,
+            "excerpt": excerpt,
+            "url": f"/{content_type}/{name}",
+            "content_type": content_type,
+            "type_indicator": {
+                "notes": "Note",
+                "how_to": "How To",
+                "bookmarks": "Bookmark",
+                "til": "TIL",
+            }.get(content_type, ""),
+            "html": file_content["html"],
+        }
+
+        if errors and os.getenv("ENVIRONMENT") != "production":
+            content_item["validation_errors"] = errors
+
+        return content_item, errors
+
+    @staticmethod
+    def iter_content(
+        content_types: Optional[List[str]] = None,
+        order: str = "desc",
+        filters: Optional[Callable[[dict], bool]] = None,
+    ) -> Iterator[dict]:
+        """Yield content items of several types in one creation date order.
+
+        Only front matter is read up front, to order each type; the types
+        are then k-way merged and a file is rendered when its item is
+        yielded, so taking the first N items renders N bodies.
+
+        Args:
+            content_types: Types to include (notes, how-tos and TILs by default)
+            order: 'desc' for newest first, 'asc' for oldest first
+            filters: Optional predicate on an item's front matter (dates as
+                strings); items failing it are never rendered
+
+        Yields:
+            Items shaped like those of get_content
+        """
+        if content_types is None:
+            content_types = ["notes", "how_to", "til"]
+        descending = order == "desc"
+        streams = [
+            ContentManager._ordered_entries(content_type, descending, filters)
+            for content_type in content_types
+        ]
+        for entry in heapq.merge(*streams, key=itemgetter(0), reverse=descending):
+            _, file, content_type = entry
+            content_item, _ = ContentManager._content_item(file, content_type)
+            yield content_item
+
+    @staticmethod
+    def count_content(
+        content_types: Optional[List[str]] = None,
+        filters: Optional[Callable[[dict], bool]] = None,
+    ) -> int:
+        """Number of items iter_content would yield, read from front matter only."""
+        if content_types is None:
+            content_types = ["notes", "how_to", "til"]
+        return sum(
+            len(ContentManager._ordered_entries(content_type, True, filters))
+            for content_type in content_types
+        )
+
+    @staticmethod
+    def _ordered_entries(
+        content_type: str,
+        descending: bool,
+        filters: Optional[Callable[[dict], bool]] = None,
+    ) -> List[tuple]:
+        """Return ((created, name), file, type) for one type, sorted by creation date."""
+        entries = []
+        for item in ContentManager.get_content_metadata(content_type):
+            if item["errors"] and os.getenv("ENVIRONMENT") == "production":
+                continue
+            metadata = item["metadata"]
+            if filters is not None and not filters(metadata):
+                continue
+            created = str(metadata.get("created") or "")
+            file = Path(CONTENT_DIR, content_type, f"{item['name']}.md")
+            entries.append(((created, item["name"]), file, content_type))
+        entries.sort(key=itemgetter(0), reverse=descending)
+        return entries
+
+    @staticmethod
+    def get_content_metadata(content_type: str) -> List[dict]:
+        """Get the front matter of every file of a type, newest first.
+
+        Bodies are never read or rendered, so this is the cheap choice for
+        listings that only need names, dates, tags and status.
+        """
+        files = list(Path(CONTENT_DIR, content_type).glob("*.md"))
+        files.sort(key=ContentManager._get_date_from_filename, reverse=True)
+
+        items = []
+        for file in files:
+            result = ContentManager.read_metadata(str(file))
+            metadata = {
+                key: value.strftime("%Y-%m-%d") if isinstance(value, datetime) else value
+                for key, value in result["metadata"].items()
+            }
+            items.append({"name": file.stem, "metadata": metadata, "errors": result["errors"]})
+        return items
+
     @staticmethod
     def _get_date_from_filename(filename: str | Path) -> str:
         match = re.search(r'(\d{4}-\d{2}-\d{2})', Path(filename).name)
@@ -284,18 +553,35 @@ class ContentManager:
             return None
 
         random_quote_file = random.choice(quote_files)
-        quote_content = ContentManager.render_markdown(str(random_quote_file))
+        content = random_quote_file.read_text(encoding="utf-8")
+        metadata, md_content, _ = ContentManager._parse_front_matter(
+            content, str(random_quote_file)
+        )
 
-        # Extract quote safely
-        soup = BeautifulSoup(quote_content["html"], "html.parser")
-        blockquote = soup.find("blockquote")
-        quote_text = blockquote.get_text() if blockquote else ""
+        # Only the quote itself is rendered, not the rest of the note
+        quote_markdown = ContentManager._first_blockquote(md_content)
+        quote_text = ""
+        if quote_markdown:
+            soup = BeautifulSoup(markdown.markdown(quote_markdown), "html.parser")
+            blockquote = soup.find("blockquote")
+            quote_text = blockquote.get_text() if blockquote else ""
 
         return {
             "text": quote_text,
-            "author": quote_content["metadata"].get("author", quote_content["metadata"].get("title", "")),
+            "author": metadata.get("author", metadata.get("title", "")),
         }
 
+    @staticmethod
+    def _first_blockquote(md_content: str) -> str:
+        """Return the markdown of the first blockquote in ``md_content``."""
+        lines = []
+        for line in md_content.splitlines():
+            if line.lstrip().startswith(">"):
+                lines.append(line)
+            elif lines:
+                break
+        return "\n".join(lines)
+
     @staticmethod
     def get_bookmarks(limit: Optional[int] = 10) -> List[dict]:
         """Get bookmarks with pagination"""
@@ -353,10 +639,7 @@ class ContentManager:
                 metadata = file_content["metadata"]
 
                 if "tags" in metadata and tag in metadata["tags"]:
-                    # Get excerpt for all post types
-                    soup = BeautifulSoup(file_content["html"], "html.parser")
-                    first_p = soup.find("p")
-                    excerpt = first_p.get_text() if first_p else ""
+                    excerpt = file_content["excerpt"]
 
                     posts.append(
                         {
@@ -480,8 +763,7 @@ class ContentManager:
         for content_type in content_types:
             files = list(Path(CONTENT_DIR, content_type).glob("*.md"))
             for file in files:
-                file_content = ContentManager.render_markdown(str(file))
-                metadata = file_content["metadata"]
+                metadata = ContentManager.read_metadata(str(file))["metadata"]
                 for tag in metadata.get("tags", []):
                     tag_counts[tag] = tag_counts.get(tag, 0) + 1
         
@@ -509,10 +791,7 @@ class ContentManager:
             file_content = ContentManager.render_markdown(str(file))
             metadata = file_content["metadata"]
 
-            # Get first paragraph for excerpt
-            soup = BeautifulSoup(file_content["html"], "html.parser")
-            first_p = soup.find("p")
-            excerpt = first_p.get_text() if first_p else ""
+            excerpt = file_content["excerpt"]
 
             # Update tag counts
             for tag in metadata.get("tags", []):
@@ -549,9 +828,7 @@ class ContentManager:
             metadata = file_content["metadata"]
 
             if tag in metadata.get("tags", []):
-                soup = BeautifulSoup(file_content["html"], "html.parser")
-                first_p = soup.find("p")
-                excerpt = first_p.get_text() if first_p else ""
+                excerpt = file_content["excerpt"]
 
                 tils.append(
                     {
@@ -573,21 +850,16 @@ class ContentManager:
     async def get_mixed_content(page: int = 1, per_page: int = 10) -> dict:
         """Get mixed content (notes, how-tos, bookmarks, TILs) sorted by date"""
         try:
-            all_content = []
             errors = []
 
-            # Get content from different sections
-            try:
-                notes = ContentManager.get_content("notes")["content"]
-            except Exception as e:
-                errors.append(f"Error fetching notes: {str(e)}")
-                notes = []
+            # Calculate pagination
+            if page < 1:
+                raise ValueError("Page number must be greater than 0")
+            if per_page < 1:
+                raise ValueError("Items per page must be greater than 0")
 
-            try:
-                how_tos = ContentManager.get_content("how_to")["content"]
-            except Exception as e:
-                errors.append(f"Error fetching how-tos: {str(e)}")
-                how_tos = []
+            start_idx = (page - 1) * per_page
+            end_idx = start_idx + per_page
 
             try:
                 bookmarks = ContentManager.get_bookmarks()
@@ -595,16 +867,10 @@ class ContentManager:
                 errors.append(f"Error fetching bookmarks: {str(e)}")
                 bookmarks = []
 
-            try:
-                til_result = ContentManager.get_til_posts(page=1, per_page=9999)
-                tils = til_result["tils"]
-            except Exception as e:
-                errors.append(f"Error fetching TILs: {str(e)}")
-                tils = []
-
-            # Process and normalize content
+            # Process and normalize content (typed items keep their own type)
             def process_content(items, content_type):
                 for item in items:
+                    content_type = item.get("content_type", content_type)
                     try:
                         # Ensure consistent metadata structure
                         if "metadata" not in item and content_type in [
@@ -618,12 +884,6 @@ class ContentManager:
                                 "tags": item.get("tags", []),
                             }
 
-                        # Generate excerpt if not present
-                        if "excerpt" not in item and "html" in item:
-                            soup = BeautifulSoup(item["html"], "html.parser")
-                            first_p = soup.find("p")
-                            item["excerpt"] = first_p.get_text() if first_p else ""
-
                         # Add content type and normalize URL
                         item["content_type"] = content_type
                         if "url" not in item:
@@ -637,16 +897,10 @@ class ContentManager:
                             "til": "TIL",
                         }.get(content_type, "")
 
-                        all_content.append(item)
+                        yield item
                     except Exception as e:
                         errors.append(f"Error processing {content_type} item: {str(e)}")
 
-            # Process each content type
-            process_content(notes, "notes")
-            process_content(how_tos, "how_to")
-            process_content(bookmarks, "bookmarks")
-            process_content(tils, "til")
-
             # Sort all content by date
             def get_date(item):
                 # Try different date locations
@@ -661,35 +915,28 @@ class ContentManager:
                         return datetime.min
                 return date or datetime.min
 
-            all_content.sort(key=get_date, reverse=True)
-
-            # Calculate pagination
-            if page < 1:
-                raise ValueError("Page number must be greater than 0")
-            if per_page < 1:
-                raise ValueError("Items per page must be greater than 0")
-
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-
-            if start_idx >= len(all_content):
-                return {
-                    "content": [],
-                    "next_page": None,
-                    "total": len(all_content),
-                    "current_page": page,
-                    "total_pages": (len(all_content) + per_page - 1) // per_page,
-                    "errors": errors,
-                }
-
-            has_more = end_idx < len(all_content)
+            # Bookmarks are a short list; the other types stream in date
+            # order and only the files on the requested page are rendered
+            bookmark_items = sorted(
+                process_content(bookmarks, "bookmarks"), key=get_date, reverse=True
+            )
+            stream_types = ["notes", "how_to", "til"]
+            try:
+                total = ContentManager.count_content(stream_types) + len(bookmark_items)
+                stream = process_content(ContentManager.iter_content(stream_types), None)
+                merged = heapq.merge(stream, bookmark_items, key=get_date, reverse=True)
+                page_content = list(islice(merged, start_idx, end_idx))
+            except Exception as e:
+                errors.append(f"Error fetching content: {str(e)}")
+                total = len(bookmark_items)
+                page_content = bookmark_items[start_idx:end_idx]
 
             return {
-                "content": all_content[start_idx:end_idx],
-                "next_page": page + 1 if has_more else None,
-                "total": len(all_content),
+                "content": page_content,
+                "next_page": page + 1 if end_idx < total else None,
+                "total": total,
                 "current_page": page,
-                "total_pages": (len(all_content) + per_page - 1) // per_page,
+                "total_pages": (total + per_page - 1) // per_page,
                 "errors": errors,
             }
 
@@ -708,65 +955,44 @@ class ContentManager:
                 return date_value.strftime("%Y-%m-%d")
             return date_value or ""
         
-        # Get content from each type
-        notes_result = ContentManager.get_content("notes")
-        notes = notes_result["content"] if isinstance(notes_result, dict) else notes_result
-        
-        how_tos_result = ContentManager.get_content("how_to")
-        how_tos = how_tos_result["content"] if isinstance(how_tos_result, dict) else how_tos_result
-        
-        til_result = ContentManager.get_til_posts(page=1, per_page=9999)
-        tils = til_result["tils"]
-        
         bookmarks = ContentManager.get_bookmarks(limit=None)
         
-        # Process and combine all content
-        for note in notes:
-            if note.get("metadata", {}).get("status") != "draft":
-                note["content_type"] = "notes"
-                note["type_label"] = "Note"
-                note["growth_stage"] = note.get("metadata", {}).get("status", "Seedling")
-                note["tags"] = note.get("metadata", {}).get("tags", [])
-                note["created"] = convert_date_to_string(note.get("metadata", {}).get("created", note.get("created", "")))
-                note["updated"] = convert_date_to_string(note.get("metadata", {}).get("updated", note.get("updated", "")))
-                all_content.append(note)
-                all_tags.update(note["tags"])
+        type_labels = {"notes": "Note", "how_to": "How-To", "til": "TIL"}
+        
+        # Notes, how-tos and TILs stream in date order with drafts skipped
+        # before rendering; items are copied rather than rewritten in place
+        # so the source dicts are never modified
+        published = ContentManager.iter_content(
+            filters=lambda metadata: metadata.get("status") != "draft"
+        )
+        for item in published:
+            metadata = item.get("metadata", {})
+            item = {
+                **item,
+                "type_label": type_labels[item["content_type"]],
+                "growth_stage": metadata.get("status", "Seedling"),
+                "tags": metadata.get("tags", []),
+                "created": convert_date_to_string(metadata.get("created", item.get("created", ""))),
+                "updated": convert_date_to_string(metadata.get("updated", item.get("updated", ""))),
+            }
+            # Add slug field for TILs
+            if item["content_type"] == "til" and "slug" not in item:
+                item["slug"] = item["name"]
+            all_content.append(item)
+            all_tags.update(item["tags"])
         
-        for how_to in how_tos:
-            if how_to.get("metadata", {}).get("status") != "draft":
-                how_to["content_type"] = "how_to"
-                how_to["type_label"] = "How-To"
-                how_to["growth_stage"] = how_to.get("metadata", {}).get("status", "Seedling")
-                how_to["tags"] = how_to.get("metadata", {}).get("tags", [])
-                how_to["created"] = convert_date_to_string(how_to.get("metadata", {}).get("created", how_to.get("created", "")))
-                how_to["updated"] = convert_date_to_string(how_to.get("metadata", {}).get("updated", how_to.get("updated", "")))
-                all_content.append(how_to)
-                all_tags.update(how_to["tags"])
-                
-        for til in tils:
-            # TILs don't have metadata wrapper, status is at top level
-            if til.get("status") != "draft":
-                til["content_type"] = "til"
-                til["type_label"] = "TIL"
-                til["growth_stage"] = til.get("status", "Seedling")
-                # Add slug field for TILs
-                if 'name' in til and 'slug' not in til:
-                    til['slug'] = til['name']
-                # Convert dates for TILs
-                til["created"] = convert_date_to_string(til.get("created", ""))
-                til["updated"] = convert_date_to_string(til.get("updated", ""))
-                all_content.append(til)
-                all_tags.update(til.get("tags", []))
-                
         for bookmark in bookmarks:
             # Bookmarks don't have metadata wrapper, status is at top level
             if bookmark.get("status") != "draft":
-                bookmark["content_type"] = "bookmarks"
-                bookmark["type_label"] = "Bookmark"
-                bookmark["growth_stage"] = bookmark.get("status", "Seedling")
-                # Convert dates for bookmarks
-                bookmark["created"] = convert_date_to_string(bookmark.get("created", ""))
-                bookmark["updated"] = convert_date_to_string(bookmark.get("updated", ""))
+                bookmark = {
+                    **bookmark,
+                    "content_type": "bookmarks",
+                    "type_label": "Bookmark",
+                    "growth_stage": bookmark.get("status", "Seedling"),
+                    # Convert dates for bookmarks
+                    "created": convert_date_to_string(bookmark.get("created", "")),
+                    "updated": convert_date_to_string(bookmark.get("updated", "")),
+                }
                 all_content.append(bookmark)
                 all_tags.update(bookmark.get("tags", []))
         
@@ -796,34 +1022,17 @@ class ContentManager:
         # Get all published content
         all_content = []
         
-        # Get content from each type
-        notes_result = ContentManager.get_content("notes")
-        notes = notes_result["content"] if isinstance(notes_result, dict) else notes_result
-        
-        how_tos_result = ContentManager.get_content("how_to")
-        how_tos = how_tos_result["content"] if isinstance(how_tos_result, dict) else how_tos_result
-        
-        til_result = ContentManager.get_til_posts(page=1, per_page=9999)
-        tils = til_result["tils"]
+        # Notes, how-tos and TILs, newest first
+        for item in ContentManager.iter_content():
+            if item["content_type"] == "til":
+                # TILs carry their tags and status at the top level
+                metadata = item["metadata"]
+                item["tags"] = metadata.get("tags", [])
+                item["status"] = metadata.get("status", "Evergreen")
+            if item.get("status") != "draft":
+                all_content.append(item)
         
         bookmarks = ContentManager.get_bookmarks(limit=None)
-        
-        # Combine all content
-        for note in notes:
-            if note.get("status") != "draft":
-                note["content_type"] = "notes"
-                all_content.append(note)
-        
-        for how_to in how_tos:
-            if how_to.get("status") != "draft":
-                how_to["content_type"] = "how_to"
-                all_content.append(how_to)
-                
-        for til in tils:
-            if til.get("status") != "draft":
-                til["content_type"] = "til"
-                all_content.append(til)
-                
         for bookmark in bookmarks:
             if bookmark.get("status") != "draft":
                 bookmark["content_type"] = "bookmarks"
@@ -838,12 +1047,11 @@ class ContentManager:
             'random_quote': None
         }
         
-        # Get recent posts (all content sorted by date)
-        recent_posts = sorted(
-            [item for item in all_content if item.get('status') != 'draft' and item.get('content_type') in ['notes', 'how_to', 'til']],
-            key=lambda x: x.get('created', ''),
-            reverse=True
-        )[:10]  # Get 10 most recent posts
+        # Get recent posts; the stream above is already newest first
+        recent_posts = [
+            item for item in all_content
+            if item.get('content_type') in ['notes', 'how_to', 'til']
+        ][:10]  # Get 10 most recent posts
         
         # Add slug field (mapping from name) for template compatibility
         for post in recent_posts:
@@ -7,8 +7,9 @@ through content by accumulating a path of notes.
 from fastapi import Request, HTTPException, Query, Depends
 from fastapi.responses import HTMLResponse
 from typing import Optional
-from app.interfaces import IContentProvider, IPathNavigationService
-from app.services.dependencies import get_content_service, get_path_navigation_service
+from app.interfaces import IPathNavigationService
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service, get_path_navigation_service
 
 
 async def explore_route(
@@ -18,7 +19,7 @@ async def explore_route(
     path: Optional[str] = Query(
         None, max_length=500, description="Comma-separated content slugs"
     ),
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     path_navigation_service: IPathNavigationService = Depends(
         get_path_navigation_service
     ),
@@ -74,7 +75,9 @@ async def explore_route(
         )
 
     # Validate the exploration path
-    validation_result = path_navigation_service.validate_exploration_path(path)
+    validation_result = await content_service.run(
+        path_navigation_service.validate_exploration_path, path
+    )
 
     # Check for circular references
     if len(path_slugs) > 1:
@@ -92,18 +95,13 @@ async def explore_route(
             detail=f"Invalid path: {'; '.join(validation_result.errors)}",
         )
 
-    # Fetch content for valid slugs
-    content_items = []
-    for slug in validation_result.valid_slugs:
-        # Try to fetch from different content types
-        content = None
-        for content_type in ["notes", "til", "bookmarks"]:
-            content = content_service.get_content_by_slug(content_type, slug)
-            if content:
-                break
-
-        if content:
-            content_items.append(content)
+    # Fetch content for valid slugs with one batch lookup
+    found = await content_service.get_contents_by_slugs(
+        validation_result.valid_slugs, ["notes", "til", "bookmarks"]
+    )
+    content_items = [
+        found[slug] for slug in validation_result.valid_slugs if found.get(slug)
+    ]
 
     # Get the current content (last item in path)
     current_content = content_items[-1] if content_items else None
@@ -4,9 +4,16 @@ These interfaces define contracts for dependency injection and testability.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from app.services.content_snapshot import ContentSnapshot
+
+
+# Content types probed, in order, when a slug's type is not known
+SLUG_LOOKUP_ORDER = ("notes", "til", "how_to", "bookmarks", "pages")
+
 
 @dataclass
 class PathValidationResult:
@@ -25,6 +32,39 @@ class CircularReferenceResult:
     cycle_slug: Optional[str] = None
 
 
+def probe_slugs(
+    provider: Any,
+    slugs: Sequence[str],
+    content_types: Optional[Sequence[str]] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Resolve slugs by probing ``provider.get_content_by_slug`` type by type.
+
+    Works with any object offering get_content_by_slug, so duck-typed
+    providers can be resolved the same way as IContentProvider ones.
+
+    Args:
+        provider: Object with a get_content_by_slug(content_type, slug) method
+        slugs: Slugs to resolve
+        content_types: Acceptable types in order of preference
+            (SLUG_LOOKUP_ORDER when omitted)
+
+    Returns:
+        Dictionary mapping each slug to its content, or None if not found
+    """
+    types = SLUG_LOOKUP_ORDER if content_types is None else content_types
+    found: Dict[str, Optional[Dict[str, Any]]] = {}
+    for slug in slugs:
+        if slug in found:
+            continue
+        content = None
+        for content_type in types:
+            content = provider.get_content_by_slug(content_type, slug)
+            if content:
+                break
+        found[slug] = content or None
+    return found
+
+
 class IContentProvider(ABC):
     """Abstract interface for content management operations."""
 
@@ -43,6 +83,26 @@ class IContentProvider(ABC):
         """
         pass
 
+    def get_contents_by_slugs(
+        self,
+        slugs: Sequence[str],
+        content_types: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several slugs of unknown content type at once.
+
+        The default implementation probes get_content_by_slug for each type
+        in turn; providers with a slug index should override it.
+
+        Args:
+            slugs: Slugs to resolve
+            content_types: Acceptable types in order of preference
+                (SLUG_LOOKUP_ORDER when omitted)
+
+        Returns:
+            Dictionary mapping each slug to its content, or None if not found
+        """
+        return probe_slugs(self, slugs, content_types)
+
     @abstractmethod
     def get_all_content(self) -> List[Dict[str, Any]]:
         """Get all content across all types.
@@ -52,6 +112,36 @@ class IContentProvider(ABC):
         """
         pass
 
+    def iter_content(
+        self,
+        content_types: Optional[Sequence[str]] = None,
+        order: str = "desc",
+        filters: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield content in creation date order, one item at a time.
+
+        Callers that need the first few items should take them from this
+        iterator (e.g. with itertools.islice) instead of requesting a huge
+        page. The default implementation sorts get_all_content(); providers
+        with a sorted index should override it so that only the items
+        actually consumed are touched.
+
+        Args:
+            content_types: Content types to include (all when omitted)
+            order: 'desc' for newest first, 'asc' for oldest first
+            filters: Optional predicate an item must satisfy
+
+        Yields:
+            Content items
+        """
+        items = [
+            item for item in self.get_all_content()
+            if (content_types is None or item.get("content_type") in content_types)
+            and (filters is None or filters(item))
+        ]
+        items.sort(key=lambda item: str(item.get("created") or ""), reverse=order == "desc")
+        yield from items
+
     @abstractmethod
     def get_content_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """Get content filtered by tag.
@@ -108,13 +198,15 @@ class IContentProvider(ABC):
 
     @abstractmethod
     async def get_mixed_content(
-        self, page: int = 1, per_page: int = 10
+        self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get paginated mixed content sorted by date.
 
         Args:
             page: Page number (1-indexed)
             per_page: Number of items per page
+            cursor: Optional opaque cursor returned as 'next_cursor' by a
+                previous page; takes precedence over page
 
         Returns:
             Dictionary with paginated content and navigation info
@@ -131,12 +223,16 @@ class IContentProvider(ABC):
         pass
 
     @abstractmethod
-    def get_til_posts(self, page: int = 1, per_page: int = 30) -> Dict[str, Any]:
+    def get_til_posts(
+        self, page: int = 1, per_page: int = 30, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get paginated TIL posts.
 
         Args:
             page: Page number (1-indexed)
             per_page: Number of items per page
+            cursor: Optional opaque cursor returned as 'next_cursor' by a
+                previous page; takes precedence over page
 
         Returns:
             Dictionary with TIL posts and pagination info
@@ -227,9 +323,15 @@ class IBacklinkService(ABC):
         pass
 
     @abstractmethod
-    def build_link_graph(self) -> Dict[str, List[str]]:
+    def build_link_graph(
+        self, snapshot: Optional["ContentSnapshot"] = None
+    ) -> Dict[str, List[str]]:
         """Build complete link graph for all content.
 
+        Args:
+            snapshot: Content snapshot to build the graph of (the current
+                content when omitted)
+
         Returns:
             Dict mapping source slugs to lists of target slugs
         """
@@ -13,12 +13,14 @@ import traceback
 from datetime import datetime
 from typing import Dict, Any, TypeVar, Callable, Awaitable
 from functools import wraps
+from itertools import islice
 from email.utils import format_datetime
 import logfire
 
 from .config import CONTENT_DIR, TEMPLATE_DIR, STATIC_DIR, SITE_URL
 from .logging_config import setup_logging, LogConfig
 from .middleware.logging_middleware import LoggingMiddleware
+from .services.async_content_provider import AsyncContentProvider, shutdown_io_executor
 from .services.dependencies import get_content_service, get_growth_stage_renderer
 from .routers import til, bookmarks, tags, garden, pages, api, content, feeds, explore
 from .content_manager import ContentManager
@@ -34,8 +36,9 @@ http_client = httpx.AsyncClient(
 async def lifespan(app: FastAPI):
     # Startup: nothing to do here
     yield
-    # Shutdown: close the HTTP client
+    # Shutdown: close the HTTP client and the content I/O threads
     await http_client.aclose()
+    shutdown_io_executor()
 
 # Set up logging
 setup_logging(LogConfig(
@@ -60,15 +63,13 @@ async def not_found_handler(request: Request, exc: HTTPException):
     
     # Get some recent content for the 404 page
     try:
-        content_service = get_content_service()
-        all_content = content_service.get_all_content()
+        content_service = AsyncContentProvider(get_content_service())
+        all_content = await content_service.get_all_content()
         recent_content = sorted(all_content, key=lambda x: x.get("updated", x.get("created", "")), reverse=True)[:5]
         
         # Add growth symbols if available
         growth_renderer = get_growth_stage_renderer()
-        for item in recent_content:
-            growth_stage = item.get("growth_stage", "seedling")
-            item["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
+        recent_content = [growth_renderer.decorate(item) for item in recent_content]
     except Exception:
         recent_content = []
     
@@ -239,42 +240,8 @@ class timed_lru_cache:
         return wrapped
 
 def generate_rss_feed():
-    # Get all content
-    notes_result = ContentManager.get_content("notes")
-    notes = notes_result["content"] if isinstance(notes_result, dict) else notes_result
-    
-    how_tos_result = ContentManager.get_content("how_to")
-    how_tos = how_tos_result["content"] if isinstance(how_tos_result, dict) else how_tos_result
-    
-    til_result = ContentManager.get_til_posts(page=1, per_page=9999)
-    tils = til_result["tils"]
-
-    # Combine all content
-    all_content = []
-    all_content.extend([(item, "notes") for item in notes])
-    all_content.extend([(item, "how_to") for item in how_tos])
-    all_content.extend([(item, "til") for item in tils])
-
-    def get_created_date(x):
-        item = x[0]
-        if isinstance(item, dict):
-            date_val = None
-            if "created" in item:
-                date_val = item.get("created", "")
-            elif "metadata" in item and isinstance(item["metadata"], dict):
-                date_val = item["metadata"].get("created", "")
-            
-            # Convert string dates to datetime for consistent comparison
-            if isinstance(date_val, str) and date_val:
-                try:
-                    return datetime.strptime(date_val, "%Y-%m-%d")
-                except ValueError:
-                    return datetime.min
-            elif isinstance(date_val, datetime):
-                return date_val
-        return datetime.min
-
-    all_content.sort(key=get_created_date, reverse=True)
+    # The 20 newest notes, how-tos and TILs; only those files are rendered
+    all_content = islice(ContentManager.iter_content(["notes", "how_to", "til"]), 20)
 
     # Generate RSS XML
     rss = '<?xml version="1.0" encoding="UTF-8" ?>\n'
@@ -289,7 +256,8 @@ def generate_rss_feed():
     rss += '<webMaster>joshua.oliphant@gmail.com (Joshua Oliphant)</webMaster>\n'
     rss += f'<atom:link href="{SITE_URL}/feed.xml" rel="self" type="application/rss+xml" />\n'
 
-    for item, content_type in all_content:
+    for item in all_content:
+        content_type = item["content_type"]
         rss += "<item>\n"
         rss += f'<title>{item["title"]}</title>\n'
         rss += f'<link>{SITE_URL}/{content_type}/{item["name"]}</link>\n'
@@ -299,26 +267,13 @@ def generate_rss_feed():
         if "excerpt" in item:
             rss += f'<description><![CDATA[{item["excerpt"]}]]></description>\n'
 
-        # Handle different date structures
-        created_date = None
-        if content_type in ["notes", "how_to"]:
-            if "created" in item.get("metadata", {}):
-                created_date = item["metadata"]["created"]
-        else:  # TiL
-            if "created" in item:
-                created_date = item["created"]
-
+        created_date = item["metadata"].get("created")
         if created_date:
             date = datetime.strptime(created_date, "%Y-%m-%d")
             rss += f"<pubDate>{format_datetime(date)}</pubDate>\n"
 
         # Add categories/tags
-        if content_type in ["notes", "how_to"]:
-            tags = item.get("metadata", {}).get("tags", [])
-        else:  # TiL
-            tags = item.get("tags", [])
-
-        for tag in tags:
+        for tag in item["metadata"].get("tags", []):
             rss += f"<category>{tag}</category>\n"
 
         rss += f'<guid>{SITE_URL}/{content_type}/{item["name"]}</guid>\n'
@@ -354,64 +309,35 @@ def generate_sitemap() -> str:
         sitemap += "    <priority>0.8</priority>\n"
         sitemap += "  </url>\n"
 
-    # Add notes
-    notes_result = ContentManager.get_content("notes")
-    notes = notes_result["content"] if isinstance(notes_result, dict) else notes_result
-    for note in notes:
-        metadata = note.get("metadata", {})
-        # Only include content with appropriate status
-        if metadata.get("status") in ["Evergreen", "Budding"]:
-            sitemap += "  <url>\n"
-            sitemap += f'    <loc>{base_url}/notes/{note["name"]}</loc>\n'
-            if metadata.get("updated"):
-                sitemap += f'    <lastmod>{metadata["updated"]}</lastmod>\n'
-            elif metadata.get("created"):
-                sitemap += f'    <lastmod>{metadata["created"]}</lastmod>\n'
-            sitemap += "    <changefreq>monthly</changefreq>\n"
-            sitemap += "    <priority>0.6</priority>\n"
-            sitemap += "  </url>\n"
-
-    # Add how-tos
-    how_tos_result = ContentManager.get_content("how_to")
-    how_tos = how_tos_result["content"] if isinstance(how_tos_result, dict) else how_tos_result
-    for how_to in how_tos:
-        metadata = how_to.get("metadata", {})
-        # Only include content with appropriate status
-        if metadata.get("status") in ["Evergreen", "Budding"]:
-            sitemap += "  <url>\n"
-            sitemap += f'    <loc>{base_url}/how_to/{how_to["name"]}</loc>\n'
-            if metadata.get("updated"):
-                sitemap += f'    <lastmod>{metadata["updated"]}</lastmod>\n'
-            elif metadata.get("created"):
-                sitemap += f'    <lastmod>{metadata["created"]}</lastmod>\n'
-            sitemap += "    <changefreq>monthly</changefreq>\n"
-            sitemap += "    <priority>0.6</priority>\n"
-            sitemap += "  </url>\n"
-
-    # Add TIL posts
-    til_result = ContentManager.get_til_posts(page=1, per_page=9999)
-    for til in til_result["tils"]:
-        # Only include content with appropriate status
-        if til.get("status") in ["Evergreen", "Budding"]:
-            sitemap += "  <url>\n"
-            sitemap += f'    <loc>{base_url}/til/{til["name"]}</loc>\n'
-            if til.get("updated"):
-                sitemap += f'    <lastmod>{til["updated"]}</lastmod>\n'
-            elif til.get("created"):
-                sitemap += f'    <lastmod>{til["created"]}</lastmod>\n'
-            sitemap += "    <changefreq>monthly</changefreq>\n"
-            sitemap += "    <priority>0.6</priority>\n"
-            sitemap += "  </url>\n"
-
-    # Add bookmarks
-    bookmarks = ContentManager.get_bookmarks()
+    # Only front matter is needed, so bodies are never rendered
+    for content_type in ("notes", "how_to", "til"):
+        for item in ContentManager.get_content_metadata(content_type):
+            metadata = item["metadata"]
+            # Only include content with appropriate status
+            if metadata.get("status") in ["Evergreen", "Budding"]:
+                sitemap += "  <url>\n"
+                sitemap += f'    <loc>{base_url}/{content_type}/{item["name"]}</loc>\n'
+                if metadata.get("updated"):
+                    sitemap += f'    <lastmod>{metadata["updated"]}</lastmod>\n'
+                elif metadata.get("created"):
+                    sitemap += f'    <lastmod>{metadata["created"]}</lastmod>\n'
+                sitemap += "    <changefreq>monthly</changefreq>\n"
+                sitemap += "    <priority>0.6</priority>\n"
+                sitemap += "  </url>\n"
+
+    # Add the most recent bookmarks
+    bookmarks = [
+        item for item in ContentManager.get_content_metadata("bookmarks")
+        if not item["errors"]
+    ][:10]
     for bookmark in bookmarks:
+        metadata = bookmark["metadata"]
         sitemap += "  <url>\n"
         sitemap += f'    <loc>{base_url}/bookmarks/{bookmark["name"]}</loc>\n'
-        if bookmark.get("updated"):
-            sitemap += f'    <lastmod>{bookmark["updated"]}</lastmod>\n'
-        elif bookmark.get("created"):
-            sitemap += f'    <lastmod>{bookmark["created"]}</lastmod>\n'
+        if metadata.get("updated"):
+            sitemap += f'    <lastmod>{metadata["updated"]}</lastmod>\n'
+        elif metadata.get("created"):
+            sitemap += f'    <lastmod>{metadata["created"]}</lastmod>\n'
         sitemap += "    <changefreq>monthly</changefreq>\n"
         sitemap += "    <priority>0.4</priority>\n"  # Lower priority for bookmarks
         sitemap += "  </url>\n"
@@ -1,12 +1,14 @@
 """API routes with service injection."""
 
 from fastapi import APIRouter, Request, Depends, HTTPException, Query
-from fastapi.responses import HTMLResponse, JSONResponse
-from app.interfaces import IContentProvider
-from app.services.dependencies import get_content_service
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service, get_graph_analytics_service
+from app.services.graph_analytics import METRICS, GraphAnalyticsService
+from app.services.path_navigation_service import MAX_PATH_LENGTH
 from jinja2 import Environment, FileSystemLoader
 from app.config import get_feature_flags
-from typing import Optional, List
+from typing import Any, List, Mapping, Optional
 import logfire
 
 env = Environment(loader=FileSystemLoader("app/templates"))
@@ -16,10 +18,10 @@ router = APIRouter(prefix="/api")
 @router.get("/content-slugs")
 async def get_content_slugs(
     content_type: Optional[str] = Query(None, description="Filter by content type: notes, til, bookmarks"),
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Return content slugs for terminal autocomplete."""
-    all_content = content_service.get_all_content()
+    all_content = await content_service.get_all_content()
 
     result = {}
     for item in all_content:
@@ -38,10 +40,118 @@ async def get_content_slugs(
     return JSONResponse(content=result)
 
 
+@router.get("/content-metrics")
+async def get_content_metrics(
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
+):
+    """Return snapshot age and rebuild timings for the content cache."""
+    get_metrics = getattr(content_service.provider, "get_snapshot_metrics", None)
+    if get_metrics is None:
+        raise HTTPException(status_code=404, detail="Content metrics not available")
+    return JSONResponse(content=get_metrics())
+
+
+@router.get("/graph/analytics")
+async def get_graph_analytics(
+    metric: str = Query("pagerank", description="One of: " + ", ".join(METRICS)),
+    limit: int = Query(20, ge=1, le=100, description="Number of results"),
+    content_type: Optional[str] = Query(None, description="Filter by content type"),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service),
+):
+    """Return the most central content by a link-graph measure."""
+    if metric not in METRICS:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown metric; use one of: {', '.join(METRICS)}"
+        )
+
+    content_types = [content_type] if content_type else None
+    top = await content_service.run(graph_service.top, limit, metric, content_types)
+    analytics = await content_service.run(graph_service.get_analytics)
+
+    results = []
+    for entry in top:
+        item = entry.pop("item")
+        results.append({
+            "slug": item.get("slug", ""),
+            "title": item.get("title", ""),
+            "content_type": item.get("content_type", ""),
+            **entry,
+        })
+
+    return JSONResponse(content={
+        "metric": metric,
+        "version": analytics.version,
+        "nodes": len(analytics.graph),
+        "edges": analytics.graph.edge_count,
+        "results": results,
+    })
+
+
+@router.get("/graph/analytics/{slug}")
+async def get_graph_node_analytics(
+    slug: str,
+    betweenness: bool = Query(
+        False, description="Include approximate betweenness (expensive on first request)"
+    ),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service),
+):
+    """Return the link-graph measures of one document."""
+    analytics = await content_service.run(graph_service.get_analytics)
+    scores = analytics.scores(slug)
+    if scores is None:
+        raise HTTPException(status_code=404, detail=f"No content with slug {slug!r}")
+
+    result = {"slug": slug, "version": analytics.version, **scores}
+    if betweenness:
+        measures = await content_service.run(graph_service.get_betweenness)
+        result["betweenness"] = measures[analytics.graph.ids[slug]]
+    return JSONResponse(content=result)
+
+
+@router.get("/graph/path")
+async def get_graph_path(
+    source: str = Query(..., alias="from", description="Slug to start from"),
+    target: str = Query(..., alias="to", description="Slug to reach"),
+    k: int = Query(3, ge=1, le=10, description="Number of paths"),
+    max_depth: int = Query(
+        6, ge=1, le=MAX_PATH_LENGTH - 1, description="Maximum links per path"
+    ),
+    redirect: bool = Query(False, description="Redirect to the shortest path's explore page"),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service),
+):
+    """Return the shortest link paths between two documents."""
+    paths = await content_service.run(graph_service.find_paths, source, target, k, max_depth)
+    if paths is None:
+        raise HTTPException(
+            status_code=404, detail=f"No content with slug {source!r} or {target!r}"
+        )
+
+    results = [
+        {"slugs": path, "length": len(path) - 1, "explore_url": "/explore/" + ",".join(path)}
+        for path in paths
+    ]
+    if redirect:
+        if not results:
+            raise HTTPException(
+                status_code=404, detail=f"No path within {max_depth} links"
+            )
+        return RedirectResponse(url=results[0]["explore_url"], status_code=303)
+
+    return JSONResponse(content={
+        "from": source,
+        "to": target,
+        "max_depth": max_depth,
+        "paths": results,
+    })
+
+
 @router.post("/topics/filter", response_class=HTMLResponse)
 async def filter_topics_api(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """API endpoint for filtering topics."""
     # Get form data
@@ -50,7 +160,7 @@ async def filter_topics_api(
     min_count = int(form_data.get("min_count", 1))
     
     # Get filtered tags
-    tag_counts = content_service.get_tag_counts()
+    tag_counts = await content_service.get_tag_counts()
     
     # Apply filters
     filtered_tags = {
@@ -79,30 +189,33 @@ async def filter_topics_api(
 @router.get("/search")
 async def search_content(
     q: str = Query(..., min_length=1, description="Search query"),
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Search content by title and text."""
-    all_content = content_service.get_all_content()
+    all_content = await content_service.get_all_content()
     query_lower = q.lower()
 
     results = []
     for item in all_content:
         # Search in title
         title = item.get("title", "").lower()
-        # Search in markdown content
-        markdown = item.get("markdown", "").lower()
         # Search in tags
         tags = [t.lower() for t in item.get("tags", [])]
+        # Search in the text stored at ingest (loaded only when needed)
+        text = None
+        if not (query_lower in title or any(query_lower in tag for tag in tags)):
+            text = item.get("plain_text", "")
+            if query_lower not in text.lower():
+                continue
 
-        if query_lower in title or query_lower in markdown or any(query_lower in tag for tag in tags):
-            results.append({
-                "slug": item.get("slug", ""),
-                "title": item.get("title", ""),
-                "content_type": item.get("content_type", "notes"),
-                "created": str(item.get("created", "")),
-                "tags": item.get("tags", []),
-                "excerpt": _get_excerpt(item.get("markdown", ""), query_lower),
-            })
+        results.append({
+            "slug": item.get("slug", ""),
+            "title": item.get("title", ""),
+            "content_type": item.get("content_type", "notes"),
+            "created": str(item.get("created", "")),
+            "tags": item.get("tags", []),
+            "excerpt": _get_excerpt(item, query_lower, text),
+        })
 
     # Sort by relevance (title matches first, then by date)
     def relevance_key(item):
@@ -118,14 +231,16 @@ async def search_content(
     })
 
 
-def _get_excerpt(text: str, query: str, context_chars: int = 100) -> str:
-    """Extract an excerpt around the query match."""
-    text_lower = text.lower()
-    pos = text_lower.find(query)
+def _get_excerpt(
+    item: Mapping[str, Any], query: str, text: Optional[str] = None, context_chars: int = 100
+) -> str:
+    """Extract an excerpt around the query match in the document's text.
 
+    Documents that matched on their title or tags show their stored excerpt.
+    """
+    pos = text.lower().find(query) if text is not None else -1
     if pos == -1:
-        # No match in text, return start of text
-        return text[:context_chars * 2] + "..." if len(text) > context_chars * 2 else text
+        return item.get("excerpt", "")
 
     # Get context around the match
     start = max(0, pos - context_chars)
@@ -148,9 +263,14 @@ async def get_mixed_content_api(
     page: int = 1,
     per_page: int = 10,
     content_types: Optional[List[str]] = None,
-    content_service: IContentProvider = Depends(get_content_service),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
-    """Return paginated mixed content as an HTMLResponse."""
+    """Return paginated mixed content as an HTMLResponse.
+
+    Pages can be addressed by number or, for stable infinite scrolling while
+    content changes, by the opaque cursor of the previous page.
+    """
     with logfire.span("mixed_content_api", page=page, per_page=per_page):
         try:
             if page < 1:
@@ -168,7 +288,7 @@ async def get_mixed_content_api(
 
             with logfire.span("fetching_mixed_content"):
                 result = await content_service.get_mixed_content(
-                    page=page, per_page=per_page
+                    page=page, per_page=per_page, cursor=cursor
                 )
                 logfire.debug(
                     "mixed_content_result",
@@ -180,8 +300,9 @@ async def get_mixed_content_api(
             with logfire.span("rendering_template"):
                 template = env.get_template("partials/mixed_content_page.html")
                 html_content = template.render(
-                    mixed_content=result["content"],
+                    content=result["content"],
                     next_page=result.get("page") + 1 if result.get("has_next") else None,
+                    next_cursor=result.get("next_cursor"),
                     request=request,
                     feature_flags=get_feature_flags(),
                 )
@@ -2,8 +2,8 @@
 
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse
-from app.interfaces import IContentProvider
-from app.services.dependencies import get_content_service
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service
 from jinja2 import Environment, FileSystemLoader
 
 env = Environment(loader=FileSystemLoader("app/templates"))
@@ -15,7 +15,7 @@ router = APIRouter()
 @router.get("/bookmarks", response_class=HTMLResponse)
 async def read_bookmarks(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render the bookmarks page as an HTMLResponse."""
     template_name = (
@@ -24,7 +24,7 @@ async def read_bookmarks(
         else "bookmarks.html"
     )
 
-    bookmarks = content_service.get_bookmarks(limit=None)
+    bookmarks = await content_service.get_bookmarks(limit=None)
 
     return HTMLResponse(
         content=env.get_template(template_name).render(
@@ -38,7 +38,7 @@ async def read_bookmarks(
 @router.get("/stars", response_class=HTMLResponse)
 async def read_stars(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render GitHub stars page as an HTMLResponse."""
     template_name = (
@@ -48,7 +48,7 @@ async def read_stars(
     )
 
     # Get starred bookmarks (assuming this is in ContentService)
-    bookmarks = content_service.get_bookmarks(limit=None)
+    bookmarks = await content_service.get_bookmarks(limit=None)
     starred_bookmarks = [b for b in bookmarks if b.get("starred", False)]
 
     return HTMLResponse(
@@ -64,11 +64,11 @@ async def read_stars(
 async def read_stars_page(
     request: Request,
     page: int,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Return paginated GitHub stars as an HTMLResponse."""
     # Implementation depends on how pagination is handled in ContentService
-    bookmarks = content_service.get_bookmarks(limit=None)
+    bookmarks = await content_service.get_bookmarks(limit=None)
     starred_bookmarks = [b for b in bookmarks if b.get("starred", False)]
 
     # Simple pagination (this could be improved in ContentService)
@@ -7,13 +7,14 @@ from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import HTMLResponse
 from jinja2 import Environment, FileSystemLoader
 
+from app.services.async_content_provider import AsyncContentProvider
 from app.services.dependencies import (
-    get_content_service,
+    get_async_content_service,
     get_backlink_service,
     get_growth_stage_renderer,
 )
 from app.services.growth_stage_renderer import GrowthStageRenderer
-from app.interfaces import IContentProvider, IBacklinkService
+from app.interfaces import IBacklinkService
 # ContentManager is in main.py for now - will be refactored later
 
 # Initialize Jinja2 environment
@@ -27,19 +28,19 @@ async def read_content(
     request: Request,
     content_type: str,
     page_name: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     backlink_service: IBacklinkService = Depends(get_backlink_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
 ):
     """Render a page for ``content_type`` and ``page_name`` as ``HTMLResponse``."""
     try:
         # Use service injection instead of ContentManager
-        content_data = content_service.get_content_by_slug(content_type, page_name)
+        content_data = await content_service.get_content_by_slug(content_type, page_name)
         if not content_data:
             raise HTTPException(status_code=404, detail="Content not found")
 
         # Get backlinks for this content
-        backlinks = backlink_service.get_backlinks(page_name)
+        backlinks = await content_service.run(backlink_service.get_backlinks, page_name)
 
         # Get growth stage information
         growth_stage_str = content_data.get("growth_stage", "seedling")
@@ -60,8 +61,8 @@ async def read_content(
     template_name = "partials/content.html" if is_htmx else "individual_content.html"
 
     # Get recent content for the sidebar
-    recent_how_tos = content_service.get_content("how_to", limit=5)
-    recent_notes = content_service.get_content("notes", limit=5)
+    recent_how_tos = await content_service.get_content("how_to", limit=5)
+    recent_notes = await content_service.get_content("notes", limit=5)
     
     # Prepare template context
     context = {
@@ -9,15 +9,17 @@ from fastapi import APIRouter, Depends, Request, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 from jinja2 import Environment, FileSystemLoader
 
+from app.services.async_content_provider import AsyncContentProvider
 from app.services.dependencies import (
-    get_content_service,
+    get_async_content_service,
     get_path_navigation_service,
     get_backlink_service,
+    get_graph_analytics_service,
     get_growth_stage_renderer
 )
+from app.services.graph_analytics import GraphAnalyticsService
 from app.services.growth_stage_renderer import GrowthStageRenderer
 from app.interfaces import (
-    IContentProvider,
     IPathNavigationService,
     IBacklinkService
 )
@@ -31,21 +33,19 @@ router = APIRouter()
 @router.get("/explore", response_class=HTMLResponse)
 async def explore_landing(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
-    growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer)
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
+    growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service)
 ):
     """Render the explore landing page."""
     template = env.get_template("explore_landing.html")
     
-    # Get recent content for suggestions
-    all_content = content_service.get_all_content()
-    recent_notes = [c for c in all_content if c.get("content_type") == "notes"][:10]
+    # Suggest the best-connected notes as starting points (newest first on ties)
+    top = await content_service.run(graph_service.top, 10, "pagerank", ["notes"])
+    recent_notes = [entry["item"] for entry in top]
     
     # Add growth stage symbols
-    for note in recent_notes:
-        growth_stage = note.get("growth_stage", "seedling")
-        note["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-        note["growth_class"] = growth_renderer.get_css_class(growth_stage)
+    recent_notes = [growth_renderer.decorate(note) for note in recent_notes]
     
     return template.render(
         request=request,
@@ -56,11 +56,11 @@ async def explore_landing(
 
 @router.get("/wander")
 async def wander(
-    content_service: IContentProvider = Depends(get_content_service)
+    content_service: AsyncContentProvider = Depends(get_async_content_service)
 ):
     """Redirect to a random content page."""
     # Get all available content
-    all_content = content_service.get_all_content()
+    all_content = await content_service.get_all_content()
     
     # Filter out drafts and empty content
     valid_content = [
@@ -95,10 +95,11 @@ async def wander(
 async def explore_path(
     path: str,
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     path_service: IPathNavigationService = Depends(get_path_navigation_service),
     backlink_service: IBacklinkService = Depends(get_backlink_service),
-    growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer)
+    growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service)
 ):
     """Handle exploration path navigation."""
     # Parse the path (comma-separated slugs)
@@ -106,32 +107,29 @@ async def explore_path(
     
     if not slugs:
         # Redirect to explore landing
-        return await explore_landing(request, content_service, growth_renderer)
+        return await explore_landing(request, content_service, growth_renderer, graph_service)
     
     # Validate the path
-    is_valid, error_message = path_service.validate_exploration_path(",".join(slugs))
+    validation = await content_service.run(
+        path_service.validate_exploration_path, ",".join(slugs)
+    )
     
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=error_message)
+    if not validation.success:
+        raise HTTPException(status_code=400, detail="; ".join(validation.errors))
     
-    # Get content for each slug in the path
+    # Get content for every slug in the path with one batch lookup
+    found = await content_service.get_contents_by_slugs(
+        slugs, ["notes", "til", "how_to", "pages"]
+    )
     path_content = []
     for slug in slugs:
-        # Try different content types
-        content = None
-        for content_type in ["notes", "til", "how_to", "pages"]:
-            content = content_service.get_content_by_slug(content_type, slug)
-            if content:
-                break
-        
+        content = found.get(slug)
         if content:
             # Add growth stage rendering
-            growth_stage = content.get("growth_stage", "seedling")
-            content["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-            content["growth_class"] = growth_renderer.get_css_class(growth_stage)
+            content = growth_renderer.decorate(content)
             
             # Get backlinks
-            backlinks = backlink_service.get_backlinks(slug)
+            backlinks = await content_service.run(backlink_service.get_backlinks, slug)
             content["backlinks"] = backlinks
             
             path_content.append(content)
@@ -142,15 +140,10 @@ async def explore_path(
     # Get suggestions for next steps
     suggestions = []
     if current_note:
-        # Get forward links from the current note
-        forward_links = backlink_service.get_forward_links(current_note.get("slug", ""))
-        
-        # Filter out notes already in the path
-        path_slugs = set(slugs)
-        suggestions = [
-            link for link in forward_links
-            if link.get("slug") not in path_slugs
-        ][:5]  # Limit to 5 suggestions
+        # Precomputed neighbours of the current note, minus the path so far
+        suggestions = await content_service.run(
+            graph_service.suggest, current_note.get("slug", ""), slugs, 5
+        )
     
     # Determine if this is an HTMX request
     is_htmx = request.headers.get("HX-Request") == "true"
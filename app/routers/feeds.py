@@ -9,7 +9,7 @@ from typing import Optional
 
 from app.services.dependencies import get_content_service
 from app.interfaces import IContentProvider
-from app.utils.feed_generator import generate_rss_feed, generate_sitemap
+from app.utils.feed_generator import render_rss_feed, render_sitemap
 
 router = APIRouter()
 
@@ -28,7 +28,7 @@ async def rss_feed(
     - growing: Maturing concepts 
     - evergreen: Polished, stable content
     """
-    rss_content = generate_rss_feed(content_service, growth_stage=growth_stage)
+    rss_content = await render_rss_feed(content_service, growth_stage=growth_stage)
     return Response(content=rss_content, media_type="application/xml")
 
 
@@ -37,7 +37,7 @@ async def sitemap(
     content_service: IContentProvider = Depends(get_content_service)
 ):
     """Serve the XML sitemap as an XML ``Response``."""
-    sitemap_content = generate_sitemap(content_service)
+    sitemap_content = await render_sitemap(content_service)
     return Response(content=sitemap_content, media_type="application/xml")
 
 
@@ -2,8 +2,9 @@
 
 from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
-from app.interfaces import IContentProvider, IPathNavigationService
-from app.services.dependencies import get_content_service, get_path_navigation_service
+from app.interfaces import IPathNavigationService
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service, get_path_navigation_service
 from app.services.growth_stage_renderer import GrowthStageRenderer
 from app.services.dependencies import get_growth_stage_renderer
 from jinja2 import Environment, FileSystemLoader
@@ -17,7 +18,7 @@ router = APIRouter()
 @router.get("/garden", response_class=HTMLResponse)
 async def garden_view(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
 ):
     """Render the garden view page."""
@@ -28,30 +29,20 @@ async def garden_view(
     )
     
     # Get all content for garden visualization
-    result = content_service.get_all_garden_content()
+    result = await content_service.get_all_garden_content()
     
     # Add growth symbols to each content item using the service
-    from app.models import GrowthStage
-    for item in result["content"]:
-        growth_stage_str = item.get("growth_stage", "seedling")
-        try:
-            growth_stage = GrowthStage(growth_stage_str.lower())
-            item["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-            item["growth_css_class"] = growth_renderer.render_stage_css_class(growth_stage)
-        except (ValueError, KeyError):
-            # Fallback to seedling if invalid stage
-            item["growth_symbol"] = growth_renderer.render_stage_symbol(GrowthStage.SEEDLING)
-            item["growth_css_class"] = growth_renderer.render_stage_css_class(GrowthStage.SEEDLING)
+    content = [growth_renderer.decorate(item) for item in result["content"]]
     
     # Get all tags from content
     all_tags = set()
-    for item in result["content"]:
+    for item in content:
         if item.get("tags"):
             all_tags.update(item["tags"])
     
     # Create garden_data object expected by template
     garden_data = {
-        "content": result["content"],
+        "content": content,
         "by_stage": result["by_stage"],
         "total_count": result["total"],
         "tags": sorted(list(all_tags)),
@@ -70,7 +61,7 @@ async def garden_view(
 @router.get("/garden-paths", response_class=HTMLResponse)
 async def garden_paths(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render the garden paths overview page."""
     template_name = (
@@ -96,7 +87,7 @@ async def garden_paths(
 async def garden_path_detail(
     request: Request,
     path_name: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     path_service: IPathNavigationService = Depends(get_path_navigation_service),
 ):
     """Render a specific garden path."""
@@ -123,7 +114,7 @@ async def garden_path_detail(
 @router.get("/api/garden-path/{path_name}/progress")
 async def garden_path_progress(
     path_name: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Get progress for a garden path."""
     # This would calculate actual progress
@@ -142,11 +133,11 @@ async def garden_path_progress(
 async def garden_bed_items(
     request: Request,
     topic: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Get items for a specific garden bed (topic)."""
     # Get content by tag/topic
-    result = content_service.get_posts_by_tag(topic)
+    result = await content_service.get_posts_by_tag(topic)
     
     return HTMLResponse(
         content=env.get_template("partials/garden_bed_items.html").render(
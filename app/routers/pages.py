@@ -2,8 +2,13 @@
 
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
-from app.interfaces import IContentProvider
-from app.services.dependencies import get_content_service, get_growth_stage_renderer
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import (
+    get_async_content_service,
+    get_graph_analytics_service,
+    get_growth_stage_renderer,
+)
+from app.services.graph_analytics import GraphAnalyticsService
 from app.services.growth_stage_renderer import GrowthStageRenderer
 from jinja2 import Environment, FileSystemLoader
 from app.config import get_feature_flags
@@ -11,35 +16,41 @@ from app.config import get_feature_flags
 env = Environment(loader=FileSystemLoader("app/templates"))
 router = APIRouter()
 
+# Homepage featured section: top PageRank content of these types
+FEATURED_COUNT = 3
+FEATURED_TYPES = ["notes", "how_to", "til"]
+
 
 @router.get("/", response_class=HTMLResponse)
 async def read_home(
     request: Request,
     page: int = 1,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
+    graph_service: GraphAnalyticsService = Depends(get_graph_analytics_service),
 ):
     """Render the home page with pagination."""
     # Get paginated mixed content (10 posts per page)
     result = await content_service.get_mixed_content(page=page, per_page=10)
     
     # Add growth symbols to each post using the service
-    from app.models import GrowthStage
-    for post in result.get("content", []):
-        growth_stage_str = post.get("growth_stage", "seedling")
-        try:
-            growth_stage = GrowthStage(growth_stage_str.lower())
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(growth_stage)
-        except (ValueError, KeyError):
-            # Fallback to seedling if invalid stage
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(GrowthStage.SEEDLING)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(GrowthStage.SEEDLING)
+    recent_posts = [growth_renderer.decorate(post) for post in result.get("content", [])]
+    
+    # Feature the notes the rest of the garden links to most (first page only)
+    featured = []
+    if page == 1:
+        top = await content_service.run(
+            graph_service.top, FEATURED_COUNT, "pagerank", FEATURED_TYPES
+        )
+        featured = [
+            growth_renderer.decorate(entry["item"]) for entry in top if entry["in_degree"]
+        ]
     
     return HTMLResponse(
         content=env.get_template("index.html").render(
             request=request,
-            recent_posts=result.get("content", []),
+            recent_posts=recent_posts,
+            featured=featured,
             pagination=result,
             feature_flags=get_feature_flags(),
         )
@@ -49,7 +60,7 @@ async def read_home(
 @router.get("/now", response_class=HTMLResponse)
 async def read_now(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render the /now page."""
     template_name = (
@@ -59,7 +70,7 @@ async def read_now(
     )
     
     # Get the now page content
-    now_content = content_service.get_content_by_slug("pages", "now")
+    now_content = await content_service.get_content_by_slug("pages", "now")
     
     return HTMLResponse(
         content=env.get_template(template_name).render(
@@ -73,7 +84,7 @@ async def read_now(
 @router.get("/projects", response_class=HTMLResponse)
 async def read_projects(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render the projects page."""
     template_name = (
@@ -83,7 +94,7 @@ async def read_projects(
     )
     
     # Get projects content
-    projects_content = content_service.get_content_by_slug("pages", "projects")
+    projects_content = await content_service.get_content_by_slug("pages", "projects")
     
     return HTMLResponse(
         content=env.get_template(template_name).render(
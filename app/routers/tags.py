@@ -2,8 +2,8 @@
 
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse
-from app.interfaces import IContentProvider
-from app.services.dependencies import get_content_service, get_growth_stage_renderer
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service, get_growth_stage_renderer
 from app.services.growth_stage_renderer import GrowthStageRenderer
 from jinja2 import Environment, FileSystemLoader
 
@@ -17,7 +17,7 @@ router = APIRouter()
 async def read_tag(
     request: Request,
     tag: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
 ):
     """Return posts filtered by tag as an HTMLResponse."""
@@ -28,22 +28,12 @@ async def read_tag(
     )
 
     # Get posts by tag across all content types
-    posts_result = content_service.get_posts_by_tag(tag)
+    posts_result = await content_service.get_posts_by_tag(tag)
     posts = posts_result.get("posts", [])
     total = posts_result.get("total", 0)
     
     # Add growth symbols to each post using the service
-    from app.models import GrowthStage
-    for post in posts:
-        growth_stage_str = post.get("growth_stage", "seedling")
-        try:
-            growth_stage = GrowthStage(growth_stage_str.lower())
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(growth_stage)
-        except (ValueError, KeyError):
-            # Fallback to seedling if invalid stage
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(GrowthStage.SEEDLING)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(GrowthStage.SEEDLING)
+    posts = [growth_renderer.decorate(post) for post in posts]
 
     # Calculate related tags based on co-occurrence
     related_tags = {}
@@ -77,7 +67,7 @@ async def read_tag(
 @router.get("/topics", response_class=HTMLResponse)
 async def read_topics(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
 ):
     """Render the topics/tags overview page as an HTMLResponse."""
@@ -88,8 +78,8 @@ async def read_topics(
     )
 
     # Get all content and tag counts
-    all_content = content_service.get_all_content()
-    tag_counts = content_service.get_tag_counts()
+    all_content = await content_service.get_all_content()
+    tag_counts = await content_service.get_tag_counts()
     
     # Build topics data structure organized by category with icons and colors
     category_config = {
@@ -210,7 +200,7 @@ async def read_topics(
 @router.post("/topics/filter", response_class=HTMLResponse)
 async def filter_topics_post(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
     growth_renderer: GrowthStageRenderer = Depends(get_growth_stage_renderer),
 ):
     """Handle POST request for filtering topics."""
@@ -237,7 +227,7 @@ async def filter_topics_post(
         )
     
     # Get posts that have ALL selected tags (intersection)
-    all_content = content_service.get_all_content()
+    all_content = await content_service.get_all_content()
     filtered_posts = []
     
     for post in all_content:
@@ -247,17 +237,7 @@ async def filter_topics_post(
             filtered_posts.append(post)
     
     # Add growth symbols to filtered posts using the service
-    from app.models import GrowthStage
-    for post in filtered_posts:
-        growth_stage_str = post.get("growth_stage", "seedling")
-        try:
-            growth_stage = GrowthStage(growth_stage_str.lower())
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(growth_stage)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(growth_stage)
-        except (ValueError, KeyError):
-            # Fallback to seedling if invalid stage
-            post["growth_symbol"] = growth_renderer.render_stage_symbol(GrowthStage.SEEDLING)
-            post["growth_css_class"] = growth_renderer.render_stage_css_class(GrowthStage.SEEDLING)
+    filtered_posts = [growth_renderer.decorate(post) for post in filtered_posts]
     
     return HTMLResponse(
         content=env.get_template("partials/topics_filtered.html").render(
@@ -275,7 +255,7 @@ async def filter_topics_get(
     request: Request,
     content_type: str = None,
     min_count: int = 1,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Handle GET request for filtering topics with query parameters."""
     template_name = (
@@ -285,7 +265,7 @@ async def filter_topics_get(
     )
 
     # Get all tag counts
-    tag_counts = content_service.get_tag_counts()
+    tag_counts = await content_service.get_tag_counts()
 
     # Apply filters
     filtered_tags = {
@@ -1,9 +1,10 @@
 """TIL (Today I Learned) routes with service injection."""
 
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, HTTPException, Query
 from fastapi.responses import HTMLResponse
-from app.interfaces import IContentProvider
-from app.services.dependencies import get_content_service
+from typing import Optional
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service
 from jinja2 import Environment, FileSystemLoader
 
 env = Environment(loader=FileSystemLoader("app/templates"))
@@ -15,7 +16,7 @@ router = APIRouter()
 @router.get("/til", response_class=HTMLResponse)
 async def read_til(
     request: Request,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Render the TIL index page as an HTMLResponse."""
     template_name = (
@@ -23,7 +24,9 @@ async def read_til(
         if request.headers.get("HX-Request") == "true"
         else "til.html"
     )
-    result = content_service.get_til_posts(page=1)
+    result = await content_service.get_til_posts(page=1)
+    recent_how_tos = await content_service.get_content("how_to", limit=5)
+    recent_notes = await content_service.get_content("notes", limit=5)
     
     # Get tags from TIL content with counts
     til_tags = {}
@@ -38,8 +41,8 @@ async def read_til(
             tils=result["posts"],
             til_tags=til_tags,
             next_page=result.get("total_pages", 1) > result.get("page", 1),
-            recent_how_tos=content_service.get_content("how_to", limit=5)["content"],
-            recent_notes=content_service.get_content("notes", limit=5)["content"],
+            recent_how_tos=recent_how_tos["content"],
+            recent_notes=recent_notes["content"],
             feature_flags=get_feature_flags(),
         )
     )
@@ -49,7 +52,7 @@ async def read_til(
 async def read_til_tag(
     request: Request,
     tag: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Return TIL posts filtered by tag as an HTMLResponse."""
     template_name = (
@@ -57,10 +60,10 @@ async def read_til_tag(
         if request.headers.get("HX-Request") == "true"
         else "til.html"
     )
-    tils = content_service.get_til_posts_by_tag(tag)
+    tils = await content_service.get_til_posts_by_tag(tag)
 
     # Get all tags for the sidebar
-    all_tils = content_service.get_til_posts(page=1)
+    all_tils = await content_service.get_til_posts(page=1)
 
     return HTMLResponse(
         content=env.get_template(template_name).render(
@@ -77,14 +80,21 @@ async def read_til_tag(
 async def read_til_page(
     request: Request,
     page: int,
-    content_service: IContentProvider = Depends(get_content_service),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Return paginated TIL posts as an HTMLResponse."""
-    result = content_service.get_til_posts(page=page)
+    try:
+        result = await content_service.get_til_posts(page=page, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return HTMLResponse(
-        content=env.get_template("partials/til_page.html").render(
-            request=request, tils=result["tils"], next_page=result["next_page"]
+        content=env.get_template("til_page.html").render(
+            request=request,
+            tils=result["posts"],
+            next_page=page + 1 if result["has_next"] else None,
+            next_cursor=result.get("next_cursor"),
         )
     )
 
@@ -93,10 +103,10 @@ async def read_til_page(
 async def read_til_detail(
     request: Request,
     til_name: str,
-    content_service: IContentProvider = Depends(get_content_service),
+    content_service: AsyncContentProvider = Depends(get_async_content_service),
 ):
     """Return a specific TIL post as an HTMLResponse."""
-    til_content = content_service.get_content_by_slug("til", til_name)
+    til_content = await content_service.get_content_by_slug("til", til_name)
 
     if not til_content:
         from fastapi import HTTPException
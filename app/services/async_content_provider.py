@@ -0,0 +1,171 @@
+"""
+Awaitable access to a content provider for async route handlers.
+
+ContentService reads files and renders markdown synchronously. Called directly
+from an ``async def`` route, one cold lookup blocks the event loop and every
+other connection on the worker waits for it. AsyncContentProvider mirrors the
+IContentProvider API as coroutines that run the underlying call in a bounded
+thread pool, so the loop keeps serving requests while disk and render work
+happens elsewhere, and the pool size caps how many such calls run at once.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from app.config import CONTENT_IO_THREADS
+from app.interfaces import IContentProvider
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Return the shared pool that runs blocking content calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=CONTENT_IO_THREADS, thread_name_prefix="content-io"
+            )
+        return _executor
+
+
+def shutdown_io_executor() -> None:
+    """Shut down the shared pool; the next call creates a fresh one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+class AsyncContentProvider:
+    """
+    Async facade over an IContentProvider.
+
+    Features:
+    - Same methods as IContentProvider, as coroutines
+    - Blocking work runs in a bounded, shared thread pool
+    - ``async def`` provider methods run through their ``_sync`` twins
+    - ``run`` offloads any other blocking call (e.g. backlink lookups)
+    - ``provider`` exposes the wrapped provider for cheap, in-memory calls
+    """
+
+    def __init__(
+        self,
+        provider: IContentProvider,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """
+        Wrap a provider.
+
+        Args:
+            provider: Synchronous content provider
+            executor: Pool to run calls in (the shared content I/O pool by default)
+        """
+        self._provider = provider
+        self._executor = executor
+
+    @property
+    def provider(self) -> IContentProvider:
+        """The wrapped synchronous provider."""
+        return self._provider
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor or get_io_executor(),
+            functools.partial(fn, *args, **kwargs),
+        )
+
+    async def _run_coroutine_method(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Await an ``async def`` provider method without blocking the loop.
+
+        Such methods do blocking work before their first await. When the
+        provider offers a ``<name>_sync`` twin, that runs in the pool;
+        otherwise the coroutine is awaited directly on the loop.
+        """
+        sync = getattr(self._provider, f"{name}_sync", None)
+        if sync is not None:
+            return await self.run(sync, *args, **kwargs)
+        return await getattr(self._provider, name)(*args, **kwargs)
+
+    async def get_content_by_slug(
+        self, content_type: str, slug: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get content by type and slug."""
+        return await self.run(self._provider.get_content_by_slug, content_type, slug)
+
+    async def get_contents_by_slugs(
+        self,
+        slugs: Sequence[str],
+        content_types: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several slugs of unknown content type at once."""
+        return await self.run(self._provider.get_contents_by_slugs, slugs, content_types)
+
+    async def get_all_content(self) -> List[Dict[str, Any]]:
+        """Get all content across all types."""
+        return await self.run(self._provider.get_all_content)
+
+    async def get_content_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Get content filtered by tag."""
+        return await self.run(self._provider.get_content_by_tag, tag)
+
+    async def get_content(
+        self, content_type: str, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get content by type with optional limit."""
+        return await self.run(self._provider.get_content, content_type, limit=limit)
+
+    async def get_bookmarks(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """Get bookmark content."""
+        return await self.run(self._provider.get_bookmarks, limit=limit)
+
+    async def get_posts_by_tag(
+        self, tag: str, content_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get posts by tag across content types."""
+        return await self.run(self._provider.get_posts_by_tag, tag, content_types)
+
+    async def get_mixed_content(
+        self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get paginated mixed content sorted by date."""
+        return await self._run_coroutine_method(
+            "get_mixed_content", page=page, per_page=per_page, cursor=cursor
+        )
+
+    async def get_til_posts(
+        self, page: int = 1, per_page: int = 30, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get paginated TIL posts."""
+        return await self.run(
+            self._provider.get_til_posts, page=page, per_page=per_page, cursor=cursor
+        )
+
+    async def get_til_posts_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Get TIL posts filtered by tag."""
+        return await self.run(self._provider.get_til_posts_by_tag, tag)
+
+    async def get_tag_counts(self) -> Dict[str, int]:
+        """Get tag usage counts across all content."""
+        return await self.run(self._provider.get_tag_counts)
+
+    async def render_markdown(self, markdown_text: str) -> Dict[str, str]:
+        """Render markdown text to HTML, returned under 'html'."""
+        return await self.run(self._provider.render_markdown, markdown_text)
+
+    async def get_homepage_sections(self) -> Dict[str, Any]:
+        """Get content sections for homepage display."""
+        return await self._run_coroutine_method("get_homepage_sections")
+
+    async def get_all_garden_content(self) -> Dict[str, Any]:
+        """Get all content for garden visualization."""
+        return await self.run(self._provider.get_all_garden_content)
@@ -8,15 +8,28 @@ caching, and relationship mapping capabilities.
 import re
 import logging
 import os
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Set, Optional
 from urllib.parse import urlparse
 
 from app.interfaces import IBacklinkService, IContentProvider
+from app.services.content_snapshot import ContentSnapshot
+from app.services.content_watcher import ContentChanges
+from app.services.link_index import LinkIndex, LinkRef
+from app.utils.single_flight import SingleFlight
 
 
 logger = logging.getLogger(__name__)
 
+# Kinds of document change accepted by BacklinkService.apply_change
+DOCUMENT_CHANGES = ("added", "modified", "removed")
+
+
+class StaleSnapshotError(Exception):
+    """Raised when links are requested for a snapshot the index has moved past."""
+
 
 class BacklinkService(IBacklinkService):
     """
@@ -24,8 +37,9 @@ class BacklinkService(IBacklinkService):
 
     Features:
     - Multiple link format support (markdown, wiki-style, relative paths)
-    - TTL-based caching with automatic refresh
-    - Bidirectional link graph construction
+    - Link index built in one pass per content snapshot (TTL cache otherwise)
+    - Single-document changes patch the index instead of rebuilding it
+    - Bidirectional link graph construction with dictionary lookups
     - Link validation and orphan detection
     """
 
@@ -39,10 +53,14 @@ class BacklinkService(IBacklinkService):
         """
         self._content_provider = content_provider
         self._cache_ttl = timedelta(minutes=cache_ttl_minutes)
-        self._backlinks_cache: Dict[str, List[Dict[str, str]]] = {}
-        self._link_graph_cache: Optional[Dict[str, List[str]]] = None
+        self._index: Optional[LinkIndex] = None
+        self._index_version: Optional[int] = None
         self._cache_time: Optional[datetime] = None
 
+        # Concurrent index rebuilds share one computation
+        self._flight = SingleFlight()
+        self._patch_lock = threading.Lock()
+
         # Regex patterns for different link formats
         self._markdown_link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
         self._wiki_link_pattern = re.compile(r"\[\[([^\]]+)\]\]")
@@ -61,31 +79,58 @@ class BacklinkService(IBacklinkService):
         if not content:
             return set()
 
-        links = set()
-
         try:
-            # Extract markdown-style links
-            markdown_matches = self._markdown_link_pattern.findall(content)
-            for link_text, link_target in markdown_matches:
-                if self._is_internal_link(link_target):
-                    normalized_target = self._normalize_link_target(
-                        link_target, content_path
-                    )
-                    if normalized_target:
-                        links.add(normalized_target)
-
-            # Extract wiki-style links
-            wiki_matches = self._wiki_link_pattern.findall(content)
-            for link_target in wiki_matches:
-                normalized_target = self._normalize_wiki_link(link_target.strip())
-                if normalized_target:
-                    links.add(normalized_target)
-
+            return {ref.link for ref in self._scan_links(content, content_path)}
         except Exception as e:
             logger.error(f"Error extracting links from content at {content_path}: {e}")
             return set()
 
-        return links
+    def get_link_index(
+        self, snapshot: Optional[ContentSnapshot] = None
+    ) -> Optional[LinkIndex]:
+        """
+        Get the link index of the current content, building it when stale.
+
+        With a snapshot-publishing provider (ContentService) the index is
+        rebuilt once per snapshot version; other providers fall back to the
+        TTL cache.
+
+        Args:
+            snapshot: Snapshot the index must describe (the provider's
+                current one when omitted)
+
+        Returns:
+            LinkIndex, or None if the content could not be read
+
+        Raises:
+            StaleSnapshotError: If ``snapshot`` was given and the index has
+                already moved past it
+        """
+        pinned = snapshot is not None
+        try:
+            if not pinned:
+                snapshot = self._current_snapshot()
+            version = snapshot.version if snapshot is not None else None
+            index = self._index
+            if index is not None:
+                if version is None and self._is_cache_valid():
+                    return index
+                if version is not None and version == self._index_version:
+                    return index
+                if not pinned and None not in (version, self._index_version) and (
+                    version < self._index_version
+                ):
+                    # Already patched past the snapshot read above: newer is fine
+                    return index
+
+            return self._flight.do(
+                ("link_index", version), lambda: self._build_index(snapshot)
+            )
+        except StaleSnapshotError:
+            raise
+        except Exception as e:
+            logger.error(f"Error building link index: {e}")
+            return None
 
     def get_backlinks(self, target_slug: str) -> List[Dict[str, str]]:
         """
@@ -97,53 +142,18 @@ class BacklinkService(IBacklinkService):
         Returns:
             List of dicts with 'source_slug', 'source_title', 'link_context'
         """
-        if self._is_cache_valid() and target_slug in self._backlinks_cache:
-            return self._backlinks_cache[target_slug]
-
-        backlinks = []
-
-        try:
-            all_content = self._content_provider.get_all_content()
-
-            for content_item in all_content:
-                source_slug = content_item.get("slug", "")
-                source_title = content_item.get("title", source_slug)
-                content_text = content_item.get("content", "")
-                content_path = content_item.get("file_path", "")
-
-                # Skip self-references
-                if source_slug == target_slug:
-                    continue
-
-                # Extract links from this content
-                internal_links = self.extract_internal_links(content_text, content_path)
-
-                # Check if any links point to our target
-                for link in internal_links:
-                    if self._link_matches_target(link, target_slug):
-                        # Extract context around the link
-                        link_context = self._extract_link_context(
-                            content_text, link, target_slug
-                        )
-
-                        backlinks.append(
-                            {
-                                "source_slug": source_slug,
-                                "source_title": source_title,
-                                "link_context": link_context,
-                            }
-                        )
-                        break
-
-        except Exception as e:
-            logger.error(f"Error getting backlinks for {target_slug}: {e}")
+        index = self.get_link_index()
+        if index is None:
             return []
 
-        # Update cache
-        self._backlinks_cache[target_slug] = backlinks
-        self._cache_time = datetime.now()
-
-        return backlinks
+        return [
+            {
+                "source_slug": source_slug,
+                "source_title": index.titles.get(source_slug, source_slug),
+                "link_context": ref.context,
+            }
+            for source_slug, ref in index.backlinks(target_slug)
+        ]
 
     def get_forward_links(self, source_slug: str) -> List[Dict[str, str]]:
         """
@@ -155,104 +165,49 @@ class BacklinkService(IBacklinkService):
         Returns:
             List of dicts with 'target_slug', 'target_title', 'link_text'
         """
-        try:
-            # Get the source content
-            all_content = self._content_provider.get_all_content()
-            source_content = None
-
-            for content_item in all_content:
-                if content_item.get("slug") == source_slug:
-                    source_content = content_item
-                    break
-
-            if not source_content:
-                return []
-
-            content_text = source_content.get("content", "")
-            content_path = source_content.get("file_path", "")
-
-            # Extract all internal links
-            internal_links = self.extract_internal_links(content_text, content_path)
-
-            forward_links = []
-
-            # For each link, find the target content and get details
-            for link in internal_links:
-                target_slug = self._resolve_link_to_slug(link, all_content)
-                if target_slug:
-                    # Find target content for title
-                    target_title = target_slug
-                    for content_item in all_content:
-                        if content_item.get("slug") == target_slug:
-                            target_title = content_item.get("title", target_slug)
-                            break
-
-                    # Extract the original link text
-                    link_text = self._extract_original_link_text(content_text, link)
-
-                    forward_links.append(
-                        {
-                            "target_slug": target_slug,
-                            "target_title": target_title,
-                            "link_text": link_text,
-                        }
-                    )
-
-            return forward_links
-
-        except Exception as e:
-            logger.error(f"Error getting forward links for {source_slug}: {e}")
+        index = self.get_link_index()
+        if index is None:
             return []
 
-    def build_link_graph(self) -> Dict[str, List[str]]:
+        return [
+            {
+                "target_slug": target_slug,
+                "target_title": index.titles.get(target_slug, target_slug),
+                "link_text": ref.text,
+            }
+            for ref, target_slug in index.forward_links(source_slug)
+        ]
+
+    def build_link_graph(
+        self, snapshot: Optional[ContentSnapshot] = None
+    ) -> Dict[str, List[str]]:
         """
         Build complete link graph for all content.
 
+        Args:
+            snapshot: Snapshot to build the graph of (the current content
+                when omitted)
+
         Returns:
             Dict mapping source slugs to lists of target slugs
-        """
-        if self._is_cache_valid() and self._link_graph_cache:
-            return self._link_graph_cache
-
-        link_graph = {}
-
-        try:
-            all_content = self._content_provider.get_all_content()
-
-            # Initialize graph with all content
-            for content_item in all_content:
-                slug = content_item.get("slug", "")
-                if slug:
-                    link_graph[slug] = []
-
-            # Build links
-            for content_item in all_content:
-                source_slug = content_item.get("slug", "")
-                content_text = content_item.get("content", "")
-                content_path = content_item.get("file_path", "")
-
-                if not source_slug:
-                    continue
-
-                # Extract all links from this content
-                internal_links = self.extract_internal_links(content_text, content_path)
 
-                # Map links to target slugs
-                for link in internal_links:
-                    target_slug = self._resolve_link_to_slug(link, all_content)
-                    if target_slug and target_slug != source_slug:
-                        if target_slug not in link_graph[source_slug]:
-                            link_graph[source_slug].append(target_slug)
-
-        except Exception as e:
-            logger.error(f"Error building link graph: {e}")
+        Raises:
+            StaleSnapshotError: If ``snapshot`` was given and the index has
+                already moved past it
+        """
+        index = self.get_link_index(snapshot)
+        if index is None:
             return {}
+        if snapshot is None:
+            return index.graph()
 
-        # Update cache
-        self._link_graph_cache = link_graph
-        self._cache_time = datetime.now()
-
-        return link_graph
+        with self._patch_lock:
+            # The cached index is patched forward in place as snapshots publish
+            if self._index_version != snapshot.version:
+                raise StaleSnapshotError(
+                    f"link index is at version {self._index_version}, not {snapshot.version}"
+                )
+            return index.graph()
 
     def validate_links(self) -> List[Dict[str, str]]:
         """
@@ -261,54 +216,18 @@ class BacklinkService(IBacklinkService):
         Returns:
             List of dicts with 'source_slug', 'broken_link', 'error'
         """
-        broken_links = []
-
-        try:
-            all_content = self._content_provider.get_all_content()
-
-            # Create a set of valid slugs for quick lookup
-            valid_slugs = {
-                content.get("slug", "")
-                for content in all_content
-                if content.get("slug")
-            }
-
-            for content_item in all_content:
-                source_slug = content_item.get("slug", "")
-                content_text = content_item.get("content", "")
-                content_path = content_item.get("file_path", "")
-
-                if not source_slug:
-                    continue
-
-                # Extract all internal links
-                internal_links = self.extract_internal_links(content_text, content_path)
-
-                for link in internal_links:
-                    target_slug = self._resolve_link_to_slug(link, all_content)
-
-                    if not target_slug:
-                        broken_links.append(
-                            {
-                                "source_slug": source_slug,
-                                "broken_link": link,
-                                "error": "Link target not found",
-                            }
-                        )
-                    elif target_slug not in valid_slugs:
-                        broken_links.append(
-                            {
-                                "source_slug": source_slug,
-                                "broken_link": link,
-                                "error": f'Target slug "{target_slug}" does not exist',
-                            }
-                        )
-
-        except Exception as e:
-            logger.error(f"Error validating links: {e}")
+        index = self.get_link_index()
+        if index is None:
             return []
 
-        return broken_links
+        return [
+            {
+                "source_slug": source_slug,
+                "broken_link": link,
+                "error": "Link target not found",
+            }
+            for source_slug, link in index.broken_links()
+        ]
 
     def get_orphaned_content(self) -> List[str]:
         """
@@ -317,39 +236,182 @@ class BacklinkService(IBacklinkService):
         Returns:
             List of content slugs that are orphaned
         """
-        try:
-            link_graph = self.build_link_graph()
+        index = self.get_link_index()
+        return index.orphans() if index is not None else []
 
-            # Find content with no outgoing links
-            no_outgoing = {slug for slug, targets in link_graph.items() if not targets}
+    def refresh_cache(self) -> None:
+        """
+        Refresh the backlink cache after content changes.
+        """
+        self._index = None
+        self._index_version = None
+        self._cache_time = None
 
-            # Find content with no incoming links
-            all_targets = set()
-            for targets in link_graph.values():
-                all_targets.update(targets)
+    def apply_change(
+        self, slug: str, change: str, document: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        Patch the link index for one added, modified or removed document.
 
-            no_incoming = set(link_graph.keys()) - all_targets
+        Only the links of the changed document are extracted again; forward
+        and reverse adjacency and orphan status are updated in place. Does
+        nothing until the index has been built.
 
-            # Orphaned content has neither incoming nor outgoing links
-            orphaned = no_outgoing & no_incoming
+        Args:
+            slug: Slug of the changed document
+            change: 'added', 'modified' or 'removed'
+            document: The document as of the change (not needed for removals)
 
-            return list(orphaned)
+        Raises:
+            ValueError: For an unknown change or a missing document
+        """
+        if change not in DOCUMENT_CHANGES:
+            raise ValueError(f"Unknown document change: {change!r}")
+        if change != "removed" and document is None:
+            raise ValueError(f"A document is required for change {change!r}")
+
+        index = self._index
+        if index is None:
+            return
+
+        if change == "removed":
+            index.remove_document(slug)
+        else:
+            index.update_document(
+                slug,
+                document.get("title", slug),
+                self._scan_links(self._content_text(document), document.get("file_path", "")),
+            )
+        logger.debug(f"Link index patched: {slug} {change}")
 
-        except Exception as e:
-            logger.error(f"Error finding orphaned content: {e}")
-            return []
+    def on_snapshot_published(
+        self, previous_version: int, snapshot: ContentSnapshot, changes: ContentChanges
+    ) -> None:
+        """
+        Bring the link index from ``previous_version`` to ``snapshot``.
 
-    def refresh_cache(self) -> None:
+        Registered with ContentService.add_snapshot_listener. Each changed file
+        becomes a document change for its slug, read from the new snapshot;
+        a file that left the snapshot (deleted, or now a draft) removes its
+        slug unless another document still has it. If the index was not built
+        from ``previous_version``, it is left for the next lookup to rebuild.
+
+        Args:
+            previous_version: Version of the snapshot that was replaced
+            snapshot: Newly published snapshot
+            changes: Files changed between the two snapshots
         """
-        Refresh the backlink cache after content changes.
+        with self._patch_lock:
+            if self._index is None or self._index_version != previous_version:
+                return
+
+            slugs = {Path(path).stem for path in changes.paths}
+            try:
+                for slug in sorted(slugs):
+                    document = snapshot.find(slug)
+                    if document is None:
+                        self.apply_change(slug, "removed")
+                    elif slug in self._index:
+                        self.apply_change(slug, "modified", document)
+                    else:
+                        self.apply_change(slug, "added", document)
+            except Exception as e:
+                logger.error(f"Error patching link index, rebuilding on next lookup: {e}")
+                self.refresh_cache()
+                return
+
+            self._index_version = snapshot.version
+
+    def _current_snapshot(self) -> Optional[ContentSnapshot]:
+        """Return the provider's published snapshot, if it publishes one."""
+        get_snapshot = getattr(self._content_provider, "get_snapshot", None)
+        if get_snapshot is None:
+            return None
+        snapshot = get_snapshot()
+        return snapshot if isinstance(snapshot, ContentSnapshot) else None
+
+    def _build_index(self, snapshot: Optional[ContentSnapshot]) -> LinkIndex:
+        """Scan all content once and cache the resulting link index.
+
+        Raises:
+            StaleSnapshotError: If a newer index was cached meanwhile; document
+                bodies are always read from the current files, so an older
+                snapshot's links cannot be recovered
         """
-        try:
-            self._backlinks_cache.clear()
-            self._link_graph_cache = None
-            self._cache_time = None
+        index = self._scan_index(snapshot)
+        version = snapshot.version if snapshot is not None else None
+        with self._patch_lock:
+            cached = self._index_version
+            if self._index is not None and None not in (version, cached) and version < cached:
+                raise StaleSnapshotError(
+                    f"link index is at version {cached}, not {version}"
+                )
+            self._index = index
+            self._index_version = version
+            self._cache_time = datetime.now()
+        logger.debug(f"Link index built for {len(index)} documents")
+        return index
+
+    def _scan_index(self, snapshot: Optional[ContentSnapshot]) -> LinkIndex:
+        """Return a new link index of ``snapshot`` (or of all current content)."""
+        if snapshot is not None:
+            all_content = snapshot.items
+        else:
+            all_content = self._content_provider.get_all_content()
 
-        except Exception as e:
-            logger.error(f"Error refreshing cache: {e}")
+        index = LinkIndex()
+        for content_item in all_content:
+            slug = content_item.get("slug", "")
+            if not slug:
+                continue
+            index.add_document(
+                slug,
+                content_item.get("title", slug),
+                self._scan_links(
+                    self._content_text(content_item), content_item.get("file_path", "")
+                ),
+            )
+        return index.link()
+
+    @staticmethod
+    def _content_text(content_item: Mapping[str, Any]) -> str:
+        """Return the markdown of a document."""
+        # Records from ContentService keep the body under "markdown"
+        return content_item.get("content") or content_item.get("markdown") or ""
+
+    def _scan_links(self, content: str, content_path: str) -> List[LinkRef]:
+        """Return the internal links of a document, first occurrence of each."""
+        if not content:
+            return []
+
+        refs: Dict[str, LinkRef] = {}
+        for match in self._markdown_link_pattern.finditer(content):
+            link_text, link_target = match.groups()
+            if not self._is_internal_link(link_target):
+                continue
+            normalized_target = self._normalize_link_target(link_target, content_path)
+            if normalized_target and normalized_target not in refs:
+                refs[normalized_target] = LinkRef(
+                    normalized_target, link_text, self._line_at(content, match.start())
+                )
+
+        for match in self._wiki_link_pattern.finditer(content):
+            link_target = match.group(1)
+            normalized_target = self._normalize_wiki_link(link_target.strip())
+            if normalized_target and normalized_target not in refs:
+                refs[normalized_target] = LinkRef(
+                    normalized_target, link_target, self._line_at(content, match.start())
+                )
+
+        return list(refs.values())
+
+    @staticmethod
+    def _line_at(content: str, position: int) -> str:
+        """Return the line containing ``position``, stripped and cut to 100 chars."""
+        start = content.rfind("\n", 0, position) + 1
+        end = content.find("\n", position)
+        line = content[start:end] if end != -1 else content[start:]
+        return line.strip()[:100]
 
     def _is_internal_link(self, link: str) -> bool:
         """Check if a link is internal (not external URL)."""
@@ -429,19 +491,6 @@ class BacklinkService(IBacklinkService):
         except Exception:
             return False
 
-    def _resolve_link_to_slug(
-        self, link: str, all_content: List[Dict]
-    ) -> Optional[str]:
-        """Resolve a link to a content slug."""
-        try:
-            for content_item in all_content:
-                slug = content_item.get("slug", "")
-                if self._link_matches_target(link, slug):
-                    return slug
-            return None
-        except Exception:
-            return None
-
     def _extract_link_context(self, content: str, link: str, target_slug: str) -> str:
         """Extract context around a link in content."""
         try:
@@ -454,26 +503,6 @@ class BacklinkService(IBacklinkService):
         except Exception:
             return ""
 
-    def _extract_original_link_text(self, content: str, normalized_link: str) -> str:
-        """Extract the original link text from content."""
-        try:
-            # Try to find markdown link that matches
-            markdown_matches = self._markdown_link_pattern.findall(content)
-            for link_text, link_target in markdown_matches:
-                if self._normalize_link_target(link_target, "") == normalized_link:
-                    return link_text
-
-            # Try wiki links
-            wiki_matches = self._wiki_link_pattern.findall(content)
-            for link_target in wiki_matches:
-                if self._normalize_wiki_link(link_target) == normalized_link:
-                    return link_target
-
-            return normalized_link
-
-        except Exception:
-            return normalized_link
-
     def _is_cache_valid(self) -> bool:
         """Check if the current cache is still valid."""
         try:
@@ -0,0 +1,233 @@
+"""
+Byte-budgeted LRU cache for ContentService.
+
+Every entry is stored with an estimate of its deep size, and the cache keeps
+its total under a configurable byte budget. Entries belong to a tier that
+decides what goes first when the budget is exceeded: rendered bodies (large
+and cheap to reload from the content index) are evicted before metadata
+records and listings (small, and what hot pages need). Pinned entries hold
+references to memory owned elsewhere, such as the snapshot's item list, and
+are neither counted against the budget nor evicted.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Tiers, in eviction order; pinned entries are never evicted
+BODY = "body"
+METADATA = "metadata"
+PINNED = "pinned"
+EVICTION_ORDER = (BODY, METADATA)
+TIERS = EVICTION_ORDER + (PINNED,)
+
+# Nested containers deeper than this are counted shallowly
+_MAX_DEPTH = 6
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory held by ``value`` and everything it contains.
+
+    Objects referenced more than once within ``value`` are counted once.
+    Mappings offering ``to_dict(include_body=False)`` (ContentRecord) are
+    measured without their bodies, which live in the body tier.
+    """
+    return _estimate(value, set(), 0)
+
+
+def _estimate(value: Any, seen: set, depth: int) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if depth >= _MAX_DEPTH or isinstance(value, (str, bytes, int, float, bool)):
+        return size
+    if isinstance(value, Mapping):
+        to_dict = getattr(value, "to_dict", None)
+        items: Iterable = (
+            to_dict(include_body=False).items() if to_dict else value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_estimate(item, seen, depth + 1) for item in value)
+    else:
+        return size
+    return size + sum(
+        _estimate(key, seen, depth + 1) + _estimate(item, seen, depth + 1)
+        for key, item in items
+    )
+
+
+class _Entry:
+    __slots__ = ("value", "size", "stored_at")
+
+    def __init__(self, value: Any, size: int):
+        self.value = value
+        self.size = size
+        self.stored_at = time.time()
+
+
+class ContentCache:
+    """
+    Tiered LRU cache bounded by total estimated bytes.
+
+    Features:
+    - Per-entry size estimate, total kept under ``max_bytes``
+    - Least recently used entries evicted first, bodies before metadata
+    - Optional entry-count limit per tier
+    - Optional maximum age checked on read; expired entries are dropped
+    - Hit, miss, expiry and eviction counters, overall and per tier
+    - Thread-safe
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[Dict[str, int]] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for evictable entries (unbounded if None)
+            max_entries: Optional entry-count limit per tier
+            sizeof: Estimates the size of a value in bytes
+        """
+        self.max_bytes = max_bytes
+        self._max_entries = dict(max_entries or {})
+        self._sizeof = sizeof
+        self._tiers: Dict[str, "OrderedDict[str, _Entry]"] = {
+            tier: OrderedDict() for tier in TIERS
+        }
+        self._tier_of: Dict[str, str] = {}
+        self._bytes = {tier: 0 for tier in TIERS}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self._evictions = {tier: 0 for tier in TIERS}
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Return the value for ``key``, or None if missing or older than ``max_age``."""
+        with self._lock:
+            tier = self._tier_of.get(key)
+            if tier is None:
+                self.misses += 1
+                return None
+            entries = self._tiers[tier]
+            entry = entries[key]
+            if max_age is not None and time.time() - entry.stored_at >= max_age:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, tier: str = METADATA) -> None:
+        """Store ``value`` under ``key`` in ``tier``, evicting to stay in budget."""
+        if tier not in TIERS:
+            raise ValueError(f"Unknown cache tier: {tier}")
+        size = 0 if tier == PINNED else self._sizeof(value)
+        with self._lock:
+            self._remove(key)
+            self._tiers[tier][key] = _Entry(value, size)
+            self._tier_of[key] = tier
+            self._bytes[tier] += size
+            self._enforce_limits(tier)
+
+    def pop(self, key: str) -> None:
+        """Drop ``key`` if present."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self, tier: Optional[str] = None) -> None:
+        """Drop every entry, or only those in ``tier``."""
+        with self._lock:
+            for name in (tier,) if tier else TIERS:
+                for key in list(self._tiers[name]):
+                    self._remove(key)
+
+    def keys(self, tier: Optional[str] = None) -> List[str]:
+        """Return a snapshot of the cached keys, optionally for one tier."""
+        with self._lock:
+            if tier:
+                return list(self._tiers[tier])
+            return list(self._tier_of)
+
+    def max_entries(self, tier: str) -> Optional[int]:
+        """Entry-count limit for ``tier``, if any."""
+        return self._max_entries.get(tier)
+
+    def count(self, tier: str) -> int:
+        """Number of entries in ``tier``."""
+        return len(self._tiers[tier])
+
+    def evictions(self, tier: Optional[str] = None) -> int:
+        """Number of entries evicted, overall or for one tier."""
+        if tier:
+            return self._evictions[tier]
+        return sum(self._evictions.values())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tier_of
+
+    def __len__(self) -> int:
+        return len(self._tier_of)
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes held by evictable entries."""
+        return sum(self._bytes[tier] for tier in EVICTION_ORDER)
+
+    def _remove(self, key: str) -> None:
+        tier = self._tier_of.pop(key, None)
+        if tier is not None:
+            entry = self._tiers[tier].pop(key)
+            self._bytes[tier] -= entry.size
+
+    def _evict_oldest(self, tier: str) -> None:
+        key = next(iter(self._tiers[tier]))
+        self._remove(key)
+        self._evictions[tier] += 1
+
+    def _enforce_limits(self, tier: str) -> None:
+        limit = self._max_entries.get(tier)
+        if limit is not None:
+            while len(self._tiers[tier]) > max(1, limit):
+                self._evict_oldest(tier)
+        if self.max_bytes is None:
+            return
+        for victim in EVICTION_ORDER:
+            while self.size > self.max_bytes and self._tiers[victim]:
+                # Never evict what was just stored unless it alone is over budget
+                if len(self._tiers[victim]) == 1 and victim == tier:
+                    break
+                self._evict_oldest(victim)
+            if self.size <= self.max_bytes:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        """Return occupancy, budget and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._tier_of),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions(),
+                "tiers": {
+                    tier: {
+                        "entries": len(self._tiers[tier]),
+                        "bytes": self._bytes[tier],
+                        "evictions": self._evictions[tier],
+                    }
+                    for tier in TIERS
+                },
+            }
@@ -3,7 +3,8 @@ ContentFilterService: Filters content based on URL state parameters.
 Implements intersection logic for filtering by content types, tags, and growth stages.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
+from app.services.content_snapshot import ContentSnapshot, item_tags, stage_key, tag_key
 from app.services.url_state import URLState
 
 
@@ -11,13 +12,16 @@ class ContentFilterService:
     """Service for filtering content based on URL state."""
 
     def filter_content(
-        self, content: List[Dict[str, Any]], url_state: URLState
+        self,
+        content: Union[ContentSnapshot, List[Dict[str, Any]]],
+        url_state: URLState,
     ) -> List[Dict[str, Any]]:
         """
         Filter content based on URL state parameters.
 
         Args:
-            content: List of content items
+            content: Content snapshot (uses its prebuilt indexes) or list of
+                content items (scanned linearly)
             url_state: URL state with filter criteria
 
         Returns:
@@ -27,10 +31,17 @@ class ContentFilterService:
         - Within a field: OR logic (e.g., types=["notes", "til"] returns notes OR til)
         - For tags: AND logic (all specified tags must be present)
         - Across fields: AND logic (all criteria must be satisfied)
+        - Tags match case-insensitively
         """
         if not content:
             return []
 
+        if isinstance(content, ContentSnapshot):
+            return content.select(
+                types=url_state.types, tags=url_state.tags, growth_stages=url_state.growth
+            )
+
+        # Building indexes for a one-off list costs more than a linear scan
         filtered = content
 
         # Filter by content types (OR logic within types)
@@ -41,18 +52,20 @@ class ContentFilterService:
 
         # Filter by tags (AND logic - all tags must be present)
         if url_state.tags:
+            wanted = {tag_key(tag) for tag in url_state.tags}
             filtered = [
                 item
                 for item in filtered
-                if all(tag in item.get("tags", []) for tag in url_state.tags)
+                if wanted <= {tag_key(tag) for tag in item_tags(item)}
             ]
 
         # Filter by growth stages (OR logic within stages)
         if url_state.growth:
+            stages = {stage_key(stage) for stage in url_state.growth}
             filtered = [
                 item
                 for item in filtered
-                if item.get("growth_stage") in url_state.growth
+                if item.get("growth_stage") and stage_key(item["growth_stage"]) in stages
             ]
 
         return filtered
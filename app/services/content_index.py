@@ -0,0 +1,298 @@
+"""
+Persistent on-disk index of parsed content for fast ContentService cold starts.
+
+Each entry is keyed by the file's path relative to the content directory and is
+validated against the file's mtime, size and SHA-256 content hash. Only files
+that changed since the index was written have to be parsed and rendered again.
+
+The file is shared by every worker process and by scripts/build_content_index.py,
+so writes never hold the database lock beyond a single statement, or a single
+explicit batch on full rebuilds, and a write that finds it locked is skipped
+rather than failing the request.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of stored records changes
+INDEX_FORMAT_VERSION = 2
+
+# Files modified this close to the moment they were indexed may change again
+# without a visible mtime change, so their hash is always re-checked.
+RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    indexed_at_ns INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+"""
+
+
+def hash_content(raw: bytes) -> str:
+    """Return the hex SHA-256 digest used to identify file contents."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON ``default`` hook that tags dates so they round-trip unchanged."""
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    """JSON ``object_hook`` that restores tagged dates."""
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+    return obj
+
+
+def encode_record(record: Dict[str, Any]) -> str:
+    """Serialize a content record to JSON, preserving date values."""
+    return json.dumps(record, default=_encode_value, ensure_ascii=False)
+
+
+def decode_record(payload: str) -> Dict[str, Any]:
+    """Deserialize a content record produced by :func:`encode_record`."""
+    return json.loads(payload, object_hook=_decode_value)
+
+
+class ContentIndex:
+    """
+    SQLite-backed index of processed content records.
+
+    Features:
+    - Stat-signature fast path (mtime + size) with hash fallback for touched files
+    - Renderer signature check that discards entries built by another pipeline
+    - In-memory operation when no index path is configured
+    - Autocommitted single writes; ``batch`` groups a full rebuild in one transaction
+    - Write-ahead logging so readers in other processes never wait on a writer
+    """
+
+    def __init__(self, index_path: Optional[str] = None, signature: str = ""):
+        """
+        Initialize the index, loading an existing index file if present.
+
+        Args:
+            index_path: Path to the SQLite index file (in-memory when None)
+            signature: Renderer signature; entries built with a different
+                signature are discarded on load
+        """
+        self._index_path = Path(index_path) if index_path else None
+        self._signature = f"{INDEX_FORMAT_VERSION}:{signature}"
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the backing database and reset it on signature mismatch."""
+        if self._index_path is not None:
+            try:
+                self._index_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(self._index_path), check_same_thread=False, isolation_level=None
+                )
+                conn.executescript(_SCHEMA)
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Content index at {self._index_path} unusable ({e}); using memory"
+                )
+                self._index_path = None
+                conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+                conn.executescript(_SCHEMA)
+        else:
+            conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            conn.executescript(_SCHEMA)
+
+        if self._index_path is not None:
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error as e:
+                logger.debug(f"Content index stays in rollback-journal mode: {e}")
+
+        row = conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        if row is None or row[0] != self._signature:
+            if row is not None:
+                logger.info("Content index signature changed; discarding entries")
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)",
+                    (self._signature,),
+                )
+        return conn
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Location of the index file, or None for an in-memory index."""
+        return self._index_path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def lookup(
+        self, key: str, stat: os.stat_result, read_bytes: Callable[[], bytes]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored record for ``key`` if the file is unchanged.
+
+        Args:
+            key: Path of the file relative to the content directory
+            stat: Current stat result of the file
+            read_bytes: Callable returning the raw file contents, used only when
+                the stat signature alone cannot prove the entry is fresh
+
+        Returns:
+            The stored record, or None if missing or stale
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime_ns, size, content_hash, indexed_at_ns, record "
+                    "FROM entries WHERE path = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Content index read of {key} failed: {e}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+
+        mtime_ns, size, content_hash, indexed_at_ns, payload = row
+        racy = mtime_ns >= indexed_at_ns - RACY_WINDOW_NS
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size and not racy:
+            self.hits += 1
+            return decode_record(payload)
+
+        # Stat changed (or is too recent to trust): compare content hashes
+        if stat.st_size == size and hash_content(read_bytes()) == content_hash:
+            self._write(
+                "UPDATE entries SET mtime_ns = ?, indexed_at_ns = ? WHERE path = ?",
+                (stat.st_mtime_ns, time.time_ns(), key),
+            )
+            self.hits += 1
+            return decode_record(payload)
+
+        self.misses += 1
+        return None
+
+    def store(
+        self, key: str, stat: os.stat_result, content_hash: str, record: Dict[str, Any]
+    ) -> None:
+        """Store a processed record for ``key``.
+
+        Args:
+            key: Path of the file relative to the content directory
+            stat: Stat result of the file the record was built from
+            content_hash: SHA-256 digest of the file contents
+            record: Processed content record
+        """
+        try:
+            payload = encode_record(record)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping content index entry for {key}: {e}")
+            return
+        self._write(
+            "INSERT OR REPLACE INTO entries "
+            "(path, mtime_ns, size, content_hash, indexed_at_ns, record) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, stat.st_mtime_ns, stat.st_size, content_hash, time.time_ns(), payload),
+        )
+
+    def discard(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        self._write("DELETE FROM entries WHERE path = ?", (key,))
+
+    def _write(self, sql: str, params: tuple) -> None:
+        """Run one write; outside a batch it commits immediately.
+
+        A locked or failing database only costs the cache entry, so errors
+        are logged and the write is dropped.
+        """
+        try:
+            with self._lock:
+                self._conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.debug(f"Content index write skipped: {e}")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the writes made inside the block into one transaction.
+
+        Used by full rebuilds, which store many records at once. If the
+        write lock cannot be taken the writes are made one by one instead.
+        """
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                began = True
+            except sqlite3.Error as e:
+                logger.debug(f"Content index batch not started: {e}")
+                began = False
+        try:
+            yield
+        finally:
+            if began:
+                with self._lock:
+                    try:
+                        self._conn.execute("COMMIT")
+                    except sqlite3.Error as e:
+                        logger.error(f"Error writing content index: {e}")
+                        if self._conn.in_transaction:
+                            self._conn.execute("ROLLBACK")
+
+    def prune(self, exists: Callable[[str], bool]) -> int:
+        """Remove entries whose source files no longer exist.
+
+        Args:
+            exists: Predicate called with each entry key
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock:
+                keys = [row[0] for row in self._conn.execute("SELECT path FROM entries")]
+        except sqlite3.Error as e:
+            logger.debug(f"Content index prune skipped: {e}")
+            return 0
+        stale = [key for key in keys if not exists(key)]
+        if stale:
+            with self.batch():
+                for key in stale:
+                    self.discard(key)
+        return len(stale)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
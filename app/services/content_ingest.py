@@ -0,0 +1,192 @@
+"""
+Parallel rendering of content files.
+
+Parsing YAML frontmatter and rendering markdown with codehilite/Pygments is
+CPU-bound, so a full index build over a large corpus is limited by a single
+core when files are processed one after another. ContentIngestor fans the
+files that actually need rendering out over a process pool in chunks and
+returns the outcomes in input order, so callers see exactly what a serial
+loop would have produced. Small batches, the common case once the content
+index is warm, are rendered in-process to avoid pool start-up costs.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pydantic import ValidationError
+
+from app.services.content_index import hash_content
+
+logger = logging.getLogger(__name__)
+
+# Outcome statuses of rendering one file
+RENDERED = "rendered"
+INVALID = "invalid"
+FAILED = "failed"
+
+# Below this many files the pool costs more than it saves
+DEFAULT_PARALLEL_THRESHOLD = 64
+
+# Chunks per worker when no chunk size is given; several chunks each keeps
+# workers busy when file sizes are uneven
+CHUNKS_PER_WORKER = 4
+
+BuildRecord = Callable[[Path, str], Dict[str, Any]]
+
+
+@dataclass
+class RenderedFile:
+    """Outcome of rendering one content file."""
+
+    status: str
+    digest: Optional[str] = None
+    record: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def render_file(file_path: Path, build_record: BuildRecord) -> RenderedFile:
+    """Read and render one file, capturing failures as an outcome.
+
+    Args:
+        file_path: Path to the markdown file
+        build_record: Parses and renders decoded file contents
+
+    Returns:
+        RenderedFile with the record and content hash, or the failure
+    """
+    try:
+        raw = file_path.read_bytes()
+        record = build_record(file_path, raw.decode("utf-8"))
+    except ValidationError as e:
+        return RenderedFile(INVALID, error=str(e))
+    except Exception as e:
+        return RenderedFile(FAILED, error=str(e))
+    return RenderedFile(RENDERED, digest=hash_content(raw), record=record)
+
+
+def resolve_worker_count(workers: Optional[int]) -> int:
+    """Return the worker count to use; 0 or None means one per CPU."""
+    if not workers or workers < 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+# Renderer owned by each worker process, created once by _init_worker
+_worker_build_record: Optional[BuildRecord] = None
+
+
+def _init_worker(content_dir: str) -> None:
+    global _worker_build_record
+    from app.services.content_service import ContentService
+
+    _worker_build_record = ContentService(content_dir=content_dir)._build_record
+
+
+def _render_in_worker(path: str) -> RenderedFile:
+    return render_file(Path(path), _worker_build_record)
+
+
+def _pool_context():
+    # Never fork: ingestion can run on the background refresh thread, and
+    # forking a threaded process may copy held locks into the children
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Import the renderer once in the fork server instead of in every worker
+    context.set_forkserver_preload(["app.services.content_service"])
+    return context
+
+
+class ContentIngestor:
+    """
+    Renders batches of content files serially or over a process pool.
+
+    Features:
+    - Configurable worker count (one per CPU by default)
+    - Chunked dispatch to amortise inter-process overhead
+    - Results always in input order, whatever the completion order
+    - Serial fallback for small batches or a single worker
+    """
+
+    def __init__(
+        self,
+        content_dir: str,
+        workers: Optional[int] = 0,
+        chunk_size: Optional[int] = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    ):
+        """
+        Initialize the ingestor.
+
+        Args:
+            content_dir: Content directory the worker renderers are built for
+            workers: Worker processes; 0 or None uses one per CPU, 1 is serial
+            chunk_size: Files per task sent to a worker; derived from the
+                batch size when omitted
+            parallel_threshold: Minimum batch size rendered in parallel
+        """
+        self._content_dir = str(content_dir)
+        self.workers = resolve_worker_count(workers)
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.last_run: Dict[str, Any] = {}
+
+    def _chunk_size_for(self, count: int, workers: int) -> int:
+        if self.chunk_size:
+            return max(1, self.chunk_size)
+        return max(1, -(-count // (workers * CHUNKS_PER_WORKER)))
+
+    def render(
+        self, paths: Sequence[Path], build_record: BuildRecord
+    ) -> List[RenderedFile]:
+        """Render ``paths`` and return one outcome per path, in order.
+
+        Args:
+            paths: Files to render
+            build_record: In-process renderer used for serial batches
+
+        Returns:
+            List of RenderedFile aligned with ``paths``
+        """
+        start = time.perf_counter()
+        workers = min(self.workers, len(paths))
+        if workers <= 1 or len(paths) < self.parallel_threshold:
+            results = [render_file(path, build_record) for path in paths]
+            mode = "serial"
+        else:
+            try:
+                results = self._render_parallel(paths, workers)
+                mode = "parallel"
+            except Exception as e:
+                # A broken pool must not take the rebuild down with it
+                logger.warning(f"Parallel ingestion failed, rendering serially: {e}")
+                results = [render_file(path, build_record) for path in paths]
+                mode = "serial"
+                workers = 1
+
+        self.last_run = {
+            "files": len(paths),
+            "mode": mode,
+            "workers": workers if mode == "parallel" else 1,
+            "duration_seconds": time.perf_counter() - start,
+        }
+        return results
+
+    def _render_parallel(self, paths: Sequence[Path], workers: int) -> List[RenderedFile]:
+        chunk_size = self._chunk_size_for(len(paths), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(self._content_dir,),
+        ) as pool:
+            # Executor.map yields in submission order, keeping output deterministic
+            return list(
+                pool.map(_render_in_worker, [str(path) for path in paths], chunksize=chunk_size)
+            )
@@ -0,0 +1,238 @@
+"""
+Two-tier content records: compact metadata plus lazily loaded bodies.
+
+Listings only need titles, dates, tags and excerpts, so ContentService keeps
+a slotted ContentRecord per document and fetches the rendered HTML, markdown
+and plain text through a BodyStore, a bounded LRU that reloads bodies from
+the content index (or re-renders the file) on demand. Resident memory then
+grows with the number of documents' metadata, not with the size of their
+bodies.
+"""
+
+import threading
+from collections import ChainMap
+from collections.abc import Mapping as MappingABC
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+from app.services.content_cache import BODY, ContentCache
+
+# Keys served by the BodyStore instead of being held on the record
+BODY_FIELDS = ("html", "markdown", "plain_text")
+
+
+class BodyStore:
+    """
+    Bounded LRU of document bodies keyed by content index key.
+
+    Features:
+    - Loads missing bodies through a caller-supplied loader
+    - Keeps bodies in the body tier of a ContentCache, which may be shared
+      with other entries so that everything counts against one byte budget
+    - Evicts the least recently used body once ``max_entries`` is reached
+    - Thread-safe; the loader runs outside the lock
+    - Hit, miss and eviction counters for metrics
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Dict[str, str]],
+        max_entries: int = 128,
+        cache: Optional[ContentCache] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            loader: Returns ``{"html": ..., "markdown": ...}`` for a key
+            max_entries: Maximum number of bodies kept in memory; ignored
+                when ``cache`` is given, which carries its own limits
+            cache: Shared cache to keep bodies in (a private one by default)
+        """
+        self._loader = loader
+        self._tier = BODY
+        if cache is None:
+            cache = ContentCache(max_entries={BODY: max(1, max_entries)})
+        self._cache = cache
+        self._max_entries = self._cache.max_entries(BODY)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return f"body:{key}"
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions(self._tier)
+
+    def get(self, key: str) -> Dict[str, str]:
+        """Return the bodies for ``key``, loading them if not cached."""
+        bodies = self._cache.get(self._key(key))
+        with self._lock:
+            if bodies is not None:
+                self.hits += 1
+                return bodies
+            self.misses += 1
+
+        bodies = self._loader(key)
+        self.put(key, bodies)
+        return bodies
+
+    def put(self, key: str, bodies: Dict[str, str]) -> None:
+        """Insert bodies for ``key``, evicting older entries if over budget."""
+        self._cache.set(self._key(key), bodies, tier=self._tier)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop the bodies for ``key``, or every body when key is None."""
+        if key is None:
+            self._cache.clear(self._tier)
+        else:
+            self._cache.pop(self._key(key))
+
+    def __len__(self) -> int:
+        return self._cache.count(self._tier)
+
+    def stats(self) -> Dict[str, int]:
+        """Return occupancy and hit/miss/eviction counters."""
+        return {
+            "entries": len(self),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ContentRecord(MappingABC):
+    """
+    Read-only metadata of one document, usable anywhere a content dict is
+    expected.
+
+    Common frontmatter fields and the derived excerpt and reading stats live
+    in slots; anything else goes into a small overflow dict. The BODY_FIELDS
+    (``record["html"]`` and friends) are fetched from the BodyStore on access. Unset fields are left unassigned so that
+    attribute access (as done by Jinja) falls back to item lookup.
+
+    Records are shared by every request reading the same snapshot, so item
+    assignment is not supported; decorate them with :func:`overlay` instead.
+    """
+
+    FIELDS = (
+        "slug",
+        "content_type",
+        "file_path",
+        "title",
+        "created",
+        "updated",
+        "tags",
+        "status",
+        "growth_stage",
+        "excerpt",
+        "word_count",
+        "reading_time",
+    )
+    __slots__ = FIELDS + ("_extra", "_store", "_body_key")
+
+    def __init__(
+        self,
+        data: Mapping[str, Any],
+        store: Optional[BodyStore] = None,
+        body_key: Optional[str] = None,
+    ):
+        """
+        Build a record from a content dict.
+
+        Args:
+            data: Processed content dictionary (bodies are dropped when a
+                store is given)
+            store: BodyStore that serves the document's bodies
+            body_key: Key of the document in the store
+        """
+        assign = object.__setattr__
+        assign(self, "_store", store)
+        assign(self, "_body_key", body_key)
+        extra = None
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                assign(self, key, value)
+            elif store is not None and key in BODY_FIELDS:
+                continue
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        assign(self, "_extra", extra)
+
+    def _has_body(self, key: str) -> bool:
+        return self._store is not None and key in BODY_FIELDS
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        if self._has_body(key):
+            return self._store.get(self._body_key)[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return True
+        return self._has_body(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+        if self._store is not None:
+            for key in BODY_FIELDS:
+                if self._extra is None or key not in self._extra:
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        slug = getattr(self, "slug", "?")
+        content_type = getattr(self, "content_type", "?")
+        return f"<ContentRecord {content_type}/{slug}>"
+
+    def copy(self) -> "ChainMap[str, Any]":
+        """Return a mutable view of the record; changes stay in the view."""
+        return overlay(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def to_dict(self, include_body: bool = True) -> Dict[str, Any]:
+        """Materialize the record as a plain dict.
+
+        Args:
+            include_body: Load and include ``html`` and ``markdown``
+        """
+        if include_body:
+            return dict(self.items())
+        return {key: self[key] for key in self if not self._has_body(key)}
+
+
+_FIELD_SET = frozenset(ContentRecord.FIELDS)
+
+
+def overlay(item: Mapping[str, Any], **fields: Any) -> "ChainMap[str, Any]":
+    """Return a per-request view of ``item`` with ``fields`` layered on top.
+
+    Lookups fall through to ``item``; assignments to the view land in the
+    overlay, so the shared record is never modified.
+    """
+    return ChainMap(dict(fields), item)
@@ -3,27 +3,115 @@ ContentService implementation providing IContentProvider interface.
 Uses composition to leverage existing ContentManager functionality.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
+import logging
+import os
+import threading
 import yaml
 import markdown
 from pydantic import ValidationError
 import time
 
-from app.interfaces import IContentProvider
+from app.interfaces import SLUG_LOOKUP_ORDER, IContentProvider
 from app.models import GrowthStage
+from app.services.content_cache import BODY, METADATA, PINNED, ContentCache
+from app.services.content_index import ContentIndex, hash_content
+from app.services.content_ingest import (
+    DEFAULT_PARALLEL_THRESHOLD,
+    INVALID,
+    RENDERED,
+    ContentIngestor,
+)
+from app.services.content_record import BODY_FIELDS, BodyStore, ContentRecord
+from app.services.content_text import summarize_html
+from app.services.content_snapshot import ContentSnapshot, ReadOnlyList, sort_key
+from app.services.content_watcher import ContentChangeDetector, ContentChanges
+from app.services.highlight_cache import get_highlight_cache, install_highlight_cache
+from app.utils.frontmatter import load_yaml, split_frontmatter
+from app.utils.markdown_pool import MarkdownPool
+from app.utils.single_flight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+# Content directories left out of get_all_content()
+EXCLUDED_FROM_ALL_CONTENT = ("unpublished", "pages")
+
+# Called with (previous snapshot version, new snapshot, files changed in between)
+SnapshotListener = Callable[[int, ContentSnapshot, ContentChanges], None]
+
+# Cached in place of a record when a slug has no file, so repeated lookups
+# of missing content skip the filesystem until the next change event
+_MISSING = object()
+
+# Extensions used to render content; part of the content index signature
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.meta',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.toc',
+]
+
+# Code blocks are highlighted through the shared highlight cache
+install_highlight_cache()
+
+# Converters are not thread-safe; each render borrows one from the pool
+MARKDOWN_POOL = MarkdownPool(lambda: markdown.Markdown(extensions=MARKDOWN_EXTENSIONS))
+
+
+def _group_by_growth_stage(snapshot: ContentSnapshot) -> Dict[str, List[Dict[str, Any]]]:
+    """Group a snapshot's items by growth stage, newest first within each."""
+    by_stage = {stage.value: [] for stage in GrowthStage}
+    for content in snapshot.items:
+        stage = content.get("growth_stage", GrowthStage.SEEDLING.value)
+        if stage in by_stage:
+            by_stage[stage].append(content)
+    return {stage: ReadOnlyList(items) for stage, items in by_stage.items()}
 
 
 class ContentService(IContentProvider):
     """Service for managing and retrieving content with caching."""
     
-    def __init__(self, content_dir: Optional[str] = None, cache_ttl: int = 300):
+    def __init__(
+        self,
+        content_dir: Optional[str] = None,
+        cache_ttl: int = 300,
+        index_path: Optional[str] = None,
+        change_detector: Optional[ContentChangeDetector] = None,
+        stale_while_revalidate: bool = False,
+        body_cache_size: int = 128,
+        cache_max_bytes: Optional[int] = None,
+        ingest_workers: Optional[int] = 0,
+        ingest_chunk_size: Optional[int] = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    ):
         """Initialize ContentService with configurable content directory and cache TTL.
         
         Args:
             content_dir: Path to content directory (defaults to app/content)
-            cache_ttl: Cache time-to-live in seconds (default 300)
+            cache_ttl: Cache time-to-live in seconds (default 300); ignored
+                when a change detector is supplied
+            index_path: Optional path to the persistent content index; when
+                omitted the index only lives in memory
+            change_detector: Optional detector for the content directory; when
+                given, cache entries live until the files they depend on change
+            stale_while_revalidate: When the all-content snapshot goes stale,
+                keep serving it and rebuild in a background worker thread
+            body_cache_size: Number of rendered bodies (HTML + markdown) kept
+                in memory; listings only hold metadata
+            cache_max_bytes: Estimated bytes the cache may hold across bodies
+                and metadata; bodies are evicted first (unbounded if None)
+            ingest_workers: Processes used to render files during full
+                rebuilds; 0 uses one per CPU, 1 renders serially
+            ingest_chunk_size: Files sent to a worker per task (derived from
+                the batch size when omitted)
+            parallel_threshold: Minimum number of files needing rendering
+                before a rebuild uses the process pool
         """
         if content_dir:
             self._content_dir = Path(content_dir)
@@ -31,36 +119,110 @@ class ContentService(IContentProvider):
             self._content_dir = Path("app/content")
         
         self._cache_ttl = cache_ttl
-        self._cache = {}
-        self._cache_timestamps = {}
-        
-        # Configure markdown processor
-        self._md = markdown.Markdown(
-            extensions=[
-                'markdown.extensions.meta',
-                'markdown.extensions.fenced_code',
-                'markdown.extensions.tables',
-                'markdown.extensions.codehilite',
-                'markdown.extensions.toc',
-            ]
+        self._cache = ContentCache(
+            max_bytes=cache_max_bytes, max_entries={BODY: max(1, body_cache_size)}
+        )
+        self._change_detector = change_detector
+        
+        # Pre-built markdown converters shared by every service in the process
+        self._markdown = MARKDOWN_POOL
+        self._md = MARKDOWN_POOL.prototype
+        
+        # All-content snapshot, replaced wholesale by each rebuild
+        self._stale_while_revalidate = stale_while_revalidate
+        self._snapshot: Optional[ContentSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+        self._invalidations = 0
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_future: Optional[Future] = None
+        self._stats = {"rebuilds": 0, "stale_served": 0, "refresh_errors": 0}
+        self._last_refresh_error: Optional[str] = None
+        
+        # Files changed since the published snapshot, handed to snapshot listeners
+        self._pending_changes = ContentChanges()
+        self._snapshot_listeners: List[SnapshotListener] = []
+        
+        # Concurrent cache misses for the same key share one rebuild
+        self._flight = SingleFlight()
+
+        # Parsed records survive restarts through the content index
+        self._index = ContentIndex(
+            index_path, signature=f"markdown-{markdown.__version__}:" + ",".join(MARKDOWN_EXTENSIONS)
+        )
+        
+        # Bodies are loaded on demand; records only carry metadata
+        self._bodies = BodyStore(self._load_body, cache=self._cache)
+        
+        # Files missing from the index are rendered in parallel on rebuilds
+        self._ingestor = ContentIngestor(
+            str(self._content_dir),
+            workers=ingest_workers,
+            chunk_size=ingest_chunk_size,
+            parallel_threshold=parallel_threshold,
         )
     
-    def _is_cache_valid(self, key: str) -> bool:
-        """Check if cache entry is still valid."""
-        if key not in self._cache_timestamps:
-            return False
-        return (time.time() - self._cache_timestamps[key]) < self._cache_ttl
+    def _apply_changes(self, changes: ContentChanges) -> None:
+        """Invalidate cache entries that depend on changed files.
+        
+        Args:
+            changes: Files added, modified or removed since the last check
+        """
+        for path in changes.paths:
+            content_type, _, filename = path.partition("/")
+            slug = filename[:-3] if filename.endswith(".md") else filename
+            
+            stale_keys = [f"{content_type}:{slug}"]
+            stale_keys.extend(
+                key for key in self._cache.keys()
+                if key.startswith(f"content:{content_type}:")
+            )
+            if content_type not in EXCLUDED_FROM_ALL_CONTENT:
+                stale_keys.append("all_content")
+                self._invalidations += 1
+            
+            for key in stale_keys:
+                self._cache.pop(key)
+        
+        for path in changes.paths:
+            self._bodies.invalidate(path)
+        for path in changes.removed:
+            self._index.discard(path)
+        
+        with self._snapshot_lock:
+            self._pending_changes.update(changes)
+        
+        if changes:
+            logger.info(
+                f"Content changed: {len(changes.added)} added, "
+                f"{len(changes.modified)} modified, {len(changes.removed)} removed"
+            )
+    
+    def check_for_changes(self, force: bool = False) -> ContentChanges:
+        """Poll the change detector and invalidate affected cache entries.
+        
+        Args:
+            force: Ignore the detector's poll interval
+            
+        Returns:
+            The changes that were applied (empty without a change detector)
+        """
+        if self._change_detector is None:
+            return ContentChanges()
+        changes = self._change_detector.check(force=force)
+        if changes:
+            self._apply_changes(changes)
+        return changes
     
     def _get_from_cache(self, key: str) -> Optional[Any]:
         """Get value from cache if valid."""
-        if self._is_cache_valid(key):
-            return self._cache.get(key)
-        return None
+        self.check_for_changes()
+        # With a change detector, entries are dropped by _apply_changes, never by age
+        max_age = None if self._change_detector is not None else self._cache_ttl
+        return self._cache.get(key, max_age=max_age)
     
-    def _set_cache(self, key: str, value: Any) -> None:
-        """Set cache value with timestamp."""
-        self._cache[key] = value
-        self._cache_timestamps[key] = time.time()
+    def _set_cache(self, key: str, value: Any, tier: str = METADATA) -> None:
+        """Set cache value, evicting older entries to stay within budget."""
+        self._cache.set(key, value, tier=tier)
     
     def _parse_frontmatter(self, content: str) -> tuple[Dict[str, Any], str]:
         """Parse YAML frontmatter and return metadata and content.
@@ -71,26 +233,12 @@ class ContentService(IContentProvider):
         Returns:
             Tuple of (metadata dict, markdown content)
         """
-        if not content.startswith('---'):
+        yaml_content, markdown_content = split_frontmatter(content)
+        if yaml_content is None:
             return {}, content
         
         try:
-            # Find the end of frontmatter
-            end_marker = content.find('\n---\n', 4)
-            if end_marker == -1:
-                return {}, content
-            
-            # Extract and parse YAML
-            yaml_content = content[4:end_marker]
-            metadata = yaml.safe_load(yaml_content)
-            if metadata is None:
-                metadata = {}
-            
-            # Extract markdown content
-            markdown_content = content[end_marker + 5:]
-            
-            return metadata, markdown_content
-            
+            return load_yaml(yaml_content), markdown_content
         except yaml.YAMLError:
             # Return empty metadata on YAML error
             return {}, content
@@ -104,9 +252,7 @@ class ContentService(IContentProvider):
         Returns:
             HTML string
         """
-        # Reset the markdown processor for clean conversion
-        self._md.reset()
-        return self._md.convert(markdown_text)
+        return self._markdown.convert(markdown_text)
     
     def _validate_growth_stage(self, metadata: Dict[str, Any]) -> None:
         """Validate growth stage in metadata.
@@ -139,8 +285,15 @@ class ContentService(IContentProvider):
                         ]
                     )
     
+    def _index_key(self, file_path: Path) -> str:
+        """Return the content index key for a file (path relative to content dir)."""
+        try:
+            return file_path.relative_to(self._content_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
     def _process_content_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Process a single content file.
+        """Process a single content file, reusing the indexed record if unchanged.
         
         Args:
             file_path: Path to the markdown file
@@ -148,44 +301,154 @@ class ContentService(IContentProvider):
         Returns:
             Processed content dictionary or None if error
         """
+        cached, stat = self._lookup_indexed(file_path)
+        if cached is not None or stat is None:
+            return cached
+
+        key = self._index_key(file_path)
         try:
-            content = file_path.read_text(encoding='utf-8')
-            metadata, markdown_content = self._parse_frontmatter(content)
-            
-            # Validate growth stage if present
-            self._validate_growth_stage(metadata)
+            raw_bytes = file_path.read_bytes()
+            result = self._build_record(file_path, raw_bytes.decode('utf-8'))
+        except ValidationError:
+            # Invalid files are never indexed so the error is raised every time
+            self._index.discard(key)
+            raise
+        except Exception:
+            return None
+
+        self._index.store(key, stat, hash_content(raw_bytes), result)
+        return result
+
+    def _lookup_indexed(self, file_path: Path) -> Tuple[Optional[Dict[str, Any]], Optional[os.stat_result]]:
+        """Return the indexed record of a file if it is unchanged.
+        
+        Args:
+            file_path: Path to the markdown file
             
-            # Convert markdown to HTML
-            html = self._convert_markdown_to_html(markdown_content)
+        Returns:
+            Tuple of (indexed record or None, stat result or None if the
+            file cannot be read)
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None, None
+
+        cached = self._index.lookup(
+            self._index_key(file_path), stat, file_path.read_bytes
+        )
+        if cached is not None:
+            # Paths are stored relative so a prebuilt index works from any checkout
+            cached["file_path"] = str(file_path)
+        return cached, stat
+
+    def _ingest(self, files: List[Path]) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, int]]:
+        """Process many files, rendering the ones not in the index in parallel.
+        
+        Args:
+            files: Markdown files to process
             
-            # Build result dictionary
-            result = {
-                "slug": file_path.stem,
-                "content_type": file_path.parent.name,
-                "file_path": str(file_path),
-                "html": html,
-                "markdown": markdown_content,
-                **metadata
-            }
+        Returns:
+            Tuple of (processed content per file in input order, None where
+            the file could not be processed; counts of indexed, reused and
+            failed files)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        stats = {"indexed": 0, "reused": 0, "failed": 0}
+        pending = []
+        for position, file_path in enumerate(files):
+            cached, stat = self._lookup_indexed(file_path)
+            if cached is not None:
+                results[position] = cached
+                stats["reused"] += 1
+            elif stat is None:
+                stats["failed"] += 1
+            else:
+                pending.append((position, file_path, stat))
+
+        rendered = self._ingestor.render(
+            [file_path for _, file_path, _ in pending], self._build_record
+        )
+        # Records are stored once rendering is done, in one short transaction
+        with self._index.batch():
+            for (position, file_path, stat), outcome in zip(pending, rendered):
+                key = self._index_key(file_path)
+                if outcome.status == RENDERED:
+                    self._index.store(key, stat, outcome.digest, outcome.record)
+                    results[position] = outcome.record
+                    stats["indexed"] += 1
+                else:
+                    if outcome.status == INVALID:
+                        self._index.discard(key)
+                    stats["failed"] += 1
+        return results, stats
+
+    def _build_record(self, file_path: Path, content: str) -> Dict[str, Any]:
+        """Parse and render file contents into a content record.
+        
+        Args:
+            file_path: Path to the markdown file
+            content: Decoded file contents
             
-            # Ensure required fields have defaults
-            if "title" not in result:
-                result["title"] = file_path.stem.replace("-", " ").title()
-            if "created" not in result:
-                result["created"] = datetime.now().isoformat()
-            if "tags" not in result:
-                result["tags"] = []
-            if "status" not in result:
-                result["status"] = "Evergreen"
+        Returns:
+            Processed content dictionary
             
-            return result
+        Raises:
+            ValidationError: If the frontmatter fails validation
+        """
+        metadata, markdown_content = self._parse_frontmatter(content)
+        
+        # Validate growth stage if present
+        self._validate_growth_stage(metadata)
+        
+        # Convert markdown to HTML
+        html = self._convert_markdown_to_html(markdown_content)
+        
+        # Build result dictionary; frontmatter may override the derived text
+        result = {
+            "slug": file_path.stem,
+            "content_type": file_path.parent.name,
+            "file_path": str(file_path),
+            "html": html,
+            "markdown": markdown_content,
+            **summarize_html(html),
+            **metadata
+        }
+        
+        # Ensure required fields have defaults
+        if "title" not in result:
+            result["title"] = file_path.stem.replace("-", " ").title()
+        if "created" not in result:
+            result["created"] = datetime.now().isoformat()
+        if "tags" not in result:
+            result["tags"] = []
+        if "status" not in result:
+            result["status"] = "Evergreen"
+        
+        return result
+
+    def _to_record(self, content: Dict[str, Any], file_path: Path) -> ContentRecord:
+        """Wrap a processed content dict as a metadata-only record."""
+        return ContentRecord(content, self._bodies, self._index_key(file_path))
+    
+    def _load_body(self, key: str) -> Dict[str, str]:
+        """Load the HTML, markdown and plain text of a document for the body store.
+        
+        Args:
+            key: Content index key (path relative to the content directory)
             
+        Returns:
+            Dictionary with 'html', 'markdown' and 'plain_text' (empty if the
+            file is gone)
+        """
+        file_path = self._content_dir / key
+        try:
+            content = self._process_content_file(file_path)
         except ValidationError:
-            # Re-raise validation errors
-            raise
-        except Exception:
-            # Log or handle other errors
-            return None
+            content = None
+        if content is None:
+            return {field: "" for field in BODY_FIELDS}
+        return {field: content.get(field, "") for field in BODY_FIELDS}
     
     def get_content_by_slug(self, content_type: str, slug: str) -> Optional[Dict[str, Any]]:
         """Get content by type and slug.
@@ -200,6 +463,8 @@ class ContentService(IContentProvider):
         # Check cache first
         cache_key = f"{content_type}:{slug}"
         cached = self._get_from_cache(cache_key)
+        if cached is _MISSING:
+            return None
         if cached is not None:
             return cached
         
@@ -208,6 +473,7 @@ class ContentService(IContentProvider):
         
         # Check if file exists
         if not file_path.exists():
+            self._set_cache(cache_key, _MISSING)
             return None
         
         # Process the file - this may raise ValidationError
@@ -217,15 +483,65 @@ class ContentService(IContentProvider):
             # Re-raise validation errors for the caller to handle
             raise
         
-        # Cache the result
-        if result:
-            self._set_cache(cache_key, result)
+        if not result:
+            return result
         
-        return result
+        # Keep the freshly rendered body warm and cache only the metadata
+        self._bodies.put(
+            self._index_key(file_path), {field: result.get(field, "") for field in BODY_FIELDS}
+        )
+        record = self._to_record(result, file_path)
+        self._set_cache(cache_key, record)
+        
+        return record
+    
+    def get_contents_by_slugs(
+        self,
+        slugs: Sequence[str],
+        content_types: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve several slugs of unknown content type at once.
+        
+        Published content is answered from the snapshot's slug index.
+        Only types kept out of the snapshot (such as pages) fall back to
+        get_content_by_slug, whose misses are negatively cached. Drafts are
+        not in the snapshot, so their slugs resolve to None here even though
+        get_content_by_slug still returns them.
+        
+        Args:
+            slugs: Slugs to resolve
+            content_types: Acceptable types in order of preference (any
+                published type, then pages, when omitted)
+            
+        Returns:
+            Dictionary mapping each slug to its content, or None if not found
+        """
+        snapshot = self.get_snapshot()
+        fallback_types = [
+            content_type
+            for content_type in (SLUG_LOOKUP_ORDER if content_types is None else content_types)
+            if content_type in EXCLUDED_FROM_ALL_CONTENT
+        ]
+        
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        for slug in slugs:
+            if slug in found:
+                continue
+            content = snapshot.find(slug, content_types)
+            for content_type in fallback_types:
+                if content is not None:
+                    break
+                content = self.get_content_by_slug(content_type, slug)
+            found[slug] = content
+        return found
     
     def get_all_content(self) -> List[Dict[str, Any]]:
         """Get all content across all types.
         
+        With stale-while-revalidate enabled, an expired snapshot is still
+        returned while a background worker builds its replacement; only the
+        very first call builds synchronously.
+        
         Returns:
             List of all content items
         """
@@ -235,43 +551,236 @@ class ContentService(IContentProvider):
         if cached is not None:
             return cached
         
-        all_content = []
-        
         # Check if content directory exists
         if not self._content_dir.exists():
-            return all_content
-        
-        # Iterate through all content directories
-        for content_dir in self._content_dir.iterdir():
-            if content_dir.is_dir() and content_dir.name not in ["unpublished", "pages"]:
-                # Get all markdown files in this directory
-                for file_path in content_dir.glob("*.md"):
-                    try:
-                        content = self._process_content_file(file_path)
-                        if content and content.get("status") != "draft":
-                            all_content.append(content)
-                    except ValidationError:
-                        # Skip files with validation errors
-                        continue
-        
-        # Sort by created date (newest first) - handle both datetime and string formats
-        def get_sort_key(item):
-            created = item.get("created", "")
-            # If it's already a string, return it
-            if isinstance(created, str):
-                return created
-            # If it's a datetime/date object, convert to ISO string
-            if hasattr(created, 'isoformat'):
-                return created.isoformat()
-            return str(created)
-        
-        all_content.sort(key=get_sort_key, reverse=True)
-        
-        # Cache the result
-        self._set_cache(cache_key, all_content)
+            return []
+        
+        snapshot = self._snapshot
+        if self._stale_while_revalidate and snapshot is not None:
+            self._schedule_refresh()
+            self._stats["stale_served"] += 1
+            return snapshot.items
+        
+        return self._flight.do(cache_key, self._rebuild_snapshot).items
+    
+    def iter_content(
+        self,
+        content_types: Optional[Sequence[str]] = None,
+        order: str = "desc",
+        filters: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Yield content in creation date order, one item at a time.
+        
+        Walks the snapshot's precomputed orderings (merged across content
+        types), so taking the first N items touches N records and loads no
+        bodies unless the caller reads them.
+        
+        Args:
+            content_types: Content types to include (all published types
+                when omitted)
+            order: 'desc' for newest first, 'asc' for oldest first
+            filters: Optional predicate an item must satisfy
+            
+        Yields:
+            Content records
+        """
+        snapshot = self.get_snapshot()
+        yield from snapshot.iter_items(content_types, "created", order, filters)
+    
+    def get_snapshot(self) -> ContentSnapshot:
+        """Return the current all-content snapshot with its lookup indexes.
+        
+        Returns:
+            The published snapshot (empty if there is no content directory)
+        """
+        items = self.get_all_content()
+        snapshot = self._snapshot
+        if snapshot is None:
+            return ContentSnapshot(items=items)
+        return snapshot
+    
+    def _load_all_content(self) -> List[Dict[str, Any]]:
+        """Process every published content file, newest first."""
+        # Sorted so ingestion order, and thus index writes, are deterministic
+        files = sorted(
+            file_path
+            for content_dir in self._content_dir.iterdir()
+            if content_dir.is_dir() and content_dir.name not in EXCLUDED_FROM_ALL_CONTENT
+            for file_path in content_dir.glob("*.md")
+        )
+        processed, _ = self._ingest(files)
+        
+        all_content = [
+            self._to_record(content, file_path)
+            for content, file_path in zip(processed, files)
+            if content and content.get("status") != "draft"
+        ]
+        
+        # Newest first, using the same key as the snapshot's created ordering
+        all_content.sort(key=sort_key, reverse=True)
+        
+        # Drop entries of files deleted since the index was written
+        self._index.prune(lambda key: (self._content_dir / key).exists())
         
         return all_content
     
+    def _rebuild_snapshot(self) -> ContentSnapshot:
+        """Build a new snapshot and swap it in.
+        
+        If content changed while the rebuild was running, the snapshot is
+        still published but the cache entry stays invalid so the next request
+        triggers another rebuild.
+        
+        Returns:
+            The newly published snapshot
+        """
+        invalidations = self._invalidations
+        with self._snapshot_lock:
+            # Changes reported from here on may or may not make it into this
+            # snapshot, so they are also passed on with the next one
+            changes, self._pending_changes = self._pending_changes, ContentChanges()
+        start = time.perf_counter()
+        try:
+            items = self._load_all_content()
+        except BaseException:
+            with self._snapshot_lock:
+                self._pending_changes.update(changes)
+            raise
+        duration = time.perf_counter() - start
+        
+        with self._snapshot_lock:
+            previous = self._snapshot
+            version = previous.version + 1 if previous else 1
+            snapshot = ContentSnapshot(
+                items=items, version=version, build_duration=duration
+            )
+            self._snapshot = snapshot
+            # Type listings derived from the previous snapshot
+            for key in self._cache.keys(PINNED):
+                if key.startswith("content:"):
+                    self._cache.pop(key)
+            if invalidations == self._invalidations:
+                # The snapshot owns the list; pinning only avoids counting it twice
+                self._set_cache("all_content", snapshot.items, tier=PINNED)
+            self._stats["rebuilds"] += 1
+        
+        logger.debug(f"Content snapshot v{version} built in {duration:.3f}s ({len(items)} items)")
+        
+        # Without a change detector nobody knows what changed in between
+        if previous is not None and self._change_detector is not None:
+            for listener in list(self._snapshot_listeners):
+                try:
+                    listener(previous.version, snapshot, changes)
+                except Exception:
+                    logger.exception("Snapshot listener failed")
+        return snapshot
+    
+    def add_snapshot_listener(self, listener: SnapshotListener) -> None:
+        """Call ``listener`` each time a rebuilt snapshot replaces the previous one.
+        
+        The listener receives the previous snapshot's version, the new
+        snapshot and the files reported changed in between, so state derived
+        from the previous snapshot can be patched rather than rebuilt. Only
+        called when a change detector is configured; otherwise the changes
+        between snapshots are unknown.
+        
+        Args:
+            listener: Callable taking (previous_version, snapshot, changes)
+        """
+        self._snapshot_listeners.append(listener)
+    
+    def _background_refresh(self) -> None:
+        """Rebuild the snapshot on the worker thread, keeping the old one on failure."""
+        try:
+            self._flight.do("all_content", self._rebuild_snapshot)
+            self._last_refresh_error = None
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            self._last_refresh_error = str(e)
+            logger.exception("Background content refresh failed; serving previous snapshot")
+    
+    def _schedule_refresh(self) -> Future:
+        """Start a background rebuild unless one is already running."""
+        with self._snapshot_lock:
+            if self._refresh_future is None or self._refresh_future.done():
+                if self._refresh_executor is None:
+                    self._refresh_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="content-refresh"
+                    )
+                self._refresh_future = self._refresh_executor.submit(
+                    self._background_refresh
+                )
+            return self._refresh_future
+    
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """Block until the in-flight background rebuild (if any) finishes.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if no rebuild is running afterwards
+        """
+        future = self._refresh_future
+        if future is None:
+            return True
+        try:
+            future.result(timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+    
+    def get_snapshot_metrics(self) -> Dict[str, Any]:
+        """Report the state of the all-content snapshot.
+        
+        Returns:
+            Dictionary with snapshot age, last rebuild duration and counters
+        """
+        snapshot = self._snapshot
+        future = self._refresh_future
+        return {
+            "stale_while_revalidate": self._stale_while_revalidate,
+            "snapshot_version": snapshot.version if snapshot else 0,
+            "snapshot_items": len(snapshot) if snapshot else 0,
+            "snapshot_age_seconds": round(snapshot.age, 3) if snapshot else None,
+            "last_rebuild_duration_seconds": (
+                round(snapshot.build_duration, 4) if snapshot else None
+            ),
+            "refresh_in_progress": future is not None and not future.done(),
+            "last_refresh_error": self._last_refresh_error,
+            "body_cache": self._bodies.stats(),
+            "cache": self._cache.stats(),
+            "last_ingest": self._ingestor.last_run,
+            "markdown_pool": self._markdown.stats(),
+            "highlight_cache": get_highlight_cache().stats(),
+            **self._stats,
+        }
+    
+    def dispose(self) -> None:
+        """Stop the background refresh worker and change detector."""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True)
+            self._refresh_executor = None
+        if self._change_detector is not None:
+            self._change_detector.close()
+    
+    def build_index(self) -> Dict[str, int]:
+        """Process every content file and write the content index.
+        
+        Used to prebuild the index (for example while building the container
+        image) so the first request after a cold start skips rendering.
+        
+        Returns:
+            Dictionary with counts of indexed, reused and failed files
+        """
+        if not self._content_dir.exists():
+            return {"indexed": 0, "reused": 0, "failed": 0}
+        
+        _, stats = self._ingest(sorted(self._content_dir.glob("*/*.md")))
+        
+        self._index.prune(lambda key: (self._content_dir / key).exists())
+        return stats
+    
     def get_content_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """Get content filtered by tag.
         
@@ -281,11 +790,7 @@ class ContentService(IContentProvider):
         Returns:
             List of content items with the specified tag
         """
-        all_content = self.get_all_content()
-        return [
-            content for content in all_content
-            if tag in content.get("tags", [])
-        ]
+        return self.get_snapshot().select(tags=[tag])
     
     def get_content(self, content_type: str, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get content by type with optional limit.
@@ -297,12 +802,38 @@ class ContentService(IContentProvider):
         Returns:
             Dictionary with 'content' list and metadata
         """
-        # Check cache
-        cache_key = f"content:{content_type}:{limit}"
+        listing = self._type_listing(content_type)
+        
+        # Limits slice the canonical listing rather than building their own
+        content_list = listing[:limit] if limit else listing
+        return {
+            "content": content_list,
+            "total": len(content_list),
+            "content_type": content_type
+        }
+    
+    def _type_listing(self, content_type: str) -> List[Dict[str, Any]]:
+        """Return every published item of one type, newest first."""
+        cache_key = f"content:{content_type}:"
         cached = self._get_from_cache(cache_key)
         if cached is not None:
             return cached
         
+        return self._flight.do(
+            cache_key, self._build_content_listing, cache_key, content_type
+        )
+    
+    def _build_content_listing(self, cache_key: str, content_type: str) -> List[Dict[str, Any]]:
+        """Build and cache the canonical listing of one content type."""
+        if content_type not in EXCLUDED_FROM_ALL_CONTENT:
+            # Shares the snapshot's records; dropped when the snapshot is replaced
+            snapshot = self.get_snapshot()
+            content_list = snapshot.listing(content_type)
+            with self._snapshot_lock:
+                if snapshot is self._snapshot:
+                    self._set_cache(cache_key, content_list, tier=PINNED)
+            return content_list
+        
         content_list = []
         content_dir = self._content_dir / content_type
         
@@ -312,38 +843,18 @@ class ContentService(IContentProvider):
                 try:
                     content = self._process_content_file(file_path)
                     if content and content.get("status") != "draft":
-                        content_list.append(content)
+                        content_list.append(self._to_record(content, file_path))
                 except ValidationError:
                     # Skip files with validation errors
                     continue
         
-        # Sort by created date - handle both datetime and string formats
-        def get_sort_key(item):
-            created = item.get("created", "")
-            # If it's already a string, return it
-            if isinstance(created, str):
-                return created
-            # If it's a datetime/date object, convert to ISO string
-            if hasattr(created, 'isoformat'):
-                return created.isoformat()
-            return str(created)
-        
-        content_list.sort(key=get_sort_key, reverse=True)
-        
-        # Apply limit if specified
-        if limit:
-            content_list = content_list[:limit]
+        # Newest first, using the same key as the snapshot's created ordering
+        content_list.sort(key=sort_key, reverse=True)
+        content_list = ReadOnlyList(content_list)
         
-        result = {
-            "content": content_list,
-            "total": len(content_list),
-            "content_type": content_type
-        }
-        
-        # Cache the result
-        self._set_cache(cache_key, result)
+        self._set_cache(cache_key, content_list)
         
-        return result
+        return content_list
     
     def get_bookmarks(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
         """Get bookmark content.
@@ -369,20 +880,7 @@ class ContentService(IContentProvider):
         Returns:
             Dictionary with filtered posts and metadata
         """
-        all_content = self.get_all_content()
-        
-        # Filter by tag
-        filtered = [
-            content for content in all_content
-            if tag in content.get("tags", [])
-        ]
-        
-        # Filter by content types if specified
-        if content_types:
-            filtered = [
-                content for content in filtered
-                if content.get("content_type") in content_types
-            ]
+        filtered = self.get_snapshot().select(types=content_types, tags=[tag])
         
         return {
             "posts": filtered,
@@ -390,76 +888,99 @@ class ContentService(IContentProvider):
             "total": len(filtered)
         }
     
-    async def get_mixed_content(self, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+    async def get_mixed_content(
+        self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get paginated mixed content sorted by date.
         
+        See get_mixed_content_sync, which does the (blocking) work.
+        """
+        return self.get_mixed_content_sync(page=page, per_page=per_page, cursor=cursor)
+    
+    def get_mixed_content_sync(
+        self, page: int = 1, per_page: int = 10, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get paginated mixed content sorted by date, synchronously.
+        
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when a cursor is given
             per_page: Number of items per page
+            cursor: Opaque cursor from a previous page's 'next_cursor'
             
         Returns:
             Dictionary with paginated content and navigation info
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        all_content = self.get_all_content()
-        
-        # Calculate pagination
-        total = len(all_content)
-        start = (page - 1) * per_page
-        end = start + per_page
+        snapshot = self.get_snapshot()
+        return self._paginate(snapshot, page, per_page, cursor, "content")
+    
+    def _paginate(
+        self,
+        snapshot: ContentSnapshot,
+        page: int,
+        per_page: int,
+        cursor: Optional[str],
+        items_key: str,
+        content_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Slice one page (newest first) out of the snapshot's created ordering."""
+        total = len(snapshot.ordering("created", "desc", content_type))
         
-        # Get page content
-        page_content = all_content[start:end]
+        if cursor:
+            page_items, next_cursor = snapshot.page_after(cursor, per_page)
+            has_next = next_cursor is not None
+        else:
+            start = (page - 1) * per_page
+            page_items = snapshot.page(start, per_page, content_type=content_type)
+            has_next = start + per_page < total
+            next_cursor = (
+                snapshot.cursor_after(page_items[-1], content_type=content_type)
+                if has_next and page_items
+                else None
+            )
         
         return {
-            "content": page_content,
+            items_key: page_items,
             "page": page,
             "per_page": per_page,
             "total": total,
             "total_pages": (total + per_page - 1) // per_page,
-            "has_next": end < total,
-            "has_prev": page > 1
+            "has_next": has_next,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor,
         }
     
     def get_tag_counts(self) -> Dict[str, int]:
         """Get count of content items per tag.
         
+        Tags differing only in case are counted together under their most
+        common spelling.
+        
         Returns:
             Dictionary mapping tags to content counts
         """
-        tag_counts = {}
-        all_content = self.get_all_content()
-        
-        for content in all_content:
-            for tag in content.get("tags", []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        return tag_counts
+        return self.get_snapshot().tag_counts()
     
-    def get_til_posts(self, page: int = 1, per_page: int = 30) -> Dict[str, Any]:
+    def get_til_posts(
+        self, page: int = 1, per_page: int = 30, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get paginated TIL posts.
         
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when a cursor is given
             per_page: Number of items per page
+            cursor: Opaque cursor from a previous page's 'next_cursor'
             
         Returns:
             Dictionary with TIL posts and pagination info
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        til_content = self.get_content("til")
-        posts = til_content.get("content", [])
-        
-        # Calculate pagination
-        total = len(posts)
-        start = (page - 1) * per_page
-        end = start + per_page
-        
-        return {
-            "posts": posts[start:end],
-            "page": page,
-            "per_page": per_page,
-            "total": total,
-            "total_pages": (total + per_page - 1) // per_page
-        }
+        snapshot = self.get_snapshot()
+        return self._paginate(snapshot, page, per_page, cursor, "posts", content_type="til")
     
     def get_til_posts_by_tag(self, tag: str) -> List[Dict[str, Any]]:
         """Get TIL posts filtered by tag.
@@ -470,13 +991,7 @@ class ContentService(IContentProvider):
         Returns:
             List of TIL posts with the specified tag
         """
-        til_content = self.get_content("til")
-        posts = til_content.get("content", [])
-        
-        return [
-            post for post in posts
-            if tag in post.get("tags", [])
-        ]
+        return self.get_snapshot().select(types=["til"], tags=[tag])
     
     def render_markdown(self, markdown_text: str) -> Dict[str, Any]:
         """Render markdown text to HTML.
@@ -496,14 +1011,18 @@ class ContentService(IContentProvider):
     async def get_homepage_sections(self) -> Dict[str, Any]:
         """Get content sections for homepage display.
         
+        See get_homepage_sections_sync, which does the (blocking) work.
+        """
+        return self.get_homepage_sections_sync()
+    
+    def get_homepage_sections_sync(self) -> Dict[str, Any]:
+        """Get content sections for homepage display, synchronously.
+        
         Returns:
             Dictionary with recent posts for simple blog-style homepage
         """
-        # Get recent content from all types, sorted by date
-        all_content = self.get_all_content()
-        
         # Take the most recent 10 posts for homepage
-        recent_posts = all_content[:10]
+        recent_posts = list(islice(self.iter_content(), 10))
         
         return {
             "recent_posts": recent_posts
@@ -515,20 +1034,12 @@ class ContentService(IContentProvider):
         Returns:
             Dictionary with all content organized for visualization
         """
-        all_content = self.get_all_content()
-        
-        # Group by growth stage
-        by_stage = {}
-        for stage in GrowthStage:
-            by_stage[stage.value] = []
-        
-        for content in all_content:
-            stage = content.get("growth_stage", GrowthStage.SEEDLING.value)
-            if stage in by_stage:
-                by_stage[stage].append(content)
+        snapshot = self.get_snapshot()
+        # Grouped once per snapshot version rather than on every request
+        by_stage = snapshot.derive("garden_by_stage", _group_by_growth_stage)
         
         return {
-            "content": all_content,
+            "content": snapshot.items,
             "by_stage": by_stage,
-            "total": len(all_content)
+            "total": len(snapshot.items)
         }
\ No newline at end of file
@@ -0,0 +1,526 @@
+"""
+Point-in-time view of the published content corpus.
+
+ContentService builds a ContentSnapshot on every full rebuild and swaps it in
+with a single reference assignment, so readers always see either the previous
+or the next corpus, never a half-built one. Snapshots and their records are
+read-only and carry a monotonically increasing version; request handlers
+decorate items through per-request overlays instead of writing to them.
+
+Each snapshot also carries inverted indexes (tag, content type and growth
+stage to document ids) so filtered lookups are set intersections instead of
+scans over every item, plus a slug index so resolving a slug of unknown type
+is a dict lookup rather than a file probe per content type. Document ids are
+positions in ``items``, which is sorted newest first; sorting ids therefore
+preserves that order.
+
+For every sort field the snapshot precomputes a permutation array of ids, so
+paginated listings slice a ready-made order instead of re-sorting, and can
+resume from an opaque keyset cursor that survives snapshot swaps.
+"""
+
+import base64
+import binascii
+import heapq
+import json
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from app.utils.single_flight import SingleFlight
+
+T = TypeVar("T")
+
+SORT_FIELDS = ("created", "updated", "title")
+SORT_ORDERS = ("asc", "desc")
+
+# (sort value, content_type/slug) - the slug breaks ties deterministically
+SortKey = Tuple[str, str]
+
+
+def sort_value(item: Dict[str, Any], sort: str) -> str:
+    """Return the comparable value of ``item`` for a sort field.
+
+    Dates are compared through their ISO form so date, datetime and string
+    values from frontmatter sort together; ``updated`` falls back to
+    ``created`` and titles compare case-insensitively.
+    """
+    if sort == "title":
+        return str(item.get("title") or "").casefold()
+    value = item.get(sort)
+    if sort == "updated" and not value:
+        value = item.get("created")
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def item_uid(item: Dict[str, Any]) -> str:
+    """Return the content_type/slug identity of an item."""
+    return f"{item.get('content_type', '')}/{item.get('slug', '')}"
+
+
+def sort_key(item: Dict[str, Any], sort: str = "created") -> SortKey:
+    """Full ordering key of an item for ``sort`` (ascending)."""
+    return (sort_value(item, sort), item_uid(item))
+
+
+def encode_cursor(sort: str, order: str, content_type: Optional[str], key: SortKey) -> str:
+    """Encode the position after ``key`` as an opaque URL-safe cursor."""
+    payload = json.dumps(
+        {"s": sort, "o": order, "t": content_type, "k": list(key)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key = state["k"]
+        if (
+            state["s"] not in SORT_FIELDS
+            or state["o"] not in SORT_ORDERS
+            or len(key) != 2
+            or not all(isinstance(part, str) for part in key)
+        ):
+            raise ValueError
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error):
+        raise ValueError("Invalid pagination cursor") from None
+    return {
+        "sort": state["s"],
+        "order": state["o"],
+        "content_type": state.get("t"),
+        "key": (key[0], key[1]),
+    }
+
+
+def tag_key(tag: Any) -> str:
+    """Return the case-folded form used to match tags."""
+    return str(tag).strip().casefold()
+
+
+def item_tags(item: Dict[str, Any]) -> List[Any]:
+    """Return an item's tags as a list, tolerating a bare string or None."""
+    tags = item.get("tags") or []
+    if isinstance(tags, str):
+        return [tags]
+    return list(tags)
+
+
+def stage_key(stage: Any) -> str:
+    """Return the lower-case form used to match growth stages."""
+    return str(getattr(stage, "value", stage)).lower()
+
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+class ReadOnlyList(list):
+    """A list that rejects in-place modification.
+
+    Snapshot item lists are shared by every request, but callers expect
+    ``list`` (the IContentProvider contract), so a tuple will not do. Slices
+    and copies are ordinary lists.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("snapshot item lists are read-only")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self):
+        return (ReadOnlyList, (list(self),))
+
+
+@dataclass(frozen=True, eq=False)
+class ContentSnapshot:
+    """Published content items plus build bookkeeping and lookup indexes.
+
+    Snapshots are immutable: ``items`` is a read-only list of read-only
+    records and attributes cannot be reassigned. Anything derived from a
+    snapshot can be cached with :meth:`derive`, which is the same as keying
+    it by ``version``.
+    """
+
+    items: Sequence[Mapping[str, Any]]
+    version: int = 0
+    built_at: float = field(default_factory=time.time)
+    build_duration: float = 0.0
+
+    by_tag: Dict[str, FrozenSet[int]] = field(init=False, repr=False)
+    by_type: Dict[str, FrozenSet[int]] = field(init=False, repr=False)
+    by_growth_stage: Dict[str, FrozenSet[int]] = field(init=False, repr=False)
+    canonical_tags: Dict[str, str] = field(init=False, repr=False)
+    by_slug: Dict[str, Tuple[int, ...]] = field(init=False, repr=False)
+    sort_keys: Dict[str, List[SortKey]] = field(init=False, repr=False)
+    orderings: Dict[str, array] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        assign = object.__setattr__
+        assign(self, "items", ReadOnlyList(self.items))
+        by_tag: Dict[str, Set[int]] = {}
+        by_type: Dict[str, Set[int]] = {}
+        by_stage: Dict[str, Set[int]] = {}
+        by_slug: Dict[str, List[int]] = {}
+        spellings: Dict[str, Counter] = {}
+
+        for doc_id, item in enumerate(self.items):
+            slug = item.get("slug")
+            if slug:
+                by_slug.setdefault(slug, []).append(doc_id)
+            for tag in item_tags(item):
+                key = tag_key(tag)
+                if not key:
+                    continue
+                by_tag.setdefault(key, set()).add(doc_id)
+                spellings.setdefault(key, Counter())[str(tag).strip()] += 1
+            content_type = item.get("content_type")
+            if content_type:
+                by_type.setdefault(content_type, set()).add(doc_id)
+            stage = item.get("growth_stage")
+            if stage:
+                by_stage.setdefault(stage_key(stage), set()).add(doc_id)
+
+        assign(self, "by_tag", {key: frozenset(ids) for key, ids in by_tag.items()})
+        assign(self, "by_type", {key: frozenset(ids) for key, ids in by_type.items()})
+        assign(self, "by_growth_stage", {key: frozenset(ids) for key, ids in by_stage.items()})
+        assign(self, "by_slug", {slug: tuple(ids) for slug, ids in by_slug.items()})
+        # Most common spelling wins; ties prefer the lower-case form, then
+        # the alphabetically first, so the choice never depends on item order
+        assign(self, "canonical_tags", {
+            key: min(counter, key=lambda tag: (-counter[tag], tag != key, tag))
+            for key, counter in spellings.items()
+        })
+
+        # Ascending permutation per sort field; descending walks it backwards
+        sort_keys: Dict[str, List[SortKey]] = {}
+        orderings: Dict[str, array] = {}
+        for sort in SORT_FIELDS:
+            keys = [sort_key(item, sort) for item in self.items]
+            sort_keys[sort] = keys
+            orderings[sort] = array(
+                "I", sorted(range(len(self.items)), key=keys.__getitem__)
+            )
+        assign(self, "sort_keys", sort_keys)
+        assign(self, "orderings", orderings)
+        # Lazily filled memos; entries are only ever added, never replaced
+        assign(self, "_type_orderings", {})
+        assign(self, "_listings", {})
+        assign(self, "_derived", {})
+        # Concurrent builds of one name share a computation; other names proceed
+        assign(self, "_derive_flight", SingleFlight())
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was built."""
+        return max(0.0, time.time() - self.built_at)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def canonical_tag(self, tag: Any) -> Optional[str]:
+        """Return the display spelling of ``tag``, or None if no item uses it."""
+        return self.canonical_tags.get(tag_key(tag))
+
+    def ids_for_tag(self, tag: Any) -> FrozenSet[int]:
+        """Ids of items tagged ``tag`` (case-insensitive)."""
+        return self.by_tag.get(tag_key(tag), _EMPTY)
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Number of items per tag, keyed by canonical spelling."""
+        return {
+            self.canonical_tags[key]: len(ids) for key, ids in self.by_tag.items()
+        }
+
+    def find(
+        self, slug: str, content_types: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the item with ``slug``, or None if the snapshot has none.
+
+        Args:
+            slug: Content slug
+            content_types: Acceptable types in order of preference; any type
+                (newest item first) when omitted
+
+        Returns:
+            The matching item or None
+        """
+        ids = self.by_slug.get(slug)
+        if not ids:
+            return None
+        if content_types is None:
+            return self.items[ids[0]]
+        by_type = {self.items[i].get("content_type"): i for i in reversed(ids)}
+        for content_type in content_types:
+            doc_id = by_type.get(content_type)
+            if doc_id is not None:
+                return self.items[doc_id]
+        return None
+
+    def ordering(
+        self,
+        sort: str = "created",
+        order: str = "desc",
+        content_type: Optional[str] = None,
+    ) -> Sequence[int]:
+        """Return item ids in the requested order.
+
+        Args:
+            sort: One of SORT_FIELDS
+            order: 'asc' or 'desc'
+            content_type: Restrict to one content type (view built once per
+                snapshot, then reused)
+
+        Returns:
+            Sequence of ids into ``items``
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        ids = self._ascending(sort, content_type)
+        return ids if order == "asc" else ids[::-1]
+
+    def _ascending(self, sort: str, content_type: Optional[str]) -> array:
+        if content_type is None:
+            return self.orderings[sort]
+        view = self._type_orderings.get((sort, content_type))
+        if view is None:
+            members = self.by_type.get(content_type, _EMPTY)
+            view = array("I", (i for i in self.orderings[sort] if i in members))
+            self._type_orderings[(sort, content_type)] = view
+        return view
+
+    def listing(self, content_type: Optional[str] = None) -> List[Mapping[str, Any]]:
+        """Return items newest first, optionally of one content type.
+
+        The read-only list is built once per snapshot; limited views and created-order
+        pages are slices of it.
+        """
+        items = self._listings.get(content_type)
+        if items is None:
+            items = ReadOnlyList(
+                self.items[i] for i in self.ordering("created", "desc", content_type)
+            )
+            self._listings[content_type] = items
+        return items
+
+    def iter_items(
+        self,
+        types: Optional[Iterable[str]] = None,
+        sort: str = "created",
+        order: str = "desc",
+        predicate: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Yield items in the requested order, one at a time.
+
+        Several content types are combined with a k-way merge of their
+        per-type orderings, so taking the first few items costs a few heap
+        operations and ``predicate`` calls rather than a sort or a full scan.
+
+        Args:
+            types: Content types to include (all types when omitted)
+            sort: One of SORT_FIELDS
+            order: 'asc' or 'desc'
+            predicate: Optional test an item must pass to be yielded
+
+        Yields:
+            Items of the snapshot
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        descending = order == "desc"
+
+        def walk(content_type: Optional[str]) -> Iterator[int]:
+            # Reversed iteration, unlike a [::-1] slice, copies nothing
+            ids = self._ascending(sort, content_type)
+            return reversed(ids) if descending else iter(ids)
+
+        if types is None:
+            ids: Iterable[int] = walk(None)
+        else:
+            ids = heapq.merge(
+                *(walk(content_type) for content_type in dict.fromkeys(types)),
+                key=self.sort_keys[sort].__getitem__,
+                reverse=descending,
+            )
+        for doc_id in ids:
+            item = self.items[doc_id]
+            if predicate is None or predicate(item):
+                yield item
+
+    def derive(self, name: str, build: Callable[["ContentSnapshot"], T]) -> T:
+        """Return ``build(self)``, computed once per snapshot.
+
+        Use this for data derived from the corpus (groupings, graphs, counts)
+        so that it is rebuilt exactly when a new snapshot is published.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        return self._derive_flight.do(name, self._derive_once, name, build)
+
+    def _derive_once(self, name: str, build: Callable[["ContentSnapshot"], T]) -> T:
+        if name not in self._derived:
+            self._derived[name] = build(self)
+        return self._derived[name]
+
+    def page(
+        self,
+        offset: int,
+        limit: int,
+        sort: str = "created",
+        order: str = "desc",
+        content_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return ``limit`` items starting at ``offset`` in the given order."""
+        if sort == "created" and order == "desc":
+            return list(self.listing(content_type)[offset:offset + limit])
+        ids = self._ascending(sort, content_type)
+        total = len(ids)
+        if order == "asc":
+            window = ids[offset:offset + limit]
+        else:
+            stop = max(0, total - offset)
+            window = ids[max(0, stop - limit):stop][::-1]
+        return [self.items[i] for i in window]
+
+    def page_after(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        sort: str = "created",
+        order: str = "desc",
+        content_type: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return the page following ``cursor`` and the cursor for the next one.
+
+        The cursor records the sort key of the last item served rather than
+        an offset, so pages stay consistent when content is added or removed
+        between requests. Its sort, order and content type override the
+        arguments.
+
+        Args:
+            cursor: Cursor from a previous page, or None for the first page
+            limit: Page size
+            sort: Sort field for a first page
+            order: Sort order for a first page
+            content_type: Content type for a first page
+
+        Returns:
+            Tuple of (items, next cursor or None when this is the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        offset = 0
+        if cursor:
+            state = decode_cursor(cursor)
+            sort, order = state["sort"], state["order"]
+            content_type = state["content_type"]
+            ids = self._ascending(sort, content_type)
+            keys = self.sort_keys[sort]
+            if order == "asc":
+                offset = bisect_right(ids, state["key"], key=keys.__getitem__)
+            else:
+                offset = len(ids) - bisect_left(ids, state["key"], key=keys.__getitem__)
+
+        items = self.page(offset, limit, sort, order, content_type)
+        next_cursor = None
+        if items and offset + len(items) < len(self._ascending(sort, content_type)):
+            next_cursor = encode_cursor(sort, order, content_type, sort_key(items[-1], sort))
+        return items, next_cursor
+
+    def cursor_after(
+        self,
+        item: Dict[str, Any],
+        sort: str = "created",
+        order: str = "desc",
+        content_type: Optional[str] = None,
+    ) -> str:
+        """Return the cursor that resumes right after ``item``."""
+        return encode_cursor(sort, order, content_type, sort_key(item, sort))
+
+    def select(
+        self,
+        types: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[Any]] = None,
+        growth_stages: Optional[Iterable[Any]] = None,
+        sort: Optional[str] = None,
+        order: str = "desc",
+    ) -> List[Dict[str, Any]]:
+        """Return items matching every given criterion.
+
+        Within ``types`` and ``growth_stages`` any value may match (OR); all
+        ``tags`` must be present (AND). Omitted or empty criteria match all.
+
+        Args:
+            types: Content types to include
+            tags: Tags that must all be present
+            growth_stages: Growth stages to include
+            sort: Optional sort field; snapshot order (newest first) if omitted
+            order: 'asc' or 'desc' when sorting
+
+        Returns:
+            Matching items
+        """
+        candidates: List[FrozenSet[int]] = []
+        if types:
+            candidates.append(
+                frozenset().union(*(self.by_type.get(t, _EMPTY) for t in types))
+            )
+        if growth_stages:
+            candidates.append(
+                frozenset().union(
+                    *(self.by_growth_stage.get(stage_key(s), _EMPTY) for s in growth_stages)
+                )
+            )
+        if tags:
+            candidates.extend(self.ids_for_tag(tag) for tag in tags)
+
+        if not candidates:
+            if sort:
+                return [self.items[i] for i in self.ordering(sort, order)]
+            return list(self.items)
+
+        # Intersect smallest first so the working set only shrinks
+        candidates.sort(key=len)
+        ids = set(candidates[0])
+        for other in candidates[1:]:
+            if not ids:
+                break
+            ids &= other
+        if sort:
+            keys = self.sort_keys[sort]
+            ordered = sorted(ids, key=keys.__getitem__, reverse=order == "desc")
+        else:
+            ordered = sorted(ids)
+        return [self.items[doc_id] for doc_id in ordered]
@@ -0,0 +1,92 @@
+"""
+Text derived from a rendered document: excerpt, plain text and reading stats.
+
+Cards, feeds and search used to work these out per request (BeautifulSoup
+over the HTML, a regex for the first paragraph, slicing the raw markdown).
+summarize_html computes them once when a document is ingested, in a single
+streaming pass over its HTML, so they can be stored in the content index
+next to the rest of the record.
+"""
+
+import math
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+# Average adult silent reading speed used for reading time estimates
+WORDS_PER_MINUTE = 200
+
+# Elements whose text never reaches the reader
+_SKIPPED_TAGS = {"script", "style", "template"}
+
+# Elements that end a run of text, so words either side are not glued together
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "pre", "blockquote", "table", "tr",
+    "td", "th", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "dt", "dd",
+}
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text and the text of the first paragraph."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.excerpt: Optional[str] = None
+        self._excerpt_parts: Optional[List[str]] = None
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag == "p" and self.excerpt is None and self._excerpt_parts is None:
+            self._excerpt_parts = []
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag == "p" and self._excerpt_parts is not None:
+            self.excerpt = "".join(self._excerpt_parts)
+            self._excerpt_parts = None
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._skipping:
+            return
+        self.parts.append(data)
+        if self._excerpt_parts is not None:
+            self._excerpt_parts.append(data)
+
+
+def reading_time(word_count: int) -> int:
+    """Return the estimated reading time in whole minutes (at least one)."""
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+def summarize_html(html: str) -> Dict[str, Any]:
+    """Derive the text fields stored with a document.
+
+    Args:
+        html: Rendered HTML of the document body
+
+    Returns:
+        Dictionary with ``excerpt`` (text of the first paragraph),
+        ``plain_text`` (visible text, whitespace collapsed), ``word_count``
+        and ``reading_time`` (minutes)
+    """
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    if extractor._excerpt_parts is not None:
+        # Unclosed final paragraph
+        extractor.excerpt = "".join(extractor._excerpt_parts)
+
+    words = "".join(extractor.parts).split()
+    return {
+        "excerpt": extractor.excerpt or "",
+        "plain_text": " ".join(words),
+        "word_count": len(words),
+        "reading_time": reading_time(len(words)),
+    }
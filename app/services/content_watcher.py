@@ -0,0 +1,349 @@
+"""
+Change detection for the content directory.
+
+ContentChangeDetector reports which markdown files were added, modified or
+removed since the previous check so ContentService can invalidate only the
+cache entries that depend on them instead of expiring everything on a timer.
+
+Backends:
+- polling: re-lists directories whose mtime changed and compares file stat
+  signatures (portable, the default)
+- inotify: Linux kernel notifications through libc, no extra dependency
+- manual: deterministic test mode where changes are reported via ``notify``
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a content file
+StatSignature = Tuple[int, int]
+
+CONTENT_SUFFIX = ".md"
+
+
+@dataclass
+class ContentChanges:
+    """Files added, modified or removed, as paths relative to the content dir."""
+
+    added: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def paths(self) -> Set[str]:
+        """All changed paths regardless of the kind of change."""
+        return self.added | self.modified | self.removed
+
+    def update(self, other: "ContentChanges") -> None:
+        """Add the changes reported in ``other`` to these."""
+        self.added |= other.added
+        self.modified |= other.modified
+        self.removed |= other.removed
+
+
+class PollingBackend:
+    """Detects changes by comparing directory mtimes and file stat signatures."""
+
+    name = "polling"
+
+    def __init__(self, content_dir: Path):
+        self._content_dir = content_dir
+        self._dir_mtimes: Dict[str, int] = {}
+        self._dir_files: Dict[str, List[str]] = {}
+
+    def _list_dir(self, subdir: os.DirEntry) -> List[str]:
+        """Return markdown files in ``subdir``, re-listing only if it changed."""
+        mtime_ns = subdir.stat().st_mtime_ns
+        if self._dir_mtimes.get(subdir.name) != mtime_ns:
+            self._dir_mtimes[subdir.name] = mtime_ns
+            self._dir_files[subdir.name] = [
+                entry.name
+                for entry in os.scandir(subdir.path)
+                if entry.name.endswith(CONTENT_SUFFIX) and entry.is_file()
+            ]
+        return self._dir_files[subdir.name]
+
+    def scan(self) -> Dict[str, StatSignature]:
+        """Return the stat signature of every content file."""
+        signatures: Dict[str, StatSignature] = {}
+        if not self._content_dir.is_dir():
+            return signatures
+
+        seen_dirs = set()
+        for subdir in os.scandir(self._content_dir):
+            if not subdir.is_dir():
+                continue
+            seen_dirs.add(subdir.name)
+            for name in self._list_dir(subdir):
+                try:
+                    stat = os.stat(os.path.join(subdir.path, name))
+                except FileNotFoundError:
+                    continue
+                signatures[f"{subdir.name}/{name}"] = (stat.st_mtime_ns, stat.st_size)
+
+        for gone in set(self._dir_mtimes) - seen_dirs:
+            self._dir_mtimes.pop(gone, None)
+            self._dir_files.pop(gone, None)
+        return signatures
+
+    def pending(self) -> Optional[Set[str]]:
+        """Polling has no event stream; None requests a full scan."""
+        return None
+
+    def close(self) -> None:
+        """Nothing to release for polling."""
+        pass
+
+
+class ManualBackend(PollingBackend):
+    """Deterministic backend for tests: only reports paths passed to notify."""
+
+    name = "manual"
+
+    def __init__(self, content_dir: Path):
+        super().__init__(content_dir)
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def notify(self, *paths: str) -> None:
+        """Record that the given relative paths changed."""
+        with self._lock:
+            self._pending.update(paths)
+
+    def pending(self) -> Optional[Set[str]]:
+        with self._lock:
+            paths, self._pending = self._pending, set()
+        return paths
+
+
+class InotifyBackend(PollingBackend):
+    """Linux inotify backend; falls back to a full scan when events overflow."""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    )
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, content_dir: Path):
+        super().__init__(content_dir)
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, str] = {}
+        self._rescan = False
+        self._add_watch(content_dir, "")
+        if content_dir.is_dir():
+            for subdir in content_dir.iterdir():
+                if subdir.is_dir():
+                    self._add_watch(subdir, subdir.name)
+
+    def _add_watch(self, path: Path, relative: str) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(path)), self.WATCH_MASK
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._watches[wd] = relative
+
+    def pending(self) -> Optional[Set[str]]:
+        paths: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(
+                    "utf-8", "surrogateescape"
+                )
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    self._rescan = True
+                    continue
+                parent = self._watches.get(wd)
+                if parent is None:
+                    continue
+                if mask & self.IN_ISDIR:
+                    if parent == "" and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        try:
+                            self._add_watch(self._content_dir / name, name)
+                        except OSError:
+                            pass
+                    # A directory appeared or vanished; re-list everything
+                    self._rescan = True
+                elif mask & self.IN_DELETE_SELF:
+                    self._watches.pop(wd, None)
+                    self._rescan = True
+                elif parent and name.endswith(CONTENT_SUFFIX):
+                    paths.add(f"{parent}/{name}")
+
+        if self._rescan:
+            self._rescan = False
+            return None
+        return paths
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class ContentChangeDetector:
+    """
+    Reports content files that changed since the previous check.
+
+    Features:
+    - Baseline taken at construction, so the first check only reports real edits
+    - Checks throttled by ``poll_interval`` to keep per-request overhead flat
+    - Pluggable backends (polling, inotify, manual test mode)
+    """
+
+    BACKENDS = {
+        "polling": PollingBackend,
+        "inotify": InotifyBackend,
+        "manual": ManualBackend,
+    }
+
+    def __init__(
+        self,
+        content_dir: str,
+        backend: str = "polling",
+        poll_interval: float = 2.0,
+    ):
+        """
+        Initialize the detector and record the current state as the baseline.
+
+        Args:
+            content_dir: Content directory to watch
+            backend: 'polling', 'inotify', 'manual' or 'auto' (inotify when
+                available, otherwise polling)
+            poll_interval: Minimum seconds between two filesystem checks
+        """
+        self._content_dir = Path(content_dir)
+        self._poll_interval = 0.0 if backend == "manual" else poll_interval
+        self._lock = threading.Lock()
+        self._backend = self._create_backend(backend)
+        self._signatures = self._backend.scan()
+        # The initial scan counts as a check; monotonic time is not zero-based
+        self._last_check = time.monotonic()
+
+    def _create_backend(self, backend: str) -> PollingBackend:
+        """Instantiate the requested backend, degrading to polling on failure."""
+        if backend == "auto":
+            try:
+                return InotifyBackend(self._content_dir)
+            except (OSError, AttributeError) as e:
+                logger.info(f"inotify unavailable ({e}); polling for content changes")
+                return PollingBackend(self._content_dir)
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown change detection backend: {backend}")
+        return self.BACKENDS[backend](self._content_dir)
+
+    @property
+    def backend_name(self) -> str:
+        """Name of the active backend."""
+        return self._backend.name
+
+    def notify(self, *paths: str) -> None:
+        """Report changed paths explicitly (manual backend only).
+
+        Args:
+            paths: Paths relative to the content directory (e.g. 'notes/a.md')
+        """
+        if not isinstance(self._backend, ManualBackend):
+            raise RuntimeError("notify() requires the manual backend")
+        self._backend.notify(*paths)
+
+    def check(self, force: bool = False) -> ContentChanges:
+        """Return the changes since the previous check.
+
+        Args:
+            force: Ignore the poll interval and check immediately
+
+        Returns:
+            ContentChanges (empty when nothing changed or the check was throttled)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self._poll_interval:
+            return ContentChanges()
+
+        with self._lock:
+            self._last_check = now
+            candidates = self._backend.pending()
+            if candidates is None:
+                return self._diff_full_scan()
+            return self._classify(candidates)
+
+    def _diff_full_scan(self) -> ContentChanges:
+        """Compare a full stat scan against the previous signatures."""
+        current = self._backend.scan()
+        previous = self._signatures
+        changes = ContentChanges(
+            added=set(current) - set(previous),
+            removed=set(previous) - set(current),
+            modified={
+                path
+                for path, signature in current.items()
+                if path in previous and previous[path] != signature
+            },
+        )
+        self._signatures = current
+        return changes
+
+    def _classify(self, candidates: Iterable[str]) -> ContentChanges:
+        """Classify paths reported by an event backend."""
+        changes = ContentChanges()
+        for path in candidates:
+            try:
+                stat = os.stat(self._content_dir / path)
+            except FileNotFoundError:
+                if self._signatures.pop(path, None) is not None:
+                    changes.removed.add(path)
+                continue
+            if path in self._signatures:
+                changes.modified.add(path)
+            else:
+                changes.added.add(path)
+            self._signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return changes
+
+    def close(self) -> None:
+        """Release backend resources."""
+        self._backend.close()
@@ -5,7 +5,11 @@ This module provides FastAPI-compatible dependency functions that can be used
 with Depends() to inject services into route handlers.
 """
 
+from fastapi import Depends
+
 from app.interfaces import IContentProvider, IBacklinkService, IPathNavigationService
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.graph_analytics import GraphAnalyticsService
 from app.services.growth_stage_renderer import GrowthStageRenderer
 from app.services.service_container import get_container
 
@@ -27,6 +31,28 @@ def get_content_service() -> IContentProvider:
     return container.get_service("content_service")
 
 
+def get_async_content_service(
+    content_service: IContentProvider = Depends(get_content_service),
+) -> AsyncContentProvider:
+    """Get the content service wrapped for use from async route handlers.
+
+    Blocking reads and renders run in the shared content I/O thread pool, so
+    they never stall the event loop. Overriding get_content_service also
+    changes the provider wrapped here.
+
+    Returns:
+        AsyncContentProvider around the ContentService instance
+
+    Example:
+        @app.get("/content")
+        async def get_content(
+            service: AsyncContentProvider = Depends(get_async_content_service)
+        ):
+            return await service.get_all_content()
+    """
+    return AsyncContentProvider(content_service)
+
+
 def get_backlink_service() -> IBacklinkService:
     """Get BacklinkService instance for dependency injection.
 
@@ -45,6 +71,23 @@ def get_backlink_service() -> IBacklinkService:
     return container.get_service("backlink_service")
 
 
+def get_graph_analytics_service() -> GraphAnalyticsService:
+    """Get GraphAnalyticsService instance for dependency injection.
+
+    Returns:
+        GraphAnalyticsService instance
+
+    Example:
+        @app.get("/graph/top")
+        async def top_content(
+            service: GraphAnalyticsService = Depends(get_graph_analytics_service)
+        ):
+            return service.top(limit=10)
+    """
+    container = get_container()
+    return container.get_service("graph_analytics_service")
+
+
 def get_path_navigation_service() -> IPathNavigationService:
     """Get PathNavigationService instance for dependency injection.
 
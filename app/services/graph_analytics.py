@@ -0,0 +1,482 @@
+"""
+Graph analytics over the content link graph: PageRank, degrees, betweenness.
+
+The garden's links (from BacklinkService's link index) and the
+``connections``/``related_content`` frontmatter fields form a directed
+graph. Ranking content by how the garden links to it (featured notes,
+explore starting points and suggestions) needs a few whole-graph measures.
+They are computed once per content snapshot and shared by every request:
+
+- PageRank, by power iteration over a sparse (CSR) adjacency held in
+  ``array`` buffers. Each iteration is one pass over the edges, so
+  50k documents with 500k links rank in seconds without numpy.
+- In and out degree, read off the same arrays.
+- Betweenness, approximated by networkx from a fixed number of sampled
+  source nodes. It is the expensive measure and is only computed when asked for.
+
+The same cached graph answers connection-path queries (see graph_paths)
+and backs the per-note suggestion table explore paths draw on (see
+graph_suggestions).
+"""
+
+import logging
+import time
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import networkx as nx
+
+from app.interfaces import IBacklinkService, IContentProvider
+from app.services.backlink_service import StaleSnapshotError
+from app.services.content_snapshot import ContentSnapshot
+from app.services.graph_paths import k_shortest_paths
+from app.services.graph_suggestions import SuggestionTable, build_suggestion_table
+
+logger = logging.getLogger(__name__)
+
+# Frontmatter fields listing slugs a document is connected to
+FRONTMATTER_EDGE_FIELDS = ("connections", "related_content")
+
+# Measures accepted by GraphAnalyticsService.top
+METRICS = ("pagerank", "in_degree", "out_degree", "betweenness")
+
+DAMPING = 0.85
+
+# Times a derivation restarts because a newer snapshot was published meanwhile
+STALE_RETRIES = 3
+
+
+@dataclass(frozen=True, eq=False)
+class LinkGraph:
+    """A directed graph over integer node ids in CSR form.
+
+    The out-neighbours of node ``u`` are ``indices[indptr[u]:indptr[u + 1]]``.
+    """
+
+    slugs: Tuple[str, ...]
+    ids: Dict[str, int]
+    indptr: array
+    indices: array
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def neighbors(self, node: int) -> array:
+        """Return the out-neighbours of ``node``."""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    @cached_property
+    def incoming(self) -> "LinkGraph":
+        """The transposed graph, built on first use and kept."""
+        return self.transpose()
+
+    def transpose(self) -> "LinkGraph":
+        """Return the graph with every edge reversed."""
+        n = len(self.slugs)
+        counts = array("I", bytes(4 * (n + 1)))
+        for target in self.indices:
+            counts[target + 1] += 1
+        for node in range(n):
+            counts[node + 1] += counts[node]
+        fill = array("I", counts)
+        indices = array("I", bytes(4 * len(self.indices)))
+        for source in range(n):
+            for target in self.neighbors(source):
+                indices[fill[target]] = source
+                fill[target] += 1
+        return LinkGraph(self.slugs, self.ids, counts, indices)
+
+
+def build_link_graph(
+    links: Mapping[str, Sequence[str]], items: Iterable[Mapping[str, Any]] = ()
+) -> LinkGraph:
+    """Combine resolved links and frontmatter connections into one graph.
+
+    Args:
+        links: Slug to linked slugs, as returned by build_link_graph()
+        items: Content records whose FRONTMATTER_EDGE_FIELDS add edges
+
+    Returns:
+        LinkGraph with one node per slug in ``links``; self-loops, duplicate
+        edges and edges to unknown slugs are dropped
+    """
+    slugs = tuple(links)
+    ids = {slug: node for node, slug in enumerate(slugs)}
+    targets: List[List[str]] = [list(links[slug]) for slug in slugs]
+    for item in items:
+        node = ids.get(item.get("slug"))
+        if node is None:
+            continue
+        for name in FRONTMATTER_EDGE_FIELDS:
+            connected = item.get(name) or []
+            targets[node].extend([connected] if isinstance(connected, str) else connected)
+
+    indptr = array("I", [0])
+    indices = array("I")
+    for node, node_targets in enumerate(targets):
+        seen = set()
+        for slug in node_targets:
+            target = ids.get(slug)
+            if target is not None and target != node and target not in seen:
+                seen.add(target)
+                indices.append(target)
+        indptr.append(len(indices))
+    return LinkGraph(slugs, ids, indptr, indices)
+
+
+def pagerank(
+    graph: LinkGraph, damping: float = DAMPING, tol: float = 1.0e-6, max_iter: int = 100
+) -> array:
+    """Return the PageRank of every node by power iteration.
+
+    Matches networkx.pagerank with uniform personalization: rank of
+    dangling nodes is spread evenly over all nodes, and iteration stops
+    once the L1 change falls below ``len(graph) * tol``.
+    """
+    n = len(graph)
+    if n == 0:
+        return array("d")
+
+    incoming = graph.incoming
+    out_degree = [graph.indptr[u + 1] - graph.indptr[u] for u in range(n)]
+    dangling = [u for u in range(n) if not out_degree[u]]
+    spans = [(incoming.indptr[v], incoming.indptr[v + 1]) for v in range(n)]
+    sources = incoming.indices
+
+    rank = [1.0 / n] * n
+    for _ in range(max_iter):
+        share = [r / d if d else 0.0 for r, d in zip(rank, out_degree)]
+        base = (1.0 - damping + damping * sum(rank[u] for u in dangling)) / n
+        new = [
+            base + damping * sum(map(share.__getitem__, sources[start:end]))
+            for start, end in spans
+        ]
+        error = sum(abs(a - b) for a, b in zip(new, rank))
+        rank = new
+        if error < n * tol:
+            break
+    else:
+        logger.warning(f"PageRank did not converge in {max_iter} iterations")
+    return array("d", rank)
+
+
+def approximate_betweenness(graph: LinkGraph, samples: int = 64, seed: int = 0) -> array:
+    """Return normalized betweenness, estimated from ``samples`` source nodes.
+
+    Exact when ``samples`` is at least the number of nodes.
+    """
+    n = len(graph)
+    if n == 0:
+        return array("d")
+
+    digraph = nx.DiGraph()
+    digraph.add_nodes_from(range(n))
+    digraph.add_edges_from(
+        (source, target) for source in range(n) for target in graph.neighbors(source)
+    )
+    scores = nx.betweenness_centrality(
+        digraph, k=min(samples, n) if samples < n else None, normalized=True, seed=seed
+    )
+    return array("d", (scores[node] for node in range(n)))
+
+
+@dataclass(frozen=True, eq=False)
+class GraphAnalytics:
+    """Per-node measures of one link graph."""
+
+    graph: LinkGraph
+    pagerank: array
+    in_degree: array
+    out_degree: array
+    version: int = 0
+    duration: float = 0.0
+    computed_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def compute(cls, graph: LinkGraph, version: int = 0) -> "GraphAnalytics":
+        """Compute PageRank and degrees of ``graph``."""
+        start = time.perf_counter()
+        n = len(graph)
+        out_degree = array("I", (graph.indptr[u + 1] - graph.indptr[u] for u in range(n)))
+        in_degree = array("I", bytes(4 * n))
+        for target in graph.indices:
+            in_degree[target] += 1
+        ranks = pagerank(graph)
+        return cls(
+            graph=graph,
+            pagerank=ranks,
+            in_degree=in_degree,
+            out_degree=out_degree,
+            version=version,
+            duration=time.perf_counter() - start,
+        )
+
+    def scores(self, slug: str) -> Optional[Dict[str, float]]:
+        """Return the measures of ``slug``, or None if it is not in the graph."""
+        node = self.graph.ids.get(slug)
+        if node is None:
+            return None
+        return {
+            "pagerank": self.pagerank[node],
+            "in_degree": self.in_degree[node],
+            "out_degree": self.out_degree[node],
+        }
+
+    def ranked(self, values: Sequence[float]) -> List[int]:
+        """Return node ids by descending ``values``; ties keep graph order."""
+        return sorted(range(len(self.graph)), key=values.__getitem__, reverse=True)
+
+
+class GraphAnalyticsService:
+    """
+    Snapshot-cached graph measures for ranking content.
+
+    Features:
+    - PageRank and degrees computed once per content snapshot version
+    - Sampled betweenness computed on first request, also once per version
+    - Top-N queries filtered by content type, returning records with scores
+    - k shortest link paths between two documents
+    - Per-note "where next" suggestions, computed once per version
+    """
+
+    def __init__(
+        self,
+        content_provider: IContentProvider,
+        backlink_service: IBacklinkService,
+        betweenness_samples: int = 64,
+        suggestions_per_note: int = 15,
+    ):
+        """
+        Initialize GraphAnalyticsService.
+
+        Args:
+            content_provider: Service for accessing content data
+            backlink_service: Source of the resolved link graph
+            betweenness_samples: Source nodes sampled to estimate betweenness
+            suggestions_per_note: Suggestions precomputed per note; the
+                default covers five after skipping a full exploration path
+        """
+        self._content_provider = content_provider
+        self._backlink_service = backlink_service
+        self._betweenness_samples = betweenness_samples
+        self._suggestions_per_note = suggestions_per_note
+
+    def get_analytics(self) -> GraphAnalytics:
+        """Return PageRank and degrees of the current content."""
+        return self._derive("graph_analytics", self._compute)
+
+    def get_betweenness(self) -> array:
+        """Return the approximate betweenness of every node of get_analytics()."""
+        return self._derive("graph_betweenness", self._compute_betweenness)
+
+    def get_suggestion_table(self) -> SuggestionTable:
+        """Return the ranked suggestions of every node of get_analytics()."""
+        return self._derive("graph_suggestions", self._compute_suggestions)
+
+    def top(
+        self,
+        limit: int = 10,
+        metric: str = "pagerank",
+        content_types: Optional[Sequence[str]] = None,
+        exclude: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the highest-scoring content.
+
+        Args:
+            limit: Maximum number of results
+            metric: One of METRICS
+            content_types: Only include these types (all when omitted)
+            exclude: Slugs to leave out
+
+        Returns:
+            List of dicts with 'item' (the content record) and the node's scores
+
+        Raises:
+            ValueError: For an unknown metric
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown graph metric: {metric!r}")
+
+        analytics = self.get_analytics()
+        betweenness = self.get_betweenness() if metric == "betweenness" else None
+        values = betweenness if betweenness is not None else getattr(analytics, metric)
+        items = self._items_by_slug()
+        excluded = set(exclude)
+
+        results = []
+        for node in analytics.ranked(values):
+            slug = analytics.graph.slugs[node]
+            item = items.get(slug)
+            if item is None or slug in excluded:
+                continue
+            if content_types is not None and item.get("content_type") not in content_types:
+                continue
+            scores = analytics.scores(slug)
+            if betweenness is not None:
+                scores["betweenness"] = betweenness[node]
+            results.append({"item": item, **scores})
+            if len(results) >= limit:
+                break
+        return results
+
+    def find_paths(
+        self, source: str, target: str, k: int = 3, max_depth: int = 6
+    ) -> Optional[List[List[str]]]:
+        """
+        Find the shortest link paths from one document to another.
+
+        Args:
+            source: Slug to start from
+            target: Slug to reach
+            k: Maximum number of paths
+            max_depth: Maximum number of links per path
+
+        Returns:
+            Up to ``k`` paths of slugs, shortest first (empty if the target
+            is not reachable within ``max_depth`` links), or None if either
+            slug is not in the graph
+        """
+        graph = self.get_analytics().graph
+        if source not in graph.ids or target not in graph.ids:
+            return None
+        paths = k_shortest_paths(
+            graph, graph.incoming, graph.ids[source], graph.ids[target], k, max_depth
+        )
+        return [[graph.slugs[node] for node in path] for path in paths]
+
+    def suggest(
+        self, slug: str, exclude: Iterable[str] = (), limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest notes to visit after ``slug``.
+
+        Args:
+            slug: The current note
+            exclude: Slugs to leave out, such as an exploration path so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of dicts with 'target_slug', 'target_title', 'relation'
+            ('forward', 'backlink' or 'two_hop') and 'score', best first
+        """
+        graph = self.get_analytics().graph
+        node = graph.ids.get(slug)
+        if node is None:
+            return []
+
+        table = self.get_suggestion_table()
+        items = self._items_by_slug()
+        excluded = {graph.ids[s] for s in exclude if s in graph.ids}
+        suggestions = []
+        for target, score, relation in table.suggest(node, excluded, limit):
+            target_slug = graph.slugs[target]
+            item = items.get(target_slug) or {}
+            suggestions.append({
+                "target_slug": target_slug,
+                "target_title": item.get("title", target_slug),
+                "relation": relation,
+                "score": score,
+            })
+        return suggestions
+
+    def rank(self, slugs: Iterable[str]) -> List[str]:
+        """Return ``slugs`` ordered by descending PageRank (unknown slugs last)."""
+        analytics = self.get_analytics()
+        ids, ranks = analytics.graph.ids, analytics.pagerank
+
+        def score(slug: str) -> float:
+            node = ids.get(slug)
+            return ranks[node] if node is not None else -1.0
+
+        return sorted(slugs, key=score, reverse=True)
+
+    def _compute(self, snapshot: Optional[ContentSnapshot]) -> GraphAnalytics:
+        items = snapshot.items if snapshot is not None else self._content_provider.get_all_content()
+        # Edges of this very snapshot; raises StaleSnapshotError once superseded
+        graph = build_link_graph(self._backlink_service.build_link_graph(snapshot), items)
+        analytics = GraphAnalytics.compute(graph, snapshot.version if snapshot is not None else 0)
+        logger.debug(
+            f"Graph analytics for {len(graph)} nodes and {graph.edge_count} edges "
+            f"computed in {analytics.duration:.3f}s"
+        )
+        return analytics
+
+    def _compute_betweenness(self, snapshot: Optional[ContentSnapshot]) -> array:
+        return approximate_betweenness(
+            self._derive_on(snapshot, "graph_analytics", self._compute).graph,
+            self._betweenness_samples,
+        )
+
+    def _compute_suggestions(self, snapshot: Optional[ContentSnapshot]) -> SuggestionTable:
+        analytics = self._derive_on(snapshot, "graph_analytics", self._compute)
+        items = self._derive_on(snapshot, "graph_items_by_slug", self._index_items)
+        tags = []
+        for slug in analytics.graph.slugs:
+            item_tags = (items.get(slug) or {}).get("tags") or []
+            if isinstance(item_tags, str):
+                item_tags = [item_tags]
+            tags.append(frozenset(str(tag).lower() for tag in item_tags))
+        start = time.perf_counter()
+        table = build_suggestion_table(
+            analytics.graph, tags, analytics.pagerank, self._suggestions_per_note
+        )
+        logger.debug(
+            f"Suggestions for {len(analytics.graph)} nodes built in "
+            f"{time.perf_counter() - start:.3f}s"
+        )
+        return table
+
+    def _items_by_slug(self) -> Dict[str, Mapping[str, Any]]:
+        return self._derive("graph_items_by_slug", self._index_items)
+
+    def _index_items(self, snapshot: Optional[ContentSnapshot]) -> Dict[str, Mapping[str, Any]]:
+        items = snapshot.items if snapshot is not None else self._content_provider.get_all_content()
+        # Reversed so the first of several items with one slug wins
+        return {item.get("slug"): item for item in reversed(items)}
+
+    def _derive(self, name: str, build: Callable[[Optional[ContentSnapshot]], Any]) -> Any:
+        """Return ``build(snapshot)`` cached on the current snapshot.
+
+        If a newer snapshot is published while building, the build is
+        abandoned and repeated on that snapshot. Providers without snapshots
+        get a fresh result on every call.
+        """
+        for _ in range(STALE_RETRIES):
+            try:
+                return self._derive_on(self._current_snapshot(), name, build)
+            except StaleSnapshotError as e:
+                logger.debug(f"Rebuilding {name} on a newer snapshot: {e}")
+        return self._derive_on(self._current_snapshot(), name, build)
+
+    @staticmethod
+    def _derive_on(
+        snapshot: Optional[ContentSnapshot],
+        name: str,
+        build: Callable[[Optional[ContentSnapshot]], Any],
+    ) -> Any:
+        """Return ``build(snapshot)`` cached on ``snapshot`` (uncached for None)."""
+        if snapshot is None:
+            return build(None)
+        return snapshot.derive(name, build)
+
+    def _current_snapshot(self) -> Optional[ContentSnapshot]:
+        get_snapshot = getattr(self._content_provider, "get_snapshot", None)
+        snapshot = get_snapshot() if get_snapshot is not None else None
+        return snapshot if isinstance(snapshot, ContentSnapshot) else None
@@ -0,0 +1,157 @@
+"""
+Shortest connection paths between two documents of the link graph.
+
+Answers "how does note A lead to note B" over the integer-id CSR adjacency
+that GraphAnalyticsService caches per snapshot (see graph_analytics). The
+shortest path comes from a bidirectional breadth-first search: it expands
+the smaller frontier each step, forward along links from the source and
+backward along the transposed graph from the target. On a garden whose
+notes link to a handful of others, that visits a few thousand nodes even
+with tens of thousands of notes. Further paths, in order of length, come
+from Yen's algorithm with the same search as its subroutine.
+
+Paths follow links in their direction and never exceed ``max_depth`` links.
+"""
+
+import heapq
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.services.graph_analytics import LinkGraph
+
+# (source, target) node pairs a search may not traverse
+Edge = Tuple[int, int]
+
+
+def shortest_path(
+    graph: "LinkGraph",
+    incoming: "LinkGraph",
+    source: int,
+    target: int,
+    max_depth: int,
+    blocked_nodes: AbstractSet[int] = frozenset(),
+    blocked_edges: AbstractSet[Edge] = frozenset(),
+) -> Optional[List[int]]:
+    """Return a shortest path of node ids from ``source`` to ``target``.
+
+    Args:
+        graph: Forward adjacency
+        incoming: The transposed graph (``graph.incoming``)
+        source: Start node
+        target: End node
+        max_depth: Maximum number of links in the path
+        blocked_nodes: Nodes the path may not visit
+        blocked_edges: Links the path may not follow
+
+    Returns:
+        Node ids from source to target, or None if no path is short enough
+    """
+    if source == target:
+        return [source]
+    if source in blocked_nodes or target in blocked_nodes:
+        return None
+
+    forward_ptr, forward_idx = graph.indptr, graph.indices
+    backward_ptr, backward_idx = incoming.indptr, incoming.indices
+    # Node -> the node it was reached from (-1 for the search roots)
+    pred: Dict[int, int] = {source: -1}
+    succ: Dict[int, int] = {target: -1}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    for _ in range(max_depth):
+        if not forward_frontier or not backward_frontier:
+            return None
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier = []
+            for node in forward_frontier:
+                for neighbor in forward_idx[forward_ptr[node]:forward_ptr[node + 1]]:
+                    if neighbor in pred or neighbor in blocked_nodes:
+                        continue
+                    if blocked_edges and (node, neighbor) in blocked_edges:
+                        continue
+                    pred[neighbor] = node
+                    if neighbor in succ:
+                        return _join(pred, succ, neighbor)
+                    frontier.append(neighbor)
+            forward_frontier = frontier
+        else:
+            frontier = []
+            for node in backward_frontier:
+                for neighbor in backward_idx[backward_ptr[node]:backward_ptr[node + 1]]:
+                    if neighbor in succ or neighbor in blocked_nodes:
+                        continue
+                    if blocked_edges and (neighbor, node) in blocked_edges:
+                        continue
+                    succ[neighbor] = node
+                    if neighbor in pred:
+                        return _join(pred, succ, neighbor)
+                    frontier.append(neighbor)
+            backward_frontier = frontier
+    return None
+
+
+def _join(pred: Dict[int, int], succ: Dict[int, int], meeting: int) -> List[int]:
+    """Return the path through ``meeting`` from both search trees."""
+    path = []
+    node = meeting
+    while node != -1:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    node = succ[meeting]
+    while node != -1:
+        path.append(node)
+        node = succ[node]
+    return path
+
+
+def k_shortest_paths(
+    graph: "LinkGraph",
+    incoming: "LinkGraph",
+    source: int,
+    target: int,
+    k: int,
+    max_depth: int,
+) -> List[List[int]]:
+    """Return up to ``k`` loop-free paths from ``source`` to ``target``, shortest first.
+
+    Yen's algorithm: each further path leaves an earlier one at some node
+    (the spur) and is completed by a search that avoids the earlier
+    path's prefix and the links already taken from that prefix.
+    """
+    first = shortest_path(graph, incoming, source, target, max_depth)
+    if first is None:
+        return []
+
+    found = [first]
+    candidates: List[Tuple[int, List[int]]] = []
+    seen = {tuple(first)}
+    while len(found) < k:
+        previous = found[-1]
+        for spur_index in range(len(previous) - 1):
+            root = previous[:spur_index + 1]
+            blocked_edges = {
+                (path[spur_index], path[spur_index + 1])
+                for path in found
+                if len(path) > spur_index + 1 and path[:spur_index + 1] == root
+            }
+            spur = shortest_path(
+                graph,
+                incoming,
+                root[-1],
+                target,
+                max_depth - spur_index,
+                blocked_nodes=frozenset(root[:-1]),
+                blocked_edges=blocked_edges,
+            )
+            if spur is None:
+                continue
+            path = root[:-1] + spur
+            if tuple(path) not in seen:
+                seen.add(tuple(path))
+                heapq.heappush(candidates, (len(path), path))
+        if not candidates:
+            break
+        found.append(heapq.heappop(candidates)[1])
+    return found
@@ -0,0 +1,141 @@
+"""
+Precomputed "where next" suggestions for every note of the link graph.
+
+Exploring the garden (/explore/a,b,c) offers notes to continue the path
+with. Instead of resolving the current note's links per request, a table
+built once per content snapshot (see graph_analytics) holds a short ranked
+list for every note, drawn from:
+
+- forward links: notes the current one links to
+- backlinks: notes linking to the current one
+- two-hop neighbours: notes the forward links lead on to
+
+Candidates score by relation weight, summed over every way they are
+related (a note linked both ways, or reached through several intermediate
+notes, scores higher), then multiplied by one plus the number of tags they
+share with the current note. Ties go to the higher PageRank, then to the
+note that comes first in the corpus.
+
+The lists are stored back to back in ``array`` buffers. A request takes the
+current note's list and skips the notes already on the path, so it costs
+O(k) for k suggestions however large the garden is.
+"""
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+from operator import neg
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from app.services.graph_analytics import LinkGraph
+
+# Relations in order of strength; a candidate is reported as its strongest
+RELATIONS = ("forward", "backlink", "two_hop")
+FORWARD, BACKLINK, TWO_HOP = range(len(RELATIONS))
+
+RELATION_WEIGHTS = (3.0, 2.0, 1.0)
+
+
+@dataclass(frozen=True, eq=False)
+class SuggestionTable:
+    """Ranked suggestions of every node, in CSR form.
+
+    The suggestions of node ``u`` are ``targets[indptr[u]:indptr[u + 1]]``,
+    best first, with matching ``scores`` and ``relations`` (indexes into
+    RELATIONS).
+    """
+
+    indptr: array
+    targets: array
+    scores: array
+    relations: array
+
+    def suggest(
+        self, node: int, exclude: AbstractSet[int] = frozenset(), limit: int = 5
+    ) -> List[Tuple[int, float, str]]:
+        """Return up to ``limit`` (node, score, relation) for ``node``, skipping ``exclude``."""
+        results = []
+        for position in range(self.indptr[node], self.indptr[node + 1]):
+            target = self.targets[position]
+            if target in exclude:
+                continue
+            results.append(
+                (target, self.scores[position], RELATIONS[self.relations[position]])
+            )
+            if len(results) >= limit:
+                break
+        return results
+
+
+def build_suggestion_table(
+    graph: "LinkGraph",
+    tags: Sequence[AbstractSet[str]],
+    pagerank: Sequence[float],
+    per_node: int = 15,
+) -> SuggestionTable:
+    """Rank the neighbours of every node of ``graph``.
+
+    Args:
+        graph: Link graph (its ``incoming`` transpose is built if needed)
+        tags: Lowercased tags of each node
+        pagerank: PageRank of each node, to break ties
+        per_node: Suggestions kept per node; enough to fill a request after
+            the notes already on an exploration path are skipped
+
+    Returns:
+        SuggestionTable over the nodes of ``graph``
+    """
+    incoming = graph.incoming
+    # Tags as bitmasks, so shared tags are counted without building sets
+    vocabulary: Dict[str, int] = {}
+    masks = [
+        sum(1 << vocabulary.setdefault(tag, len(vocabulary)) for tag in node_tags)
+        for node_tags in tags
+    ]
+    indptr = array("I", [0])
+    targets = array("I")
+    scores = array("d")
+    relations = array("B")
+
+    forward_weight, backlink_weight, two_hop_weight = RELATION_WEIGHTS
+    for node in range(len(graph)):
+        forward = graph.neighbors(node)
+        forward_set = set(forward)
+        backlink_set = set(incoming.neighbors(node))
+        # Two-hop weight accumulates once per intermediate note
+        weight = Counter(chain.from_iterable(map(graph.neighbors, forward)))
+        if two_hop_weight != 1.0:
+            for target in weight:
+                weight[target] *= two_hop_weight
+        for target in forward_set:
+            weight[target] += forward_weight
+        for target in backlink_set:
+            weight[target] += backlink_weight
+        weight.pop(node, None)
+
+        mask = masks[node]
+        if mask:
+            for target in weight:
+                shared = (mask & masks[target]).bit_count()
+                if shared:
+                    weight[target] *= 1 + shared
+
+        # Ties go to the higher PageRank, then to the earlier note
+        best = sorted(
+            zip(weight.values(), map(pagerank.__getitem__, weight), map(neg, weight)),
+            reverse=True,
+        )
+        for score, _, negated in best[:per_node]:
+            target = -negated
+            targets.append(target)
+            scores.append(score)
+            relations.append(
+                FORWARD if target in forward_set
+                else BACKLINK if target in backlink_set
+                else TWO_HOP
+            )
+        indptr.append(len(targets))
+
+    return SuggestionTable(indptr, targets, scores, relations)
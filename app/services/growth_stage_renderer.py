@@ -5,8 +5,10 @@ This service provides methods to render growth stages as visual symbols,
 CSS classes, and opacity values for the digital garden interface.
 """
 
-from typing import Dict
+from collections import ChainMap
+from typing import Any, Dict, Mapping
 from app.models import GrowthStage
+from app.services.content_record import overlay
 
 
 class GrowthStageRenderer:
@@ -77,6 +79,30 @@ class GrowthStageRenderer:
         self._validate_stage(stage)
         return self.STAGE_OPACITY[stage]
 
+    def decorate(self, item: Mapping[str, Any]) -> "ChainMap[str, Any]":
+        """Return a per-request view of a content item with its growth symbol.
+
+        Adds ``growth_symbol`` and ``growth_css_class`` in an overlay so the
+        shared snapshot record is left untouched. Missing or unknown stages
+        render as seedlings.
+
+        Args:
+            item: Content item (usually a read-only snapshot record)
+
+        Returns:
+            Overlay of ``item`` with the rendered growth stage fields
+        """
+        value = item.get("growth_stage") or GrowthStage.SEEDLING
+        try:
+            stage = GrowthStage(str(getattr(value, "value", value)).lower())
+        except ValueError:
+            stage = GrowthStage.SEEDLING
+        return overlay(
+            item,
+            growth_symbol=self.render_stage_symbol(stage),
+            growth_css_class=self.render_stage_css_class(stage),
+        )
+
     def _validate_stage(self, stage: GrowthStage) -> None:
         """Validate that stage is a valid GrowthStage enum.
 
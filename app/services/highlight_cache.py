@@ -0,0 +1,241 @@
+"""
+Cache of Pygments-highlighted code blocks.
+
+Highlighting is the most expensive step of rendering a technical note, and
+the same snippets recur across documents, rebuilds and restarts. The output
+of a code block depends only on its lexer, its highlighting options and its
+source, so highlighted HTML is cached under that key, in memory and
+optionally on disk (see HIGHLIGHT_CACHE_PATH). Lexer and formatter lookups
+are memoized as well, so a miss no longer searches Pygments' registry.
+
+The markdown ``codehilite`` and ``fenced_code`` extensions construct
+``CodeHilite`` by its module-level name; install_highlight_cache() points
+that name at CachedCodeHilite, so every converter built by ContentManager
+and ContentService shares one cache.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import markdown
+from markdown.extensions import codehilite, fenced_code
+
+from app.config import HIGHLIGHT_CACHE_PATH
+from app.services.render_cache import RenderCache, hash_config
+
+try:
+    import pygments
+    from pygments import highlight
+    from pygments.formatters import get_formatter_by_name
+    from pygments.lexers import get_lexer_by_name, guess_lexer
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover
+    pygments = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache key or the stored payload changes
+HIGHLIGHT_FORMAT_VERSION = 1
+
+# (lexer alias, options, code digest)
+HighlightKey = Tuple[str, str, str]
+
+
+def _options_key(options: Dict[str, Any]) -> str:
+    """Return a stable string for a dict of Pygments options."""
+    return json.dumps(options, sort_keys=True, default=str)
+
+
+@lru_cache(maxsize=256)
+def _lexer_by_name(alias: str, options_key: str):
+    try:
+        return get_lexer_by_name(alias, **json.loads(options_key))
+    except ClassNotFound:
+        # Remembered too: an unknown alias costs a scan of every lexer
+        return None
+
+
+@lru_cache(maxsize=64)
+def _formatter_by_name(name: str, options_key: str):
+    options = json.loads(options_key)
+    try:
+        return get_formatter_by_name(name, **options)
+    except ClassNotFound:
+        return get_formatter_by_name("html", **options)
+
+
+def get_lexer(alias: str, options: Optional[Dict[str, Any]] = None):
+    """Return a shared lexer for ``alias``, or None if Pygments has none.
+
+    Lexers hold no per-document state, so one instance per alias and
+    options is reused for every block.
+    """
+    return _lexer_by_name(alias, _options_key(options or {}))
+
+
+class HighlightCache:
+    """
+    Cache of highlighted code blocks.
+
+    Features:
+    - Keyed by lexer alias, highlighting options and a SHA-256 of the code
+    - Bounded in-memory LRU in front of an optional RenderCache file
+    - Hit/miss counters for the memory and disk tiers
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_entries: int = 2048):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: SQLite file persisting entries (memory only when None)
+            max_entries: Highlighted blocks kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[HighlightKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = None
+        if cache_path:
+            self._store = RenderCache(
+                cache_path,
+                hash_config(
+                    HIGHLIGHT_FORMAT_VERSION,
+                    getattr(pygments, "__version__", None),
+                    markdown.__version__,
+                ),
+            )
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def highlight(self, block: codehilite.CodeHilite) -> str:
+        """Return the highlighted HTML for a prepared CodeHilite block."""
+        options = dict(
+            block.options,
+            _formatter=getattr(block.pygments_formatter, "__qualname__", block.pygments_formatter),
+            _guess_lang=block.guess_lang,
+            _lang_prefix=block.lang_prefix,
+        )
+        key = (
+            block.lang or "",
+            _options_key(options),
+            hashlib.sha256(block.src.encode("utf-8")).hexdigest(),
+        )
+
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+
+        html = self._load(key)
+        if html is None:
+            html = _highlight(block)
+            with self._lock:
+                self.misses += 1
+            self._save(key, html)
+        else:
+            with self._lock:
+                self.disk_hits += 1
+
+        with self._lock:
+            self._entries[key] = html
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def _load(self, key: HighlightKey) -> Optional[str]:
+        if self._store is None:
+            return None
+        stored = self._store.get(self._store_key(key))
+        return stored["html"] if stored else None
+
+    def _save(self, key: HighlightKey, html: str) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.put(self._store_key(key), {"html": html})
+        except sqlite3.Error as e:
+            # Ingest workers share the file; a locked write just isn't cached
+            logger.debug(f"Highlight cache write skipped: {e}")
+
+    @staticmethod
+    def _store_key(key: HighlightKey) -> str:
+        return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, hit/miss counters and memoized lexer count."""
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "lexers": _lexer_by_name.cache_info().currsize,
+            "path": str(self._store.path) if self._store and self._store.path else None,
+        }
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the disk file is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _highlight(block: codehilite.CodeHilite) -> str:
+    """Highlight a block as CodeHilite.hilite does, with memoized lookups."""
+    options = block.options
+    options_key = _options_key(options)
+    lexer = _lexer_by_name(block.lang, options_key) if block.lang else None
+    if lexer is None:
+        if block.guess_lang:
+            try:
+                lexer = guess_lexer(block.src, **options)
+            except ValueError:  # pragma: no cover
+                pass
+        if lexer is None:
+            lexer = _lexer_by_name("text", options_key)
+    if not block.lang:
+        # Use the guessed lexer's language instead
+        block.lang = lexer.aliases[0]
+
+    if isinstance(block.pygments_formatter, str):
+        formatter = _formatter_by_name(block.pygments_formatter, options_key)
+    else:
+        formatter = block.pygments_formatter(
+            lang_str=f"{block.lang_prefix}{block.lang}", **options
+        )
+    return highlight(block.src, lexer, formatter)
+
+
+@lru_cache()
+def get_highlight_cache() -> HighlightCache:
+    """Return the process-wide highlight cache."""
+    return HighlightCache(HIGHLIGHT_CACHE_PATH)
+
+
+class CachedCodeHilite(codehilite.CodeHilite):
+    """CodeHilite that serves highlighted output from the highlight cache."""
+
+    def hilite(self, shebang: bool = True) -> str:
+        if pygments is None or not self.use_pygments:
+            return super().hilite(shebang)
+
+        self.src = self.src.strip("\n")
+        if self.lang is None and shebang:
+            # The header may set the language and hl_lines, so parse it first
+            self._parseHeader()
+        return get_highlight_cache().highlight(self)
+
+
+def install_highlight_cache() -> None:
+    """Make the codehilite and fenced_code extensions use CachedCodeHilite."""
+    codehilite.CodeHilite = CachedCodeHilite
+    fenced_code.CodeHilite = CachedCodeHilite
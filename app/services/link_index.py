@@ -0,0 +1,279 @@
+"""
+Forward and reverse link index over the content corpus.
+
+BacklinkService used to re-extract the links of every document for each
+backlink lookup and to resolve every link with a scan of the whole corpus,
+which made the link graph and link validation quadratic in the number of
+documents. A LinkIndex is built once per content snapshot from a single
+pass over the documents and answers those questions with dictionary
+lookups:
+
+- a slug lookup table resolving a link the way BacklinkService matches
+  links (exact, case-insensitive, or with spaces as hyphens)
+- forward adjacency (source -> resolved targets) and its reverse
+- the links of each document with their text and surrounding line, so
+  backlink context is not re-derived from the markdown per request
+- the set of orphans (documents with no links in either direction)
+
+When a single document changes, update_document() and remove_document()
+patch these tables in place. The cost is proportional to the links of that
+document and of the documents whose links resolve differently afterwards,
+never to the size of the corpus.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class LinkRef:
+    """An internal link as written in a document."""
+
+    link: str
+    """Normalized link target (a slug or path, not yet resolved)."""
+
+    text: str
+    """Original link text."""
+
+    context: str
+    """The line the link appears on, stripped and cut to 100 characters."""
+
+
+def match_keys(link: str) -> Set[str]:
+    """Return the lowercased slugs a link matches.
+
+    Mirrors BacklinkService._link_matches_target: a link matches a slug
+    when they are equal ignoring case, or once spaces in the link are
+    replaced by hyphens.
+    """
+    key = link.lower()
+    return {key, key.replace(" ", "-")}
+
+
+class LinkIndex:
+    """
+    Link relationships of one corpus, keyed by slug.
+
+    Documents are added in corpus order with add_document(), then link()
+    resolves every link against the complete slug table. Afterwards
+    update_document() and remove_document() keep the index current. Lookups
+    never touch document bodies and are safe to run while another thread
+    patches the index.
+    """
+
+    def __init__(self):
+        self.titles: Dict[str, str] = {}
+        self.links: Dict[str, List[LinkRef]] = {}
+        self.forward: Dict[str, List[str]] = {}
+        self.reverse: Dict[str, List[str]] = {}
+        # Lowercased slug -> [(position, slug)] sorted; the earliest wins
+        self._slugs: Dict[str, List[Tuple[int, str]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._counter = count()
+        # Match key -> {source slug: first link of that source with the key}
+        self._linked_from: Dict[str, Dict[str, LinkRef]] = {}
+        # Insertion-ordered set of slugs without links in either direction
+        self._orphans: Dict[str, None] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self.titles
+
+    def add_document(self, slug: str, title: str, links: Iterable[LinkRef]) -> None:
+        """Register a document and the links it contains, before link().
+
+        A slug seen before keeps its first title and gains the new links.
+        """
+        if slug not in self.titles:
+            self._register_slug(slug, title)
+            self.links[slug] = []
+        refs = self.links[slug]
+        for ref in links:
+            refs.append(ref)
+            self._add_link_keys(slug, ref)
+
+    def link(self) -> "LinkIndex":
+        """Resolve every registered link into forward and reverse adjacency."""
+        with self._lock:
+            self.forward = {slug: [] for slug in self.titles}
+            self.reverse = {slug: [] for slug in self.titles}
+            for source, refs in self.links.items():
+                targets = self.forward[source]
+                for target in self._resolve_refs(source, refs):
+                    targets.append(target)
+                    self.reverse[target].append(source)
+            self._orphans = {
+                slug: None
+                for slug in self.titles
+                if not self.forward[slug] and not self.reverse[slug]
+            }
+        return self
+
+    def update_document(self, slug: str, title: str, links: Iterable[LinkRef]) -> None:
+        """Add a document, or replace the title and links of an existing one."""
+        links = list(links)
+        with self._lock:
+            is_new = slug not in self.titles
+            if is_new:
+                self._register_slug(slug, title)
+                self.forward[slug] = []
+                self.reverse[slug] = []
+            else:
+                self.titles[slug] = title
+                for ref in self.links[slug]:
+                    self._remove_link_keys(slug, ref)
+
+            self.links[slug] = links
+            for ref in links:
+                self._add_link_keys(slug, ref)
+            self._relink(slug)
+
+            if is_new:
+                # Links that were broken, or pointed elsewhere, may now resolve here
+                for source in self._sources_matching(slug):
+                    self._relink(source)
+            self._update_orphan(slug)
+
+    def remove_document(self, slug: str) -> bool:
+        """Remove a document and every link from or to it.
+
+        Returns:
+            False if the slug was not in the index
+        """
+        with self._lock:
+            if slug not in self.titles:
+                return False
+
+            for ref in self.links.pop(slug):
+                self._remove_link_keys(slug, ref)
+            for target in self.forward.pop(slug):
+                self.reverse[target].remove(slug)
+                self._update_orphan(target)
+
+            del self.titles[slug]
+            key = slug.lower()
+            entries = self._slugs[key]
+            entries.remove((self._positions.pop(slug), slug))
+            if not entries:
+                del self._slugs[key]
+            self._orphans.pop(slug, None)
+
+            # Sources that linked here now resolve elsewhere or not at all
+            sources = self.reverse.pop(slug)
+            for source in sources:
+                self.forward[source].remove(slug)
+            for source in set(sources) | set(self._sources_matching(slug)):
+                self._relink(source)
+            return True
+
+    def resolve(self, link: str) -> Optional[str]:
+        """Return the slug a link points to, or None if nothing matches.
+
+        When several documents match, the one added first wins, as with the
+        corpus scan this replaces.
+        """
+        best = None
+        for key in match_keys(link):
+            entries = self._slugs.get(key)
+            if entries and (best is None or entries[0][0] < best[0]):
+                best = entries[0]
+        return best[1] if best else None
+
+    def forward_links(self, source: str) -> List[Tuple[LinkRef, str]]:
+        """Return (link, target slug) for each resolvable link of ``source``."""
+        with self._lock:
+            resolved = []
+            for ref in self.links.get(source, ()):
+                target = self.resolve(ref.link)
+                if target:
+                    resolved.append((ref, target))
+            return resolved
+
+    def backlinks(self, target: str) -> List[Tuple[str, LinkRef]]:
+        """Return (source slug, link) for each document linking to ``target``.
+
+        ``target`` does not have to exist, so links to missing documents are
+        found too. Self-references are skipped.
+        """
+        with self._lock:
+            sources = self._linked_from.get(target.lower(), {})
+            return [(source, ref) for source, ref in sources.items() if source != target]
+
+    def broken_links(self) -> List[Tuple[str, str]]:
+        """Return (source slug, link) for every link that resolves to nothing."""
+        with self._lock:
+            return [
+                (source, ref.link)
+                for source, refs in self.links.items()
+                for ref in refs
+                if self.resolve(ref.link) is None
+            ]
+
+    def orphans(self) -> List[str]:
+        """Return the slugs with neither outgoing nor incoming links."""
+        with self._lock:
+            return list(self._orphans)
+
+    def is_orphan(self, slug: str) -> bool:
+        """Return whether ``slug`` has neither outgoing nor incoming links."""
+        return slug in self._orphans
+
+    def graph(self) -> Dict[str, List[str]]:
+        """Return a copy of the forward adjacency (slug -> target slugs)."""
+        with self._lock:
+            return {slug: list(targets) for slug, targets in self.forward.items()}
+
+    def _register_slug(self, slug: str, title: str) -> None:
+        position = next(self._counter)
+        self.titles[slug] = title
+        self._positions[slug] = position
+        bisect.insort(self._slugs.setdefault(slug.lower(), []), (position, slug))
+
+    def _add_link_keys(self, source: str, ref: LinkRef) -> None:
+        for key in match_keys(ref.link):
+            self._linked_from.setdefault(key, {}).setdefault(source, ref)
+
+    def _remove_link_keys(self, source: str, ref: LinkRef) -> None:
+        for key in match_keys(ref.link):
+            sources = self._linked_from.get(key)
+            if sources is not None and sources.pop(source, None) is not None and not sources:
+                del self._linked_from[key]
+
+    def _sources_matching(self, slug: str) -> List[str]:
+        """Return the documents with a link that matches ``slug``."""
+        return [s for s in self._linked_from.get(slug.lower(), ()) if s != slug]
+
+    def _resolve_refs(self, source: str, refs: Iterable[LinkRef]) -> List[str]:
+        targets: List[str] = []
+        for ref in refs:
+            target = self.resolve(ref.link)
+            if target and target != source and target not in targets:
+                targets.append(target)
+        return targets
+
+    def _relink(self, source: str) -> None:
+        """Re-resolve the links of ``source`` and patch both adjacencies."""
+        old = self.forward.get(source, [])
+        new = self._resolve_refs(source, self.links[source])
+        for target in old:
+            if target not in new:
+                self.reverse[target].remove(source)
+                self._update_orphan(target)
+        for target in new:
+            if target not in old:
+                self.reverse[target].append(source)
+                self._update_orphan(target)
+        self.forward[source] = new
+        self._update_orphan(source)
+
+    def _update_orphan(self, slug: str) -> None:
+        if self.forward.get(slug) or self.reverse.get(slug):
+            self._orphans.pop(slug, None)
+        else:
+            self._orphans[slug] = None
@@ -12,6 +12,7 @@ from app.interfaces import (
     IContentProvider,
     PathValidationResult,
     CircularReferenceResult,
+    probe_slugs,
 )
 
 
@@ -88,13 +89,18 @@ class PathNavigationService(IPathNavigationService):
     def _validate_slugs_existence(
         self, slugs: List[str]
     ) -> Tuple[List[str], List[str]]:
-        """Validate slug existence against ContentService."""
+        """Validate slug existence against ContentService in one batch lookup."""
         valid_slugs = []
         invalid_slugs = []
 
+        if isinstance(self._content_service, IContentProvider):
+            found = self._content_service.get_contents_by_slugs(slugs, ["notes"])
+        else:
+            # Duck-typed providers only offer get_content_by_slug
+            found = probe_slugs(self._content_service, slugs, ["notes"])
+
         for slug in slugs:
-            content = self._content_service.get_content_by_slug("notes", slug)
-            if content is not None:
+            if found.get(slug) is not None:
                 valid_slugs.append(slug)
             else:
                 invalid_slugs.append(slug)
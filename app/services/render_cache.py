@@ -0,0 +1,215 @@
+"""
+Persistent cache of rendered documents keyed by source content.
+
+Rendering a document (markdown, link decoration, sanitising) depends only on
+its source text and on the renderer configuration, so the output (the HTML
+and anything extracted while rendering, such as the excerpt) is stored under
+the SHA-256 of the source and a hash of that configuration. Entries survive
+restarts in a single SQLite file as zlib-compressed JSON, and entries whose
+source file is gone or that were rendered with another configuration are
+garbage-collected.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or the stored payload format changes
+CACHE_FORMAT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS renders (
+    source_hash TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    path TEXT,
+    used_at_ns INTEGER NOT NULL,
+    rendered BLOB NOT NULL,
+    PRIMARY KEY (source_hash, config_hash)
+);
+"""
+
+
+def hash_source(source: str) -> str:
+    """Return the hex SHA-256 digest identifying a rendered source text."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def hash_config(*parts: Any) -> str:
+    """Return a short digest of everything that affects rendered output."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RenderCache:
+    """
+    SQLite-backed cache of rendered documents.
+
+    Features:
+    - Keyed by source hash and renderer config hash, so moved or
+      duplicated files share one entry and pipeline changes miss cleanly
+    - Output stored as compressed JSON in one file (in memory when no path)
+    - Entries from other configurations dropped when the cache is opened
+    - ``prune`` removes entries whose source files no longer exist
+    """
+
+    def __init__(self, cache_path: Optional[str], config_hash: str):
+        """
+        Initialize the cache, opening an existing cache file if present.
+
+        Args:
+            cache_path: Path to the SQLite cache file (in-memory when None)
+            config_hash: Digest of the renderer configuration, see hash_config
+        """
+        self._cache_path = Path(cache_path) if cache_path else None
+        self.config_hash = config_hash
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the backing database, dropping entries of other configurations."""
+        conn = None
+        if self._cache_path is not None:
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self._cache_path), check_same_thread=False)
+                self._create_schema(conn)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Render cache at {self._cache_path} unusable ({e}); using memory"
+                )
+                self._cache_path = None
+                conn = None
+        if conn is None:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._create_schema(conn)
+
+        # A cache: losing the last writes on a crash only costs re-renders
+        conn.execute("PRAGMA synchronous = OFF")
+        removed = conn.execute(
+            "DELETE FROM renders WHERE config_hash != ?", (self.config_hash,)
+        ).rowcount
+        conn.commit()
+        if removed:
+            logger.info(f"Render cache: dropped {removed} entries from another renderer config")
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create the table, discarding one written in an older format."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_FORMAT_VERSION:
+            conn.execute("DROP TABLE IF EXISTS renders")
+            conn.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+        conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Location of the cache file, or None for an in-memory cache."""
+        return self._cache_path
+
+    def get(self, source_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached output for a source hash, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rendered FROM renders WHERE source_hash = ? AND config_hash = ?",
+                (source_hash, self.config_hash),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(
+        self, source_hash: str, rendered: Dict[str, Any], path: Optional[str] = None
+    ) -> None:
+        """Store the rendered output for a source hash.
+
+        Args:
+            source_hash: Digest of the source, see hash_source
+            rendered: JSON-serialisable output, e.g. ``{"html": ...}``
+            path: Source file the output came from, used by prune
+        """
+        blob = zlib.compress(json.dumps(rendered, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO renders "
+                "(source_hash, config_hash, path, used_at_ns, rendered) VALUES (?, ?, ?, ?, ?)",
+                (source_hash, self.config_hash, path, time.time_ns(), blob),
+            )
+            self._conn.commit()
+
+    def render(
+        self,
+        source: str,
+        render: Callable[[str], Dict[str, Any]],
+        path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return the output for ``source``, rendering and storing it on a miss.
+
+        Args:
+            source: Source text
+            render: Renders the source text
+            path: Source file, recorded for prune
+
+        Returns:
+            Rendered output
+        """
+        source_hash = hash_source(source)
+        rendered = self.get(source_hash)
+        if rendered is None:
+            rendered = render(source)
+            self.put(source_hash, rendered, path)
+        return rendered
+
+    def prune(self, exists: Callable[[str], bool]) -> int:
+        """Remove entries whose source file no longer exists.
+
+        An entry shared by identical files records the last path it was
+        stored for, so it may be dropped while a copy remains; that copy is
+        simply rendered again.
+
+        Args:
+            exists: Predicate called with each recorded source path
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            paths = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT path FROM renders WHERE path IS NOT NULL"
+                )
+            ]
+        stale = [path for path in paths if not exists(path)]
+        with self._lock:
+            self._conn.executemany("DELETE FROM renders WHERE path = ?", [(p,) for p in stale])
+            self._conn.commit()
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, hit/miss counters and the backing path."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM renders").fetchone()[0]
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "path": str(self._cache_path) if self._cache_path else None,
+        }
+
+    def close(self) -> None:
+        """Close the backing database."""
+        with self._lock:
+            self._conn.close()
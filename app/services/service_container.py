@@ -10,10 +10,22 @@ from contextlib import asynccontextmanager
 import threading
 from fastapi import FastAPI
 
-from app.config import CONTENT_DIR
+from app.config import (
+    CONTENT_BODY_CACHE_SIZE,
+    CONTENT_CACHE_MAX_BYTES,
+    CONTENT_DIR,
+    CONTENT_INDEX_PATH,
+    CONTENT_INGEST_PARALLEL_THRESHOLD,
+    CONTENT_INGEST_WORKERS,
+    CONTENT_STALE_WHILE_REVALIDATE,
+    CONTENT_WATCH_BACKEND,
+    CONTENT_WATCH_INTERVAL,
+)
 from app.interfaces import IContentProvider, IBacklinkService, IPathNavigationService
 from app.services.content_service import ContentService
+from app.services.content_watcher import ContentChangeDetector
 from app.services.backlink_service import BacklinkService
+from app.services.graph_analytics import GraphAnalyticsService
 from app.services.path_navigation_service import PathNavigationService
 from app.services.growth_stage_renderer import GrowthStageRenderer
 
@@ -158,12 +170,31 @@ class ServiceContainer:
 
 
 # Service factory functions
-def create_content_service(content_dir: Optional[str] = None, cache_ttl: int = 300) -> IContentProvider:
+def create_content_service(
+    content_dir: Optional[str] = None,
+    cache_ttl: int = 300,
+    index_path: Optional[str] = None,
+    watch_backend: Optional[str] = None,
+    watch_interval: float = CONTENT_WATCH_INTERVAL,
+    stale_while_revalidate: bool = False,
+    body_cache_size: int = CONTENT_BODY_CACHE_SIZE,
+    cache_max_bytes: Optional[int] = CONTENT_CACHE_MAX_BYTES,
+    ingest_workers: int = CONTENT_INGEST_WORKERS,
+    parallel_threshold: int = CONTENT_INGEST_PARALLEL_THRESHOLD,
+) -> IContentProvider:
     """Create ContentService instance with configuration.
 
     Args:
         content_dir: Path to content directory
         cache_ttl: Cache time-to-live in seconds
+        index_path: Path to the persistent content index (in-memory if None)
+        watch_backend: Change detection backend; None or 'off' keeps TTL expiry
+        watch_interval: Seconds between polls of the content directory
+        stale_while_revalidate: Rebuild expired content in the background
+        body_cache_size: Number of rendered bodies kept in memory
+        cache_max_bytes: Estimated byte budget shared by bodies and metadata
+        ingest_workers: Processes rendering files on full rebuilds (0 = per CPU)
+        parallel_threshold: Minimum files to render before using the pool
 
     Returns:
         ContentService instance
@@ -171,7 +202,23 @@ def create_content_service(content_dir: Optional[str] = None, cache_ttl: int = 3
     if content_dir is None:
         content_dir = CONTENT_DIR
 
-    return ContentService(content_dir=content_dir, cache_ttl=cache_ttl)
+    change_detector = None
+    if watch_backend and watch_backend != "off":
+        change_detector = ContentChangeDetector(
+            content_dir, backend=watch_backend, poll_interval=watch_interval
+        )
+
+    return ContentService(
+        content_dir=content_dir,
+        cache_ttl=cache_ttl,
+        index_path=index_path,
+        change_detector=change_detector,
+        stale_while_revalidate=stale_while_revalidate,
+        body_cache_size=body_cache_size,
+        cache_max_bytes=cache_max_bytes,
+        ingest_workers=ingest_workers,
+        parallel_threshold=parallel_threshold,
+    )
 
 
 def create_backlink_service(content_service: IContentProvider) -> IBacklinkService:
@@ -183,7 +230,11 @@ def create_backlink_service(content_service: IContentProvider) -> IBacklinkServi
     Returns:
         BacklinkService instance
     """
-    return BacklinkService(content_service)
+    service = BacklinkService(content_service)
+    if hasattr(content_service, "add_snapshot_listener"):
+        # Content changes patch the link index instead of rebuilding it
+        content_service.add_snapshot_listener(service.on_snapshot_published)
+    return service
 
 
 def create_path_navigation_service(
@@ -200,6 +251,21 @@ def create_path_navigation_service(
     return PathNavigationService(content_service)
 
 
+def create_graph_analytics_service(
+    content_service: IContentProvider, backlink_service: IBacklinkService
+) -> GraphAnalyticsService:
+    """Create GraphAnalyticsService over the backlink service's link graph.
+
+    Args:
+        content_service: ContentService instance
+        backlink_service: BacklinkService instance
+
+    Returns:
+        GraphAnalyticsService instance
+    """
+    return GraphAnalyticsService(content_service, backlink_service)
+
+
 def create_growth_stage_renderer() -> GrowthStageRenderer:
     """Create GrowthStageRenderer instance (stateless service).
 
@@ -224,7 +290,15 @@ def setup_container() -> ServiceContainer:
 
     # Register ContentService (singleton)
     container.register_singleton(
-        "content_service", lambda: create_content_service(CONTENT_DIR, 300)
+        "content_service",
+        lambda: create_content_service(
+            CONTENT_DIR,
+            300,
+            index_path=CONTENT_INDEX_PATH,
+            watch_backend=CONTENT_WATCH_BACKEND,
+            watch_interval=CONTENT_WATCH_INTERVAL,
+            stale_while_revalidate=CONTENT_STALE_WHILE_REVALIDATE,
+        ),
     )
 
     # Register BacklinkService (singleton, depends on ContentService)
@@ -233,6 +307,15 @@ def setup_container() -> ServiceContainer:
         lambda: create_backlink_service(container.get_service("content_service")),
     )
 
+    # Register GraphAnalyticsService (singleton, depends on both of the above)
+    container.register_singleton(
+        "graph_analytics_service",
+        lambda: create_graph_analytics_service(
+            container.get_service("content_service"),
+            container.get_service("backlink_service"),
+        ),
+    )
+
     # Register PathNavigationService (singleton, depends on ContentService)
     container.register_singleton(
         "path_navigation_service",
@@ -3,6 +3,7 @@ Utility modules for the digital garden application.
 
 This package contains shared utilities:
 - cache: Caching decorators and utilities (timed_lru_cache)
+- single_flight: Coalescing of concurrent identical computations (SingleFlight)
 - http_client: HTTP client setup and configuration
 - helpers: General utility functions
 """
\ No newline at end of file
@@ -3,10 +3,32 @@
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from email.utils import format_datetime
+from itertools import islice
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
 from app.interfaces import IContentProvider
+from app.utils.single_flight import SingleFlight
+
+
+# Coalesces concurrent feed/sitemap generations for the same content provider
+feed_flight = SingleFlight()
+
+
+async def render_rss_feed(
+    content_service: IContentProvider, growth_stage: Optional[str] = None
+) -> str:
+    """Generate the RSS feed in a worker thread, shared by concurrent callers."""
+    key = ("rss", id(content_service), (growth_stage or "").lower())
+    return await feed_flight.do_async(
+        key, generate_rss_feed, content_service, growth_stage=growth_stage
+    )
+
+
+async def render_sitemap(content_service: IContentProvider) -> str:
+    """Generate the sitemap in a worker thread, shared by concurrent callers."""
+    key = ("sitemap", id(content_service))
+    return await feed_flight.do_async(key, generate_sitemap, content_service)
 
 
 def generate_rss_feed(content_service: IContentProvider, growth_stage: Optional[str] = None) -> str:
@@ -16,28 +38,21 @@ def generate_rss_feed(content_service: IContentProvider, growth_stage: Optional[
         content_service: The content provider service
         growth_stage: Optional filter by growth stage (seedling, budding, growing, evergreen)
     """
-    # Get all content from service
-    posts = content_service.get_all_content()
-    
-    # Filter out drafts and sort by date
-    published_posts = [p for p in posts if p.get("status") != "draft"]
-    
     # Filter by growth stage if specified
+    stage = None
     if growth_stage:
         valid_stages = ["seedling", "budding", "growing", "evergreen"]
         if growth_stage.lower() in valid_stages:
-            published_posts = [p for p in published_posts if p.get("growth_stage", "seedling").lower() == growth_stage.lower()]
+            stage = growth_stage.lower()
     
-    # Sort by date with proper type handling
-    def get_sort_key(item):
-        created = item.get("created", "")
-        if isinstance(created, str):
-            return created
-        if hasattr(created, 'isoformat'):
-            return created.isoformat()
-        return str(created)
+    def include(post) -> bool:
+        # Drafts never appear in the feed
+        if post.get("status") == "draft":
+            return False
+        return stage is None or post.get("growth_stage", "seedling").lower() == stage
     
-    published_posts.sort(key=get_sort_key, reverse=True)
+    # Newest first, taking only the 20 items the feed shows
+    published_posts = list(islice(content_service.iter_content(filters=include), 20))
     
     base_url = "https://joshuaoliph.com"
     title = "Joshua Oliphant's Digital Garden"
@@ -55,7 +70,7 @@ def generate_rss_feed(content_service: IContentProvider, growth_stage: Optional[
     ET.SubElement(channel, "lastBuildDate").text = format_datetime(datetime.now())
     
     # Add items
-    for post in published_posts[:20]:  # Limit to 20 most recent items
+    for post in published_posts:
         item = ET.SubElement(channel, "item")
         
         # Title
@@ -66,14 +81,8 @@ def generate_rss_feed(content_service: IContentProvider, growth_stage: Optional[
         slug = post.get("slug", post.get("name", ""))
         ET.SubElement(item, "link").text = f"{base_url}/{content_type}/{slug}"
         
-        # Description with growth stage info
-        description = post.get("description", "")
-        if not description and "html" in post:
-            # Extract first paragraph from HTML
-            import re
-            match = re.search(r'<p>(.*?)</p>', post["html"])
-            if match:
-                description = match.group(1)
+        # Description with growth stage info, falling back to the stored excerpt
+        description = post.get("description") or post.get("excerpt", "")
         
         # Add growth stage information to description
         growth_stage = post.get("growth_stage", "seedling")
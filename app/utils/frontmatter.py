@@ -0,0 +1,95 @@
+"""Header-only frontmatter scanning.
+
+Tag counts, quotes and the sitemap need a document's YAML frontmatter but
+none of its body. Reading the file only up to the closing ``---`` and
+parsing that block with libyaml (when PyYAML was built with it) skips the
+markdown, HTML and sanitising passes a full render pays for.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import yaml
+
+
+# libyaml's C loader is several times faster than the pure-Python one
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+FRONTMATTER_DELIMITER = "---"
+
+
+def load_yaml(text: str) -> Dict[str, Any]:
+    """Parse a YAML mapping with the fastest available safe loader.
+
+    Args:
+        text: YAML source
+
+    Returns:
+        Parsed mapping (empty for an empty document)
+
+    Raises:
+        yaml.YAMLError: If the YAML is malformed or not a mapping
+    """
+    data = yaml.load(text, Loader=YamlLoader)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise yaml.YAMLError("Front matter is not a mapping")
+    return data
+
+
+def read_frontmatter_block(file_path: Union[str, Path]) -> Optional[str]:
+    """Read the raw frontmatter of a file without reading its body.
+
+    Args:
+        file_path: Path to a markdown file
+
+    Returns:
+        Text between the opening and closing ``---`` lines, or None if the
+        file does not start with frontmatter or it is never closed
+    """
+    with open(file_path, "rb") as f:
+        first = f.readline()
+        if first.rstrip(b"\r\n") != b"---":
+            return None
+        lines = []
+        for line in f:
+            if line.rstrip(b"\r\n") == b"---":
+                return b"".join(lines).decode("utf-8")
+            lines.append(line)
+    return None
+
+
+def read_frontmatter(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Read and parse the frontmatter of a file, leaving the body unread.
+
+    Args:
+        file_path: Path to a markdown file
+
+    Returns:
+        Parsed frontmatter, or None if the file has none
+
+    Raises:
+        yaml.YAMLError: If the frontmatter is malformed
+    """
+    block = read_frontmatter_block(file_path)
+    if block is None:
+        return None
+    return load_yaml(block)
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Split already-read file contents into frontmatter and body.
+
+    Args:
+        content: Full file contents
+
+    Returns:
+        Tuple of (frontmatter text or None, markdown body)
+    """
+    if not content.startswith(FRONTMATTER_DELIMITER + "\n"):
+        return None, content
+    end_marker = content.find("\n---\n", 3)
+    if end_marker == -1:
+        return None, content
+    return content[4:end_marker], content[end_marker + 5:]
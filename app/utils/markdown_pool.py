@@ -0,0 +1,101 @@
+"""Pooled, pre-built markdown converters.
+
+Building a ``markdown.Markdown`` instance loads and registers every
+extension, which for a handful of extensions costs about as much as
+converting a short document. A ``Markdown`` instance is not thread-safe,
+but it can be reset and reused, so MarkdownPool keeps idle instances and
+hands each conversion its own one.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+import markdown
+
+
+MarkdownFactory = Callable[[], markdown.Markdown]
+
+
+def default_pool_size() -> int:
+    """Idle converters to keep: enough for the I/O thread pool's workers."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class MarkdownPool:
+    """
+    Thread-safe pool of reusable markdown converters.
+
+    Features:
+    - Converters are built on demand by a factory and reused afterwards
+    - Each converter is reset before it goes back to the pool
+    - Never blocks: a busy pool builds an extra converter, and converters
+      beyond ``size`` idle ones are dropped on release
+    """
+
+    def __init__(self, factory: MarkdownFactory, size: Optional[int] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Builds a configured ``markdown.Markdown`` instance
+            size: Maximum idle converters kept (default_pool_size() if None)
+        """
+        self._factory = factory
+        self.size = size if size is not None else default_pool_size()
+        self._idle: List[markdown.Markdown] = []
+        self._lock = threading.Lock()
+        self._prototype: Optional[markdown.Markdown] = None
+        self.created = 0
+        self.reused = 0
+
+    def _build(self) -> markdown.Markdown:
+        md = self._factory()
+        with self._lock:
+            self.created += 1
+            if self._prototype is None:
+                self._prototype = md
+        return md
+
+    @property
+    def prototype(self) -> markdown.Markdown:
+        """The first converter built, for inspecting the configured extensions.
+
+        It is pooled like any other converter; do not convert with it directly.
+        """
+        if self._prototype is None:
+            self._release(self._build())
+        return self._prototype
+
+    def _acquire(self) -> markdown.Markdown:
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+        return self._build()
+
+    def _release(self, md: markdown.Markdown) -> None:
+        md.reset()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(md)
+
+    @contextmanager
+    def checkout(self) -> Iterator[markdown.Markdown]:
+        """Borrow a converter, e.g. to read ``toc_tokens`` after converting."""
+        md = self._acquire()
+        try:
+            yield md
+        finally:
+            self._release(md)
+
+    def convert(self, text: str) -> str:
+        """Convert markdown to HTML with a pooled converter."""
+        with self.checkout() as md:
+            return md.convert(text)
+
+    def stats(self) -> dict:
+        """Return converters built and reused, and how many are idle."""
+        with self._lock:
+            return {"created": self.created, "reused": self.reused, "idle": len(self._idle)}
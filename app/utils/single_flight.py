@@ -0,0 +1,140 @@
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same expensive result at the same time
+(typically right after a cache expiry), only the first one computes it; the
+others wait for that computation and receive the same result or exception.
+Works for plain threads and for asyncio callers.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class _Call:
+    """An in-flight computation for one key."""
+
+    future: Future = field(default_factory=Future)
+    owner: Optional[int] = None
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one computation.
+
+    Features:
+    - ``do`` for synchronous callers, ``do_async`` for coroutines
+    - Sync functions called through ``do_async`` run in a worker thread so
+      the event loop stays responsive while the leader computes
+    - Re-entrant: a leader calling back into the same key computes directly
+      instead of deadlocking on itself
+    - Exceptions are shared with every waiter and never cached
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = {"executions": 0, "shared": 0}
+
+    def _join_or_lead(self, key: Hashable, owner: int) -> tuple[_Call, bool]:
+        """Return the call for ``key`` and whether the caller must compute it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call(owner=owner)
+                self._calls[key] = call
+                self.stats["executions"] += 1
+                return call, True
+            if call.owner == owner:
+                # Re-entrant call from the leader itself
+                return call, True
+            call.waiters += 1
+            self.stats["shared"] += 1
+            return call, False
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identifies the computation being coalesced
+            fn: Function to call when no computation for ``key`` is running
+
+        Returns:
+            The result of the shared computation
+        """
+        call, leader = self._join_or_lead(key, threading.get_ident())
+        if not leader:
+            return call.future.result()
+        if call.future.done() or call.future.running():
+            # Re-entrant: the outer frame owns the future
+            return fn(*args, **kwargs)
+
+        call.future.set_running_or_notify_cancel()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.future.set_exception(e)
+            raise
+        else:
+            call.future.set_result(result)
+            return result
+        finally:
+            self._finish(key, call)
+
+    async def do_async(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await a shared computation for ``key``.
+
+        Coroutine functions are awaited on the event loop; plain functions are
+        run in a worker thread through ``do`` so sync and async callers
+        coalesce with each other.
+
+        Args:
+            key: Identifies the computation being coalesced
+            fn: Function or coroutine function to run when none is in flight
+
+        Returns:
+            The result of the shared computation
+        """
+        if not asyncio.iscoroutinefunction(fn):
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    call.waiters += 1
+                    self.stats["shared"] += 1
+            if call is not None:
+                return await asyncio.wrap_future(call.future)
+            return await asyncio.to_thread(self.do, key, fn, *args, **kwargs)
+
+        task = asyncio.current_task()
+        call, leader = self._join_or_lead(key, id(task))
+        if not leader:
+            return await asyncio.wrap_future(call.future)
+        if call.future.running():
+            return await fn(*args, **kwargs)
+
+        call.future.set_running_or_notify_cancel()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            call.future.set_exception(e)
+            raise
+        else:
+            call.future.set_result(result)
+            return result
+        finally:
+            self._finish(key, call)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a computation for ``key`` is currently running."""
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Benchmark request latency under concurrent load with and without offloading
+blocking content work from the event loop.
+
+Generates a synthetic corpus, serves the real application in-process (one
+event loop, like a single uvicorn worker) and fires a mix of cold content
+pages, which read and render markdown, and cheap /health probes. Reports
+p50/p95/p99 latency per request kind for two modes:
+
+- blocking: provider calls run directly on the event loop (the behaviour
+  before route handlers awaited AsyncContentProvider)
+- threaded: provider calls run in the bounded content I/O thread pool
+
+With blocking calls, every probe queued behind a render waits for it, which
+shows up as a p99 for /health close to that of the content pages.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.main import app
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.backlink_service import BacklinkService
+from app.services.content_service import ContentService
+from app.services.dependencies import (
+    get_async_content_service,
+    get_backlink_service,
+    get_content_service,
+)
+
+NOTE = """---
+title: "Benchmark note {i}"
+created: 2024-01-{day:02d}
+tags: [benchmark, python]
+status: "Evergreen"
+---
+
+# Benchmark note {i}
+
+{paragraphs}
+
+```python
+{code}
+```
+"""
+
+
+class InlineContentProvider(AsyncContentProvider):
+    """Runs provider calls directly on the event loop."""
+
+    async def run(self, fn, *args, **kwargs):
+        result = fn(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
+
+
+def write_corpus(root: Path, documents: int) -> None:
+    """Write ``documents`` notes with prose and highlighted code."""
+    notes = root / "notes"
+    notes.mkdir(parents=True)
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12
+    code = "\n".join(f"def handler_{n}(request):\n    return {{'n': {n}}}" for n in range(40))
+    for i in range(documents):
+        (notes / f"note-{i}.md").write_text(
+            NOTE.format(
+                i=i,
+                day=i % 28 + 1,
+                paragraphs="\n\n".join([paragraph] * 8),
+                code=code,
+            )
+        )
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` in milliseconds."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index] * 1000
+
+
+async def run_load(
+    mode: str, documents: int, requests: int, concurrency: int, content_ratio: float
+) -> Dict[str, List[float]]:
+    """Fire the request mix and return latencies per request kind."""
+    latencies: Dict[str, List[float]] = {"content": [], "health": []}
+    queue: asyncio.Queue = asyncio.Queue()
+    every = max(1, round(1 / content_ratio)) if content_ratio > 0 else 0
+    for n in range(requests):
+        if every and n % every == 0:
+            queue.put_nowait(("content", f"/notes/note-{n % documents}"))
+        else:
+            queue.put_nowait(("health", "/health"))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            while True:
+                try:
+                    kind, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                start = time.perf_counter()
+                response = await client.get(url)
+                latencies[kind].append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{mode}: {url} returned {response.status_code}")
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def benchmark(mode: str, content_dir: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one mode against a fresh, cold ContentService."""
+    # No TTL and a one-entry body cache: every content request re-renders
+    service = ContentService(content_dir=str(content_dir), cache_ttl=0, body_cache_size=1)
+    backlinks = BacklinkService(service)
+    provider_cls = InlineContentProvider if mode == "blocking" else AsyncContentProvider
+    app.dependency_overrides[get_content_service] = lambda: service
+    app.dependency_overrides[get_backlink_service] = lambda: backlinks
+    app.dependency_overrides[get_async_content_service] = lambda: provider_cls(service)
+    try:
+        started = time.perf_counter()
+        latencies = asyncio.run(
+            run_load(mode, args.documents, args.requests, args.concurrency, args.content_ratio)
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        app.dependency_overrides.clear()
+
+    return {"mode": mode, "elapsed": elapsed, "latencies": latencies}
+
+
+def main():
+    """Main entry point for the latency benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark latency under concurrent load")
+    parser.add_argument("--documents", type=int, default=200, help="Synthetic notes (default: 200)")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per mode (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients (default: 32)")
+    parser.add_argument(
+        "--content-ratio",
+        type=float,
+        default=0.2,
+        help="Share of requests that render a content page (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    # Per-request access logs would dominate the output and the timings
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = Path(tmp) / "content"
+        write_corpus(content_dir, args.documents)
+
+        results = [benchmark(mode, content_dir, args) for mode in ("blocking", "threaded")]
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"{args.content_ratio:.0%} content pages over {args.documents} documents"
+    )
+    print(f"{'mode':<10}{'kind':<9}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for result in results:
+        for kind, samples in result["latencies"].items():
+            print(
+                f"{result['mode']:<10}{kind:<9}{len(samples):>7}"
+                f"{percentile(samples, 50):>10.1f}{percentile(samples, 95):>10.1f}"
+                f"{percentile(samples, 99):>10.1f}"
+                f"{(statistics.mean(samples) * 1000 if samples else 0):>10.1f}"
+            )
+        print(f"{result['mode']:<10}total wall time {result['elapsed']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark shortest-path queries over the link graph.
+
+/api/graph/path answers "how does note A lead to note B" with a
+bidirectional breadth-first search over the CSR adjacency that
+GraphAnalyticsService caches per snapshot, then finds further paths with
+Yen's algorithm. For each graph size this reports the one-off cost of the
+transposed adjacency and the mean time of a single shortest path and of the
+k shortest paths between random pairs, next to networkx's unidirectional
+and bidirectional searches over a DiGraph of the same links.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import networkx as nx
+
+from app.services.graph_analytics import LinkGraph, build_link_graph
+from app.services.graph_paths import k_shortest_paths, shortest_path
+
+
+def make_graph(documents: int, links: int, seed: int = 7) -> LinkGraph:
+    """Return a graph of ``documents`` notes with ``links`` random links each."""
+    rng = random.Random(seed)
+    return build_link_graph({
+        f"note-{i}": [f"note-{rng.randrange(documents)}" for _ in range(links)]
+        for i in range(documents)
+    })
+
+
+def mean_query(run: Callable[[int, int], object], pairs: List[Tuple[int, int]]) -> float:
+    """Return the mean seconds per call of ``run`` over ``pairs``."""
+    start = time.perf_counter()
+    for source, target in pairs:
+        run(source, target)
+    return (time.perf_counter() - start) / len(pairs)
+
+
+def benchmark(documents: int, links: int, queries: int, k: int, max_depth: int) -> None:
+    """Time path queries over one random graph."""
+    graph = make_graph(documents, links)
+    rng = random.Random(documents)
+    pairs = [(rng.randrange(documents), rng.randrange(documents)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    incoming = graph.incoming
+    transpose = time.perf_counter() - start
+
+    single = mean_query(
+        lambda s, t: shortest_path(graph, incoming, s, t, max_depth), pairs
+    )
+    several = mean_query(
+        lambda s, t: k_shortest_paths(graph, incoming, s, t, k, max_depth), pairs
+    )
+
+    digraph = nx.DiGraph()
+    digraph.add_nodes_from(range(documents))
+    digraph.add_edges_from((u, v) for u in range(documents) for v in graph.neighbors(u))
+
+    def networkx_path(search):
+        def run(source, target):
+            try:
+                return search(digraph, source, target)
+            except nx.NetworkXNoPath:
+                return None
+        return run
+
+    nx_single = mean_query(networkx_path(nx.shortest_path), pairs)
+    nx_bidirectional = mean_query(networkx_path(nx.bidirectional_shortest_path), pairs)
+
+    mismatches = 0
+    for source, target in pairs:
+        path = shortest_path(graph, incoming, source, target, documents)
+        expected = networkx_path(nx.bidirectional_shortest_path)(source, target)
+        mismatches += (path is None) != (expected is None) or (
+            path is not None and len(path) != len(expected)
+        )
+
+    print(f"\n{documents} documents, {graph.edge_count} links, {queries} queries")
+    print(f"  transpose (once)       {transpose * 1000:>10.1f} ms")
+    print(f"  shortest path          {single * 1000:>10.3f} ms/query")
+    print(f"  {k} shortest paths       {several * 1000:>10.3f} ms/query")
+    print(f"  networkx shortest_path {nx_single * 1000:>10.3f} ms/query")
+    print(f"  networkx bidirectional {nx_bidirectional * 1000:>10.3f} ms/query")
+    print(f"  mismatches             {mismatches:>10}")
+
+
+def main():
+    """Main entry point for the graph path benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark link-graph path queries")
+    parser.add_argument(
+        "--documents", type=int, nargs="+", default=[1000, 10000, 50000],
+        help="Graph sizes (default: 1000 10000 50000)",
+    )
+    parser.add_argument("--links", type=int, default=5, help="Links per document (default: 5)")
+    parser.add_argument("--queries", type=int, default=200, help="Random pairs per size (default: 200)")
+    parser.add_argument("--k", type=int, default=3, help="Paths per query (default: 3)")
+    parser.add_argument("--max-depth", type=int, default=6, help="Maximum links per path (default: 6)")
+    args = parser.parse_args()
+
+    for documents in args.documents:
+        benchmark(documents, args.links, args.queries, args.k, args.max_depth)
+
+
+if __name__ == "__main__":
+    main()
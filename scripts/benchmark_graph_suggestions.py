@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-note suggestion table used by /explore paths.
+
+The table ranks forward links, backlinks and two-hop neighbours of every
+note once per content snapshot; an exploration request then reads the
+current note's list and skips the notes already on its path. For each
+graph size this reports the one-off table build and memory, and the mean
+time of a request-sized lookup, next to ranking the same candidates from
+scratch for one note, as a request would without the table.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.graph_analytics import build_link_graph, pagerank
+from app.services.graph_suggestions import build_suggestion_table
+
+TAGS = [f"tag-{i}" for i in range(40)]
+
+
+def benchmark(documents: int, links: int, queries: int, path_length: int) -> None:
+    """Time the table build and lookups over one random graph."""
+    rng = random.Random(documents)
+    graph = build_link_graph({
+        f"note-{i}": [f"note-{rng.randrange(documents)}" for _ in range(links)]
+        for i in range(documents)
+    })
+    tags = [frozenset(rng.sample(TAGS, rng.randrange(4))) for _ in range(documents)]
+    ranks = pagerank(graph)
+    graph.incoming  # built with the analytics in the service
+
+    start = time.perf_counter()
+    table = build_suggestion_table(graph, tags, ranks)
+    build = time.perf_counter() - start
+    size = sum(
+        buffer.itemsize * len(buffer)
+        for buffer in (table.indptr, table.targets, table.scores, table.relations)
+    )
+
+    paths = [
+        [rng.randrange(documents) for _ in range(path_length)] for _ in range(queries)
+    ]
+    start = time.perf_counter()
+    for path in paths:
+        table.suggest(path[-1], frozenset(path), 5)
+    lookup = (time.perf_counter() - start) / queries
+
+    # Ranking one note's candidates on demand, as a request would without the table
+    start = time.perf_counter()
+    for path in paths:
+        node = path[-1]
+        candidates = set(graph.neighbors(node)) | set(graph.incoming.neighbors(node))
+        for middle in graph.neighbors(node):
+            candidates.update(graph.neighbors(middle))
+        candidates -= set(path)
+        sorted(
+            candidates,
+            key=lambda target: (len(tags[node] & tags[target]), ranks[target]),
+            reverse=True,
+        )[:5]
+    on_demand = (time.perf_counter() - start) / queries
+
+    print(f"\n{documents} documents, {graph.edge_count} links")
+    print(f"  table build (once)  {build * 1000:>10.1f} ms")
+    print(f"  table size          {size / 1e6:>10.1f} MB")
+    print(f"  suggest from table  {lookup * 1e6:>10.1f} us/request")
+    print(f"  rank on demand      {on_demand * 1e6:>10.1f} us/request")
+
+
+def main():
+    """Main entry point for the suggestion table benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the explore suggestion table")
+    parser.add_argument(
+        "--documents", type=int, nargs="+", default=[1000, 10000, 50000],
+        help="Graph sizes (default: 1000 10000 50000)",
+    )
+    parser.add_argument("--links", type=int, default=5, help="Links per document (default: 5)")
+    parser.add_argument("--queries", type=int, default=1000, help="Lookups per size (default: 1000)")
+    parser.add_argument("--path-length", type=int, default=5, help="Notes per path (default: 5)")
+    args = parser.parse_args()
+
+    for documents in args.documents:
+        benchmark(documents, args.links, args.queries, args.path_length)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark BacklinkService's link index against per-lookup corpus scans.
+
+Before the index, every backlink lookup re-extracted the links of every
+document, and resolving a link scanned the corpus for a matching slug, so
+building the link graph or validating links took O(N^2 * L) for N documents
+with L links each. The index is built in one pass over the corpus; lookups
+are dictionary reads.
+
+For each corpus size this reports the index build time, the mean time of a
+backlink and a forward-link lookup, and the time of the full link graph,
+link validation and orphan detection, and of patching the index after a
+single document is edited. The previous scans are timed for
+corpora up to --scan-limit documents (they take minutes beyond that) and the
+results of both approaches are compared.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from unittest.mock import Mock
+
+from app.interfaces import IContentProvider
+from app.services.backlink_service import BacklinkService
+
+PARAGRAPH = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor."
+
+
+def make_corpus(documents: int, links: int, seed: int = 7) -> List[Dict[str, str]]:
+    """Return ``documents`` notes, each with ``links`` internal links (some broken)."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(documents):
+        lines = [f"# Note {i}", PARAGRAPH]
+        for n in range(links):
+            target = rng.randrange(documents)
+            if n % 10 == 9:
+                lines.append(f"A [missing note](notes/missing-{i}-{n}.md) here.")
+            elif n % 2:
+                lines.append(f"Related: [[Note {target}]]")
+            else:
+                lines.append(f"See [note {target}](notes/note-{target}.md) for details.")
+            lines.append(PARAGRAPH)
+        corpus.append({
+            "slug": f"note-{i}",
+            "title": f"Note {i}",
+            "content": "\n".join(lines),
+            "file_path": f"notes/note-{i}.md",
+        })
+    return corpus
+
+
+class ScanningLookups:
+    """The previous lookups, which scan the corpus every time."""
+
+    def __init__(self, service: BacklinkService, corpus: List[Dict[str, str]]):
+        self.service = service
+        self.corpus = corpus
+
+    def resolve(self, link: str) -> Optional[str]:
+        for item in self.corpus:
+            if self.service._link_matches_target(link, item["slug"]):
+                return item["slug"]
+        return None
+
+    def backlinks(self, target: str) -> List[str]:
+        sources = []
+        for item in self.corpus:
+            if item["slug"] == target:
+                continue
+            links = self.service.extract_internal_links(item["content"], item["file_path"])
+            if any(self.service._link_matches_target(link, target) for link in links):
+                sources.append(item["slug"])
+        return sources
+
+    def graph(self) -> Dict[str, List[str]]:
+        graph = {item["slug"]: [] for item in self.corpus}
+        for item in self.corpus:
+            for link in self.service.extract_internal_links(item["content"], item["file_path"]):
+                target = self.resolve(link)
+                if target and target != item["slug"] and target not in graph[item["slug"]]:
+                    graph[item["slug"]].append(target)
+        return graph
+
+
+def timed(run: Callable[[], object]) -> Tuple[float, object]:
+    """Return (seconds, result) of one call."""
+    start = time.perf_counter()
+    result = run()
+    return time.perf_counter() - start, result
+
+
+def mean_lookup(run: Callable[[str], object], slugs: List[str]) -> float:
+    """Return the mean seconds per call of ``run`` over ``slugs``."""
+    start = time.perf_counter()
+    for slug in slugs:
+        run(slug)
+    return (time.perf_counter() - start) / len(slugs)
+
+
+def time_edit(service: BacklinkService, document: Dict[str, str], body: str, rounds: int = 20) -> float:
+    """Return the mean seconds to patch the index for one edited document.
+
+    Each round edits ``document`` and then restores it, so the index ends
+    up as it started.
+    """
+    edited = dict(document, content=body)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        service.apply_change(document["slug"], "modified", edited)
+        service.apply_change(document["slug"], "modified", document)
+    return (time.perf_counter() - start) / (2 * rounds)
+
+
+def benchmark(documents: int, links: int, samples: int, scan_limit: int) -> None:
+    """Time the index and, for small corpora, the scans it replaces."""
+    corpus = make_corpus(documents, links)
+    provider = Mock(spec=IContentProvider)
+    provider.get_all_content.return_value = corpus
+    service = BacklinkService(provider)
+    slugs = random.Random(documents).sample([item["slug"] for item in corpus], samples)
+
+    build, _ = timed(service.get_link_index)
+    backlink = mean_lookup(service.get_backlinks, slugs)
+    forward = mean_lookup(service.get_forward_links, slugs)
+    graph_time, graph = timed(service.build_link_graph)
+    validate, broken = timed(service.validate_links)
+    orphans, _ = timed(service.get_orphaned_content)
+    patch = time_edit(service, corpus[0], corpus[1]["content"])
+
+    print(f"\n{documents} documents, {links} links each ({len(broken)} broken)")
+    print(f"  index build      {build * 1000:>10.1f} ms")
+    print(f"  get_backlinks    {backlink * 1e6:>10.1f} us/lookup")
+    print(f"  get_forward_links{forward * 1e6:>10.1f} us/lookup")
+    print(f"  build_link_graph {graph_time * 1000:>10.1f} ms")
+    print(f"  validate_links   {validate * 1000:>10.1f} ms")
+    print(f"  orphans          {orphans * 1000:>10.1f} ms")
+    print(f"  patch one edit   {patch * 1e6:>10.1f} us")
+
+    if documents > scan_limit:
+        print(f"  (corpus scans skipped above {scan_limit} documents)")
+        return
+
+    scans = ScanningLookups(service, corpus)
+    scan_backlink = mean_lookup(scans.backlinks, slugs)
+    scan_graph, expected = timed(scans.graph)
+    mismatches = sum(
+        sorted(graph[slug]) != sorted(expected[slug]) for slug in expected
+    ) + sum(
+        sorted(b["source_slug"] for b in service.get_backlinks(slug)) != sorted(scans.backlinks(slug))
+        for slug in slugs
+    )
+    print(f"  scan backlinks   {scan_backlink * 1000:>10.1f} ms/lookup "
+          f"({scan_backlink / backlink:,.0f}x the index)")
+    print(f"  scan link graph  {scan_graph * 1000:>10.1f} ms "
+          f"({scan_graph / (build + graph_time):,.0f}x build + graph)")
+    print(f"  mismatches       {mismatches:>10}")
+
+
+def main():
+    """Main entry point for the link index benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the BacklinkService link index")
+    parser.add_argument(
+        "--documents", type=int, nargs="+", default=[1000, 10000, 50000],
+        help="Corpus sizes (default: 1000 10000 50000)",
+    )
+    parser.add_argument("--links", type=int, default=10, help="Links per document (default: 10)")
+    parser.add_argument("--samples", type=int, default=100, help="Slugs looked up per size (default: 100)")
+    parser.add_argument(
+        "--scan-limit", type=int, default=1000,
+        help="Largest corpus timed with the previous scans (default: 1000)",
+    )
+    args = parser.parse_args()
+
+    for documents in args.documents:
+        benchmark(documents, args.links, min(args.samples, documents), args.scan_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of building a markdown converter per document against
+reusing pre-built converters from a MarkdownPool.
+
+For each pipeline (the ContentService extensions and the legacy
+ContentManager extensions) reports, per document:
+
+- build: constructing a ``markdown.Markdown`` instance alone
+- convert: converting with an already built instance
+- fresh: building an instance and converting (the per-call pattern)
+- pooled: converting through a MarkdownPool
+
+Short documents show the construction overhead most clearly, so the
+corpus mixes short TIL-sized notes with longer ones.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import markdown
+
+from app.content_manager import _build_markdown
+from app.services.content_service import MARKDOWN_EXTENSIONS
+from app.utils.markdown_pool import MarkdownPool
+
+SHORT = """# Tip {i}
+
+Use `functools.cache` for pure functions. See [the docs](https://docs.python.org).
+"""
+
+LONG = """# Note {i}
+
+{paragraphs}
+
+## Example
+
+```python
+{code}
+```
+
+| key | value |
+|-----|-------|
+| a   | 1     |
+"""
+
+
+def make_corpus(documents: int, long_share: float) -> List[str]:
+    """Return ``documents`` markdown sources, ``long_share`` of them long."""
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+    code = "\n".join(f"def handler_{n}(request):\n    return {{'n': {n}}}" for n in range(20))
+    every = max(1, round(1 / long_share)) if long_share > 0 else 0
+    corpus = []
+    for i in range(documents):
+        if every and i % every == 0:
+            corpus.append(LONG.format(i=i, paragraphs="\n\n".join([paragraph] * 6), code=code))
+        else:
+            corpus.append(SHORT.format(i=i))
+    return corpus
+
+
+def time_per_document(corpus: List[str], render: Callable[[str], object], rounds: int) -> float:
+    """Return the best mean seconds per document over ``rounds`` passes."""
+    best = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in corpus:
+            render(text)
+        best.append((time.perf_counter() - start) / len(corpus))
+    return min(best)
+
+
+def benchmark(name: str, factory: Callable[[], markdown.Markdown], corpus: List[str], rounds: int) -> Dict[str, float]:
+    """Time one pipeline in every mode."""
+    built = factory()
+    pool = MarkdownPool(factory)
+
+    def convert(text: str) -> str:
+        built.reset()
+        return built.convert(text)
+
+    return {
+        "pipeline": name,
+        "build": time_per_document(corpus, lambda text: factory(), rounds),
+        "convert": time_per_document(corpus, convert, rounds),
+        "fresh": time_per_document(corpus, lambda text: factory().convert(text), rounds),
+        "pooled": time_per_document(corpus, pool.convert, rounds),
+    }
+
+
+def main():
+    """Main entry point for the markdown pipeline benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark per-document markdown construction")
+    parser.add_argument("--documents", type=int, default=300, help="Documents per pass (default: 300)")
+    parser.add_argument(
+        "--long-share",
+        type=float,
+        default=0.2,
+        help="Share of long documents in the corpus (default: 0.2)",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Passes per mode; best is kept (default: 3)")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents, args.long_share)
+    results = [
+        benchmark(
+            "ContentService",
+            lambda: markdown.Markdown(extensions=MARKDOWN_EXTENSIONS),
+            corpus,
+            args.rounds,
+        ),
+        benchmark("ContentManager", _build_markdown, corpus, args.rounds),
+    ]
+
+    print(f"{args.documents} documents, {args.long_share:.0%} long, best of {args.rounds}")
+    print(f"{'pipeline':<16}{'build ms':>10}{'convert ms':>12}{'fresh ms':>10}{'pooled ms':>11}{'saved':>8}")
+    for result in results:
+        saved = 1 - result["pooled"] / result["fresh"] if result["fresh"] else 0.0
+        print(
+            f"{result['pipeline']:<16}{result['build'] * 1000:>10.3f}"
+            f"{result['convert'] * 1000:>12.3f}{result['fresh'] * 1000:>10.3f}"
+            f"{result['pooled'] * 1000:>11.3f}{saved:>8.0%}"
+        )
+    overhead = statistics.mean(r["build"] / r["fresh"] for r in results if r["fresh"])
+    print(f"Construction is {overhead:.0%} of a fresh per-document render on average")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark ContentManager's single-pass render against the previous chain of
+HTML re-parses.
+
+The previous chain converted markdown, parsed the HTML with BeautifulSoup to
+add link classes, let ``bleach.clean`` parse it again to sanitize, and
+parsed the sanitized HTML a final time to pull out the first paragraph as
+an excerpt. The single pass captures the excerpt and headings from the
+markdown tree and decorates links inside the sanitizer's own parse.
+
+Reports, per document, the best mean time and the mean peak traced memory
+(tracemalloc) of each mode, and checks that both produce the same excerpts.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import bleach
+from bs4 import BeautifulSoup
+
+from app.content_manager import (
+    ALLOWED_TAGS,
+    LINK_CLASSES,
+    SANITIZE_ATTRIBUTES,
+    ContentManager,
+    _markdown_pool,
+)
+
+NOTE = """# Note {i}
+
+Intro paragraph with a [link](https://example.com/{i}) and **bold** text.
+
+{paragraphs}
+
+## Details
+
+- item with [another link](https://example.com/a/{i})
+- item two
+
+> A quoted line.
+
+```python
+{code}
+```
+
+### Closing
+
+Final paragraph &copy; {i}.
+"""
+
+
+def make_corpus(documents: int) -> List[str]:
+    """Return ``documents`` markdown bodies with links, headings and code."""
+    paragraph = "Lorem ipsum dolor sit amet, [consectetur](https://example.com) adipiscing elit. " * 6
+    code = "\n".join(f"def handler_{n}(request):\n    return {{'n': {n}}}" for n in range(10))
+    return [
+        NOTE.format(i=i, paragraphs="\n\n".join([paragraph] * (i % 5 + 1)), code=code)
+        for i in range(documents)
+    ]
+
+
+def render_chain(content: str) -> Dict[str, str]:
+    """The previous render: markdown, then three separate HTML parses."""
+    html_content = _markdown_pool.convert(content)
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    for link in soup.find_all("a"):
+        existing_classes = link.get("class", [])
+        if isinstance(existing_classes, str):
+            existing_classes = existing_classes.split()
+        link["class"] = " ".join(existing_classes + LINK_CLASSES)
+
+    clean_html = bleach.clean(
+        str(soup), tags=ALLOWED_TAGS, attributes=SANITIZE_ATTRIBUTES, strip=True
+    )
+
+    first_p = BeautifulSoup(clean_html, "html.parser").find("p")
+    return {"html": clean_html, "excerpt": first_p.get_text() if first_p else ""}
+
+
+def time_per_document(corpus: List[str], render: Callable[[str], object], rounds: int) -> float:
+    """Return the best mean seconds per document over ``rounds`` passes."""
+    best = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in corpus:
+            render(text)
+        best.append((time.perf_counter() - start) / len(corpus))
+    return min(best)
+
+
+def peak_memory_per_document(corpus: List[str], render: Callable[[str], object]) -> float:
+    """Return the mean tracemalloc peak, in KiB, of rendering one document."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for text in corpus:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            render(text)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024
+
+
+def main():
+    """Main entry point for the render post-processing benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark single-pass HTML post-processing")
+    parser.add_argument("--documents", type=int, default=200, help="Documents per pass (default: 200)")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed passes; best is kept (default: 3)")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents)
+    modes = {"chain": render_chain, "single-pass": ContentManager._render_body}
+
+    mismatched = sum(
+        render_chain(text)["excerpt"] != ContentManager._render_body(text)["excerpt"]
+        for text in corpus
+    )
+
+    print(f"{args.documents} documents, best of {args.rounds}")
+    print(f"{'mode':<13}{'ms/doc':>9}{'peak KiB/doc':>15}")
+    results = {}
+    for name, render in modes.items():
+        results[name] = time_per_document(corpus, render, args.rounds)
+        memory = peak_memory_per_document(corpus, render)
+        print(f"{name:<13}{results[name] * 1000:>9.3f}{memory:>15.1f}")
+    print(f"Single pass takes {results['single-pass'] / results['chain']:.0%} of the chain's time")
+    print(f"Excerpt mismatches: {mismatched}")
+
+
+if __name__ == "__main__":
+    main()
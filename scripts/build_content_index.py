@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Prebuild the persistent content index.
+
+Parses and renders every markdown file under the content directory and writes
+the results to the content index, so a freshly started server only has to
+process files that changed after the index was built. Run during the image
+build so cold starts on fly.io skip the full parse.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import CONTENT_DIR, CONTENT_INDEX_PATH
+from app.services.content_service import ContentService
+
+
+def main():
+    """Main entry point for the index build script."""
+    parser = argparse.ArgumentParser(
+        description="Prebuild the parsed-content index used by ContentService"
+    )
+    parser.add_argument(
+        "--content-dir",
+        type=Path,
+        default=Path(CONTENT_DIR),
+        help=f"Path to content directory (default: {CONTENT_DIR})",
+    )
+    parser.add_argument(
+        "--index-path",
+        type=Path,
+        default=Path(CONTENT_INDEX_PATH),
+        help=f"Path of the index file to write (default: {CONTENT_INDEX_PATH})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes for rendering (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Files sent to a worker per task (default: derived from corpus size)",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the existing index and process every file again",
+    )
+
+    args = parser.parse_args()
+
+    if not args.content_dir.exists():
+        print(f"Error: Content directory not found: {args.content_dir}")
+        sys.exit(1)
+
+    if args.rebuild and args.index_path.exists():
+        args.index_path.unlink()
+
+    start = time.perf_counter()
+    service = ContentService(
+        content_dir=str(args.content_dir),
+        index_path=str(args.index_path),
+        ingest_workers=args.workers,
+        ingest_chunk_size=args.chunk_size,
+    )
+    stats = service.build_index()
+    elapsed = time.perf_counter() - start
+
+    print(f"Content index written to {args.index_path}")
+    print(
+        f"  indexed: {stats['indexed']}  reused: {stats['reused']}  "
+        f"failed: {stats['failed']}  ({elapsed:.2f}s)"
+    )
+    ingest = service.get_snapshot_metrics()["last_ingest"]
+    if ingest:
+        print(f"  rendered {ingest['files']} files ({ingest['mode']}, {ingest['workers']} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Shared fixtures: markdown notes written to a temporary content directory.
+
+A test module declares the notes it needs by overriding the ``notes``
+fixture; ``content_dir`` writes them and ``graph_service`` and
+``graph_client`` build the link-graph services and routes on top.
+"""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+
+NOTE = """---
+title: "{title}"
+created: {created}
+tags: [{tags}]
+status: "{status}"
+{frontmatter}---
+
+{body}
+"""
+
+
+def render_note(
+    title: str,
+    body: str = "",
+    created: str = "2024-03-14",
+    tags: Any = "python",
+    status: str = "Evergreen",
+    **frontmatter: Any,
+) -> str:
+    """Return the markdown of a note.
+
+    Extra keyword arguments become frontmatter fields, written verbatim
+    (lists as flow sequences). The body defaults to "Body of <title>.".
+    """
+    if not isinstance(tags, str):
+        tags = ", ".join(tags)
+    fields = "".join(
+        f"{key}: [{', '.join(value)}]\n" if isinstance(value, (list, tuple)) else f"{key}: {value}\n"
+        for key, value in frontmatter.items()
+    )
+    return NOTE.format(
+        title=title,
+        created=created,
+        tags=tags,
+        status=status,
+        frontmatter=fields,
+        body=body or f"Body of {title}.",
+    )
+
+
+@pytest.fixture
+def write_note(tmp_path):
+    """Return ``write(path, **fields)``, which writes ``content/<path>.md``.
+
+    ``path`` is "<content type>/<slug>"; the title defaults to the slug with
+    hyphens as spaces, title-cased. Returns the written file's path.
+    """
+    root = tmp_path / "content"
+
+    def write(path: str, **fields: Any) -> Path:
+        file_path = root / f"{path}.md"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fields.setdefault("title", file_path.stem.replace("-", " ").title())
+        file_path.write_text(render_note(**fields))
+        return file_path
+
+    return write
+
+
+@pytest.fixture
+def notes() -> Dict[str, Dict[str, Any]]:
+    """Notes content_dir starts with, as {"<type>/<slug>": fields}; override per module."""
+    return {}
+
+
+@pytest.fixture
+def content_dir(tmp_path, notes, write_note):
+    """Content directory holding the module's ``notes``."""
+    root = tmp_path / "content"
+    root.mkdir(exist_ok=True)
+    for path, fields in notes.items():
+        write_note(path, **fields)
+    return root
+
+
+@pytest.fixture
+def graph_service(content_dir):
+    """GraphAnalyticsService over content_dir, with exact betweenness for small gardens."""
+    from app.services.backlink_service import BacklinkService
+    from app.services.content_service import ContentService
+    from app.services.graph_analytics import GraphAnalyticsService
+
+    content = ContentService(content_dir=str(content_dir))
+    return GraphAnalyticsService(content, BacklinkService(content), betweenness_samples=100)
+
+
+@pytest.fixture
+def graph_client(graph_service):
+    """TestClient whose content, path and graph services use graph_service's content."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.services.dependencies import (
+        get_content_service,
+        get_graph_analytics_service,
+        get_path_navigation_service,
+    )
+    from app.services.path_navigation_service import PathNavigationService
+
+    content = graph_service._content_provider
+    app.dependency_overrides[get_content_service] = lambda: content
+    app.dependency_overrides[get_path_navigation_service] = lambda: PathNavigationService(content)
+    app.dependency_overrides[get_graph_analytics_service] = lambda: graph_service
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,139 @@
+"""
+Test suite for the async content provider used by route handlers.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.interfaces import IContentProvider
+from app.services.async_content_provider import AsyncContentProvider
+from app.services.dependencies import get_async_content_service, get_content_service
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test-io")
+    yield pool
+    pool.shutdown(wait=True)
+
+
+class SlowProvider:
+    """Provider whose lookups block like a cold file read and render."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def get_content_by_slug(self, content_type, slug):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {"content_type": content_type, "slug": slug}
+
+    async def get_mixed_content(self, page=1, per_page=10, cursor=None):
+        return self.get_mixed_content_sync(page=page, per_page=per_page, cursor=cursor)
+
+    def get_mixed_content_sync(self, page=1, per_page=10, cursor=None):
+        time.sleep(self.delay)
+        return {"page": page, "per_page": per_page, "thread": threading.current_thread().name}
+
+
+class AsyncOnlyProvider:
+    """Provider whose async method has no synchronous twin."""
+
+    async def get_homepage_sections(self):
+        await asyncio.sleep(0)
+        return {"thread": threading.current_thread().name}
+
+
+class TestAsyncContentProvider:
+    """Blocking provider calls run in the pool, not on the event loop."""
+
+    async def test_calls_run_in_pool(self, executor):
+        provider = SlowProvider(delay=0)
+        service = AsyncContentProvider(provider, executor=executor)
+
+        result = await service.get_content_by_slug("notes", "first")
+
+        assert result == {"content_type": "notes", "slug": "first"}
+        assert all(name.startswith("test-io") for name in provider.threads)
+
+    async def test_event_loop_keeps_running(self, executor):
+        service = AsyncContentProvider(SlowProvider(delay=0.2), executor=executor)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        await service.get_content_by_slug("notes", "cold")
+        beat.cancel()
+
+        # A blocking call on the loop would have allowed no ticks at all
+        assert ticks >= 5
+
+    async def test_pool_bounds_concurrency(self, executor):
+        provider = SlowProvider(delay=0.05)
+        service = AsyncContentProvider(provider, executor=executor)
+
+        await asyncio.gather(
+            *(service.get_content_by_slug("notes", f"n{i}") for i in range(6))
+        )
+
+        assert provider.peak == 2
+
+    async def test_async_provider_methods_are_offloaded(self, executor):
+        service = AsyncContentProvider(SlowProvider(delay=0), executor=executor)
+
+        result = await service.get_mixed_content(page=2, per_page=5)
+
+        assert result["page"] == 2
+        assert result["thread"].startswith("test-io")
+
+    async def test_async_only_methods_are_awaited_on_the_loop(self, executor):
+        service = AsyncContentProvider(AsyncOnlyProvider(), executor=executor)
+
+        result = await service.get_homepage_sections()
+
+        assert result["thread"] == threading.current_thread().name
+
+    async def test_run_offloads_arbitrary_calls(self, executor):
+        service = AsyncContentProvider(SlowProvider(delay=0), executor=executor)
+
+        name = await service.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("test-io")
+
+
+def test_dependency_wraps_overridden_provider():
+    mock_provider = Mock(spec=IContentProvider)
+    mock_provider.get_tag_counts.return_value = {"python": 2}
+    app = FastAPI()
+
+    @app.get("/tags")
+    async def tags(service: AsyncContentProvider = Depends(get_async_content_service)):
+        return await service.get_tag_counts()
+
+    app.dependency_overrides[get_content_service] = lambda: mock_provider
+
+    response = TestClient(app).get("/tags")
+
+    assert response.json() == {"python": 2}
+    mock_provider.get_tag_counts.assert_called_once_with()
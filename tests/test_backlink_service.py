@@ -11,7 +11,7 @@ from typing import Dict, List, Set
 from datetime import datetime, timedelta
 
 from app.interfaces import IBacklinkService, IContentProvider
-from app.services.backlink_service import BacklinkService
+from app.services.backlink_service import BacklinkService, StaleSnapshotError
 from app.models import BaseContent
 
 
@@ -245,14 +245,13 @@ class TestBacklinkService:
     def test_refresh_cache_clears_data(self, backlink_service, mock_content_provider):
         """Test cache refresh clears cached data."""
         # Pre-populate cache
-        backlink_service._backlinks_cache = {"target": [{"source_slug": "old"}]}
-        backlink_service._link_graph_cache = {"old": ["data"]}
-        backlink_service._cache_time = datetime.now() - timedelta(hours=1)
+        mock_content_provider.get_all_content.return_value = []
+        backlink_service.get_link_index()
         
         backlink_service.refresh_cache()
         
-        assert len(backlink_service._backlinks_cache) == 0
-        assert backlink_service._link_graph_cache is None
+        assert backlink_service._index is None
+        assert backlink_service._index_version is None
         assert backlink_service._cache_time is None
 
     def test_cache_performance_caching_works(self, backlink_service, mock_content_provider):
@@ -323,4 +322,247 @@ class TestBacklinkService:
         context = backlink_service._extract_link_context(content, "target", "target")
         
         assert "link" in context
-        assert len(context) <= 100  # Should be truncated
\ No newline at end of file
+        assert len(context) <= 100  # Should be truncated
+
+class TestLinkIndex:
+    """The link index is built in one pass and answers lookups from dicts."""
+
+    @pytest.fixture
+    def documents(self):
+        return [
+            {"slug": "hub", "title": "Hub", "file_path": "notes/hub.md",
+             "content": "Intro.\nSee [the spoke](notes/spoke.md) here.\nAnd [[Second Spoke]] too."},
+            {"slug": "spoke", "title": "Spoke", "file_path": "notes/spoke.md",
+             "content": "Back to [hub](hub.md) and [gone](notes/gone.md)."},
+            {"slug": "second-spoke", "title": "Second Spoke", "file_path": "notes/second-spoke.md",
+             "content": "Mentions the spoke without linking."},
+            {"slug": "loner", "title": "Loner", "file_path": "notes/loner.md", "content": "Alone."},
+        ]
+
+    @pytest.fixture
+    def service(self, documents):
+        provider = Mock(spec=IContentProvider)
+        provider.get_all_content.return_value = documents
+        return BacklinkService(provider)
+
+    def test_all_lookups_share_one_scan(self, service):
+        with patch.object(service, "_scan_links", wraps=service._scan_links) as scan:
+            service.get_backlinks("spoke")
+            service.get_forward_links("hub")
+            service.validate_links()
+            service.get_orphaned_content()
+            service.build_link_graph()
+
+        assert scan.call_count == 4
+        assert service._content_provider.get_all_content.call_count == 1
+
+    def test_backlink_context_is_the_line_of_the_link(self, service):
+        assert service.get_backlinks("spoke") == [
+            {"source_slug": "hub", "source_title": "Hub",
+             "link_context": "See [the spoke](notes/spoke.md) here."}
+        ]
+        assert [b["source_slug"] for b in service.get_backlinks("second-spoke")] == ["hub"]
+
+    def test_forward_links_carry_original_text(self, service):
+        links = service.get_forward_links("hub")
+
+        assert [(l["target_slug"], l["target_title"], l["link_text"]) for l in links] == [
+            ("spoke", "Spoke", "the spoke"),
+            ("second-spoke", "Second Spoke", "Second Spoke"),
+        ]
+
+    def test_graph_broken_links_and_orphans(self, service):
+        assert service.build_link_graph() == {
+            "hub": ["spoke", "second-spoke"],
+            "spoke": ["hub"],
+            "second-spoke": [],
+            "loner": [],
+        }
+        assert service.validate_links() == [
+            {"source_slug": "spoke", "broken_link": "gone", "error": "Link target not found"}
+        ]
+        assert service.get_orphaned_content() == ["loner"]
+
+    def test_earliest_document_wins_resolution(self):
+        from app.services.link_index import LinkIndex
+
+        index = LinkIndex()
+        index.add_document("My-Page", "First", [])
+        index.add_document("my-page", "Second", [])
+
+        assert index.resolve("my page") == "My-Page"
+        assert index.resolve("MY-PAGE") == "My-Page"
+        assert index.resolve("other") is None
+
+    def test_rebuilt_once_per_snapshot_version(self, documents):
+        from app.services.content_snapshot import ContentSnapshot
+
+        provider = Mock()
+        provider.get_snapshot.return_value = ContentSnapshot(items=documents, version=1)
+        service = BacklinkService(provider)
+
+        first = service.get_link_index()
+        assert service.get_link_index() is first
+
+        provider.get_snapshot.return_value = ContentSnapshot(items=documents[:2], version=2)
+        second = service.get_link_index()
+
+        assert second is not first
+        assert len(second) == 2
+        provider.get_all_content.assert_not_called()
+
+    def test_reads_markdown_of_content_service_records(self, tmp_path):
+        from app.services.content_service import ContentService
+
+        notes = tmp_path / "content" / "notes"
+        notes.mkdir(parents=True)
+        (notes / "alpha.md").write_text('---\ntitle: "Alpha"\ncreated: 2024-01-01\n---\n\nSee [[Beta]].\n')
+        (notes / "beta.md").write_text('---\ntitle: "Beta"\ncreated: 2024-01-02\n---\n\nNo links.\n')
+        service = BacklinkService(ContentService(content_dir=str(tmp_path / "content")))
+
+        assert service.get_backlinks("beta") == [
+            {"source_slug": "alpha", "source_title": "Alpha", "link_context": "See [[Beta]]."}
+        ]
+
+
+class TestIncrementalLinkIndex:
+    """Single-document changes patch the index in place."""
+
+    @pytest.fixture
+    def index(self):
+        from app.services.link_index import LinkIndex, LinkRef
+
+        index = LinkIndex()
+        index.add_document("a", "A", [LinkRef("b", "b", ""), LinkRef("new", "new", "")])
+        index.add_document("b", "B", [])
+        index.add_document("c", "C", [])
+        return index.link()
+
+    def test_added_document_resolves_broken_links(self, index):
+        from app.services.link_index import LinkRef
+
+        index.update_document("new", "New", [LinkRef("c", "c", "")])
+
+        assert index.forward["a"] == ["b", "new"]
+        assert index.reverse["new"] == ["a"]
+        assert index.reverse["c"] == ["new"]
+        assert index.broken_links() == []
+        assert index.orphans() == []
+
+    def test_removed_document_breaks_links_and_orphans(self, index):
+        assert index.remove_document("b")
+
+        assert index.forward["a"] == []
+        assert index.broken_links() == [("a", "b"), ("a", "new")]
+        assert index.is_orphan("a")
+        assert "b" not in index.orphans()
+        assert not index.remove_document("b")
+
+    def test_modified_document_replaces_its_links(self, index):
+        from app.services.link_index import LinkRef
+
+        index.update_document("a", "A2", [LinkRef("c", "c", "line")])
+
+        assert index.graph() == {"a": ["c"], "b": [], "c": []}
+        assert index.reverse["b"] == []
+        assert index.is_orphan("b")
+        assert index.backlinks("c")[0][1].context == "line"
+        assert index.backlinks("new") == []
+
+    def test_patched_index_matches_a_rebuild(self, index):
+        from app.services.link_index import LinkIndex, LinkRef
+
+        index.update_document("new", "New", [LinkRef("a", "a", "")])
+        index.remove_document("c")
+        index.update_document("c", "C", [LinkRef("b", "b", "")])
+
+        rebuilt = LinkIndex()
+        for slug in index.titles:
+            rebuilt.add_document(slug, index.titles[slug], index.links[slug])
+        rebuilt.link()
+
+        assert {s: sorted(t) for s, t in index.graph().items()} == {
+            s: sorted(t) for s, t in rebuilt.graph().items()
+        }
+        assert sorted(index.orphans()) == sorted(rebuilt.orphans())
+
+    def test_apply_change_scans_only_the_changed_document(self):
+        provider = Mock(spec=IContentProvider)
+        provider.get_all_content.return_value = [
+            {"slug": f"n{i}", "title": f"N{i}", "content": f"[[n{i + 1}]]", "file_path": ""}
+            for i in range(50)
+        ]
+        service = BacklinkService(provider)
+        service.get_link_index()
+
+        with patch.object(service, "_scan_links", wraps=service._scan_links) as scan:
+            service.apply_change("n10", "modified", {"title": "N10", "content": "[[n0]]"})
+
+        assert scan.call_count == 1
+        assert [b["source_slug"] for b in service.get_backlinks("n0")] == ["n10"]
+        assert service.get_backlinks("n11") == []
+
+    def test_apply_change_validates_arguments(self):
+        service = BacklinkService(Mock(spec=IContentProvider))
+
+        with pytest.raises(ValueError):
+            service.apply_change("x", "renamed")
+        with pytest.raises(ValueError):
+            service.apply_change("x", "added")
+
+    def test_content_changes_patch_instead_of_rebuild(self, tmp_path):
+        from app.services.content_service import ContentService
+        from app.services.content_watcher import ContentChangeDetector
+        from app.services.service_container import create_backlink_service
+
+        notes = tmp_path / "content" / "notes"
+        notes.mkdir(parents=True)
+        note = '---\ntitle: "{title}"\ncreated: 2024-01-0{day}\n---\n\n{body}\n'
+        (notes / "alpha.md").write_text(note.format(title="Alpha", day=1, body="See [[Beta]]."))
+        (notes / "beta.md").write_text(note.format(title="Beta", day=2, body="No links."))
+        detector = ContentChangeDetector(str(tmp_path / "content"), backend="manual")
+        content = ContentService(content_dir=str(tmp_path / "content"), change_detector=detector)
+        service = create_backlink_service(content)
+        assert [b["source_slug"] for b in service.get_backlinks("beta")] == ["alpha"]
+
+        (notes / "gamma.md").write_text(note.format(title="Gamma", day=3, body="[[Beta]] too."))
+        (notes / "alpha.md").unlink()
+        detector.notify("notes/gamma.md", "notes/alpha.md")
+
+        with patch.object(BacklinkService, "_build_index", side_effect=AssertionError):
+            backlinks = service.get_backlinks("beta")
+            orphans = service.get_orphaned_content()
+
+        assert backlinks == [
+            {"source_slug": "gamma", "source_title": "Gamma", "link_context": "[[Beta]] too."}
+        ]
+        assert orphans == []
+        assert service._index_version == content.get_snapshot().version
+
+    def test_graph_of_an_older_snapshot_is_refused(self, tmp_path):
+        from app.services.content_service import ContentService
+        from app.services.content_watcher import ContentChangeDetector
+        from app.services.service_container import create_backlink_service
+
+        notes = tmp_path / "content" / "notes"
+        notes.mkdir(parents=True)
+        note = '---\ntitle: "{title}"\ncreated: 2024-01-0{day}\n---\n\n{body}\n'
+        (notes / "alpha.md").write_text(note.format(title="Alpha", day=1, body="See [[Beta]]."))
+        (notes / "beta.md").write_text(note.format(title="Beta", day=2, body="No links."))
+        detector = ContentChangeDetector(str(tmp_path / "content"), backend="manual")
+        content = ContentService(content_dir=str(tmp_path / "content"), change_detector=detector)
+        service = create_backlink_service(content)
+        older = content.get_snapshot()
+        service.get_link_index()
+
+        (notes / "beta.md").write_text(note.format(title="Beta", day=2, body="See [[Alpha]]."))
+        detector.notify("notes/beta.md")
+        newer = content.get_snapshot()
+
+        # The cached index was patched forward to the newer snapshot
+        assert service._index_version == newer.version
+        with pytest.raises(StaleSnapshotError):
+            service.build_link_graph(older)
+        assert service.build_link_graph(newer) == {"alpha": ["beta"], "beta": ["alpha"]}
+        assert service.build_link_graph() == service.build_link_graph(newer)
+        assert service._index_version == newer.version
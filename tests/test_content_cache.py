@@ -0,0 +1,157 @@
+"""
+Test suite for the byte-budgeted content cache.
+"""
+
+import time
+
+import pytest
+
+from app.services.content_cache import (
+    BODY,
+    METADATA,
+    PINNED,
+    ContentCache,
+    estimate_size,
+)
+from app.services.content_record import BodyStore, ContentRecord
+from app.services.content_service import ContentService
+
+
+def _fixed_size(value):
+    """Treat every value as 100 bytes so budgets are easy to reason about."""
+    return 100
+
+
+class TestEstimateSize:
+    """Sizes grow with content and ignore record bodies."""
+
+    def test_nested_values_are_counted(self):
+        small = {"title": "a", "tags": ["x"]}
+        large = {"title": "a" * 1000, "tags": ["x"] * 50}
+
+        assert estimate_size(large) > estimate_size(small) + 1000
+
+    def test_shared_objects_counted_once(self):
+        text = "x" * 10_000
+
+        assert estimate_size([text, text]) < 2 * estimate_size(text)
+
+    def test_record_bodies_are_excluded(self):
+        store = BodyStore(lambda key: {"html": "", "markdown": ""})
+        record = ContentRecord(
+            {"title": "Note", "html": "<p>" + "x" * 10_000 + "</p>"},
+            store=store,
+            body_key="notes/note.md",
+        )
+
+        assert estimate_size(record) < 5_000
+
+
+class TestContentCache:
+    """LRU eviction by bytes, body tier first."""
+
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = ContentCache(max_bytes=300, sizeof=_fixed_size)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("a")
+
+        cache.set("d", "d")
+
+        assert cache.keys(METADATA) == ["c", "a", "d"]
+        assert cache.size == 300
+        assert cache.evictions(METADATA) == 1
+
+    def test_bodies_evicted_before_metadata(self):
+        cache = ContentCache(max_bytes=300, sizeof=_fixed_size)
+        cache.set("body:one", {}, tier=BODY)
+        cache.set("body:two", {}, tier=BODY)
+        cache.set("notes:one", {})
+
+        cache.set("notes:two", {})
+
+        assert "body:one" not in cache
+        assert "notes:one" in cache and "notes:two" in cache
+        assert cache.evictions(BODY) == 1
+        assert cache.evictions(METADATA) == 0
+
+    def test_pinned_entries_are_free_and_kept(self):
+        cache = ContentCache(max_bytes=100, sizeof=_fixed_size)
+        cache.set("all_content", [1, 2, 3], tier=PINNED)
+        cache.set("a", "a")
+        cache.set("b", "b")
+
+        assert "all_content" in cache
+        assert cache.size == 100
+
+    def test_per_tier_entry_limit(self):
+        cache = ContentCache(max_entries={BODY: 2}, sizeof=_fixed_size)
+        for n in range(4):
+            cache.set(f"body:{n}", {}, tier=BODY)
+        cache.set("meta", {})
+
+        assert cache.count(BODY) == 2
+        assert cache.count(METADATA) == 1
+        assert cache.evictions(BODY) == 2
+
+    def test_max_age_expires_on_read(self):
+        cache = ContentCache()
+        cache.set("a", "value")
+
+        assert cache.get("a", max_age=60) == "value"
+        time.sleep(0.01)
+        assert cache.get("a", max_age=0.001) is None
+        assert "a" not in cache
+        assert cache.expirations == 1
+
+    def test_unknown_tier_is_rejected(self):
+        with pytest.raises(ValueError):
+            ContentCache().set("a", 1, tier="bogus")
+
+    def test_stats(self):
+        cache = ContentCache(max_bytes=1000, sizeof=_fixed_size)
+        cache.set("a", "a")
+        cache.set("body:a", {}, tier=BODY)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 200
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["tiers"][BODY] == {"entries": 1, "bytes": 100, "evictions": 0}
+
+
+class TestSharedBudget:
+    """BodyStore and ContentService share one cache."""
+
+    def test_body_store_uses_body_tier(self):
+        cache = ContentCache(max_bytes=200, sizeof=_fixed_size)
+        store = BodyStore(lambda key: {"html": key, "markdown": key}, cache=cache)
+        cache.set("notes:one", {})
+
+        store.get("notes/a.md")
+        store.get("notes/b.md")
+
+        assert cache.keys(BODY) == ["body:notes/b.md"]
+        assert "notes:one" in cache
+        assert store.stats()["evictions"] == 1
+
+    def test_service_reports_cache_stats(self, tmp_path):
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        (notes / "first.md").write_text(
+            '---\ntitle: "First"\ncreated: 2024-01-01\ntags: [python]\n---\n\nHello\n'
+        )
+        service = ContentService(content_dir=str(tmp_path), cache_max_bytes=1 << 20)
+
+        note = service.get_content_by_slug("notes", "first")
+        assert "Hello" in note["html"]
+
+        stats = service.get_snapshot_metrics()["cache"]
+        assert stats["max_bytes"] == 1 << 20
+        assert stats["tiers"][BODY]["entries"] == 1
+        assert stats["tiers"][METADATA]["entries"] >= 1
+        assert 0 < stats["bytes"] <= 1 << 20
@@ -5,6 +5,7 @@ Tests filtering content by types, tags, and growth stages with intersection logi
 
 import pytest
 from app.services.content_filter_service import ContentFilterService
+from app.services.content_snapshot import ContentSnapshot
 from app.services.url_state import URLState
 from typing import Dict, List, Any
 
@@ -132,3 +133,23 @@ class TestContentFilterService:
         url_state = URLState(types=["notes"])
         filtered = filter_service.filter_content([], url_state)
         assert filtered == []
+
+    def test_filter_snapshot_uses_indexes(self, filter_service, sample_content):
+        """Test that a snapshot is filtered the same way as a plain list."""
+        url_state = URLState(types=["notes"], tags=["web"])
+
+        filtered = filter_service.filter_content(ContentSnapshot(items=sample_content), url_state)
+
+        assert [item["title"] for item in filtered] == ["Web Standards"]
+
+    def test_filter_list_matches_snapshot(self, filter_service, sample_content):
+        """Test that the linear list filter agrees with the snapshot indexes."""
+        url_state = URLState(tags=["WEB"], growth=["Evergreen"])
+
+        from_list = filter_service.filter_content(sample_content, url_state)
+        from_snapshot = filter_service.filter_content(
+            ContentSnapshot(items=sample_content), url_state
+        )
+
+        assert [item["title"] for item in from_list] == ["Web Standards"]
+        assert [item["title"] for item in from_snapshot] == ["Web Standards"]
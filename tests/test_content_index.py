@@ -0,0 +1,211 @@
+"""
+Test suite for the persistent content index used by ContentService.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.services.content_index import (
+    ContentIndex,
+    decode_record,
+    encode_record,
+    hash_content,
+)
+from app.services.content_service import ContentService
+
+
+INDEXED = {
+    "updated": "2024-03-15 10:30:00",
+    "tags": ["python", "indexing"],
+    "body": "Some **indexed** content.",
+}
+
+
+@pytest.fixture
+def notes():
+    """A couple of notes in two content types."""
+    return {"notes/indexed-note": INDEXED, "til/quick-tip": INDEXED}
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Move a file's mtime into the past so it is outside the racy window."""
+    stamp = path.stat().st_mtime - seconds
+    os.utime(path, (stamp, stamp))
+
+
+class TestRecordEncoding:
+    """Records must round-trip through the index without losing types."""
+
+    def test_dates_round_trip(self):
+        record = {
+            "created": date(2024, 3, 14),
+            "updated": datetime(2024, 3, 15, 10, 30),
+            "tags": ["a"],
+            "nested": {"when": date(2020, 1, 1)},
+        }
+
+        assert decode_record(encode_record(record)) == record
+
+    def test_hash_is_stable(self):
+        assert hash_content(b"abc") == hash_content(b"abc")
+        assert hash_content(b"abc") != hash_content(b"abd")
+
+
+class TestContentIndex:
+    """Unit tests for ContentIndex freshness checks."""
+
+    def test_lookup_hits_when_file_unchanged(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        _age(note)
+        index = ContentIndex(str(tmp_path / "index.sqlite3"))
+        raw = note.read_bytes()
+        index.store("notes/indexed-note.md", note.stat(), hash_content(raw), {"title": "x"})
+
+        result = index.lookup("notes/indexed-note.md", note.stat(), note.read_bytes)
+
+        assert result == {"title": "x"}
+
+    def test_lookup_misses_when_content_changes(self, content_dir, tmp_path, write_note):
+        note = content_dir / "notes" / "indexed-note.md"
+        index = ContentIndex(str(tmp_path / "index.sqlite3"))
+        index.store(
+            "notes/indexed-note.md", note.stat(), hash_content(note.read_bytes()), {"title": "x"}
+        )
+
+        write_note("notes/indexed-note", **{**INDEXED, "body": "Some **changed** content."})
+
+        assert index.lookup("notes/indexed-note.md", note.stat(), note.read_bytes) is None
+
+    def test_touched_file_is_reused_by_hash(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        index = ContentIndex(str(tmp_path / "index.sqlite3"))
+        index.store(
+            "notes/indexed-note.md", note.stat(), hash_content(note.read_bytes()), {"title": "x"}
+        )
+
+        _age(note, seconds=3600)
+
+        assert index.lookup("notes/indexed-note.md", note.stat(), note.read_bytes) == {"title": "x"}
+
+    def test_signature_change_discards_entries(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        path = str(tmp_path / "index.sqlite3")
+        index = ContentIndex(path, signature="v1")
+        index.store("notes/indexed-note.md", note.stat(), "hash", {"title": "x"})
+        index.close()
+
+        assert len(ContentIndex(path, signature="v1")) == 1
+        assert len(ContentIndex(path, signature="v2")) == 0
+
+    def test_prune_removes_missing_files(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        index = ContentIndex()
+        index.store("notes/indexed-note.md", note.stat(), "hash", {})
+        index.store("notes/gone.md", note.stat(), "hash", {})
+
+        removed = index.prune(lambda key: (content_dir / key).exists())
+
+        assert removed == 1
+        assert len(index) == 1
+
+    def test_single_writes_do_not_lock_other_processes(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        path = str(tmp_path / "index.sqlite3")
+        first, second = ContentIndex(path), ContentIndex(path)
+
+        first.store("notes/indexed-note.md", note.stat(), "hash", {"title": "x"})
+        started = time.monotonic()
+        second.store("til/quick-tip.md", note.stat(), "hash", {"title": "y"})
+
+        assert time.monotonic() - started < 1
+        assert len(first) == len(second) == 2
+
+    def test_database_errors_are_cache_misses(self, content_dir, tmp_path):
+        note = content_dir / "notes" / "indexed-note.md"
+        index = ContentIndex(str(tmp_path / "index.sqlite3"))
+        index.close()
+
+        index.store("notes/indexed-note.md", note.stat(), "hash", {"title": "x"})
+        index.discard("notes/indexed-note.md")
+
+        assert index.lookup("notes/indexed-note.md", note.stat(), note.read_bytes) is None
+
+
+class TestContentServiceIndex:
+    """ContentService should only re-process files that changed."""
+
+    def test_warm_start_skips_rendering(self, content_dir, tmp_path):
+        index_path = str(tmp_path / "index.sqlite3")
+        for note in content_dir.glob("*/*.md"):
+            _age(note)
+
+        cold = ContentService(content_dir=str(content_dir), index_path=index_path)
+        cold_content = cold.get_all_content()
+
+        warm = ContentService(content_dir=str(content_dir), index_path=index_path)
+        with patch.object(
+            ContentService, "_convert_markdown_to_html", side_effect=AssertionError
+        ):
+            warm_content = warm.get_all_content()
+
+        assert [c["title"] for c in warm_content] == [c["title"] for c in cold_content]
+        assert warm_content[0]["created"] == date(2024, 3, 14)
+
+    def test_only_changed_files_are_reprocessed(self, content_dir, tmp_path, write_note):
+        index_path = str(tmp_path / "index.sqlite3")
+        for note in content_dir.glob("*/*.md"):
+            _age(note)
+        ContentService(content_dir=str(content_dir), index_path=index_path).build_index()
+
+        write_note("til/quick-tip", **INDEXED, title="Updated Tip")
+
+        service = ContentService(content_dir=str(content_dir), index_path=index_path)
+        with patch.object(
+            ContentService,
+            "_convert_markdown_to_html",
+            autospec=True,
+            return_value="<p>x</p>",
+        ) as convert:
+            titles = {c["title"] for c in service.get_all_content()}
+
+        assert convert.call_count == 1
+        assert titles == {"Indexed Note", "Updated Tip"}
+
+    def test_build_index_reports_counts(self, content_dir, tmp_path):
+        index_path = str(tmp_path / "index.sqlite3")
+        for note in content_dir.glob("*/*.md"):
+            _age(note)
+
+        first = ContentService(content_dir=str(content_dir), index_path=index_path).build_index()
+        second = ContentService(content_dir=str(content_dir), index_path=index_path).build_index()
+
+        assert first == {"indexed": 2, "reused": 0, "failed": 0}
+        assert second == {"indexed": 0, "reused": 2, "failed": 0}
+
+    def test_cli_builds_index(self, content_dir, tmp_path):
+        index_path = tmp_path / "built" / "index.sqlite3"
+        script = Path(__file__).parent.parent / "scripts" / "build_content_index.py"
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(script),
+                "--content-dir",
+                str(content_dir),
+                "--index-path",
+                str(index_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert index_path.exists()
+        assert "indexed: 2" in result.stdout
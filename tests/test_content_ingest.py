@@ -0,0 +1,93 @@
+"""
+Test suite for parallel content ingestion.
+"""
+
+import pytest
+
+from app.services.content_ingest import (
+    FAILED,
+    INVALID,
+    RENDERED,
+    ContentIngestor,
+    resolve_worker_count,
+)
+from app.services.content_service import ContentService
+
+
+@pytest.fixture
+def notes():
+    """A handful of notes and one invalid file."""
+    layout = {
+        f"notes/note-{day}": {
+            "created": f"2024-03-{day:02d}",
+            "body": f"Body of Note {day} with `code`.",
+        }
+        for day in range(1, 9)
+    }
+    layout["notes/broken"] = {"created": "2024-03-09", "growth_stage": "wilted"}
+    return layout
+
+
+def _paths(content_dir):
+    return sorted((content_dir / "notes").glob("*.md"))
+
+
+class TestContentIngestor:
+    """Serial and parallel rendering produce identical, ordered outcomes."""
+
+    def test_small_batches_render_serially(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+        ingestor = ContentIngestor(str(content_dir), workers=4, parallel_threshold=100)
+
+        results = ingestor.render(_paths(content_dir), service._build_record)
+
+        assert ingestor.last_run["mode"] == "serial"
+        assert [r.status for r in results].count(RENDERED) == 8
+        assert results[0].status == INVALID
+
+    def test_parallel_matches_serial_order(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+        paths = _paths(content_dir)
+        serial = ContentIngestor(str(content_dir), workers=1).render(paths, service._build_record)
+
+        ingestor = ContentIngestor(str(content_dir), workers=2, chunk_size=2, parallel_threshold=1)
+        parallel = ingestor.render(paths, service._build_record)
+
+        assert ingestor.last_run["mode"] == "parallel"
+        assert ingestor.last_run["workers"] == 2
+        assert [r.status for r in parallel] == [r.status for r in serial]
+        assert [r.digest for r in parallel] == [r.digest for r in serial]
+        assert [r.record and r.record["html"] for r in parallel] == [
+            r.record and r.record["html"] for r in serial
+        ]
+
+    def test_unreadable_file_is_a_failure(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+        ingestor = ContentIngestor(str(content_dir), workers=1)
+
+        (result,) = ingestor.render([content_dir / "notes" / "gone.md"], service._build_record)
+
+        assert result.status == FAILED
+        assert result.error
+
+    def test_worker_count_defaults_to_cpus(self):
+        assert resolve_worker_count(0) >= 1
+        assert resolve_worker_count(None) >= 1
+        assert resolve_worker_count(3) == 3
+
+
+class TestServiceIngestion:
+    """ContentService rebuilds go through the ingestor."""
+
+    def test_parallel_rebuild_indexes_every_file(self, content_dir):
+        service = ContentService(
+            content_dir=str(content_dir), ingest_workers=2, parallel_threshold=1
+        )
+
+        items = service.get_all_content()
+        stats = service.build_index()
+
+        assert [item["title"] for item in items] == [f"Note {day}" for day in range(8, 0, -1)]
+        assert service.get_snapshot_metrics()["last_ingest"]["files"] == 1
+        # Everything but the invalid file was indexed by the first rebuild
+        assert stats == {"indexed": 0, "reused": 8, "failed": 1}
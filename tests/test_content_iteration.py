@@ -0,0 +1,144 @@
+"""
+Test suite for lazy, date-ordered content iteration (iter_content).
+"""
+
+from datetime import date
+from itertools import islice
+from unittest.mock import Mock, patch
+
+import pytest
+
+import app.content_manager as content_manager
+from app.content_manager import ContentManager
+from app.services.content_service import ContentService
+from app.services.content_snapshot import ContentSnapshot
+from app.utils.feed_generator import generate_rss_feed
+
+
+def dated(created, status="Evergreen"):
+    return {"created": created, "updated": created, "status": status}
+
+
+@pytest.fixture
+def notes():
+    """Notes, TILs and how-tos with interleaved creation dates."""
+    layout = {}
+    for day in range(1, 9):
+        layout[f"notes/note-{day}"] = dated(f"2024-01-{day * 3:02d}")
+        layout[f"til/til-{day}"] = dated(f"2024-01-{day * 3 - 1:02d}")
+    layout["how_to/guide"] = dated("2024-01-10")
+    layout["notes/draft"] = dated("2024-02-01", status="draft")
+    return layout
+
+
+class TestSnapshotIteration:
+    """ContentSnapshot.iter_items merges per-type orderings."""
+
+    @pytest.fixture
+    def snapshot(self):
+        items = [
+            {"slug": f"s{i}", "content_type": ("notes", "til", "how_to")[i % 3],
+             "created": date(2024, 1, 20 - i), "title": f"T{i}"}
+            for i in range(9)
+        ]
+        return ContentSnapshot(items=items)
+
+    def test_merge_matches_global_order(self, snapshot):
+        merged = [item["slug"] for item in snapshot.iter_items(["notes", "til"])]
+
+        assert merged == ["s0", "s1", "s3", "s4", "s6", "s7"]
+
+    def test_ascending_and_predicate(self, snapshot):
+        items = snapshot.iter_items(
+            ["how_to", "notes"], order="asc", predicate=lambda item: item["slug"] != "s3"
+        )
+
+        assert [item["slug"] for item in items] == ["s8", "s6", "s5", "s2", "s0"]
+
+    def test_stops_after_items_taken(self, snapshot):
+        predicate = Mock(return_value=True)
+
+        list(islice(snapshot.iter_items(predicate=predicate), 2))
+
+        assert predicate.call_count == 2
+
+
+class TestServiceIteration:
+    """ContentService.iter_content yields records without loading bodies."""
+
+    def test_newest_first_across_types(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+
+        first = [item["slug"] for item in islice(service.iter_content(["notes", "til"]), 3)]
+
+        # Drafts are never published into the snapshot
+        assert first == ["note-8", "til-8", "note-7"]
+
+    def test_top_items_load_no_bodies(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+        service.get_all_content()
+
+        with patch.object(ContentService, "_load_body", side_effect=AssertionError):
+            titles = [item["title"] for item in islice(service.iter_content(), 5)]
+
+        assert len(titles) == 5
+
+    def test_feed_takes_twenty_published_items(self, content_dir, write_note):
+        for day in range(10, 20):
+            write_note(f"notes/extra-{day}", **dated(f"2024-03-{day}"))
+        service = ContentService(content_dir=str(content_dir))
+
+        feed = generate_rss_feed(service)
+
+        assert feed.count("<item>") == 20
+        assert "draft" not in feed.lower().split("<channel>")[1].split("<item>")[1]
+
+
+class TestContentManagerIteration:
+    """The legacy ContentManager renders only the files it yields."""
+
+    @pytest.fixture(autouse=True)
+    def legacy_dir(self, content_dir, monkeypatch):
+        monkeypatch.setattr(content_manager, "CONTENT_DIR", str(content_dir))
+        monkeypatch.setattr(content_manager, "get_render_cache", lambda: Mock(
+            render=lambda source, render, path=None: render(source)
+        ))
+
+    def test_merged_in_creation_order(self):
+        names = [item["name"] for item in ContentManager.iter_content(order="asc")]
+
+        assert names[:4] == ["til-1", "note-1", "til-2", "note-2"]
+        assert names.index("guide") == names.index("note-3") + 1
+        assert len(names) == ContentManager.count_content() == 18
+
+    def test_top_items_render_only_those_files(self):
+        with patch.object(
+            ContentManager, "_render_body", wraps=ContentManager._render_body
+        ) as render:
+            top = list(islice(ContentManager.iter_content(), 3))
+
+        assert [item["name"] for item in top] == ["draft", "note-8", "til-8"]
+        assert render.call_count == 3
+
+    def test_filters_apply_before_rendering(self):
+        with patch.object(
+            ContentManager, "_render_body", wraps=ContentManager._render_body
+        ) as render:
+            item = next(ContentManager.iter_content(
+                ["notes"], filters=lambda metadata: metadata["status"] != "draft"
+            ))
+
+        assert item["name"] == "note-8"
+        assert render.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mixed_content_page_renders_one_page(self):
+        with patch.object(ContentManager, "get_bookmarks", return_value=[]), patch.object(
+            ContentManager, "_render_body", wraps=ContentManager._render_body
+        ) as render:
+            result = await ContentManager.get_mixed_content.__wrapped__(page=2, per_page=4)
+
+        assert [item["name"] for item in result["content"]] == ["til-7", "note-6", "til-6", "note-5"]
+        assert result["total"] == 18
+        # The items of pages one and two, none beyond
+        assert render.call_count == 8
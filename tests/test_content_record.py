@@ -0,0 +1,172 @@
+"""
+Test suite for metadata-only content records and the lazy body store.
+"""
+
+import sys
+from datetime import date
+
+import pytest
+from jinja2 import Environment
+
+from app.services.content_record import BodyStore, ContentRecord, overlay
+from app.services.content_service import ContentService
+
+
+@pytest.fixture
+def notes():
+    """A handful of notes."""
+    return {
+        f"notes/note-{i}": {"description": f'"About Note {i}"', "body": f"Body of **Note {i}**."}
+        for i in range(5)
+    }
+
+
+class TestBodyStore:
+    """LRU behaviour of the body store."""
+
+    def test_loads_on_miss_and_caches(self):
+        loads = []
+        store = BodyStore(lambda key: loads.append(key) or {"html": key}, max_entries=2)
+
+        assert store.get("a") == {"html": "a"}
+        assert store.get("a") == {"html": "a"}
+        assert loads == ["a"]
+        assert store.stats()["hits"] == 1
+
+    def test_evicts_least_recently_used(self):
+        store = BodyStore(lambda key: {"html": key}, max_entries=2)
+        store.get("a")
+        store.get("b")
+        store.get("a")
+        store.get("c")
+
+        assert store.stats()["evictions"] == 1
+        assert store.stats()["entries"] == 2
+        store.get("a")
+        assert store.stats()["misses"] == 3
+
+    def test_invalidate(self):
+        store = BodyStore(lambda key: {"html": key})
+        store.get("a")
+        store.invalidate("a")
+
+        assert len(store) == 0
+
+
+class TestContentRecord:
+    """ContentRecord behaves like the content dicts it replaces."""
+
+    def _record(self, store=None):
+        data = {
+            "slug": "a",
+            "content_type": "notes",
+            "title": "A",
+            "tags": ["x"],
+            "html": "<p>A</p>",
+            "markdown": "A",
+            "description": "About A",
+        }
+        return ContentRecord(data, store, "notes/a.md")
+
+    def test_bodies_come_from_store(self):
+        store = BodyStore(lambda key: {"html": f"<p>{key}</p>", "markdown": key})
+        record = self._record(store)
+
+        assert "html" in record
+        assert len(store) == 0
+        assert record["html"] == "<p>notes/a.md</p>"
+        assert record.get("markdown") == "notes/a.md"
+
+    def test_mapping_behaviour(self):
+        record = self._record()
+
+        assert record["title"] == "A"
+        assert record.get("growth_stage", "seedling") == "seedling"
+        assert "growth_stage" not in record
+        assert record["description"] == "About A"
+        assert record["html"] == "<p>A</p>"
+
+    def test_record_is_read_only(self):
+        record = self._record()
+
+        with pytest.raises(TypeError):
+            record["title"] = "B"
+        with pytest.raises(AttributeError):
+            record.title = "B"
+
+    def test_overlay_leaves_record_untouched(self):
+        record = self._record()
+        view = overlay(record, growth_symbol="*")
+        view["title"] = "B"
+
+        assert view["growth_symbol"] == "*"
+        assert dict(view)["title"] == "B"
+        assert view["description"] == "About A"
+        assert record["title"] == "A"
+        assert "growth_symbol" not in record
+
+    def test_copy_is_independent(self):
+        record = self._record()
+        clone = record.copy()
+        clone["title"] = "Changed"
+        clone["extra"] = 1
+
+        assert record["title"] == "A"
+        assert "extra" not in record
+
+    def test_jinja_attribute_access(self):
+        record = self._record()
+        template = Environment().from_string(
+            "{{ item.title }}|{{ item.description }}|{{ item.growth_stage or 'none' }}"
+        )
+
+        assert template.render(item=record) == "A|About A|none"
+
+    def test_record_is_smaller_than_dict(self):
+        record = self._record()
+
+        assert not hasattr(record, "__dict__")
+        assert sys.getsizeof(record) < sys.getsizeof(dict(record))
+
+
+class TestContentServiceBodies:
+    """ContentService listings hold metadata and load bodies lazily."""
+
+    def test_listing_loads_bodies_on_demand(self, content_dir):
+        service = ContentService(content_dir=str(content_dir), body_cache_size=2)
+
+        items = service.get_all_content()
+
+        assert all(isinstance(item, ContentRecord) for item in items)
+        assert service._bodies.stats()["entries"] == 0
+        assert "<strong>Note 0</strong>" in next(
+            item["html"] for item in items if item["slug"] == "note-0"
+        )
+
+    def test_body_cache_stays_bounded(self, content_dir):
+        service = ContentService(content_dir=str(content_dir), body_cache_size=2)
+
+        htmls = [item["html"] for item in service.get_all_content()]
+
+        assert len(htmls) == 5
+        stats = service.get_snapshot_metrics()["body_cache"]
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 3
+
+    def test_get_content_by_slug_primes_body(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+
+        record = service.get_content_by_slug("notes", "note-1")
+
+        assert record["title"] == "Note 1"
+        assert "<strong>Note 1</strong>" in record["html"]
+        assert service._bodies.stats()["misses"] == 0
+
+    def test_missing_file_yields_empty_body(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+        items = service.get_all_content()
+        (content_dir / "notes" / "note-3.md").unlink()
+
+        gone = next(item for item in items if item["slug"] == "note-3")
+
+        assert gone["html"] == ""
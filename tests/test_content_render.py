@@ -0,0 +1,66 @@
+"""
+Test suite for ContentManager's single-pass render.
+"""
+
+from bs4 import BeautifulSoup
+
+from app.content_manager import LINK_CLASSES, ContentManager, _markdown_pool
+
+
+DOCUMENT = """# Title &amp; more
+
+See [docs](https://example.com) and <https://auto.link>, \\*not em\\* &copy; 2024.
+
+## Sub *heading*
+
+<div>raw block</div>
+
+Later paragraph <script>alert(1)</script>
+"""
+
+
+def _first_paragraph(html):
+    first_p = BeautifulSoup(html, "html.parser").find("p")
+    return first_p.get_text() if first_p else ""
+
+
+class TestSinglePassRender:
+    """Excerpt, headings and links come out of one render."""
+
+    def test_excerpt_matches_rendered_first_paragraph(self):
+        rendered = ContentManager._render_body(DOCUMENT)
+
+        assert rendered["excerpt"] == _first_paragraph(rendered["html"])
+        assert rendered["excerpt"] == "See docs and https://auto.link, *not em* \u00a9 2024."
+
+    def test_raw_html_block_is_not_an_excerpt(self):
+        rendered = ContentManager._render_body("<div>raw</div>\n\nFirst real paragraph.\n")
+
+        assert rendered["excerpt"] == "First real paragraph."
+
+    def test_headings_are_collected_with_ids(self):
+        rendered = ContentManager._render_body(DOCUMENT)
+
+        assert rendered["headings"] == [
+            {"level": 1, "id": "title-more", "text": "Title & more"},
+            {"level": 2, "id": "sub-heading", "text": "Sub heading"},
+        ]
+
+    def test_links_decorated_once_and_html_sanitized(self):
+        html = ContentManager._render_body(DOCUMENT)["html"]
+        links = BeautifulSoup(html, "html.parser").find_all("a")
+
+        assert len(links) == 2
+        for link in links:
+            assert link["class"] == LINK_CLASSES
+        assert "<script>" not in html
+
+    def test_pooled_converter_forgets_previous_document(self):
+        ContentManager._render_body("# Heading\n\nSome text.\n")
+
+        rendered = ContentManager._render_body("```\ncode only\n```\n")
+
+        assert rendered["excerpt"] == ""
+        assert rendered["headings"] == []
+        with _markdown_pool.checkout() as md:
+            assert md.excerpt == "" and md.headings == []
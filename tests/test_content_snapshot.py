@@ -0,0 +1,434 @@
+"""
+Test suite for the all-content snapshot: inverted indexes and
+stale-while-revalidate rebuilds.
+"""
+
+import re
+import threading
+from dataclasses import FrozenInstanceError
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.services.content_service import ContentService
+from app.services.content_snapshot import ContentSnapshot, decode_cursor
+from app.services.content_watcher import ContentChangeDetector
+
+
+@pytest.fixture
+def notes():
+    """A single note."""
+    return {"notes/first": {}}
+
+
+def _titles(items):
+    return sorted(item["title"] for item in items)
+
+
+class TestSnapshotIndexes:
+    """Inverted indexes answer filtered lookups."""
+
+    @pytest.fixture
+    def snapshot(self):
+        return ContentSnapshot(
+            items=[
+                {"slug": "a", "content_type": "notes", "tags": ["Python", "web"], "growth_stage": "evergreen"},
+                {"slug": "b", "content_type": "til", "tags": ["python"], "growth_stage": "budding"},
+                {"slug": "c", "content_type": "notes", "tags": "python", "growth_stage": "seedling"},
+                {"slug": "d", "content_type": "bookmarks", "tags": None},
+            ]
+        )
+
+    def _slugs(self, items):
+        return [item["slug"] for item in items]
+
+    def test_tag_lookup_is_case_insensitive(self, snapshot):
+        assert self._slugs(snapshot.select(tags=["PYTHON"])) == ["a", "b", "c"]
+        assert snapshot.canonical_tag("PYTHON") == "python"
+        assert snapshot.canonical_tag("missing") is None
+
+    def test_tag_counts_merge_spellings(self, snapshot):
+        assert snapshot.tag_counts() == {"python": 3, "web": 1}
+
+    def test_criteria_intersect(self, snapshot):
+        assert self._slugs(snapshot.select(types=["notes"], tags=["python"])) == ["a", "c"]
+        assert self._slugs(snapshot.select(tags=["python", "web"])) == ["a"]
+        assert self._slugs(
+            snapshot.select(types=["notes", "til"], growth_stages=["budding", "evergreen"])
+        ) == ["a", "b"]
+        assert snapshot.select(tags=["python", "missing"]) == []
+
+    def test_no_criteria_returns_everything(self, snapshot):
+        assert self._slugs(snapshot.select()) == ["a", "b", "c", "d"]
+
+    def test_service_tag_apis_use_snapshot(self, content_dir, write_note):
+        write_note("til/tip", tags="Python, testing")
+        service = ContentService(content_dir=str(content_dir))
+
+        assert _titles(service.get_content_by_tag("python")) == ["First", "Tip"]
+        assert [p["title"] for p in service.get_til_posts_by_tag("TESTING")] == ["Tip"]
+        assert service.get_posts_by_tag("python", ["notes"])["total"] == 1
+        assert service.get_tag_counts() == {"python": 2, "testing": 1}
+
+
+class TestSlugIndex:
+    """Slug lookups across content types without touching the filesystem."""
+
+    @pytest.fixture
+    def snapshot(self):
+        return ContentSnapshot(
+            items=[
+                {"slug": "shared", "content_type": "til"},
+                {"slug": "shared", "content_type": "notes"},
+                {"slug": "only-note", "content_type": "notes"},
+            ]
+        )
+
+    def test_find_respects_type_preference(self, snapshot):
+        assert snapshot.find("shared")["content_type"] == "til"
+        assert snapshot.find("shared", ["notes", "til"])["content_type"] == "notes"
+        assert snapshot.find("only-note", ["til"]) is None
+        assert snapshot.find("missing") is None
+
+    def test_batch_lookup_skips_file_probes(self, content_dir, write_note):
+        write_note("pages/about")
+        service = ContentService(content_dir=str(content_dir))
+        service.get_all_content()
+
+        with patch.object(service, "_process_content_file", wraps=service._process_content_file) as process:
+            found = service.get_contents_by_slugs(["first", "about", "nope", "first"])
+
+        assert found["first"]["title"] == "First"
+        assert found["about"]["title"] == "About"
+        assert found["nope"] is None
+        # Only the page, which the snapshot excludes, was read from disk
+        assert process.call_count == 1
+
+    def test_batch_lookup_excludes_drafts(self, content_dir, write_note):
+        write_note("notes/wip", title="WIP", status="draft")
+        service = ContentService(content_dir=str(content_dir))
+
+        assert service.get_contents_by_slugs(["wip"], ["notes"]) == {"wip": None}
+        assert service.get_content_by_slug("notes", "wip")["title"] == "WIP"
+
+    def test_missing_slugs_are_negatively_cached(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        service = ContentService(content_dir=str(content_dir), change_detector=detector)
+
+        with patch("pathlib.Path.exists", autospec=True, side_effect=lambda p: False) as exists:
+            assert service.get_content_by_slug("pages", "later") is None
+            assert service.get_content_by_slug("pages", "later") is None
+        assert exists.call_count == 1
+
+        write_note("pages/later")
+        detector.notify("pages/later.md")
+
+        assert service.get_content_by_slug("pages", "later")["title"] == "Later"
+
+
+class TestSnapshotOrdering:
+    """Precomputed permutations and keyset cursors."""
+
+    @pytest.fixture
+    def snapshot(self):
+        items = [
+            {"slug": f"s{i}", "content_type": "til" if i % 2 else "notes",
+             "title": f"Title {chr(ord('e') - i)}", "created": date(2024, 1, 10 - i),
+             "updated": date(2024, 2, i + 1) if i != 2 else None}
+            for i in range(5)
+        ]
+        return ContentSnapshot(items=items)
+
+    def _slugs(self, items):
+        return [item["slug"] for item in items]
+
+    def test_orderings_per_sort_field(self, snapshot):
+        assert self._slugs(snapshot.select(sort="created", order="desc")) == ["s0", "s1", "s2", "s3", "s4"]
+        assert self._slugs(snapshot.select(sort="title", order="asc")) == ["s4", "s3", "s2", "s1", "s0"]
+        # s2 has no updated date and falls back to created (2024-01-08)
+        assert self._slugs(snapshot.select(sort="updated", order="desc")) == ["s4", "s3", "s1", "s0", "s2"]
+
+    def test_page_slices_ordering(self, snapshot):
+        assert self._slugs(snapshot.page(1, 2)) == ["s1", "s2"]
+        assert self._slugs(snapshot.page(1, 2, sort="created", order="asc")) == ["s3", "s2"]
+        assert self._slugs(snapshot.page(0, 5, content_type="til")) == ["s1", "s3"]
+        assert snapshot.page(10, 2) == []
+
+    def test_cursor_walks_all_pages(self, snapshot):
+        seen, cursor = [], None
+        while True:
+            items, cursor = snapshot.page_after(cursor, 2, sort="title", order="desc")
+            seen.extend(self._slugs(items))
+            if cursor is None:
+                break
+
+        assert seen == ["s0", "s1", "s2", "s3", "s4"]
+
+    def test_cursor_survives_new_snapshot(self, snapshot):
+        first, cursor = snapshot.page_after(None, 2)
+        newer = ContentSnapshot(
+            items=[{"slug": "new", "content_type": "notes", "created": date(2025, 1, 1)}]
+            + snapshot.items
+        )
+
+        rest, _ = newer.page_after(cursor, 10)
+
+        assert self._slugs(first) == ["s0", "s1"]
+        assert self._slugs(rest) == ["s2", "s3", "s4"]
+
+    def test_invalid_cursor_rejected(self, snapshot):
+        with pytest.raises(ValueError):
+            snapshot.page_after("not-a-cursor", 2)
+        with pytest.raises(ValueError):
+            decode_cursor("")
+
+    def test_service_til_cursor_pagination(self, content_dir, write_note):
+        for day in range(1, 6):
+            write_note(f"til/tip-{day}", created=f"2024-04-0{day}")
+        service = ContentService(content_dir=str(content_dir))
+
+        first = service.get_til_posts(page=1, per_page=2)
+        second = service.get_til_posts(per_page=2, cursor=first["next_cursor"])
+        by_page = service.get_til_posts(page=2, per_page=2)
+
+        assert [p["title"] for p in first["posts"]] == ["Tip 5", "Tip 4"]
+        assert [p["title"] for p in second["posts"]] == ["Tip 3", "Tip 2"]
+        assert by_page["posts"] == second["posts"]
+        assert first["total"] == 5
+
+    def test_route_cursor_chain_from_first_page(self, content_dir, write_note):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        from app.services.dependencies import get_content_service
+
+        # More than one 30-item page
+        for n in range(1, 36):
+            created = date(2024, 1, 1) + timedelta(days=n)
+            write_note(f"til/tip-{n}", created=created.isoformat())
+        service = ContentService(content_dir=str(content_dir))
+        app.dependency_overrides[get_content_service] = lambda: service
+        try:
+            client = TestClient(app)
+            titles = []
+            urls = ["/til/page/1"]
+            url = urls[0]
+            # Only the first request is addressed by page number
+            for _ in range(10):
+                html = client.get(url).text
+                titles.extend(re.findall(r"Tip (\d+)\s*</a>", html))
+                match = re.search(r'hx-get="(/til/page/\d+\?cursor=[\w-]+)"', html)
+                if match is None:
+                    break
+                url = match.group(1)
+                urls.append(url)
+        finally:
+            app.dependency_overrides.clear()
+
+        assert len(urls) == 2
+        assert [int(n) for n in titles] == list(range(35, 0, -1))
+
+    def test_listing_built_once_per_type(self, snapshot):
+        notes = snapshot.listing("notes")
+
+        assert self._slugs(notes) == ["s0", "s2", "s4"]
+        assert snapshot.listing("notes") is notes
+        assert self._slugs(snapshot.listing()) == ["s0", "s1", "s2", "s3", "s4"]
+
+    def test_service_limits_slice_one_listing(self, content_dir, write_note):
+        for n in range(2, 5):
+            write_note(f"notes/note-{n}", created=f"2024-03-0{n}")
+        service = ContentService(content_dir=str(content_dir))
+
+        full = service.get_content("notes")
+        with patch.object(
+            ContentService, "_process_content_file", side_effect=AssertionError
+        ):
+            limited = service.get_content("notes", limit=2)
+            bookmarks = service.get_bookmarks(limit=3)
+
+        assert [n["title"] for n in limited["content"]] == ["First", "Note 4"]
+        assert limited["total"] == 2
+        assert all(a is b for a, b in zip(limited["content"], full["content"]))
+        assert bookmarks == []
+
+
+class TestImmutableSnapshots:
+    """Snapshots are read-only and decorated through per-request overlays."""
+
+    def test_snapshot_and_items_are_read_only(self, content_dir):
+        snapshot = ContentService(content_dir=str(content_dir)).get_snapshot()
+
+        with pytest.raises(FrozenInstanceError):
+            snapshot.version = 5
+        with pytest.raises(TypeError):
+            snapshot.items.append({})
+        with pytest.raises(TypeError):
+            snapshot.items[0]["title"] = "Changed"
+
+    def test_derived_data_follows_snapshot_version(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        service = ContentService(content_dir=str(content_dir), change_detector=detector)
+        builds = []
+
+        def count(snapshot):
+            builds.append(snapshot.version)
+            return len(snapshot)
+
+        first = service.get_snapshot()
+        assert first.derive("count", count) == 1
+        assert first.derive("count", count) == 1
+
+        write_note("notes/second")
+        detector.notify("notes/second.md")
+        second = service.get_snapshot()
+
+        assert second.version == first.version + 1
+        assert second.derive("count", count) == 2
+        assert builds == [first.version, second.version]
+
+    def test_slow_derivation_does_not_block_others(self):
+        snapshot = ContentSnapshot(items=[{"slug": "a", "content_type": "notes"}])
+        started, release = threading.Event(), threading.Event()
+
+        def slow(snapshot):
+            started.set()
+            # Only released once "fast" was derived while this build ran
+            return release.wait(2)
+
+        worker = threading.Thread(target=snapshot.derive, args=("slow", slow))
+        worker.start()
+        try:
+            assert started.wait(5)
+            assert snapshot.derive("fast", len) == 1
+        finally:
+            release.set()
+            worker.join()
+        assert snapshot.derive("slow", slow) is True
+
+    def test_routes_decorate_without_mutating_records(self, content_dir):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        from app.services.dependencies import get_content_service
+
+        service = ContentService(content_dir=str(content_dir))
+        app.dependency_overrides[get_content_service] = lambda: service
+        try:
+            client = TestClient(app)
+            for url in ("/", "/tags/python", "/garden"):
+                assert client.get(url).status_code == 200, url
+        finally:
+            app.dependency_overrides.clear()
+
+        record = service.get_all_content()[0]
+        assert "growth_symbol" not in record
+        assert "growth_css_class" not in record
+
+
+class TestStaleWhileRevalidate:
+    """Expired snapshots are served while the next one builds."""
+
+    def test_first_build_is_synchronous(self, content_dir):
+        service = ContentService(content_dir=str(content_dir), stale_while_revalidate=True)
+
+        assert _titles(service.get_all_content()) == ["First"]
+
+        metrics = service.get_snapshot_metrics()
+        assert metrics["snapshot_version"] == 1
+        assert metrics["rebuilds"] == 1
+        assert metrics["stale_served"] == 0
+        assert metrics["last_rebuild_duration_seconds"] >= 0
+
+    def test_expired_snapshot_served_while_rebuilding(self, content_dir, write_note):
+        service = ContentService(
+            content_dir=str(content_dir), cache_ttl=0, stale_while_revalidate=True
+        )
+        service.get_all_content()
+        write_note("notes/second")
+
+        started = threading.Event()
+        release = threading.Event()
+        original = ContentService._load_all_content
+
+        def slow_load(self):
+            started.set()
+            release.wait(5)
+            return original(self)
+
+        with patch.object(ContentService, "_load_all_content", slow_load):
+            stale = service.get_all_content()
+            assert started.wait(5)
+            assert service.get_snapshot_metrics()["refresh_in_progress"]
+            # A second caller during the rebuild neither blocks nor starts another one
+            assert _titles(service.get_all_content()) == ["First"]
+            release.set()
+            assert service.wait_for_refresh(timeout=5)
+
+        assert _titles(stale) == ["First"]
+        assert _titles(service._snapshot.items) == ["First", "Second"]
+        metrics = service.get_snapshot_metrics()
+        assert metrics["snapshot_version"] == 2
+        assert metrics["stale_served"] == 2
+        assert metrics["rebuilds"] == 2
+
+    def test_failed_refresh_keeps_previous_snapshot(self, content_dir):
+        service = ContentService(
+            content_dir=str(content_dir), cache_ttl=0, stale_while_revalidate=True
+        )
+        service.get_all_content()
+
+        with patch.object(
+            ContentService, "_load_all_content", side_effect=RuntimeError("disk gone")
+        ):
+            assert _titles(service.get_all_content()) == ["First"]
+            service.wait_for_refresh(timeout=5)
+
+        metrics = service.get_snapshot_metrics()
+        assert metrics["snapshot_version"] == 1
+        assert metrics["refresh_errors"] == 1
+        assert metrics["last_refresh_error"] == "disk gone"
+
+    def test_change_during_rebuild_keeps_cache_invalid(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        service = ContentService(
+            content_dir=str(content_dir),
+            change_detector=detector,
+            stale_while_revalidate=True,
+        )
+        original = ContentService._load_all_content
+
+        def load_then_change(self):
+            items = original(self)
+            write_note("notes/late")
+            detector.notify("notes/late.md")
+            self.check_for_changes()
+            return items
+
+        with patch.object(ContentService, "_load_all_content", load_then_change):
+            service.get_all_content()
+
+        assert "all_content" not in service._cache
+        assert _titles(service.get_all_content()) == ["First"]
+        service.wait_for_refresh(timeout=5)
+        assert _titles(service.get_all_content()) == ["First", "Late"]
+
+    def test_disabled_rebuilds_synchronously(self, content_dir, write_note):
+        service = ContentService(content_dir=str(content_dir), cache_ttl=0)
+        service.get_all_content()
+        write_note("notes/second")
+
+        assert _titles(service.get_all_content()) == ["First", "Second"]
+        assert service.get_snapshot_metrics()["stale_served"] == 0
+
+    def test_dispose_stops_worker(self, content_dir):
+        service = ContentService(
+            content_dir=str(content_dir), cache_ttl=0, stale_while_revalidate=True
+        )
+        service.get_all_content()
+        service.get_all_content()
+
+        service.dispose()
+
+        assert service.get_snapshot_metrics()["refresh_in_progress"] is False
@@ -0,0 +1,115 @@
+"""
+Test suite for text derived at ingest: excerpts, plain text and reading time.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.content_service import ContentService
+from app.services.content_text import reading_time, summarize_html
+from app.utils.feed_generator import generate_rss_feed
+
+
+def page(title, **fields):
+    """A note whose first paragraph makes the excerpt."""
+    body = (
+        f"# {title}\n\nFirst paragraph of {title} &amp; friends.\n\n"
+        "Second paragraph mentions caching strategies."
+    )
+    return {"title": title, "body": body, **fields}
+
+
+@pytest.fixture
+def notes():
+    """Two notes."""
+    return {"notes/alpha": page("Alpha"), "notes/beta": page("Beta")}
+
+
+class TestSummarizeHtml:
+    """One streaming pass over the rendered HTML."""
+
+    def test_excerpt_is_first_paragraph_text(self):
+        summary = summarize_html(
+            '<h1>Title</h1>\n<p>See <a href="/x">docs</a> &amp; more.</p>\n<p>Later.</p>'
+        )
+
+        assert summary["excerpt"] == "See docs & more."
+        assert summary["plain_text"] == "Title See docs & more. Later."
+        assert summary["word_count"] == 6
+
+    def test_block_boundaries_separate_words(self):
+        summary = summarize_html("<ul><li>one</li><li>two</li></ul><pre>code()</pre>")
+
+        assert summary["plain_text"] == "one two code()"
+        assert summary["excerpt"] == ""
+
+    def test_scripts_are_not_text(self):
+        summary = summarize_html("<p>Visible</p><script>var hidden = 1;</script>")
+
+        assert summary["plain_text"] == "Visible"
+
+    def test_reading_time_rounds_up_to_whole_minutes(self):
+        assert reading_time(0) == 1
+        assert reading_time(200) == 1
+        assert reading_time(201) == 2
+        assert summarize_html("<p>" + "word " * 450 + "</p>")["reading_time"] == 3
+
+
+class TestIngestedText:
+    """ContentService stores the derived text with each record."""
+
+    def test_records_carry_excerpt_and_reading_stats(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+
+        record = next(c for c in service.get_all_content() if c["slug"] == "alpha")
+
+        assert record["excerpt"] == "First paragraph of Alpha & friends."
+        assert record["word_count"] == 12
+        assert record["reading_time"] == 1
+        assert "caching strategies" in record["plain_text"]
+
+    def test_frontmatter_excerpt_wins(self, content_dir, write_note):
+        write_note("notes/alpha", **page("Alpha", excerpt='"Hand written"'))
+        service = ContentService(content_dir=str(content_dir))
+
+        assert service.get_content_by_slug("notes", "alpha")["excerpt"] == "Hand written"
+
+    def test_warm_start_reads_stored_text(self, content_dir, tmp_path):
+        index_path = str(tmp_path / "index.sqlite3")
+        ContentService(content_dir=str(content_dir), index_path=index_path).build_index()
+
+        warm = ContentService(content_dir=str(content_dir), index_path=index_path)
+        with patch.object(ContentService, "_convert_markdown_to_html", side_effect=AssertionError):
+            excerpts = {c["slug"]: c["excerpt"] for c in warm.get_all_content()}
+
+        assert excerpts["beta"] == "First paragraph of Beta & friends."
+
+    def test_feed_uses_stored_excerpt(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+
+        feed = generate_rss_feed(service)
+
+        assert "First paragraph of Alpha &amp; friends." in feed
+
+    def test_search_matches_stored_text(self, content_dir):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        from app.services.dependencies import get_content_service
+
+        service = ContentService(content_dir=str(content_dir))
+        app.dependency_overrides[get_content_service] = lambda: service
+        try:
+            client = TestClient(app)
+            by_text = client.get("/api/search", params={"q": "CACHING"}).json()
+            by_title = client.get("/api/search", params={"q": "beta"}).json()
+        finally:
+            app.dependency_overrides.clear()
+
+        assert by_text["total"] == 2
+        assert all("caching strategies" in r["excerpt"] for r in by_text["results"])
+        assert "&amp;" not in by_text["results"][0]["excerpt"]
+        assert [r["excerpt"] for r in by_title["results"]] == [
+            "First paragraph of Beta & friends."
+        ]
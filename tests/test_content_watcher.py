@@ -0,0 +1,172 @@
+"""
+Test suite for filesystem-change-driven cache invalidation.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.services.content_service import ContentService
+from app.services.content_watcher import ContentChangeDetector, ContentChanges
+
+
+@pytest.fixture
+def notes():
+    """One note and one TIL."""
+    return {"notes/first": {}, "til/tip": {}}
+
+
+def _touch(path: Path) -> None:
+    """Move a rewritten file's mtime forward so stat signatures differ."""
+    stamp = path.stat().st_mtime + 5
+    os.utime(path, (stamp, stamp))
+
+
+class TestContentChangeDetector:
+    """Change classification for each backend."""
+
+    def test_first_check_reports_nothing(self, content_dir):
+        detector = ContentChangeDetector(str(content_dir), poll_interval=0)
+
+        assert not detector.check()
+
+    def test_polling_detects_add_modify_remove(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), poll_interval=0)
+
+        _touch(write_note("notes/first", title="Edited"))
+        write_note("notes/second")
+        (content_dir / "til" / "tip.md").unlink()
+
+        changes = detector.check()
+
+        assert changes.modified == {"notes/first.md"}
+        assert changes.added == {"notes/second.md"}
+        assert changes.removed == {"til/tip.md"}
+        assert not detector.check()
+
+    def test_poll_interval_throttles_checks(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), poll_interval=3600)
+        write_note("notes/second")
+
+        assert not detector.check()
+        assert detector.check(force=True).added == {"notes/second.md"}
+
+    def test_manual_backend_only_reports_notified_paths(self, content_dir, write_note):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        write_note("notes/second")
+        _touch(write_note("notes/first", title="Edited"))
+
+        assert not detector.check()
+
+        detector.notify("notes/second.md", "notes/first.md", "til/missing.md")
+        changes = detector.check()
+
+        assert changes.added == {"notes/second.md"}
+        assert changes.modified == {"notes/first.md"}
+        assert changes.removed == set()
+
+    def test_manual_backend_reports_removal(self, content_dir):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        (content_dir / "til" / "tip.md").unlink()
+
+        detector.notify("til/tip.md")
+
+        assert detector.check().removed == {"til/tip.md"}
+
+    def test_notify_requires_manual_backend(self, content_dir):
+        detector = ContentChangeDetector(str(content_dir), backend="polling")
+
+        with pytest.raises(RuntimeError):
+            detector.notify("notes/first.md")
+
+    def test_unknown_backend_rejected(self, content_dir):
+        with pytest.raises(ValueError):
+            ContentChangeDetector(str(content_dir), backend="fsevents")
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+    def test_inotify_detects_changes(self, content_dir, write_note):
+        try:
+            detector = ContentChangeDetector(
+                str(content_dir), backend="inotify", poll_interval=0
+            )
+        except OSError as e:
+            pytest.skip(f"inotify unavailable: {e}")
+
+        try:
+            write_note("notes/second")
+            (content_dir / "til" / "tip.md").unlink()
+
+            changes = detector.check()
+
+            assert changes.added == {"notes/second.md"}
+            assert changes.removed == {"til/tip.md"}
+        finally:
+            detector.close()
+
+
+class TestContentServiceInvalidation:
+    """ContentService drops only the entries that depend on changed files."""
+
+    def _service(self, content_dir):
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        return ContentService(
+            content_dir=str(content_dir), cache_ttl=0, change_detector=detector
+        ), detector
+
+    def test_cache_does_not_expire_without_changes(self, content_dir):
+        service, _ = self._service(content_dir)
+        service.get_all_content()
+
+        with patch.object(
+            ContentService, "_process_content_file", side_effect=AssertionError
+        ):
+            titles = [c["title"] for c in service.get_all_content()]
+
+        assert sorted(titles) == ["First", "Tip"]
+
+    def test_modified_file_is_reloaded(self, content_dir, write_note):
+        service, detector = self._service(content_dir)
+        service.get_all_content()
+        service.get_content_by_slug("til", "tip")
+
+        _touch(write_note("notes/first", title="Edited"))
+        detector.notify("notes/first.md")
+
+        titles = sorted(c["title"] for c in service.get_all_content())
+
+        assert titles == ["Edited", "Tip"]
+        assert "til:tip" in service._cache
+
+    def test_added_and_removed_files_update_listing(self, content_dir, write_note):
+        service, detector = self._service(content_dir)
+        assert service.get_content("notes")["total"] == 1
+
+        write_note("notes/second")
+        detector.notify("notes/second.md")
+        assert service.get_content("notes")["total"] == 2
+
+        (content_dir / "notes" / "first.md").unlink()
+        detector.notify("notes/first.md")
+        notes = service.get_content("notes")["content"]
+        assert [c["title"] for c in notes] == ["Second"]
+
+    def test_excluded_directory_keeps_all_content(self, content_dir, write_note):
+        (content_dir / "pages").mkdir()
+        service, detector = self._service(content_dir)
+        service.get_all_content()
+
+        write_note("pages/about")
+        detector.notify("pages/about.md")
+
+        changes = service.check_for_changes()
+
+        assert changes.added == {"pages/about.md"}
+        assert "all_content" in service._cache
+
+    def test_without_detector_reports_no_changes(self, content_dir):
+        service = ContentService(content_dir=str(content_dir))
+
+        assert service.check_for_changes() == ContentChanges()
@@ -0,0 +1,123 @@
+"""
+Test suite for header-only frontmatter scanning.
+"""
+
+import pytest
+import yaml
+
+from app.content_manager import ContentManager
+from app.services.content_service import ContentService
+from app.utils.frontmatter import (
+    YamlLoader,
+    load_yaml,
+    read_frontmatter,
+    read_frontmatter_block,
+    split_frontmatter,
+)
+
+
+def _write(path, header, body=b"Body text.\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(header + body)
+    return path
+
+
+class TestFrontmatterScan:
+    """Reading metadata without touching the document body."""
+
+    def test_reads_only_the_header(self, tmp_path):
+        # The body is not valid UTF-8, so decoding it would fail
+        path = _write(
+            tmp_path / "notes" / "a.md",
+            b"---\ntitle: A\ntags:\n  - python\n---\n",
+            b"\xff\xfe not text\n",
+        )
+
+        assert read_frontmatter(path) == {"title": "A", "tags": ["python"]}
+
+    def test_missing_or_unclosed_header(self, tmp_path):
+        plain = _write(tmp_path / "plain.md", b"# Just markdown\n")
+        unclosed = _write(tmp_path / "open.md", b"---\ntitle: A\n", b"")
+
+        assert read_frontmatter_block(plain) is None
+        assert read_frontmatter(unclosed) is None
+
+    def test_crlf_delimiters(self, tmp_path):
+        path = _write(tmp_path / "win.md", b"---\r\ntitle: A\r\n---\r\n")
+
+        assert read_frontmatter(path) == {"title": "A"}
+
+    def test_prefers_libyaml_loader(self):
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert YamlLoader is expected
+
+    def test_non_mapping_is_an_error(self):
+        assert load_yaml("") == {}
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("- a\n- b\n")
+
+    def test_split_matches_full_file(self):
+        header, body = split_frontmatter("---\ntitle: A\n---\nBody\n")
+
+        assert load_yaml(header) == {"title": "A"}
+        assert body == "Body\n"
+        assert split_frontmatter("No header\n") == (None, "No header\n")
+
+
+class TestMetadataConsumers:
+    """Metadata-only callers agree with a full render."""
+
+    def test_read_metadata_matches_render(self, tmp_path):
+        path = _write(
+            tmp_path / "notes" / "a.md",
+            b"---\ntitle: A\ncreated: 2024-01-02\nupdated: 2024-01-03\ntags:\n  - python\nstatus: Evergreen\n---\n",
+        )
+
+        scanned = ContentManager.read_metadata(str(path))
+
+        assert scanned["errors"] == []
+        assert scanned["metadata"] == ContentManager._parse_front_matter(
+            path.read_text(), str(path)
+        )[0]
+
+    def test_read_metadata_reports_errors(self, tmp_path):
+        missing = ContentManager.read_metadata(str(tmp_path / "nope.md"))
+        plain = _write(tmp_path / "notes" / "plain.md", b"# Just markdown\n")
+        bad_date = _write(tmp_path / "notes" / "bad.md", b"---\ncreated: soon-ish\n---\n")
+
+        assert missing["errors"] == ["File not found"]
+        assert ContentManager.read_metadata(str(plain))["errors"] == ["No front matter found"]
+        assert ContentManager.read_metadata(str(bad_date))["errors"] == [
+            "Invalid front matter format"
+        ]
+
+    def test_random_quote_renders_only_the_blockquote(self, tmp_path, monkeypatch):
+        import app.content_manager as content_manager
+
+        _write(
+            tmp_path / "notes" / "quoting-someone.md",
+            b"---\ntitle: Quoting Someone\ncreated: 2024-01-02\nauthor: Someone\n---\n",
+            b"Intro.\n\n> Stay *curious*.\n> Always.\n\nMore text.\n",
+        )
+        monkeypatch.setattr(content_manager, "CONTENT_DIR", str(tmp_path), raising=False)
+        monkeypatch.setattr(
+            ContentManager,
+            "_render_body",
+            staticmethod(lambda content: pytest.fail("full render")),
+        )
+
+        quote = ContentManager.get_random_quote()
+
+        assert quote == {"text": "\nStay curious.\nAlways.\n", "author": "Someone"}
+
+    def test_content_service_parses_with_shared_loader(self, tmp_path):
+        service = ContentService(content_dir=str(tmp_path))
+
+        metadata, body = service._parse_frontmatter("---\ntitle: A\n---\nBody\n")
+
+        assert metadata == {"title": "A"}
+        assert body == "Body\n"
+        assert service._parse_frontmatter("---\n: [\n---\nBody\n") == (
+            {},
+            "---\n: [\n---\nBody\n",
+        )
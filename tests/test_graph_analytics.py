@@ -0,0 +1,195 @@
+"""
+Test suite for link-graph analytics: PageRank, degrees and betweenness.
+"""
+
+import random
+from unittest.mock import Mock, patch
+
+import networkx as nx
+import pytest
+from networkx.algorithms.link_analysis.pagerank_alg import _pagerank_python
+
+from app.interfaces import IContentProvider
+from app.services.backlink_service import BacklinkService
+from app.services.content_service import ContentService
+from app.services.graph_analytics import (
+    GraphAnalytics,
+    GraphAnalyticsService,
+    approximate_betweenness,
+    build_link_graph,
+    pagerank,
+)
+
+
+@pytest.fixture
+def notes():
+    """A hub every note links to, a chain, and a frontmatter connection."""
+    pages = {
+        "hub": {"body": "The centre."},
+        "a": {"body": "See [[hub]] and [[b]]."},
+        "b": {"body": "See [[hub]]."},
+        "c": {"body": "See [hub](notes/hub.md)."},
+        "d": {"body": "No links.", "connections": ["c"]},
+    }
+    return {
+        f"notes/{slug}": {"created": f"2024-01-{day:02d}", **fields}
+        for day, (slug, fields) in enumerate(pages.items(), start=1)
+    }
+
+
+class TestAlgorithms:
+    """Sparse power iteration and sampled betweenness."""
+
+    @pytest.fixture
+    def random_graph(self):
+        rng = random.Random(3)
+        n = 300
+        links = {f"s{i}": [f"s{rng.randrange(n)}" for _ in range(rng.randrange(6))] for i in range(n)}
+        graph = build_link_graph(links)
+        digraph = nx.DiGraph()
+        digraph.add_nodes_from(range(n))
+        digraph.add_edges_from((u, v) for u in range(n) for v in graph.neighbors(u))
+        return graph, digraph
+
+    def test_pagerank_matches_networkx(self, random_graph):
+        graph, digraph = random_graph
+
+        ranks = pagerank(graph)
+        expected = _pagerank_python(digraph)
+
+        assert max(abs(ranks[node] - expected[node]) for node in expected) < 1e-9
+        assert sum(ranks) == pytest.approx(1.0)
+
+    def test_betweenness_exact_when_sampling_every_node(self, random_graph):
+        graph, digraph = random_graph
+
+        scores = approximate_betweenness(graph, samples=len(graph))
+        expected = nx.betweenness_centrality(digraph, normalized=True)
+
+        assert list(scores) == pytest.approx([expected[node] for node in range(len(graph))])
+
+    def test_graph_drops_self_loops_duplicates_and_unknown_slugs(self):
+        graph = build_link_graph(
+            {"a": ["a", "b", "b", "missing"], "b": []},
+            [{"slug": "b", "related_content": ["a", "nowhere"]}, {"slug": "x", "connections": ["a"]}],
+        )
+
+        assert [list(graph.neighbors(node)) for node in range(2)] == [[1], [0]]
+        assert list(graph.transpose().neighbors(0)) == [1]
+
+    def test_degrees(self):
+        analytics = GraphAnalytics.compute(build_link_graph({"a": ["b", "c"], "b": ["c"], "c": []}))
+
+        assert analytics.scores("c")["in_degree"] == 2
+        assert analytics.scores("a")["out_degree"] == 2
+        assert analytics.scores("missing") is None
+
+
+class TestGraphAnalyticsService:
+    """Analytics are cached per snapshot and rank content records."""
+
+    def test_hub_ranks_first(self, graph_service):
+        top = graph_service.top(limit=2)
+
+        assert [entry["item"]["slug"] for entry in top] == ["hub", "c"]
+        assert top[0]["in_degree"] == 3
+
+    def test_frontmatter_connections_are_edges(self, graph_service):
+        scores = graph_service.get_analytics().scores("d")
+
+        assert scores["out_degree"] == 1
+
+    def test_betweenness_metric(self, graph_service):
+        top = graph_service.top(limit=1, metric="betweenness")
+
+        # Every path from d to the hub passes through c
+        assert top[0]["item"]["slug"] == "c"
+        assert top[0]["betweenness"] > 0
+
+    def test_computed_once_per_snapshot(self, graph_service):
+        first = graph_service.get_analytics()
+
+        with patch("app.services.graph_analytics.pagerank", side_effect=AssertionError):
+            assert graph_service.get_analytics() is first
+            graph_service.top(limit=3)
+
+    def test_snapshot_published_during_build(self, content_dir, write_note):
+        from app.services.content_watcher import ContentChangeDetector
+        from app.services.service_container import create_backlink_service
+
+        detector = ContentChangeDetector(str(content_dir), backend="manual")
+        content = ContentService(content_dir=str(content_dir), change_detector=detector)
+        backlinks = create_backlink_service(content)
+        service = GraphAnalyticsService(content, backlinks)
+        older = content.get_snapshot()
+        backlinks.get_link_index()
+        build_graph = backlinks.build_link_graph
+
+        def publish_first(snapshot=None):
+            if snapshot is older:
+                write_note("notes/d", created="2024-01-05", body="See [[a]].")
+                detector.notify("notes/d.md")
+                content.get_snapshot()
+            return build_graph(snapshot)
+
+        with patch.object(backlinks, "build_link_graph", side_effect=publish_first):
+            analytics = service.get_analytics()
+
+        newer = content.get_snapshot()
+        assert analytics.version == newer.version
+        assert analytics.scores("a")["in_degree"] == 1
+        assert "graph_analytics" not in older._derived
+
+    def test_rank_orders_slugs(self, graph_service):
+        assert graph_service.rank(["d", "missing", "hub"]) == ["hub", "d", "missing"]
+
+    def test_unknown_metric(self, graph_service):
+        with pytest.raises(ValueError):
+            graph_service.top(metric="closeness")
+
+    def test_provider_without_snapshots(self):
+        provider = Mock(spec=IContentProvider)
+        provider.get_all_content.return_value = [
+            {"slug": "x", "title": "X", "content": "[[y]]", "file_path": "x.md"},
+            {"slug": "y", "title": "Y", "content": "", "file_path": "y.md"},
+        ]
+        service = GraphAnalyticsService(provider, BacklinkService(provider))
+
+        assert [entry["item"]["slug"] for entry in service.top(limit=1)] == ["y"]
+
+
+class TestGraphRoutes:
+    """The API and the homepage use the analytics."""
+
+    def test_analytics_endpoint(self, graph_client):
+        body = graph_client.get("/api/graph/analytics", params={"limit": 2}).json()
+
+        assert body["nodes"] == 5
+        assert body["edges"] == 5
+        assert [r["slug"] for r in body["results"]] == ["hub", "c"]
+        assert body["results"][0]["title"] == "Hub"
+
+    def test_analytics_endpoint_rejects_unknown_metric(self, graph_client):
+        assert graph_client.get("/api/graph/analytics", params={"metric": "x"}).status_code == 400
+
+    def test_node_endpoint(self, graph_client, graph_service):
+        with patch.object(graph_service, "get_betweenness") as get_betweenness:
+            body = graph_client.get("/api/graph/analytics/c").json()
+
+        assert body["in_degree"] == 1
+        assert "betweenness" not in body
+        get_betweenness.assert_not_called()
+        assert graph_client.get("/api/graph/analytics/missing").status_code == 404
+
+    def test_node_endpoint_betweenness_on_request(self, graph_client):
+        body = graph_client.get("/api/graph/analytics/c", params={"betweenness": "true"}).json()
+
+        assert body["betweenness"] > 0
+
+    def test_homepage_features_linked_notes(self, graph_client):
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(graph_client.get("/").text, "html.parser")
+        featured = soup.find(id="featured-content").find_next("ul").find_all("a")
+
+        assert [a["href"] for a in featured] == ["/notes/hub", "/notes/c", "/notes/b"]
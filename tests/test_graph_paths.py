@@ -0,0 +1,137 @@
+"""
+Test suite for shortest link paths between documents.
+"""
+
+import random
+from itertools import islice
+
+import networkx as nx
+import pytest
+
+from app.services.graph_analytics import build_link_graph
+from app.services.graph_paths import k_shortest_paths, shortest_path
+
+
+@pytest.fixture
+def notes():
+    """a -> hub directly and through b; d reaches hub only through c."""
+    pages = {
+        "hub": "The centre.",
+        "a": "See [[hub]] and [[b]].",
+        "b": "See [[hub]].",
+        "c": "See [[hub]].",
+        "d": "See [[c]].",
+    }
+    return {
+        f"notes/{slug}": {"created": f"2024-01-{day:02d}", "body": body}
+        for day, (slug, body) in enumerate(pages.items(), start=1)
+    }
+
+
+def chain(length):
+    """A graph s0 -> s1 -> ... -> s{length}."""
+    return build_link_graph({f"s{i}": [f"s{i + 1}"] for i in range(length)} | {f"s{length}": []})
+
+
+class TestSearch:
+    """Bidirectional BFS and Yen's algorithm over the CSR graph."""
+
+    @pytest.fixture
+    def random_graphs(self):
+        graphs = []
+        for seed in range(10):
+            rng = random.Random(seed)
+            n = 120
+            links = {f"s{i}": [f"s{rng.randrange(n)}" for _ in range(rng.randrange(4))] for i in range(n)}
+            graph = build_link_graph(links)
+            digraph = nx.DiGraph()
+            digraph.add_nodes_from(range(n))
+            digraph.add_edges_from((u, v) for u in range(n) for v in graph.neighbors(u))
+            graphs.append((rng, graph, digraph))
+        return graphs
+
+    def test_shortest_path_matches_networkx(self, random_graphs):
+        for rng, graph, digraph in random_graphs:
+            for _ in range(30):
+                source, target = rng.randrange(len(graph)), rng.randrange(len(graph))
+                path = shortest_path(graph, graph.incoming, source, target, max_depth=len(graph))
+                try:
+                    expected = nx.shortest_path_length(digraph, source, target)
+                except nx.NetworkXNoPath:
+                    assert path is None
+                    continue
+                assert len(path) - 1 == expected
+                assert path[0] == source and path[-1] == target
+                assert all(digraph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+    def test_k_shortest_paths_match_networkx(self, random_graphs):
+        for rng, graph, digraph in random_graphs:
+            for _ in range(10):
+                source, target = rng.randrange(len(graph)), rng.randrange(len(graph))
+                if source == target or not nx.has_path(digraph, source, target):
+                    continue
+                paths = k_shortest_paths(graph, graph.incoming, source, target, 4, len(graph))
+                expected = list(islice(nx.shortest_simple_paths(digraph, source, target), 4))
+                assert [len(p) for p in paths] == [len(p) for p in expected]
+                assert len({tuple(p) for p in paths}) == len(paths)
+
+    def test_depth_limit(self):
+        graph = chain(4)
+
+        assert shortest_path(graph, graph.incoming, 0, 4, max_depth=3) is None
+        assert shortest_path(graph, graph.incoming, 0, 4, max_depth=4) == [0, 1, 2, 3, 4]
+        assert k_shortest_paths(graph, graph.incoming, 0, 4, 3, max_depth=3) == []
+
+    def test_paths_follow_link_direction(self):
+        graph = chain(2)
+
+        assert shortest_path(graph, graph.incoming, 2, 0, max_depth=5) is None
+
+    def test_blocked_nodes_and_edges(self):
+        graph = build_link_graph({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+        a, b, c, d = range(4)
+
+        assert shortest_path(graph, graph.incoming, a, d, 5, blocked_nodes={b}) == [a, c, d]
+        assert shortest_path(graph, graph.incoming, a, d, 5, blocked_edges={(a, c), (b, d)}) is None
+
+
+class TestFindPaths:
+    """GraphAnalyticsService.find_paths maps ids back to slugs."""
+
+    def test_paths_shortest_first(self, graph_service):
+        assert graph_service.find_paths("a", "hub") == [["a", "hub"], ["a", "b", "hub"]]
+
+    def test_unreachable_and_unknown(self, graph_service):
+        assert graph_service.find_paths("hub", "a") == []
+        assert graph_service.find_paths("d", "hub", max_depth=1) == []
+        assert graph_service.find_paths("missing", "hub") is None
+
+
+class TestPathRoute:
+    """/api/graph/path returns paths and links them to /explore."""
+
+    def test_paths(self, graph_client):
+        body = graph_client.get("/api/graph/path", params={"from": "d", "to": "hub"}).json()
+
+        assert body["paths"] == [
+            {"slugs": ["d", "c", "hub"], "length": 2, "explore_url": "/explore/d,c,hub"}
+        ]
+
+    def test_redirect_to_explore(self, graph_client):
+        response = graph_client.get(
+            "/api/graph/path",
+            params={"from": "a", "to": "hub", "redirect": "true"},
+            follow_redirects=False,
+        )
+
+        assert response.status_code == 303
+        assert response.headers["location"] == "/explore/a,hub"
+
+    def test_errors(self, graph_client):
+        assert graph_client.get("/api/graph/path", params={"from": "x", "to": "hub"}).status_code == 404
+        assert graph_client.get(
+            "/api/graph/path", params={"from": "hub", "to": "a", "redirect": "true"}
+        ).status_code == 404
+        assert graph_client.get(
+            "/api/graph/path", params={"from": "a", "to": "hub", "max_depth": 10}
+        ).status_code == 422
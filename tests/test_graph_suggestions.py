@@ -0,0 +1,112 @@
+"""
+Test suite for the precomputed per-note suggestion table.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.backlink_service import BacklinkService
+from app.services.graph_analytics import GraphAnalyticsService, build_link_graph
+from app.services.graph_suggestions import build_suggestion_table
+
+
+@pytest.fixture
+def notes():
+    """a -> hub, b; b -> hub; c -> hub; d -> c, with overlapping tags."""
+    pages = {
+        "hub": ("python", "The centre."),
+        "a": ("python, web", "See [[hub]] and [[b]]."),
+        "b": ("web", "See [[hub]]."),
+        "c": ("rust", "See [[hub]]."),
+        "d": ("rust", "See [[c]]."),
+    }
+    return {
+        f"notes/{slug}": {"created": f"2024-01-{day:02d}", "tags": tags, "body": body}
+        for day, (slug, (tags, body)) in enumerate(pages.items(), start=1)
+    }
+
+
+def table_for(links, tags=None, per_node=15):
+    graph = build_link_graph(links)
+    tags = tags or {}
+    return graph, build_suggestion_table(
+        graph,
+        [frozenset(tags.get(slug, ())) for slug in graph.slugs],
+        [0.0] * len(graph),
+        per_node,
+    )
+
+
+class TestSuggestionTable:
+    """Scoring and storage of the per-node lists."""
+
+    def test_relations_add_up(self):
+        graph, table = table_for({"a": ["b", "c"], "b": ["a", "d"], "c": ["d"], "d": []})
+
+        suggestions = table.suggest(graph.ids["a"])
+
+        # b links back (3 + 2); d is two hops away through both b and c (1 + 1)
+        assert suggestions == [
+            (graph.ids["b"], 5.0, "forward"),
+            (graph.ids["c"], 3.0, "forward"),
+            (graph.ids["d"], 2.0, "two_hop"),
+        ]
+
+    def test_shared_tags_multiply(self):
+        graph, table = table_for(
+            {"a": ["b", "c"], "b": [], "c": []},
+            tags={"a": {"x", "y"}, "c": {"x", "y"}},
+        )
+
+        assert table.suggest(graph.ids["a"])[0] == (graph.ids["c"], 9.0, "forward")
+
+    def test_exclude_limit_and_cap(self):
+        links = {"a": [f"n{i}" for i in range(10)]} | {f"n{i}": [] for i in range(10)}
+        graph, table = table_for(links, per_node=4)
+
+        suggestions = table.suggest(graph.ids["a"], exclude={graph.ids["n0"]}, limit=2)
+
+        assert len(table.targets) == 4 + 10  # a keeps four; each n keeps its backlink
+        assert [graph.slugs[node] for node, _, _ in suggestions] == ["n1", "n2"]
+
+
+class TestSuggest:
+    """GraphAnalyticsService.suggest over a content snapshot."""
+
+    def test_forward_links_first(self, graph_service):
+        suggestions = graph_service.suggest("a")
+
+        assert [(s["target_slug"], s["relation"], s["score"]) for s in suggestions] == [
+            ("hub", "forward", 8.0),
+            ("b", "forward", 6.0),
+        ]
+        assert suggestions[0]["target_title"] == "Hub"
+
+    def test_backlinks_and_two_hops(self, graph_service):
+        assert [s["target_slug"] for s in graph_service.suggest("d")] == ["c", "hub"]
+        assert graph_service.suggest("hub")[0]["target_slug"] == "a"
+
+    def test_excludes_path(self, graph_service):
+        assert [s["target_slug"] for s in graph_service.suggest("d", ["d", "c"])] == ["hub"]
+        assert graph_service.suggest("missing") == []
+
+    def test_built_once_per_snapshot(self, graph_service):
+        with patch(
+            "app.services.graph_analytics.build_suggestion_table",
+            wraps=build_suggestion_table,
+        ) as build:
+            graph_service.suggest("a")
+            graph_service.suggest("d")
+
+        assert build.call_count == 1
+
+    def test_explore_uses_table(self, graph_service, graph_client):
+        with patch.object(
+            GraphAnalyticsService, "suggest", autospec=True, return_value=[]
+        ) as suggest, patch.object(BacklinkService, "get_forward_links") as forward:
+            response = graph_client.get("/explore/a,b")
+
+        assert response.status_code == 200
+        suggest.assert_called_once_with(graph_service, "b", ["a", "b"], 5)
+        forward.assert_not_called()
@@ -0,0 +1,118 @@
+"""
+Test suite for the shared Pygments highlight cache.
+"""
+
+from unittest.mock import patch
+
+import markdown
+import pytest
+
+from app.services import highlight_cache
+from app.services.highlight_cache import (
+    CachedCodeHilite,
+    HighlightCache,
+    get_lexer,
+    install_highlight_cache,
+)
+
+
+EXTENSIONS = ["markdown.extensions.fenced_code", "markdown.extensions.codehilite"]
+
+PYTHON_BLOCK = """```python
+def greet(name):
+    return f"hello {name}"  # friendly
+```"""
+
+INDENTED_BLOCK = """Intro.
+
+    #!/usr/bin/env python
+    print("indented")
+"""
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh in-memory cache installed as the process-wide one."""
+    fresh = HighlightCache()
+    install_highlight_cache()
+    monkeypatch.setattr(highlight_cache, "get_highlight_cache", lambda: fresh)
+    return fresh
+
+
+def render_uncached(text: str) -> str:
+    with patch.object(CachedCodeHilite, "hilite", CachedCodeHilite.__mro__[1].hilite):
+        return markdown.markdown(text, extensions=EXTENSIONS)
+
+
+class TestHighlightCache:
+    """Output, keys and statistics."""
+
+    @pytest.mark.parametrize("text", [PYTHON_BLOCK, INDENTED_BLOCK, "```fakeLanguage\nx @#$\n```"])
+    def test_output_matches_codehilite(self, cache, text):
+        expected = render_uncached(text)
+
+        assert markdown.markdown(text, extensions=EXTENSIONS) == expected
+        assert markdown.markdown(text, extensions=EXTENSIONS) == expected
+        assert cache.stats()["hits"] == 1
+
+    def test_repeated_snippet_is_highlighted_once(self, cache):
+        with patch.object(highlight_cache, "highlight", wraps=highlight_cache.highlight) as pyg:
+            for _ in range(3):
+                markdown.markdown(PYTHON_BLOCK, extensions=EXTENSIONS)
+
+        assert pyg.call_count == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_lexer_and_options_are_part_of_the_key(self, cache):
+        markdown.markdown(PYTHON_BLOCK, extensions=EXTENSIONS)
+        markdown.markdown(PYTHON_BLOCK.replace("python", "ruby"), extensions=EXTENSIONS)
+        markdown.markdown(
+            PYTHON_BLOCK,
+            extensions=EXTENSIONS,
+            extension_configs={"markdown.extensions.codehilite": {"linenums": True}},
+        )
+
+        assert cache.stats()["misses"] == 3
+
+    def test_memory_entries_are_bounded(self):
+        cache = HighlightCache(max_entries=2)
+        install_highlight_cache()
+        with patch.object(highlight_cache, "get_highlight_cache", lambda: cache):
+            for n in range(4):
+                markdown.markdown(f"```python\nx = {n}\n```", extensions=EXTENSIONS)
+
+        assert cache.stats()["entries"] == 2
+
+    def test_entries_persist_on_disk(self, tmp_path):
+        path = str(tmp_path / "highlight.sqlite3")
+        install_highlight_cache()
+        with patch.object(highlight_cache, "get_highlight_cache", lambda: HighlightCache(path)):
+            first = markdown.markdown(PYTHON_BLOCK, extensions=EXTENSIONS)
+
+        restarted = HighlightCache(path)
+        with patch.object(highlight_cache, "get_highlight_cache", lambda: restarted), \
+                patch.object(highlight_cache, "highlight", side_effect=AssertionError):
+            second = markdown.markdown(PYTHON_BLOCK, extensions=EXTENSIONS)
+
+        assert first == second
+        assert restarted.stats()["disk_hits"] == 1
+
+    def test_lexer_lookup_is_memoized(self):
+        assert get_lexer("python") is get_lexer("python")
+        assert get_lexer("no-such-language") is None
+
+
+class TestSharedCache:
+    """ContentManager and ContentService render through one cache."""
+
+    def test_both_renderers_share_entries(self, cache):
+        from app.content_manager import ContentManager
+        from app.services.content_service import ContentService
+
+        ContentService(content_dir="/nonexistent")._convert_markdown_to_html(PYTHON_BLOCK)
+        html = ContentManager._render_body(PYTHON_BLOCK)["html"]
+
+        assert 'class="codehilite"' in html
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
@@ -0,0 +1,109 @@
+"""
+Test suite for pooled markdown converters.
+"""
+
+import threading
+
+import markdown
+
+from app.content_manager import _build_markdown
+from app.services.content_service import MARKDOWN_POOL, ContentService
+from app.utils.markdown_pool import MarkdownPool
+
+
+def _counting_factory(calls):
+    def factory():
+        calls.append(1)
+        return markdown.Markdown(extensions=["extra", "toc"])
+
+    return factory
+
+
+class TestMarkdownPool:
+    """Reuse, isolation and bounds of the pool."""
+
+    def test_converters_are_reused(self):
+        calls = []
+        pool = MarkdownPool(_counting_factory(calls))
+
+        for i in range(5):
+            assert pool.convert(f"# Title {i}") == f'<h1 id="title-{i}">Title {i}</h1>'
+
+        assert len(calls) == 1
+        assert pool.stats() == {"created": 1, "reused": 4, "idle": 1}
+
+    def test_state_does_not_leak_between_documents(self):
+        pool = MarkdownPool(_counting_factory([]))
+
+        first = pool.convert("Text[^1]\n\n[^1]: A footnote")
+        second = pool.convert("Plain text")
+
+        assert "footnote" in first
+        assert second == "<p>Plain text</p>"
+
+    def test_checkout_exposes_converter_state(self):
+        pool = MarkdownPool(_counting_factory([]))
+
+        with pool.checkout() as md:
+            md.convert("# One\n\n## Two")
+            names = [token["name"] for token in md.toc_tokens]
+
+        assert names == ["One"]
+        with pool.checkout() as md:
+            assert md.toc_tokens == []
+
+    def test_idle_converters_are_bounded(self):
+        calls = []
+        pool = MarkdownPool(_counting_factory(calls), size=1)
+        outer = pool._acquire()
+        inner = pool._acquire()
+
+        pool._release(outer)
+        pool._release(inner)
+
+        assert len(calls) == 2
+        assert pool.stats()["idle"] == 1
+
+    def test_concurrent_conversions(self):
+        pool = MarkdownPool(_counting_factory([]), size=4)
+        barrier = threading.Barrier(8)
+        results = {}
+
+        def worker(n):
+            barrier.wait()
+            results[n] = [pool.convert(f"# Doc {n}-{i}") for i in range(20)]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        for n in range(8):
+            assert results[n] == [
+                f'<h1 id="doc-{n}-{i}">Doc {n}-{i}</h1>' for i in range(20)
+            ]
+        assert pool.stats()["idle"] <= 4
+
+
+class TestSharedPipelines:
+    """ContentService and ContentManager render through pools."""
+
+    def test_services_share_the_module_pool(self, tmp_path):
+        first = ContentService(content_dir=str(tmp_path))
+        second = ContentService(content_dir=str(tmp_path))
+        created = MARKDOWN_POOL.stats()["created"]
+
+        first.render_markdown("# One")
+        second.render_markdown("# Two")
+
+        assert first._markdown is second._markdown is MARKDOWN_POOL
+        assert MARKDOWN_POOL.stats()["created"] - created <= 1
+
+    def test_pooled_render_matches_fresh_converter(self):
+        pool = MarkdownPool(_build_markdown)
+        text = "# Title\n\nSee [docs](https://example.com).\n\n!!! note\n    Careful\n"
+
+        pool.convert("Warm up[^1]\n\n[^1]: note")
+
+        assert pool.convert(text) == _build_markdown().convert(text)
@@ -347,6 +347,21 @@ class TestContentServiceIntegration:
         except ImportError:
             pytest.fail("PathNavigationService should be importable")
     
+    def test_uses_batch_lookup_when_available(self):
+        """Providers implementing IContentProvider are queried in one batch."""
+        from app.interfaces import IContentProvider
+        from app.services.path_navigation_service import PathNavigationService
+
+        provider = Mock(spec=IContentProvider)
+        provider.get_contents_by_slugs.return_value = {"note1": {"slug": "note1"}, "gone": None}
+
+        result = PathNavigationService(provider).validate_exploration_path("note1,gone")
+
+        provider.get_contents_by_slugs.assert_called_once_with(["note1", "gone"], ["notes"])
+        provider.get_content_by_slug.assert_not_called()
+        assert result.valid_slugs == ["note1"]
+        assert result.invalid_slugs == ["gone"]
+
     def test_handles_content_service_errors(self, mock_content_service):
         """Test 19: Should handle ContentService exceptions gracefully."""
         try:
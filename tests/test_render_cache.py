@@ -0,0 +1,99 @@
+"""
+Test suite for the persistent rendered-HTML cache.
+"""
+
+import os
+import sqlite3
+from unittest.mock import Mock
+
+import app.content_manager as content_manager
+from app.content_manager import ContentManager
+from app.services.render_cache import RenderCache, hash_config, hash_source
+
+
+class TestRenderCache:
+    """Keys, persistence and garbage collection."""
+
+    def test_render_reuses_output_for_same_source(self):
+        cache = RenderCache(None, hash_config("v1"))
+        render = Mock(side_effect=lambda text: {"html": f"<p>{text}</p>"})
+
+        assert cache.render("hello", render) == {"html": "<p>hello</p>"}
+        assert cache.render("hello", render) == {"html": "<p>hello</p>"}
+        assert cache.render("other", render) == {"html": "<p>other</p>"}
+
+        assert render.call_count == 2
+        assert cache.stats()["hits"] == 1
+
+    def test_entries_survive_reopen(self, tmp_path):
+        path = tmp_path / "render.sqlite3"
+        RenderCache(str(path), "cfg").put(hash_source("hello"), {"html": "<p>hello</p>"})
+
+        reopened = RenderCache(str(path), "cfg")
+
+        assert reopened.get(hash_source("hello")) == {"html": "<p>hello</p>"}
+
+    def test_html_is_stored_compressed(self, tmp_path):
+        path = tmp_path / "render.sqlite3"
+        html = "<p>" + "repetitive text " * 500 + "</p>"
+        RenderCache(str(path), "cfg").put(hash_source("x"), {"html": html})
+
+        (blob,) = sqlite3.connect(str(path)).execute("SELECT rendered FROM renders").fetchone()
+
+        assert len(blob) < len(html) / 10
+
+    def test_config_change_drops_entries(self, tmp_path):
+        path = tmp_path / "render.sqlite3"
+        RenderCache(str(path), hash_config("v1")).put(hash_source("hello"), {"html": "<p>old</p>"})
+
+        cache = RenderCache(str(path), hash_config("v2"))
+
+        assert cache.get(hash_source("hello")) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_prune_removes_deleted_sources(self, tmp_path):
+        kept = tmp_path / "kept.md"
+        gone = tmp_path / "gone.md"
+        kept.write_text("kept")
+        cache = RenderCache(None, "cfg")
+        cache.put(hash_source("kept"), {"html": "<p>kept</p>"}, path=str(kept))
+        cache.put(hash_source("gone"), {"html": "<p>gone</p>"}, path=str(gone))
+
+        assert cache.prune(os.path.exists) == 1
+        assert cache.get(hash_source("kept")) == {"html": "<p>kept</p>"}
+        assert cache.get(hash_source("gone")) is None
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        cache = RenderCache(str(blocker / "render.sqlite3"), "cfg")
+        cache.put(hash_source("a"), {"html": "<p>a</p>"})
+
+        assert cache.path is None
+        assert cache.get(hash_source("a")) == {"html": "<p>a</p>"}
+
+
+class TestContentManagerRenderCache:
+    """render_markdown consults the cache before rendering."""
+
+    def test_render_markdown_skips_conversion_on_hit(self, write_note, monkeypatch):
+        note = write_note(
+            "notes/cached",
+            created="2024-01-02",
+            updated="2024-01-03",
+            body="# Cached\n\nSee [docs](https://example.com).",
+        )
+        cache = RenderCache(None, content_manager.RENDER_CONFIG_HASH)
+        monkeypatch.setattr(content_manager, "get_render_cache", lambda: cache)
+        convert = Mock(wraps=ContentManager._render_body)
+        monkeypatch.setattr(ContentManager, "_render_body", convert)
+
+        first = ContentManager.render_markdown(str(note))
+        second = ContentManager.render_markdown(str(note))
+
+        assert convert.call_count == 1
+        assert first == second
+        assert 'class="text-emerald-600' in first["html"]
+        assert first["excerpt"] == "See docs."
+
@@ -0,0 +1,198 @@
+"""
+Test suite for single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from app.interfaces import IContentProvider
+from app.services.backlink_service import BacklinkService
+from app.services.content_service import ContentService
+from app.utils.feed_generator import render_sitemap
+from app.utils.single_flight import SingleFlight
+
+
+def _run_threads(count, target):
+    """Start ``count`` threads on ``target`` at once and collect their results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestSingleFlight:
+    """Unit tests for the SingleFlight primitive."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        results = _run_threads(8, lambda: flight.do("key", compute))
+
+        assert results == ["result"] * 8
+        assert len(calls) == 1
+        assert flight.stats == {"executions": 1, "shared": 7}
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats["executions"] == 2
+
+    def test_exception_shared_and_not_cached(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                errors.append(str(e))
+
+        _run_threads(3, call)
+
+        assert errors == ["boom"] * 3
+        assert not flight.in_flight("key")
+        assert flight.do("key", lambda: "recovered") == "recovered"
+
+    def test_reentrant_call_does_not_deadlock(self):
+        flight = SingleFlight()
+
+        def outer():
+            return flight.do("key", lambda: "inner") + "-outer"
+
+        assert flight.do("key", outer) == "inner-outer"
+
+    def test_async_callers_share_sync_computation(self):
+        flight = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return 42
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("key", compute) for _ in range(5))
+            )
+
+        assert asyncio.run(main()) == [42] * 5
+        assert len(calls) == 1
+
+    def test_async_callers_share_coroutine(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("key", compute) for _ in range(5))
+            )
+
+        assert asyncio.run(main()) == ["done"] * 5
+        assert len(calls) == 1
+
+
+class TestCoalescedRebuilds:
+    """Services route cache misses through single-flight."""
+
+    def test_get_all_content_rebuilds_once(self, tmp_path):
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        (notes / "a.md").write_text("---\ntitle: A\ncreated: 2024-01-01\n---\nBody")
+        service = ContentService(content_dir=str(tmp_path))
+        original = service._load_all_content
+        calls = []
+
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.1)
+            return original()
+
+        service._load_all_content = slow_load
+
+        results = _run_threads(6, service.get_all_content)
+
+        assert len(calls) == 1
+        assert all(len(items) == 1 for items in results)
+
+    def test_get_content_rebuilds_once(self, tmp_path):
+        (tmp_path / "til").mkdir()
+        (tmp_path / "til" / "t.md").write_text("---\ntitle: T\ncreated: 2024-01-01\n---\nBody")
+        service = ContentService(content_dir=str(tmp_path))
+        original = service._build_content_listing
+        calls = []
+
+        def slow_build(*args):
+            calls.append(1)
+            time.sleep(0.1)
+            return original(*args)
+
+        service._build_content_listing = slow_build
+
+        results = _run_threads(6, lambda: service.get_content("til"))
+
+        assert len(calls) == 1
+        assert all(result["total"] == 1 for result in results)
+
+    def test_build_link_graph_rebuilds_once(self):
+        provider = Mock(spec=IContentProvider)
+
+        def slow_content():
+            time.sleep(0.1)
+            return [{"slug": "a", "content": "[[b]]"}, {"slug": "b", "content": ""}]
+
+        provider.get_all_content.side_effect = slow_content
+        service = BacklinkService(provider)
+
+        results = _run_threads(6, service.build_link_graph)
+
+        assert provider.get_all_content.call_count == 1
+        assert all(graph == {"a": ["b"], "b": []} for graph in results)
+
+    def test_sitemap_generation_coalesced(self):
+        provider = Mock(spec=IContentProvider)
+
+        def slow_content():
+            time.sleep(0.1)
+            return [{"slug": "a", "content_type": "notes", "status": "Evergreen"}]
+
+        provider.get_all_content.side_effect = slow_content
+
+        async def main():
+            return await asyncio.gather(*(render_sitemap(provider) for _ in range(4)))
+
+        results = asyncio.run(main())
+
+        assert provider.get_all_content.call_count == 1
+        assert len(set(results)) == 1
+        assert "/notes/a" in results[0]